@@ -18,7 +18,8 @@ from ezdxf.tools.rgb import int2rgb, rgb2int
 from ezdxf.tools.pattern import PATTERN
 from ezdxf.lldxf import const  # restore module structure ezdxf.const
 from ezdxf.lldxf.validator import is_dxf_file, is_dxf_stream
-from ezdxf.filemanagement import readzip, new, read, readfile
+from ezdxf.filemanagement import readzip, readgz, new, read, readfile
+from ezdxf.dxfstream import iterdxf, opendxf
 from ezdxf.tools.standards import setup_linetypes, setup_styles, setup_dimstyles, setup_dimstyle
 from ezdxf.render.arrows import ARROWS
 
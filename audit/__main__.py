@@ -2,30 +2,199 @@
 # Created: 21.01.2018
 # Copyright (C) 2018, Manfred Moitzi
 # License: MIT License
+"""
+Usage::
+
+    python -m ezdxf.audit FILE [FILE ...]
+    python -m ezdxf.audit --jobs 8 --json report.jsonl --checkpoint done.txt DIR "drawings/**/*.dxf"
+
+Arguments can be files, directories (all files of the directory tree) or glob patterns. Files which are not DXF
+files are skipped without loading. Without argument ``--json`` the audit report of each file is printed to stdout,
+else one JSON record is written for each file::
+
+    {"filename": ..., "status": "ok" | "issues" | "skipped" | "failed", "dxfversion": ..., "release": ...,
+     "encoding": ..., "entities": 1234, "entity_counts": {"LINE": 1000, ...}, "error_count": 1,
+     "errors": [{"code": 101, "message": ..., "dxftype": ..., "handle": ...}],
+     "load_time": 0.5, "audit_time": 0.01, "message": ..., "exit_code": 1}
+
+The checkpoint file stores the names of all processed files, a restarted run with the same checkpoint file skips
+these files and appends to the JSON report. The checkpoint file and the JSON report are never audited, even if they
+are located in a scanned directory.
+
+Exit codes, the scheme of the previous versions is preserved, but all files are processed before exiting:
+
+    - 0: all files loaded, audit issues don't change the exit code
+    - 1: unable to read a file, or an unexpected error while loading or auditing a file
+    - 2: a file has an invalid DXF structure (DXFError)
+    - 3: argument ``--fail-fast`` stopped the run at the first file with audit issues
+
+If several files failed, the exit code of the first failed file is returned.
+
+"""
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Set, TextIO, Optional
 import sys
 import argparse
 import os
+import io
 import glob
+import json
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from ezdxf import readfile, options
+from ezdxf.filemanagement import dxf_file_info
 from ezdxf.lldxf.const import DXFError
-from ezdxf.lldxf.validator import is_dxf_file
+from ezdxf.lldxf.validator import is_dxf_file, is_binary_dxf_file
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Drawing
+
+OK = 'ok'
+ISSUES = 'issues'
+SKIPPED = 'skipped'
+FAILED = 'failed'
+
+# exit codes
+EXIT_READ_ERROR = 1
+EXIT_DXF_ERROR = 2
+EXIT_FAIL_FAST = 3
+
+
+def audit(filename: str, ignore_zero_pointers: bool = False) -> Tuple[dict, str]:
+    """
+    Load and audit DXF file `filename`, loading and audit errors do not exit the process.
+
+    Returns:
+        tuple (record, report), the JSON serializable `record` of the audit result, see module documentation,
+        and the printable `report`. The `record` of a file which could not be loaded or audited has the status
+        ``'failed'`` and the key ``'exit_code'``, which is :data:`EXIT_READ_ERROR` or :data:`EXIT_DXF_ERROR`.
+
+    .. versionchanged:: 0.11
 
+        returns the audit result instead of printing the report, and does not call :func:`sys.exit` for files which
+        could not be loaded
 
-def audit(filename: str, ignore_zero_pointers: bool = False) -> None:
+    """
+    record = {
+        'filename': filename,
+        'status': SKIPPED,
+    }  # type: dict
     try:
-        dwg = readfile(filename, legacy_mode=True)
+        # skip non DXF files without loading
+        if not _is_dxf_file(filename):
+            record['message'] = "File '{}' is not a DXF file.".format(filename)
+            return record, record['message'] + '\n'
+        if not is_binary_dxf_file(filename):
+            info = dxf_file_info(filename)
+            record['dxfversion'] = info.version
+            record['release'] = info.release
+            record['encoding'] = info.encoding
+        t0 = time.perf_counter()
+        doc = readfile(filename, legacy_mode=True)
+        record['load_time'] = round(time.perf_counter() - t0, 4)
     except IOError:
-        print("Unable to read DXF file '{}'.".format(filename))
-        sys.exit(1)
+        return _failed(record, "Unable to read DXF file '{}'.".format(filename), EXIT_READ_ERROR)
     except DXFError as e:
-        print(str(e))
-        sys.exit(2)
+        return _failed(record, str(e), EXIT_DXF_ERROR)
+    except Exception as e:  # do not stop the batch processing by unexpected loading errors
+        return _failed(record, '{}: {}'.format(type(e).__name__, str(e)), EXIT_READ_ERROR)
 
-    auditor = dwg.auditor()
+    try:
+        result, report = audit_document(doc, ignore_zero_pointers)
+    except Exception as e:  # do not stop the batch processing by unexpected audit errors
+        return _failed(record, '{}: {}'.format(type(e).__name__, str(e)), EXIT_READ_ERROR)
+    record.update(result)
+    return record, report
+
+
+def _failed(record: dict, message: str, exit_code: int) -> Tuple[dict, str]:
+    """ Returns `record` with status ``'failed'`` and the printable report of a file which could not be processed. """
+    record['status'] = FAILED
+    record['message'] = message
+    record['exit_code'] = exit_code
+    return record, message + '\n'
+
+
+def audit_document(doc: 'Drawing', ignore_zero_pointers: bool = False) -> Tuple[dict, str]:
+    """
+    Audit `doc`, returns tuple (result, report), the JSON serializable audit `result` without the loading
+    information, see module documentation, and the printable `report`.
+
+    .. versionadded:: 0.11
+
+    """
+    result = dict()  # type: dict
+    result['dxfversion'] = doc.dxfversion
+    result['release'] = doc.acad_release
+    result['encoding'] = doc.encoding
+    t0 = time.perf_counter()
+    auditor = doc.auditor()
     errors = auditor.run()
     if ignore_zero_pointers:
-        errors = auditor.filter_zero_pointers(errors)
-    auditor.print_report(errors)
+        errors = list(auditor.filter_zero_pointers(errors))
+    result['audit_time'] = round(time.perf_counter() - t0, 4)
+
+    db = doc.entitydb
+    result['entities'] = len(db)
+    result['entity_counts'] = dict(Counter(entity.dxftype() for entity in db.values()))
+    result['error_count'] = len(errors)
+    result['errors'] = [{
+        'code': error.code,
+        'message': error.message,
+        'dxftype': error.entity.dxftype() if error.entity is not None else None,
+        'handle': error.entity.dxf.handle if error.entity is not None else None,
+    } for error in errors]
+    result['status'] = ISSUES if len(errors) else OK
+    report = io.StringIO()
+    auditor.print_report(errors, stream=report)
+    return result, report.getvalue()
+
+
+def _is_dxf_file(filename: str) -> bool:
+    try:
+        return is_dxf_file(filename)
+    except DXFError:  # invalid group code
+        return False
+
+
+def _audit(filename: str, ignore_zero_pointers: bool) -> Tuple[dict, str]:
+    # entry point of worker processes
+    options.compress_binary_data = True
+    return audit(filename, ignore_zero_pointers)
+
+
+def collect_files(patterns: Iterable[str], exclude: Iterable[str] = None) -> Iterable[str]:
+    """
+    Yields all files of `patterns`, which can be filenames, directories or glob patterns, except the files in
+    `exclude` like the checkpoint file.
+
+    """
+    excluded = set(os.path.abspath(name) for name in exclude or [])
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, dirs, files in os.walk(pattern):
+                dirs.sort()
+                for name in sorted(files):
+                    filename = os.path.join(root, name)
+                    if os.path.abspath(filename) not in excluded:
+                        yield filename
+            continue
+        names = sorted(glob.glob(pattern, recursive=True))
+        if len(names) == 0:
+            print("File(s) '{}' not found.".format(pattern), file=sys.stderr)
+        for name in names:
+            if os.path.isdir(name):
+                yield from collect_files([name], excluded)
+            elif os.path.abspath(name) not in excluded:
+                yield name
+
+
+def load_checkpoint(filename: str) -> Set[str]:
+    """ Returns the names of all processed files stored in checkpoint file `filename`. """
+    if not os.path.exists(filename):
+        return set()
+    with open(filename, mode='rt', encoding='utf-8') as fp:
+        return set(line.rstrip('\n') for line in fp if line.strip())
 
 
 def processing_msg(text: str) -> None:
@@ -33,38 +202,135 @@ def processing_msg(text: str) -> None:
     print('-' * len(text))
 
 
+class Reporter:
+    """ Writes audit results as JSON records or printed reports and updates the checkpoint file. """
+
+    def __init__(self, json_stream: Optional[TextIO], checkpoint: Optional[TextIO]):
+        self.json_stream = json_stream
+        self.checkpoint = checkpoint
+        self.status = Counter()
+        self.exit_code = 0  # exit code of the first failed file
+
+    def write(self, record: dict, report: str) -> None:
+        self.status[record['status']] += 1
+        if not self.exit_code:
+            self.exit_code = record.get('exit_code', 0)
+        if self.json_stream is not None:
+            self.json_stream.write(json.dumps(record) + '\n')
+            self.json_stream.flush()
+        else:
+            processing_msg(record['filename'])
+            print(report)
+        if self.checkpoint is not None:
+            self.checkpoint.write(os.path.abspath(record['filename']) + '\n')
+            self.checkpoint.flush()
+
+
+def run(filenames: List[str], reporter: Reporter, jobs: int = 1, ignore_zero_pointers: bool = False,
+        fail_fast: bool = False) -> bool:
+    """
+    Audit `filenames` by `jobs` worker processes, returns ``False`` if stopped by argument `fail_fast`.
+
+    """
+    def stop(record: dict) -> bool:
+        return fail_fast and record['status'] in (ISSUES, FAILED)
+
+    if jobs < 2 or len(filenames) < 2:
+        for filename in filenames:
+            record, report = audit(filename, ignore_zero_pointers)
+            reporter.write(record, report)
+            if stop(record):
+                return False
+        return True
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(_audit, filename, ignore_zero_pointers): filename for filename in filenames}
+        for future in as_completed(futures):
+            try:
+                record, report = future.result()
+            except Exception as e:  # worker process terminated abruptly
+                record, report = _failed({'filename': futures[future]}, '{}: {}'.format(type(e).__name__, str(e)),
+                                        EXIT_READ_ERROR)
+            reporter.write(record, report)
+            if stop(record):
+                for pending in futures:
+                    pending.cancel()
+                return False
+    return True
+
+
 def main() -> None:
-    print()
     parser = argparse.ArgumentParser()
     parser.add_argument(
         'files',
         metavar='FILE',
         nargs='+',
-        help='audit DXF files',
+        help='audit DXF files, directories or glob patterns',
     )
     parser.add_argument(
         '-z', '--ignore_zero_pointers',
         action='store_true',
         help='ignore zero pointers',
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='count of worker processes',
+    )
+    parser.add_argument(
+        '--json',
+        metavar='JSONL',
+        help="write one JSON record for each file into JSONL, '-' for stdout",
+    )
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='stop at the first file with audit issues or loading errors',
+    )
+    parser.add_argument(
+        '--checkpoint',
+        metavar='FILE',
+        help='store processed files in FILE and skip files already stored by a previous run',
+    )
 
     args = parser.parse_args(sys.argv[1:])
+    if not args.json:
+        print()
 
     options.compress_binary_data = True
-    for pattern in args.files:
-        names = list(glob.glob(pattern))
-        if len(names) == 0:
-            print("File(s) '{}' not found.".format(pattern))
-            continue
-        for filename in names:
-            if not os.path.exists(filename):
-                print("File '{}' not found.".format(filename))
-                continue
-            if not is_dxf_file(filename):
-                print("File '{}' is not a DXF file.".format(filename))
-                continue
-            processing_msg(filename)
-            audit(filename, args.ignore_zero_pointers)
+    # never audit the output files of this run
+    filenames = list(collect_files(args.files, exclude=[name for name in (args.checkpoint, args.json)
+                                                        if name and name != '-']))
+    if args.checkpoint:
+        done = load_checkpoint(args.checkpoint)
+        filenames = [filename for filename in filenames if os.path.abspath(filename) not in done]
+
+    json_stream = None
+    checkpoint = None
+    try:
+        if args.json == '-':
+            json_stream = sys.stdout
+        elif args.json:
+            # continue report of a resumed run
+            json_stream = open(args.json, mode='at' if args.checkpoint else 'wt', encoding='utf-8')
+        if args.checkpoint:
+            checkpoint = open(args.checkpoint, mode='at', encoding='utf-8')
+        reporter = Reporter(json_stream, checkpoint)
+        completed = run(filenames, reporter, jobs=args.jobs, ignore_zero_pointers=args.ignore_zero_pointers,
+                        fail_fast=args.fail_fast)
+    finally:
+        if json_stream is not None and json_stream is not sys.stdout:
+            json_stream.close()
+        if checkpoint is not None:
+            checkpoint.close()
+    if json_stream is not None and reporter.status:
+        print(', '.join('{}: {}'.format(status, count) for status, count in sorted(reporter.status.items())),
+              file=sys.stderr)
+    if reporter.exit_code:
+        sys.exit(reporter.exit_code)
+    if not completed:
+        sys.exit(EXIT_FAIL_FAST)
 
 
 if __name__ == "__main__":
@@ -5,19 +5,25 @@
 """
 audit(drawing, stream): check a DXF drawing for errors.
 """
-from typing import TYPE_CHECKING, Iterable, List, Set, TextIO, Any
+from typing import TYPE_CHECKING, Iterable, List, Set, TextIO, Any, Dict, Tuple, Optional
 
 import sys
 from ezdxf.lldxf.types import is_pointer_code, DXFTag
 from ezdxf.lldxf.const import Error
 from ezdxf.lldxf.validator import is_valid_layer_name, is_adsk_special_layer
 from ezdxf.entities.dxfentity import DXFEntity
+from ezdxf.entities.dxfgfx import DXFGraphic
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import DXFEntity, Drawing
 
 REQUIRED_ROOT_DICT_ENTRIES = ('ACAD_GROUP', 'ACAD_PLOTSTYLENAME')
 
+# audit record of a graphical entity: (layer, linetype, color, pointers), unsupported attributes are None
+AuditRecord = Tuple[Optional[str], Optional[str], Optional[int], Tuple[str, ...]]
+# found issue without entity: (code, message, data)
+Issue = Tuple[int, str, Any]
+
 
 class ErrorEntry:
     def __init__(self, code: int, message: str = '', dxf_entity: 'DXFEntity' = None, data: Any = None):
@@ -33,15 +39,96 @@ def target_pointers(tags: Iterable[DXFTag]) -> Iterable[DXFTag]:
             yield tag
 
 
+class AuditLookup:
+    """
+    Lookup sets for the audit process, collected once for each audit run: lower case names of all existing
+    linetypes, text styles and dimension styles and the handles of all database entities.
+
+    The table names are not necessary for checking layers, because undefined layers are valid and created
+    implicit by CAD applications.
+
+    Args:
+        dxfversion: DXF version string like 'AC1015'
+        linetypes: lower case linetype names
+        styles: lower case text style names
+        dimstyles: lower case dimension style names
+        handles: handles of all database entities
+
+    .. versionadded:: 0.11
+
+    """
+    __slots__ = ('dxfversion', 'linetypes', 'styles', 'dimstyles', 'handles')
+
+    def __init__(self, dxfversion: str, linetypes: Iterable[str] = None, styles: Iterable[str] = None,
+                 dimstyles: Iterable[str] = None, handles: Iterable[str] = None):
+        self.dxfversion = dxfversion
+        self.linetypes = frozenset(linetypes or [])
+        self.styles = frozenset(styles or [])
+        self.dimstyles = frozenset(dimstyles or [])
+        self.handles = frozenset(handles or [])
+
+    @classmethod
+    def from_doc(cls, doc: 'Drawing') -> 'AuditLookup':
+        """ Collect lookup sets from `doc`. """
+        tables = doc.tables
+        return cls(
+            dxfversion=doc.dxfversion,
+            # table keys are lower case names
+            linetypes=tables.linetypes.entries.keys(),
+            styles=tables.styles.entries.keys(),
+            dimstyles=tables.dimstyles.entries.keys(),
+            handles=doc.entitydb.keys(),
+        )
+
+
+def check_graphic_record(record: AuditRecord, lookup: AuditLookup) -> Tuple[Issue, ...]:
+    """
+    Returns issues of a graphical entity described by its audit `record`, same checks and order as
+    :meth:`DXFGraphic.audit`. Undefined pointer targets are returned for every entity, merging them to one
+    error message for each handle is done by the :class:`Auditor`. (internal API)
+
+    """
+    layer, linetype, color, pointers = record
+    issues = []
+    if layer is not None and not is_valid_layer_name(layer):
+        if not (lookup.dxfversion > 'AC1009' and is_adsk_special_layer(layer)):
+            issues.append((Error.INVALID_LAYER_NAME, 'Invalid layer name: {}'.format(layer), None))
+    if linetype is not None:
+        key = linetype.lower()
+        if key not in ('bylayer', 'byblock') and key not in lookup.linetypes:
+            issues.append((Error.UNDEFINED_LINETYPE, 'Undefined linetype: {}'.format(linetype), None))
+    if color is not None and (color < 0 or color > 257):
+        issues.append((Error.INVALID_COLOR_INDEX, 'Invalid color index: {}'.format(color), None))
+    handles = lookup.handles
+    for handle in pointers:
+        if handle not in handles:
+            issues.append((
+                Error.POINTER_TARGET_NOT_EXISTS, 'Pointer target does not exist: (#{})'.format(handle), handle
+            ))
+    return tuple(issues)
+
+
 class Auditor:
     def __init__(self, doc: 'Drawing'):
         self.doc = doc
         self.errors = []  # type: List[ErrorEntry]
         self.undefined_targets = set()  # type: Set[str]
+        self._lookup = None  # type: Optional[AuditLookup]
+        # collected by the last run: count of graphical entities with extracted and with reused audit record
+        self.checked_entities = 0
+        self.reused_entities = 0
 
     def reset(self) -> None:
         self.errors = []
         self.undefined_targets = set()
+        self._lookup = None
+
+    @property
+    def lookup(self) -> AuditLookup:
+        """ Lookup sets of the current audit run, collected from the document at first access. """
+        if self._lookup is None:
+            self._lookup = AuditLookup.from_doc(self.doc)
+        return self._lookup
 
     def __len__(self) -> int:
         return len(self.errors)
@@ -87,6 +174,19 @@ class Auditor:
         self.errors.append(error)
 
     def run(self) -> List[ErrorEntry]:
+        """
+        Run audit process and returns found errors.
+
+        Graphical entities are checked by their audit record (layer, linetype, color and pointers) against lookup
+        sets collected once for each run, each distinct record is checked only once. The audit record is cached by
+        the entity until an audited DXF attribute is changed, a following run extracts only the records of changed
+        entities.
+
+        .. versionchanged:: 0.11
+
+            precomputed lookup sets and cached audit records
+
+        """
         self.reset()
         dxfversion = self.doc.dxfversion
         if dxfversion > 'AC1009':  # modern style DXF13 or later
@@ -117,8 +217,70 @@ class Auditor:
         tables.block_records.audit(self)
 
     def check_database_entities(self) -> None:
+        lookup = self.lookup
+        undefined_targets = self.undefined_targets
+        # audit process of entity classes: None for no checks, False for a special audit process, else the supported
+        # record attributes (layer, linetype, color) and if the record can be cached by the entity
+        processes = dict()  # type: Dict[type, Optional[Tuple[bool, bool, bool, bool]]]
+        # found issues of all distinct audit records of this run
+        results = dict()  # type: Dict[AuditRecord, Tuple[Issue, ...]]
+        graphic_audit = DXFGraphic.audit
+        default_audit = DXFEntity.audit
+        default_pointers = DXFEntity.check_pointers
+        checked = 0
+        reused = 0
         for entity in self.doc.entitydb.values():
-            entity.audit(self)
+            cls = type(entity)
+            try:
+                process = processes[cls]
+            except KeyError:
+                audit = cls.audit
+                if audit is default_audit:
+                    process = None
+                elif audit is not graphic_audit:
+                    process = False
+                else:
+                    # check_pointers() of the default implementation returns only the owner handle, changes are
+                    # tracked by the DXF namespace
+                    process = (
+                        entity.is_supported_dxf_attrib('layer'),
+                        entity.is_supported_dxf_attrib('linetype'),
+                        entity.is_supported_dxf_attrib('color'),
+                        cls.check_pointers is default_pointers,
+                    )
+                processes[cls] = process
+            if process is None:  # nothing to check
+                continue
+            if process is False:
+                entity.audit(self)
+                continue
+
+            record = entity._audit_record
+            if record is None:
+                has_layer, has_linetype, has_color, cache = process
+                dxf = entity.dxf
+                record = (
+                    dxf.layer if has_layer else None,
+                    dxf.linetype if has_linetype else None,
+                    dxf.color if has_color else None,
+                    tuple(entity.check_pointers()),
+                )
+                if cache:
+                    entity._audit_record = record
+                checked += 1
+            else:
+                reused += 1
+            issues = results.get(record)
+            if issues is None:
+                issues = results[record] = check_graphic_record(record, lookup)
+            for code, message, data in issues:
+                if code == Error.POINTER_TARGET_NOT_EXISTS:
+                    if data in undefined_targets:  # for every undefined pointer add just one error message
+                        continue
+                    undefined_targets.add(data)
+                self.add_error(code=code, message=message, dxf_entity=entity, data=data)
+        self.checked_entities = checked
+        self.reused_entities = reused
 
     def check_if_linetype_exists(self, entity: 'DXFEntity') -> None:
         """
@@ -130,7 +292,7 @@ class Auditor:
         if linetype.lower() in ('bylayer', 'byblock'):  # no table entry in linetypes required
             return
 
-        if linetype not in self.doc.linetypes:
+        if linetype.lower() not in self.lookup.linetypes:
             self.add_error(
                 code=Error.UNDEFINED_LINETYPE,
                 message='Undefined linetype: {}'.format(linetype),
@@ -144,7 +306,7 @@ class Auditor:
         if not entity.is_supported_dxf_attrib('style'):
             return
         style = entity.dxf.style
-        if style not in self.doc.styles:
+        if style.lower() not in self.lookup.styles:
             self.add_error(
                 code=Error.UNDEFINED_TEXT_STYLE,
                 message='Undefined dimstyle: {}'.format(style),
@@ -158,7 +320,7 @@ class Auditor:
         if not entity.is_supported_dxf_attrib('dimstyle'):
             return
         dimstyle = entity.dxf.dimstyle
-        if dimstyle not in self.doc.dimstyles:
+        if dimstyle.lower() not in self.lookup.dimstyles:
             self.add_error(
                 code=Error.UNDEFINED_DIMENSION_STYLE,
                 message='Undefined dimstyle: {}'.format(dimstyle),
@@ -199,7 +361,7 @@ class Auditor:
         if not entity.is_supported_dxf_attrib('owner'):
             return
         owner_handle = entity.dxf.owner
-        if owner_handle not in self.doc.entitydb:
+        if owner_handle not in self.lookup.handles:
             self.add_error(
                 code=Error.INVALID_OWNER_HANDLE,
                 message='Invalid owner handle: #{}'.format(owner_handle),
@@ -208,9 +370,9 @@ class Auditor:
 
     def check_pointer_target_exists(self, entity: 'DXFEntity', zero_pointer_valid: bool = False) -> None:
         assert isinstance(entity, DXFEntity)
-        db = self.doc.entitydb
+        handles = self.lookup.handles
         for handle in entity.check_pointers():
-            if handle not in db:
+            if handle not in handles:
                 if handle == '0' and zero_pointer_valid:  # default unset pointer
                     continue
                 if handle in self.undefined_targets:  # for every undefined pointer add just one error message
@@ -226,9 +388,11 @@ class Auditor:
     def check_handles_exists(self, entity: 'DXFEntity',
                              handles: Iterable[str],
                              zero_pointer_valid: bool = False) -> None:
-        db = self.doc.entitydb
+        existing_handles = self.lookup.handles
         for handle in handles:
-            if handle not in db:
+            # dictionaries store handles or entities
+            key = handle if isinstance(handle, str) else handle.dxf.handle
+            if key not in existing_handles:
                 if handle == '0' and zero_pointer_valid:  # default unset pointer
                     continue
                 if handle in self.undefined_targets:  # for every undefined pointer add just one error message
@@ -0,0 +1,256 @@
+# Purpose: columnar export and import of DXF attributes
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, Dict, List, Any, Tuple
+from collections import namedtuple
+from array import array
+from itertools import chain, repeat
+from operator import attrgetter
+import math
+
+from ezdxf.lldxf.attributes import XType
+from ezdxf.lldxf.const import DXFValueError, DXFAttributeError
+from ezdxf.lldxf.types import POINT_CODES, HEX_HANDLE_CODES, TYPE_TABLE
+from ezdxf.entities.factory import ENTITY_CLASSES
+
+from ezdxf.math.numpysupport import numpy  # None if NumPy is not installed, columns are stored as Python arrays
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFEntity, DXFGraphic, DXFAttr, DXFNamespace, BaseLayout
+
+__all__ = ['Categorical', 'to_columns', 'from_columns']
+
+# column kinds
+POINT = 'point'
+FLOAT = 'float'
+INT = 'int'
+HANDLE = 'handle'
+STRING = 'string'
+
+POINT_XTYPES = {XType.point2d, XType.point3d, XType.any_point}
+DXFTYPE = 'dxftype'  # pseudo attribute, DXF type of the entity as categorical column
+IGNORED_COLUMNS = {DXFTYPE, 'handle', 'owner'}  # ignored by from_columns()
+NAN = float('nan')
+NAN3 = (NAN, NAN, NAN)
+DXF = attrgetter('dxf')
+FLAGS = attrgetter('_flags')
+XYZ = attrgetter('xyz')  # coordinates of Vector() as tuple
+
+Categorical = namedtuple('Categorical', 'codes categories')
+Categorical.__doc__ = """ Categorical column of string attributes, `codes` is an integer array of indices into the
+`categories` list, code ``-1`` marks entities without this attribute. """
+
+
+def column_kind(attrib: 'DXFAttr') -> str:
+    """ Returns the column kind of DXF attribute definition `attrib`. (internal API) """
+    code = attrib.code
+    if attrib.xtype in POINT_XTYPES or code in POINT_CODES:
+        return POINT
+    if code in HEX_HANDLE_CODES:
+        return HANDLE
+    type_ = TYPE_TABLE.get(code, str)
+    if type_ is float:
+        return FLOAT
+    if type_ is int:
+        return INT
+    return STRING
+
+
+def to_columns(entities: Iterable['DXFEntity'], names: Iterable[str]) -> Dict[str, Any]:
+    """
+    Returns the DXF attributes `names` of all `entities` as ``dict`` of columns, the DXF attributes of all entities of
+    the same class are read column by column in one pass. The columns contain the same values as
+    ``entity.dxf.name``, which is the DXF default value for unset attributes. Column types:
+
+        - point attributes: float64 array of shape ``(n, 3)``, ``NaN`` for missing points
+        - float attributes: float64 array, ``NaN`` for missing values
+        - integer attributes: int64 array, ``0`` for missing values
+        - handle attributes like ``'handle'`` or ``'owner'``: int64 array of the handles as integers, ``0`` for
+          missing handles
+        - string attributes: :class:`Categorical`, code ``-1`` for missing values
+
+    The pseudo attribute ``'dxftype'`` returns the DXF type of the entities as :class:`Categorical`.
+
+    Entities which do not support a requested DXF attribute get a missing value in this column, but at least one
+    entity has to support the attribute. Without NumPy the columns are Python :class:`array.array` objects, point
+    columns are flat arrays of ``x, y, z`` triples.
+
+    Args:
+        entities: iterable of DXF entities
+        names: iterable of DXF attribute names
+
+    Raises:
+        DXFAttributeError: DXF attribute not supported by any entity
+
+    .. versionadded:: 0.11
+
+    """
+    names = list(names)
+    entities = list(entities)
+    namespaces = list(map(DXF, entities))  # decodes lazy loaded entities
+    kinds = dict()  # type: Dict[str, str]
+    if len(set(map(type, entities))) < 2 and len(set(map(type, namespaces))) < 2:
+        raw_columns = namespace_columns(entities, namespaces, names, kinds)
+    else:  # export each entity class separately and merge the columns
+        count = len(entities)
+        raw_columns = [[None] * count for _ in names]
+        groups = dict()  # type: Dict[Tuple[type, type], List[int]]
+        for index, key in enumerate(zip(map(type, entities), map(type, namespaces))):
+            groups.setdefault(key, []).append(index)
+        for indices in groups.values():
+            columns = namespace_columns(
+                [entities[index] for index in indices], [namespaces[index] for index in indices], names, kinds)
+            for raw_column, values in zip(raw_columns, columns):
+                for index, value in zip(indices, values):
+                    raw_column[index] = value
+    if entities:
+        for name in names:
+            if name not in kinds:
+                raise DXFAttributeError('DXF attribute "{}" is not supported by any entity.'.format(name))
+    return {name: make_column(kinds.get(name, STRING), values) for name, values in zip(names, raw_columns)}
+
+
+def namespace_columns(entities: List['DXFEntity'], namespaces: List['DXFNamespace'], names: List[str],
+                      kinds: Dict[str, str]) -> List[List]:
+    """
+    Returns the DXF attributes `names` of `entities` as list of columns, all entities have to be of the same class
+    and `namespaces` are the DXF namespaces of `entities`. Unsupported attributes are ``None``, the column kinds
+    of the supported attributes are stored in `kinds`, the first entity class which supports an attribute defines
+    the column kind. (internal API)
+    """
+    count = len(entities)
+    if count == 0:
+        return [[] for _ in names]
+    namespace = namespaces[0]
+    dxfattribs = namespace.dxfattribs
+    # stored DXF attributes are marked by a bit in DXFNamespace._flags, most entities share the same few patterns
+    flags = list(map(FLAGS, namespaces))
+    patterns = set(flags)
+    columns = []
+    for name in names:
+        if name == DXFTYPE:
+            kinds.setdefault(name, STRING)
+            columns.append([entities[0].dxftype()] * count)
+            continue
+        attrib = dxfattribs.get(name)
+        if attrib is None:
+            columns.append([None] * count)
+            continue
+        kinds.setdefault(name, column_kind(attrib))
+        get = attrgetter(name)
+        flag = namespace._FLAGS.get(name)
+        if flag is None or all(pattern & flag for pattern in patterns):  # callback attribute or stored by all
+            columns.append(list(map(get, namespaces)))
+            continue
+        default = namespace._DEFAULTS[name]
+        if any(pattern & flag for pattern in patterns):
+            columns.append([get(ns) if f & flag else default for ns, f in zip(namespaces, flags)])
+        else:  # not stored by any entity
+            columns.append([default] * count)
+    return columns
+
+
+def make_column(kind: str, values: List) -> Any:
+    """ Returns column of `kind` for `values`, ``None`` marks missing values. (internal API) """
+    if kind == STRING:
+        categories = list(dict.fromkeys(values))  # order of appearance
+        if None in categories:
+            categories.remove(None)
+        lookup = {value: code for code, value in enumerate(categories)}
+        lookup[None] = -1
+        codes = list(map(lookup.__getitem__, values))
+        return Categorical(numpy.array(codes, dtype=numpy.int32) if numpy else array('i', codes), categories)
+    if kind == POINT:
+        try:
+            points = list(map(XYZ, values))
+        except AttributeError:  # missing points
+            points = [NAN3 if value is None else XYZ(value) for value in values]
+        coordinates = list(chain.from_iterable(points))
+        if numpy:
+            return numpy.array(coordinates, dtype=numpy.float64).reshape(-1, 3)
+        return array('d', coordinates)
+    if kind == HANDLE:
+        if None in values:
+            values = [0 if value is None else int(value, 16) for value in values]
+        else:
+            values = list(map(int, values, repeat(16)))
+    elif None in values:
+        missing = NAN if kind == FLOAT else 0
+        values = [missing if value is None else value for value in values]
+    if kind == FLOAT:
+        return numpy.array(values, dtype=numpy.float64) if numpy else array('d', values)
+    return numpy.array(values, dtype=numpy.int64) if numpy else array('q', values)
+
+
+def from_columns(layout: 'BaseLayout', dxftype: str, columns: Dict[str, Any],
+                 dxfattribs: dict = None) -> List['DXFGraphic']:
+    """
+    Creates new entities of type `dxftype` in `layout` from a ``dict`` of `columns`, one entity for each row, all
+    columns must have the same length. Accepts all columns created by :func:`to_columns`, NumPy arrays of shape
+    ``(n, 2)`` or ``(n, 3)`` or flat ``x, y, z`` arrays for points and any sequence of values for other attributes,
+    `dxfattribs` are shared by all new entities.
+
+    Missing values (``NaN``, categorical code ``-1``, handle ``0`` or ``None``) leave the DXF attribute unset. The
+    columns ``'dxftype'``, ``'handle'``, ``'owner'`` and read only attributes like ``'count'`` are ignored, the new
+    entities get new handles.
+
+    Args:
+        layout: target layout
+        dxftype: DXF type of the new entities like ``'LINE'``
+        columns: ``dict`` of DXF attribute names and columns
+        dxfattribs: DXF attributes shared by all new entities
+
+    Returns: list of new entities
+
+    Raises:
+        DXFValueError: unsupported DXF type or columns of different lengths
+        DXFAttributeError: DXF attribute not supported by `dxftype`
+
+    .. versionadded:: 0.11
+
+    """
+    entity_class = ENTITY_CLASSES.get(dxftype)
+    if entity_class is None:
+        raise DXFValueError('Unsupported DXF type: {}'.format(dxftype))
+    dxfattribs_def = entity_class.DXFATTRIBS
+    names = []
+    decoded = []
+    for name, column in columns.items():
+        if name in IGNORED_COLUMNS:
+            continue
+        attrib = dxfattribs_def.get(name)
+        if attrib is None:
+            raise DXFAttributeError('Invalid DXF attribute "{}" for entity {}'.format(name, dxftype))
+        if attrib.xtype == XType.callback:
+            continue
+        values = decode_column(column_kind(attrib), column)
+        if decoded and len(values) != len(decoded[0]):
+            raise DXFValueError('All columns require the same length.')
+        names.append(name)
+        decoded.append(values)
+
+    count = len(decoded[0]) if decoded else 0
+    return layout.new_entities(dxftype, count, dxfattribs, dict(zip(names, decoded)))
+
+
+def _tolist(column: Any) -> List:
+    return column.tolist() if hasattr(column, 'tolist') else list(column)
+
+
+def decode_column(kind: str, column: Any) -> List:
+    """ Returns the values of `column` as list of Python objects, ``None`` for missing values. (internal API) """
+    if isinstance(column, Categorical):
+        categories = column.categories
+        return [None if code < 0 else categories[code] for code in _tolist(column.codes)]
+    if kind == POINT:
+        if isinstance(column, array):  # flat x, y, z array
+            points = list(zip(*[iter(column)] * 3))
+        else:
+            points = _tolist(column)
+        return [None if point is None or math.isnan(point[0]) else point for point in points]
+    values = _tolist(column)
+    if kind == FLOAT:
+        return [None if value is None or value != value else value for value in values]  # NaN != NaN
+    if kind == HANDLE:
+        return [value if isinstance(value, str) else ('%X' % value if value else None) for value in values]
+    return values
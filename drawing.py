@@ -1,7 +1,8 @@
 # Created: 11.03.2011
 # Copyright (c) 2011-2019, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, TextIO, Iterable, Union, Sequence, Tuple, Callable
+from typing import TYPE_CHECKING, TextIO, BinaryIO, Iterable, Iterator, Union, Sequence, Tuple, Callable
+from contextlib import contextmanager, ExitStack
 from datetime import datetime
 import io
 import logging
@@ -12,7 +13,7 @@ from ezdxf.lldxf.const import DXF13, DXF14, DXF2000, DXF2007, DXF12, DXF2013, ve
 from ezdxf.lldxf.const import DXFVersionError
 from ezdxf.lldxf.loader import load_dxf_structure, fill_database
 from ezdxf.lldxf import repair
-from .lldxf.tagwriter import TagWriter
+from .lldxf.tagwriter import TagWriter, BinaryTagWriter
 
 from ezdxf.entitydb import EntityDB
 from ezdxf.entities.factory import EntityFactory
@@ -22,7 +23,7 @@ from ezdxf.tools.juliandate import juliandate
 
 from ezdxf.tools import guid
 from ezdxf.tracker import Tracker
-from ezdxf.query import EntityQuery
+from ezdxf.query import EntityQuery, indexed_query
 from ezdxf.groupby import groupby
 from ezdxf.render.dimension import DimensionRenderer
 
@@ -92,6 +93,10 @@ class Drawing:
         self._acad_compatible = True  # will generated DXF file compatible with AutoCAD
         self._dimension_renderer = DimensionRenderer()  # set DIMENSION rendering engine
         self._acad_incompatibility_reason = set()  # avoid multiple warnings for same reason
+        # update the extents of all layouts and the header variables $EXTMIN and $EXTMAX at saving, see
+        # Layout.update_extents(), the bounding boxes of all entities are recalculated because not all inplace changes
+        # invalidate the cached bounding boxes
+        self.update_extents = False
         # Don't create any new entities here:
         # New created handles could collide with handles loaded from DXF file.
         assert len(self.entitydb) == 0
@@ -212,7 +217,8 @@ class Drawing:
         return version
 
     @classmethod
-    def read(cls, stream: TextIO, legacy_mode: bool = False, filter_stack: TFilterStack = None) -> 'Drawing':
+    def read(cls, stream: TextIO, legacy_mode: bool = False, filter_stack: TFilterStack = None,
+             workers: int = None, lazy: bool = False) -> 'Drawing':
         """ Open an existing drawing. Package users should use the factory function :func:`ezdxf.read`.
 
         Args:
@@ -224,6 +230,9 @@ class Drawing:
 
                 TFilterStack: Sequence[Sequence[Callable[[Iterable[DXFTag]], Iterable[DXFTag]]]]
                 e.g. [(raw_tag_filter1, raw_tag_filter2), (compiled_tag_filter1, )]
+             workers: count of worker processes to load DXF entities, ``None`` or ``1`` for loading by the calling
+                      process
+             lazy: decode graphic entities at first access of an entity attribute
 
         (internal API)
         """
@@ -255,17 +264,17 @@ class Drawing:
             tagger = _filter(tagger)
 
         doc = Drawing()
-        doc._load(tagger)
+        doc._load(tagger, workers=workers, lazy=lazy)
         return doc
 
     @classmethod
-    def from_tags(cls, compiled_tags: Iterable['DXFTag']) -> 'Drawing':
+    def from_tags(cls, compiled_tags: Iterable['DXFTag'], workers: int = None, lazy: bool = False) -> 'Drawing':
         """ Create new drawing from compiled tags. (internal API)"""
         doc = Drawing()
-        doc._load(compiled_tags)
+        doc._load(compiled_tags, workers=workers, lazy=lazy)
         return doc
 
-    def _load(self, tagger: Iterable['DXFTag']):
+    def _load(self, tagger: Iterable['DXFTag'], workers: int = None, lazy: bool = False):
         sections = load_dxf_structure(tagger)  # load complete DXF entity structure
         try:  # discard section THUMBNAILIMAGE
             del sections['THUMBNAILIMAGE']
@@ -290,7 +299,7 @@ class Drawing:
         # setup handles
         self.entitydb.handles.reset(seed)
         # store all necessary DXF entities in the drawing database
-        fill_database(sections, self.dxffactory)
+        fill_database(sections, self.dxffactory, workers=workers, lazy=lazy)
         # all handles used in the DXF file are known at this point
         # -----------------------------------------------------------------------------------
         # create sections:
@@ -342,27 +351,41 @@ class Drawing:
         if '*Paper_Space' not in self.block_records:
             self.block_records.new('*Paper_Space')
 
-    def saveas(self, filename: str, encoding: str = None) -> None:
+    def saveas(self, filename: str, encoding: str = None, fmt: str = 'asc') -> None:
         """
         Write drawing to file-system by setting the :attr:`~ezdxf.drawing.Drawing.filename`
-        attribute to `filename`. For argument `encoding` see: :meth:`~ezdxf.drawing.Drawing.save`.
+        attribute to `filename`. For argument `encoding` and `fmt` see: :meth:`~ezdxf.drawing.Drawing.save`.
 
         Args:
             filename: file name as string
             encoding: override file encoding
+            fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for binary DXF
+
+        .. versionadded:: 0.11
+
+            compressed output for file names ending with ``'.gz'``, ``'.xz'`` or ``'.zip'``
 
         """
         self.filename = filename
-        self.save(encoding=encoding)
+        self.save(encoding=encoding, fmt=fmt)
 
-    def save(self, encoding: str = None) -> None:
+    def save(self, encoding: str = None, fmt: str = 'asc') -> None:
         """
         Write drawing to file-system by using the :attr:`~ezdxf.drawing.Drawing.filename` attribute as filename.
         Override file encoding by argument `encoding`, handle with care, but this option allows you to create
         DXF files for applications that handles file encoding different than AutoCAD.
 
+        The output is compressed if the filename ends with ``'.gz'`` (gzip), ``'.xz'`` (LZMA) or ``'.zip'`` (zip
+        archive with one DXF file, named like the archive without the ``'.zip'`` extension). Read compressed files by
+        :func:`ezdxf.readgz` or :func:`ezdxf.readzip`.
+
         Args:
             encoding: override default encoding as Python encoding string like ``'utf-8'``
+            fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for binary DXF
+
+        .. versionadded:: 0.11
+
+            argument `fmt` and compressed output
 
         """
         # DXF R12, R2000, R2004 - ASCII encoding
@@ -372,21 +395,38 @@ class Drawing:
             enc = 'utf-8' if self.dxfversion >= DXF2007 else self.encoding
         else:  # override default encoding, for applications that handles encoding different than AutoCAD
             enc = encoding
-        # in ASCII mode, unknown characters will be escaped as \U+nnnn unicode characters.
 
-        with io.open(self.filename, mode='wt', encoding=enc, errors='dxfreplace') as fp:
-            self.write(fp)
+        if fmt.startswith('asc'):
+            # in ASCII mode, unknown characters will be escaped as \U+nnnn unicode characters.
+            with open_output_file(self.filename, encoding=enc) as fp:
+                self.write(fp, fmt=fmt)
+        elif fmt.startswith('bin'):
+            with open_output_file(self.filename) as fp:
+                self._write(BinaryTagWriter(fp, dxfversion=self.dxfversion, encoding=enc, buffered=True))
+        else:
+            raise ValueError("Unknown output format: '{}'.".format(fmt))
 
-    def write(self, stream: TextIO) -> None:
+    def write(self, stream: Union[TextIO, BinaryIO], fmt: str = 'asc') -> None:
         """
         Write drawing to a text stream. For DXF R2004 (AC1018) and prior open stream with drawing
         :attr:`~ezdxf.drawing.Drawing.encoding` and :code:`mode='wt'`. For DXF R2007 (AC1021) and later use
-        :code:`encoding='utf-8'`.
+        :code:`encoding='utf-8'`. For binary DXF (`fmt` is ``'bin'``) open a binary stream, strings are encoded
+        by the drawing encoding.
 
         Args:
-            stream: output text stream
+            stream: output text stream or binary stream
+            fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for binary DXF
 
         """
+        if fmt.startswith('asc'):
+            self._write(TagWriter(stream, dxfversion=self.dxfversion, buffered=True))
+        elif fmt.startswith('bin'):
+            enc = 'utf-8' if self.dxfversion >= DXF2007 else self.encoding
+            self._write(BinaryTagWriter(stream, dxfversion=self.dxfversion, encoding=enc, buffered=True))
+        else:
+            raise ValueError("Unknown output format: '{}'.".format(fmt))
+
+    def _write(self, tagwriter: 'TagWriter') -> None:
         dxfversion = self.dxfversion
         if dxfversion == DXF12:
             handles = bool(self.header.get('$HANDLING', 0))
@@ -396,10 +436,16 @@ class Drawing:
             self.classes.add_required_classes(dxfversion)
 
         self._create_appids()
+        if self.update_extents:
+            for layout in self.layouts:
+                layout.update_extents(cached=False)
         self._update_header_vars()
         self._update_metadata()
-        tagwriter = TagWriter(stream, write_handles=handles, dxfversion=dxfversion)
+        tagwriter.write_handles = handles
+        if isinstance(tagwriter, BinaryTagWriter):
+            tagwriter.write_signature()
         self.export_sections(tagwriter)
+        tagwriter.flush()
 
     def export_sections(self, tagwriter: 'TagWriter') -> None:
         """ DXF export sections. (internal API) """
@@ -560,8 +606,13 @@ class Drawing:
 
             :ref:`entity query string` and :ref:`entity queries`
 
+        .. versionadded:: 0.11
+
+            uses the secondary indexes of the entity database for queries by entity names or equality of the
+            attributes ``layer``, ``owner`` and ``name`` (INSERT)
+
         """
-        return EntityQuery(self.chain_layouts_and_blocks(), query)
+        return indexed_query(self.layouts_and_blocks(), self.entitydb, query)
 
     def groupby(self, dxfattrib="", key=None) -> dict:
         """
@@ -776,3 +827,40 @@ class Drawing:
             return False
         else:
             return True
+
+
+@contextmanager
+def open_output_file(filename: str, encoding: str = None) -> Iterator[Union[TextIO, BinaryIO]]:
+    """
+    Context manager to open the output file `filename` as text stream if `encoding` is not ``None`` or else as
+    binary stream. The output is compressed for file names ending with ``'.gz'``, ``'.xz'`` or ``'.zip'``.
+    (internal API)
+
+    """
+    name = filename.lower()
+    with ExitStack() as stack:
+        if name.endswith('.gz'):
+            import gzip
+            fp = gzip.open(filename, mode='wb')
+        elif name.endswith('.xz'):
+            import lzma
+            fp = lzma.open(filename, mode='wb')
+        elif name.endswith('.zip'):
+            import zipfile
+            import os
+            archive = stack.enter_context(zipfile.ZipFile(filename, mode='w', compression=zipfile.ZIP_DEFLATED))
+            arcname = os.path.basename(filename)[:-4]
+            if not arcname.lower().endswith('.dxf'):
+                arcname += '.dxf'
+            fp = archive.open(arcname, mode='w')
+        elif encoding is not None:  # uncompressed text stream
+            yield stack.enter_context(io.open(filename, mode='wt', encoding=encoding, errors='dxfreplace'))
+            return
+        else:  # uncompressed binary stream
+            yield stack.enter_context(io.open(filename, mode='wb'))
+            return
+
+        stream = stack.enter_context(fp)
+        if encoding is not None:
+            stream = stack.enter_context(io.TextIOWrapper(stream, encoding=encoding, errors='dxfreplace'))
+        yield stream
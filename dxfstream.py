@@ -0,0 +1,185 @@
+# Purpose: iterate over DXF entities of huge DXF files with constant memory usage
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, Iterator, TextIO, Optional, Set
+import io
+
+from ezdxf.lldxf.const import DXF12, DXFStructureError
+from ezdxf.lldxf.tags import group_tags
+from ezdxf.lldxf.tagger import low_level_tagger, tag_compiler
+from ezdxf.lldxf.validator import is_dxf_file, is_binary_dxf_file
+from ezdxf.entities.factory import EntityFactory
+from ezdxf.entities.dxfgfx import entity_linker
+from ezdxf.sections.header import HeaderSection
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFTag, DXFGraphic, Tags
+
+__all__ = ['IterDXF', 'opendxf', 'iterdxf', 'modelspace_entities']
+
+# entities following a POLYLINE or an INSERT entity up to and including the SEQEND entity
+SUB_ENTITIES = {'VERTEX', 'ATTRIB', 'SEQEND', 'MTEXT'}
+
+
+class IterDXF:
+    """
+    Iterator for DXF entities of huge DXF files, without loading the whole DXF document into memory. Only the
+    modelspace entities of the ENTITIES section are supported, the resulting entities are not bound to a DXF document
+    and have no access to the DXF resources like layers, linetypes or blocks.
+
+    The HEADER section is loaded lazily at the first access of the :attr:`header` property.
+
+    Args:
+        filename: DXF filename
+        errors: text decoding error handler, see :func:`open`
+
+    """
+
+    def __init__(self, filename: str, errors: str = 'ignore'):
+        from ezdxf.filemanagement import dxf_file_info
+        if not is_dxf_file(filename):
+            raise IOError("File '{}' is not a DXF file.".format(filename))
+        if is_binary_dxf_file(filename):
+            raise IOError("Binary DXF file '{}' is not supported.".format(filename))
+        self.filename = filename
+        self.encoding = dxf_file_info(filename).encoding
+        self.errors = errors
+        self._header = None  # type: Optional[HeaderSection]
+
+    def _open(self) -> TextIO:
+        return io.open(self.filename, mode='rt', encoding=self.encoding, errors=self.errors)
+
+    @property
+    def header(self) -> HeaderSection:
+        """ Returns the :class:`~ezdxf.sections.header.HeaderSection`, loaded at first access. """
+        if self._header is None:
+            with self._open() as fp:
+                tags = section_tags(low_level_tagger(fp), 'HEADER')
+                try:
+                    self._header = HeaderSection.load(tags)
+                except StopIteration:  # no HEADER section, like minimal DXF R12 files
+                    self._header = HeaderSection.new(dxfversion=DXF12)
+        return self._header
+
+    @property
+    def dxfversion(self) -> str:
+        """ Returns the DXF version of the DXF file as string like ``'AC1009'``. """
+        return self.header.get('$ACADVER', DXF12)
+
+    def modelspace(self, types: Iterable[str] = None) -> Iterable['DXFGraphic']:
+        """
+        Yields all modelspace entities of the ENTITIES section, one at the time. Linked entities like VERTEX, ATTRIB
+        and SEQEND are attached to their main entity POLYLINE or INSERT and are never yielded on their own, they are
+        not loaded at all if the main entity is not requested.
+
+        Args:
+            types: iterable of requested DXF types as strings like ``['LINE', 'CIRCLE']`` or ``None`` for all types
+
+        """
+        with self._open() as fp:
+            yield from modelspace_entities(fp, types)
+
+
+def opendxf(filename: str, errors: str = 'ignore') -> IterDXF:
+    """ Returns an :class:`IterDXF` object for DXF file `filename`, does not load any DXF entities. """
+    return IterDXF(filename, errors=errors)
+
+
+def iterdxf(filename: str, types: Iterable[str] = None, errors: str = 'ignore') -> Iterable['DXFGraphic']:
+    """
+    Iterate over the modelspace entities of the DXF file `filename` with constant memory usage, regardless of the
+    file size. This is the preferred method to process huge DXF files, which do not fit into memory as
+    :class:`~ezdxf.drawing.Drawing`. No entity database, layouts or blocks will be created, the yielded entities are
+    not bound to a DXF document.
+
+    Args:
+        filename: DXF filename
+        types: iterable of requested DXF types as strings like ``['LINE', 'CIRCLE']`` or ``None`` for all types
+        errors: text decoding error handler, see :func:`open`
+
+    Raises:
+        IOError: File `filename` is not an ASCII DXF file or does not exist.
+        DXFStructureError: for invalid DXF structure
+
+    """
+    return IterDXF(filename, errors=errors).modelspace(types)
+
+
+def section_tags(tagger: Iterator['DXFTag'], name: str) -> Iterator['DXFTag']:
+    """
+    Yields the compiled tags of section `name` from the low level `tagger` including the leading (0, 'SECTION') and
+    (2, name) tags but without the closing (0, 'ENDSEC') tag. Tags in front of the requested section are skipped
+    without compiling them. (internal API)
+
+    """
+    for tag in tagger:
+        if tag == (0, 'SECTION'):
+            name_tag = next(tagger, None)
+            if name_tag == (2, name):
+                yield from tag_compiler(iter((tag, name_tag)))
+                break
+    else:  # section does not exist
+        return
+
+    def section_content() -> Iterator['DXFTag']:
+        for tag in tagger:
+            if tag == (0, 'ENDSEC'):
+                return
+            yield tag
+        raise DXFStructureError("DXFStructureError: missing ENDSEC tag.")
+
+    yield from tag_compiler(section_content())
+
+
+def modelspace_entities(stream: TextIO, types: Iterable[str] = None) -> Iterable['DXFGraphic']:
+    """
+    Yields the modelspace entities of the ENTITIES section from text `stream`, for arguments see :func:`iterdxf`.
+    (internal API)
+
+    """
+    requested = set(types) if types is not None else None  # type: Optional[Set[str]]
+    factory = EntityFactory()
+    linked_entity = entity_linker()
+    queued = None  # type: Optional[DXFGraphic] # main entity, maybe waiting for linked entities
+    # state of the entities linked to the preceding POLYLINE or INSERT entity:
+    # None for no linked entities, True for loading them and False for skipping them without building entities
+    load_linked_entities = None  # type: Optional[bool]
+
+    def has_linked_entities(tags: 'Tags') -> bool:
+        dxftype = tags[0].value
+        return dxftype == 'POLYLINE' or (dxftype == 'INSERT' and tags.get_first_value(66, 0) == 1)
+
+    def is_modelspace_entity(entity: 'DXFGraphic') -> bool:
+        return not entity.dxf.get('paperspace', 0)
+
+    entities = group_tags(section_tags(low_level_tagger(stream), 'ENTITIES'))
+    try:
+        next(entities)  # skip (0, 'SECTION') (2, 'ENTITIES')
+    except StopIteration:  # no ENTITIES section
+        return
+
+    for tags in entities:
+        dxftype = tags[0].value
+        if load_linked_entities is not None:
+            # VERTEX, ATTRIB and SEQEND entities belong to the preceding main entity and are never yielded on their own
+            if load_linked_entities:
+                linked_entity(factory.entity(tags))
+            elif dxftype not in SUB_ENTITIES:
+                raise DXFStructureError("expected DXF entity {} or SEQEND".format(dxftype))
+            if dxftype == 'SEQEND':
+                load_linked_entities = None
+            continue
+
+        is_requested = requested is None or dxftype in requested
+        if has_linked_entities(tags):
+            load_linked_entities = is_requested
+        if not is_requested:
+            continue
+        entity = factory.entity(tags)
+        if not linked_entity(entity):
+            # all linked entities of the preceding main entity are loaded
+            if queued is not None and is_modelspace_entity(queued):
+                yield queued
+            queued = entity
+    if queued is not None and is_modelspace_entity(queued):
+        yield queued
@@ -62,7 +62,7 @@ from .ellipse import Ellipse
 from .xline import XLine
 from .mtext import MText
 from .spline import Spline
-from .mesh import Mesh, MeshData
+from .mesh import Mesh, MeshData, MeshDataView
 from .hatch import Hatch, BoundaryPaths, PolylinePath, EdgePath, LineEdge, ArcEdge, EllipseEdge, SplineEdge, Pattern, PatternLine, Gradient
 from .image import Image, ImageDef
 from .underlay import Underlay, UnderlayDefinition, PdfUnderlay, DgnUnderlay, DwfUnderlay
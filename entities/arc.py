@@ -2,15 +2,17 @@
 # License: MIT License
 # Created 2019-02-15
 from typing import TYPE_CHECKING
+import math
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import acdb_entity
+from ezdxf.math.transformtools import OCSTransform
 from .circle import acdb_circle, Circle
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DXFNamespace
+    from ezdxf.eztypes import TagWriter, DXFNamespace, Matrix44
 
 __all__ = ['Arc']
 
@@ -46,3 +48,26 @@ class Arc(Circle):
         # for all DXF versions
         self.dxf.export_dxf_attribs(tagwriter, ['start_angle', 'end_angle'])
 
+    def transform(self, m: 'Matrix44') -> 'Arc':
+        """ Transform ARC entity by transformation matrix `m` inplace.
+
+        Raises:
+            NonUniformScalingError: for non uniform scaling of the OCS xy-plane, convert the ARC to an ELLIPSE
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        ocs = OCSTransform(dxf.extrusion, m)
+        self._transform(ocs)
+        # angles are preserved by uniform scaling, the orientation of the OCS is preserved by OCSTransform()
+        start_angle = dxf.start_angle
+        sweep_angle = dxf.end_angle - start_angle
+        start_angle = ocs.transform_deg_angle(start_angle)
+        end_angle = start_angle + sweep_angle
+        if not math.isclose(sweep_angle % 360., 0., abs_tol=1e-12):
+            end_angle %= 360.
+        dxf.start_angle = start_angle
+        dxf.end_angle = end_angle
+        return self
+
@@ -1,7 +1,7 @@
 # Created: 17.02.2019
 # Copyright (c) 2019, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 import logging
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER, DXF2007, DXFInternalEzdxfError
@@ -183,12 +183,40 @@ class BlockRecord(DXFEntity):
 
         """
         # assign layout
-        if hasattr(entity, 'set_owner'):
+        if entity.is_lazy and entity.lazy_owner() == (self.dxf.handle, int(self.is_any_paperspace)):
+            pass  # lazy loaded entity already assigned to this layout, don't decode entity
+        elif hasattr(entity, 'set_owner'):
             entity.set_owner(self.dxf.handle, paperspace=int(self.is_any_paperspace))
         else:
             logger.debug('Unexpected entity {}'.format(entity))
         self.entity_space.add(entity)
 
+    def add_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        """
+        Add multiple existing DXF entities to BLOCK_RECORD in one step, entities already assigned to this
+        BLOCK_RECORD like entities created by :meth:`~ezdxf.layouts.BaseLayout.new_entities` are not modified.
+
+        Args:
+            entities: iterable of :class:`DXFGraphic`
+
+        .. versionadded:: 0.11
+
+        """
+        owner = self.dxf.handle
+        paperspace = int(self.is_any_paperspace)
+        entities = list(entities)
+        for entity in entities:
+            if entity.is_lazy:
+                if entity.lazy_owner() == (owner, paperspace):
+                    continue
+            elif entity.dxf.get('owner') == owner and entity.dxf.get('paperspace', 0) == paperspace:
+                continue
+            if hasattr(entity, 'set_owner'):
+                entity.set_owner(owner, paperspace=paperspace)
+            else:
+                logger.debug('Unexpected entity {}'.format(entity))
+        self.entity_space.extend(entities)
+
     def unlink_entity(self, entity: 'DXFGraphic') -> None:
         """
         Unlink `entity` from BLOCK_RECORD.
@@ -4,13 +4,14 @@
 from typing import TYPE_CHECKING
 from ezdxf.math import Vector
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
-from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER
+from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER, NonUniformScalingError
+from ezdxf.math.transformtools import OCSTransform
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DXFNamespace
+    from ezdxf.eztypes import TagWriter, DXFNamespace, Matrix44
 
 __all__ = ['Circle']
 
@@ -27,6 +28,7 @@ class Circle(DXFGraphic):
     """ DXF CIRCLE entity """
     DXFTYPE = 'CIRCLE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_circle)
+    SUPPORTS_TRANSFORM = True
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         dxf = super().load_dxf_attribs(processor)
@@ -45,3 +47,32 @@ class Circle(DXFGraphic):
             tagwriter.write_tag2(SUBCLASS_MARKER, acdb_circle.name)
         # for all DXF versions
         self.dxf.export_dxf_attribs(tagwriter, ['center', 'radius', 'thickness', 'extrusion'])
+
+    def transform(self, m: 'Matrix44') -> 'Circle':
+        """ Transform CIRCLE entity by transformation matrix `m` inplace.
+
+        Raises:
+            NonUniformScalingError: for non uniform scaling of the OCS xy-plane, convert the CIRCLE to an ELLIPSE
+
+        .. versionadded:: 0.11
+
+        """
+        self._transform(OCSTransform(self.dxf.extrusion, m))
+        return self
+
+    def translate(self, dx: float, dy: float, dz: float) -> 'Circle':
+        """ Optimized CIRCLE/ARC translation about `dx` in x-axis, `dy` in y-axis and `dz` in z-axis.
+
+        .. versionadded:: 0.11
+
+        """
+        self.dxf.center = self._ocs_translation(dx, dy, dz) + self.dxf.center
+        return self
+
+    def _transform(self, ocs: OCSTransform) -> None:
+        if not ocs.scale_uniform:
+            raise NonUniformScalingError('{} does not support non uniform scaling.'.format(self.dxftype()))
+        dxf = self.dxf
+        dxf.center = ocs.transform_vertex(dxf.center)
+        dxf.radius = ocs.transform_length(dxf.radius)
+        self._transform_ocs_extrusion(ocs)
@@ -96,10 +96,13 @@ class Dictionary(DXFObject):
             elif code == KEY_CODE:
                 dict_key = value
             if dict_key and entry_handle:
-                try:
-                    entity = self.entitydb[entry_handle]
-                except KeyError:
+                if self.doc is None:  # loaded by a worker process
                     entity = entry_handle  # store entity as handle string
+                else:
+                    try:
+                        entity = self.entitydb[entry_handle]
+                    except KeyError:
+                        entity = entry_handle  # store entity as handle string
 
                 self._data[dict_key] = entity
                 entry_handle = None
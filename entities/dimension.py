@@ -4,19 +4,20 @@
 import math
 from typing import TYPE_CHECKING, Optional
 from ezdxf.math import Vector, X_AXIS
+from ezdxf.math.transformtools import OCSTransform
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER, DXF2010, DXF2000, DXF2007
 from ezdxf.render.arrows import ARROWS
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
-from ezdxf.lldxf.const import DXFInternalEzdxfError, DXFValueError, DXFTableEntryError
+from ezdxf.lldxf.const import DXFInternalEzdxfError, DXFValueError, DXFTableEntryError, NonUniformScalingError
 from ezdxf.lldxf.types import get_xcode_for
 from ezdxf.tools import take2
 import logging
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DimStyle, DXFNamespace, BlockLayout, OCS
+    from ezdxf.eztypes import TagWriter, DimStyle, DXFNamespace, BlockLayout, OCS, Matrix44
 
 logger = logging.getLogger('ezdxf')
 
@@ -341,6 +342,7 @@ class Dimension(DXFGraphic, OverrideMixin):
     """ DXF DIMENSION entity """
     DXFTYPE = 'DIMENSION'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_dimension, acdb_dimension_dummy)
+    SUPPORTS_TRANSFORM = True
     LINEAR = 0
     ALIGNED = 1
     ANGULAR = 2
@@ -435,6 +437,62 @@ class Dimension(DXFGraphic, OverrideMixin):
         block_name = self.get_dxf_attrib('geometry', None)
         return self.doc.blocks.get(block_name)
 
+    def transform(self, m: 'Matrix44') -> 'Dimension':
+        """ Transform DIMENSION entity by transformation matrix `m` inplace. The definition points and the entities
+        of the associated geometry block are transformed, the dimension is not re-rendered. A geometry block shared
+        with other DIMENSION entities is not modified, the DIMENSION entity gets a transformed copy of the block.
+
+        Raises:
+            NonUniformScalingError: for non uniform scaling
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        ocs = OCSTransform(dxf.extrusion, m)
+        if not ocs.scale_uniform:
+            raise NonUniformScalingError('DIMENSION does not support non uniform scaling.')
+        for name in ('defpoint', 'defpoint2', 'defpoint3', 'defpoint4', 'defpoint5'):  # in WCS
+            if dxf.hasattr(name):
+                dxf.set(name, Vector(m.transform(dxf.get(name))))
+        for name in ('text_midpoint', 'insert'):  # in OCS
+            if dxf.hasattr(name):
+                dxf.set(name, ocs.transform_vertex(dxf.get(name)))
+        for name in ('angle', 'horizontal_direction'):
+            if dxf.hasattr(name):
+                dxf.set(name, ocs.transform_deg_angle(dxf.get(name)))
+        if dxf.hasattr('leader_length'):
+            dxf.leader_length = ocs.transform_length(dxf.leader_length)
+        self._transform_ocs_extrusion(ocs)
+        block = self.get_geometry_block() if self.doc else None
+        if block is not None:
+            if self._is_geometry_block_shared():
+                block = self._copy_geometry_block(block)
+            for entity in block:
+                if entity.SUPPORTS_TRANSFORM:
+                    entity.transform(m)
+                else:
+                    logger.debug('Transformation of {} entity in dimension block not supported.'.format(
+                        entity.dxftype()))
+        return self
+
+    def _is_geometry_block_shared(self) -> bool:
+        """ Returns ``True`` if other DIMENSION entities use the same geometry block. """
+        from ezdxf.entitydb import index_value
+        handles = self.doc.entitydb.index('geometry').get(index_value(self.dxf.geometry), ())
+        handle = self.dxf.handle
+        return any(h != handle for h in handles)
+
+    def _copy_geometry_block(self, block: 'BlockLayout') -> 'BlockLayout':
+        """ Copy geometry `block` into a new anonymous block and use it as geometry block of this DIMENSION entity.
+        """
+        db = self.doc.entitydb
+        new_block = self.doc.blocks.new_anonymous_block(type_char='D', base_point=block.block.dxf.base_point)
+        for entity in block:
+            new_block.add_entity(db.duplicate_entity(entity))
+        self.dxf.geometry = new_block.name
+        return new_block
+
     def get_measurement(self) -> Optional[float]:
         """ Returns the actual dimension measurement in :ref:`WCS` units, no scaling applied.
 
@@ -2,13 +2,18 @@
 # License: MIT License
 # Created 2019-02-13
 # DXFEntity - Root Entity
-from typing import TYPE_CHECKING, List, Any, Iterable, Optional, Union, Type, TypeVar
+from typing import TYPE_CHECKING, List, Any, Iterable, Optional, Union, Type, TypeVar, Tuple, Dict, Callable, Sequence
 import copy
+from itertools import repeat
 from ezdxf import options
-from ezdxf.lldxf.types import handle_code, dxftag, cast_value
+from ezdxf.lldxf.types import handle_code, dxftag, POINT_CODES, TYPE_TABLE, BINARAY_DATA
+from ezdxf.lldxf.types import TAG_STRING_FORMAT
+from ezdxf.math.vector import Vector
 from ezdxf.lldxf.tags import Tags
+from ezdxf.lldxf.tagwriter import TagWriter
 from ezdxf.lldxf.extendedtags import ExtendedTags
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
+from ezdxf.lldxf.validator import entity_structure_validator
 from ezdxf.lldxf.const import DXF2000, STRUCTURE_MARKER, OWNER_CODE, DXF12
 from ezdxf.lldxf.const import ACAD_REACTORS, ACAD_XDICTIONARY
 from ezdxf.lldxf.const import DXFAttributeError, DXFValueError, DXFTypeError, DXFKeyError
@@ -21,9 +26,12 @@ import logging
 logger = logging.getLogger('ezdxf')
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import Auditor, TagWriter, Drawing, EntityDB, EntityFactory, Dictionary, BaseLayout
+    from ezdxf.eztypes import Auditor, Drawing, EntityDB, EntityFactory, Dictionary, BaseLayout
 
-__all__ = ['DXFNamespace', 'DXFEntity', 'DXFTagStorage', 'SubclassProcessor', 'base_class']
+__all__ = [
+    'DXFNamespace', 'DXFEntity', 'DXFTagStorage', 'LazyEntity', 'SubclassProcessor', 'base_class', 'namespace_class',
+    'lazy_class', 'subclass_loader',
+]
 
 """
 DXFEntity() is the base class of **all** DXF entities.
@@ -47,23 +55,58 @@ ERR_DXF_ATTRIB_NOT_EXITS = 'DXF attribute "{}" does not exist'
 #
 #   Polyline.on_layer_change(name) -> changes also layers of all vertices
 #
+_setattr = object.__setattr__
+_getattr = object.__getattribute__
+
 SETTER_EVENTS = {
     'layer': 'on_layer_change',
     'linetype': 'on_linetype_change',
 }
 
+# changing this DXF attributes updates the secondary indexes of the entity database, see EntityDB.reindex()
+INDEXED_ATTRIBS = {'layer', 'owner', 'name', 'geometry'}
+
+# changing this DXF attributes invalidates the cached audit record DXFEntity._audit_record, see Auditor
+AUDITED_ATTRIBS = {'layer', 'linetype', 'color', 'owner'}
+
+# changing this DXF attributes does not invalidate the cached bounding box DXFEntity._box, all other DXF attributes
+# are geometry attributes
+NON_GEOMETRY_ATTRIBS = {
+    'handle', 'owner', 'layer', 'linetype', 'color', 'paperspace', 'lineweight', 'ltscale', 'invisible', 'true_color',
+    'color_name', 'transparency', 'shadow_mode', 'material_handle', 'visualstyle_handle', 'plotstyle_enum',
+    'plotstyle_handle',
+}
+
 
 class DXFNamespace:
     """
     Uses the Python object itself as attribute storage, only valid Python names can be used as attrib name.
 
+    Each DXF entity class gets its own namespace class, generated from the DXF attribute definitions by
+    :func:`namespace_class`, which stores the DXF attributes in slots. ``DXFNamespace(processor, entity)`` returns an
+    instance of the namespace class of the entity.
+
     The namespace can only contain immutable objects: string, int, float, bool, Vector
     Because of the immutability, copy and deepcopy are the same.
 
     (internal class)
     """
+    # existing DXF attributes are marked by a bit in _flags, unset slots would raise an AttributeError
+    __slots__ = ('_entity', '_flags')
+    _FLAGS = {}  # flag bit of stored DXF attributes, set by namespace_class()
+    _DEFAULTS = {}  # DXF default values of stored DXF attributes, set by namespace_class()
+    _CASTS = {}  # type casts of stored DXF attributes, set by namespace_class()
+    _DXFATTRIBS = None  # DXF attribute definitions, set by namespace_class()
+    _GEOMETRY = frozenset()  # geometry attributes, set by namespace_class()
+    _TRACKED = frozenset()  # geometry, setter event, indexed and audited attributes, set by namespace_class()
+
+    def __new__(cls, processor: 'SubclassProcessor' = None, entity: 'DXFEntity' = None):
+        if cls is DXFNamespace:
+            cls = namespace_class(DXFEntity if entity is None else entity.__class__)
+        return object.__new__(cls)
 
     def __init__(self, processor: 'SubclassProcessor' = None, entity: 'DXFEntity' = None):
+        object.__setattr__(self, '_flags', 0)
         if processor:
             base_class_ = processor.base_class
             code = handle_code(base_class_[0].value)
@@ -78,18 +121,38 @@ class DXFNamespace:
 
     def copy(self, entity: 'DXFEntity'):
         namespace = self.__class__()
-        for k, v in self.__dict__.items():
-            namespace.__dict__[k] = v
+        for k, v in self.all_existing_dxf_attribs().items():
+            namespace._store(k, v)
         namespace.rewire(entity)
         return namespace
 
     def __deepcopy__(self, memodict: dict = None):
         return self.copy(self._entity)
 
+    def __reduce__(self):
+        """ Pickle support, entities are loaded by worker processes. """
+        state = self.all_existing_dxf_attribs()
+        state['_entity'] = self._entity
+        return _new_namespace, (self._entity.__class__,), state
+
+    def __setstate__(self, state: dict) -> None:
+        # bypass __setattr__()
+        object.__setattr__(self, '_flags', 0)
+        object.__setattr__(self, '_entity', state.pop('_entity'))
+        for k, v in state.items():
+            self._store(k, v)
+
+    def _store(self, key: str, value: Any) -> None:
+        # bypass __setattr__()
+        _setattr(self, key, value)
+        _setattr(self, '_flags', self._flags | self._FLAGS[key])
+
     def reset_handles(self):
         """ Reset handle and owner to None. """
-        self.__dict__['handle'] = None
-        self.__dict__['owner'] = None
+        # bypass __setattr__()
+        _setattr(self, 'handle', None)
+        _setattr(self, 'owner', None)
+        _setattr(self, '_flags', self._flags | self._FLAGS['handle'] | self._FLAGS['owner'])
 
     def rewire(self, entity: 'DXFEntity', handle: str = None, owner: str = None) -> None:
         """
@@ -102,57 +165,84 @@ class DXFNamespace:
 
         """
         # bypass __setattr__()
-        self.__dict__['_entity'] = entity
+        object.__setattr__(self, '_entity', entity)
         if handle is not None:
-            self.__dict__['handle'] = handle
+            self._store('handle', handle)
         if owner is not None:
-            self.__dict__['owner'] = owner
+            self._store('owner', owner)
 
     def __getattr__(self, key: str) -> Any:
         """ called if key does not exist, returns default value or None for unset default values
         """
+        try:
+            return self._DEFAULTS[key]  # returns None for attributes without default value
+        except KeyError:
+            pass
+        if key == '_entity':  # not bound to an entity
+            raise AttributeError(key)
         attrib_def = self.dxfattribs.get(key, None)  # type: DXFAttr
-        if attrib_def:
-            if attrib_def.xtype == XType.callback:
-                return attrib_def.get_callback_value(self._entity)
-            else:
-                return attrib_def.default  # returns None for attributes without default value
+        if attrib_def and attrib_def.xtype == XType.callback:
+            return attrib_def.get_callback_value(self._entity)
         else:
             raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype))
 
     def __setattr__(self, key: str, value: Any) -> None:
-        attrib_def = self.dxfattribs.get(key, None)  # type: DXFAttr
-        if attrib_def:
-            if attrib_def.xtype == XType.callback:
+        cast = self._CASTS.get(key)
+        if cast is not None:
+            # bypass __setattr__()
+            _setattr(self, key, None if value is None else cast(value))
+            _setattr(self, '_flags', self._flags | self._FLAGS[key])
+        else:
+            attrib_def = self._DXFATTRIBS.get(key, None)  # type: DXFAttr
+            if attrib_def and attrib_def.xtype == XType.callback:
                 attrib_def.set_callback_value(self._entity, value)
             else:
-                self.__dict__[key] = cast_value(attrib_def.code, value)
-        else:
-            raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype))
+                raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype))
 
-        if key in SETTER_EVENTS:
-            handler = getattr(self._entity, SETTER_EVENTS[key], None)
-            if handler:
-                handler(value)
+        if key in self._TRACKED:
+            self._changed(key)
+            if key in SETTER_EVENTS:
+                handler = getattr(self._entity, SETTER_EVENTS[key], None)
+                if handler:
+                    handler(value)
+
+    def _changed(self, key: str) -> None:
+        """
+        Invalidates the cached bounding box of the entity after changing geometry attribute `key`, the cached audit
+        record after changing audited attribute `key` and updates the secondary index `key` of the entity database,
+        see :meth:`EntityDB.reindex`.
+
+        """
+        entity = self._entity
+        if entity is None:
+            return
+        if key in self._GEOMETRY and entity._box is not None:
+            entity._box = None
+        if key in AUDITED_ATTRIBS and entity._audit_record is not None:
+            entity._audit_record = None
+        if key in INDEXED_ATTRIBS:
+            doc = entity.doc
+            if doc is not None:
+                doc.entitydb.reindex(entity, key)
 
     def __delattr__(self, key: str) -> None:
         if self.hasattr(key):
-            del self.__dict__[key]
+            self.discard(key)
         else:
             raise DXFAttributeError(ERR_DXF_ATTRIB_NOT_EXITS.format(key))
 
     def get(self, key: str, default: Any = None) -> Any:
         """ Returns given `default` value not DXF default value for unset attributes. """
-        # callback values should not exist as attribute in __dict__
-        if self.hasattr(key):
-            # do not return the DXF default value
-            return self.__dict__[key]
+        # callback values are not stored in the namespace
+        flag = self._FLAGS.get(key)
+        if flag is not None:
+            if self._flags & flag:
+                # do not return the DXF default value
+                return object.__getattribute__(self, key)
+            return default  # return give default
         attrib_def = self.dxfattribs.get(key, None)  # type: DXFAttr
-        if attrib_def:
-            if attrib_def.xtype == XType.callback:
-                return attrib_def.get_callback_value(self._entity)
-            else:
-                return default  # return give default
+        if attrib_def and attrib_def.xtype == XType.callback:
+            return attrib_def.get_callback_value(self._entity)
         else:
             raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype))
 
@@ -163,18 +253,21 @@ class DXFNamespace:
         Contains only DXF attributes, which are accessible by DXFNamespace.
 
         """
-        attribs = dict(self.__dict__)
-        del attribs['_entity']
-        return attribs
+        flags = self._flags
+        return {
+            key: object.__getattribute__(self, key) for key, flag in self._FLAGS.items() if flags & flag
+        }
 
     def set(self, key: str, value: Any) -> None:
         self.__setattr__(key, value)
 
     def discard(self, key: str) -> None:
-        try:
-            del self.__dict__[key]
-        except KeyError:
-            pass
+        flag = self._FLAGS.get(key, 0)
+        if self._flags & flag:
+            object.__delattr__(self, key)
+            object.__setattr__(self, '_flags', self._flags & ~flag)
+            if key in self._TRACKED:
+                self._changed(key)
 
     def is_supported(self, key: str) -> bool:
         """
@@ -194,7 +287,7 @@ class DXFNamespace:
         Does no check if attribute `key` is supported, but implicit supported if exists.
 
         """
-        return key in self.__dict__
+        return bool(self._flags & self._FLAGS.get(key, 0))
 
     @property
     def dxftype(self):
@@ -228,11 +321,50 @@ class DXFNamespace:
             attribs: DXF attribute name as string or an iterable of names
 
         """
-        if isinstance(attribs, str):
-            self._export_dxf_attribute_optional(tagwriter, attribs)
-        else:
-            for name in attribs:
+        names = (attribs, ) if isinstance(attribs, str) else tuple(attribs)
+        plan = export_plan(self.__class__, tagwriter.dxfversion, names)
+        if plan is None:  # contains invalid DXF attributes, raises DXFAttributeError at the first invalid attribute
+            for name in names:
                 self._export_dxf_attribute_optional(tagwriter, name)
+            return
+
+        flags = self._flags
+        not_force_optional = not tagwriter.force_optional
+        tags = []
+        for name, code, flag, attrib, optional, default, kind in plan:
+            if flag is None:  # callback attribute
+                value = attrib.get_callback_value(self._entity)
+            elif flags & flag:
+                value = _getattr(self, name)
+            else:
+                value = None
+            if value is None:
+                if optional:
+                    continue
+                value = default  # force default value e.g. layer, default value could be None
+                if value is None:
+                    continue  # do not export None
+            # check optional value == default value
+            elif optional and not_force_optional and default is not None and (default == value):
+                continue  # do not write explicit optional attribs if equal to default value
+            if kind == EXPORT_POINT2D and len(value) > 2:
+                value = value[:2]  # just use x, y for 2d points if value is a 3d point (Vector, tuple)
+            tags.append((code, kind, value))
+
+        if tagwriter.__class__ is TagWriter:  # write preformatted DXF strings in one batch
+            strings = []
+            for code, kind, value in tags:
+                if kind == EXPORT_VALUE:
+                    strings.append(TAG_STRING_FORMAT % (code, TYPE_TABLE.get(code, str)(value)))
+                elif kind == EXPORT_BINARY:
+                    strings.append(dxftag(code, value).dxfstr())
+                else:  # points
+                    for index, component in enumerate(value):
+                        strings.append(TAG_STRING_FORMAT % (code + index * 10, float(component)))
+            tagwriter.write_str(''.join(strings))
+        else:
+            for code, kind, value in tags:
+                tagwriter.write_tag(dxftag(code, value))
 
     def _export_dxf_attribute_optional(self, tagwriter: 'TagWriter', name: str) -> None:
         """
@@ -267,6 +399,96 @@ class DXFNamespace:
             raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(name, self.dxftype))
 
 
+EXPORT_VALUE = 0
+EXPORT_POINT = 1
+EXPORT_POINT2D = 2
+EXPORT_BINARY = 3
+ExportPlan = List[Tuple[str, int, Optional[int], DXFAttr, bool, Any, int]]
+_EXPORT_PLANS = dict()  # type: Dict[Tuple[Type[DXFNamespace], str, Tuple[str, ...]], Optional[ExportPlan]]
+
+
+def export_plan(namespace: Type[DXFNamespace], dxfversion: str, names: Tuple[str, ...]) -> Optional[ExportPlan]:
+    """
+    Returns the cached export plan for DXF attributes `names` of `namespace` class and DXF version `dxfversion`, as
+    list of (name, code, flag, DXFAttr, optional, default, kind) tuples, attributes not supported by `dxfversion` are
+    removed, `flag` is ``None`` for callback attributes. Returns ``None`` if `names` contains invalid DXF attributes.
+    (internal API)
+
+    """
+    key = (namespace, dxfversion, names)
+    try:
+        return _EXPORT_PLANS[key]
+    except KeyError:
+        pass
+
+    plan = []
+    dxfattribs = namespace._DXFATTRIBS
+    for name in names:
+        attrib = dxfattribs.get(name, None)  # type: DXFAttr
+        if attrib is None:
+            plan = None
+            break
+        if dxfversion < attrib.dxfversion:
+            continue
+        code = attrib.code
+        if code in BINARAY_DATA:
+            kind = EXPORT_BINARY
+        elif code in POINT_CODES:
+            kind = EXPORT_POINT2D if attrib.xtype == XType.point2d else EXPORT_POINT
+        else:
+            kind = EXPORT_VALUE
+        flag = None if attrib.xtype == XType.callback else namespace._FLAGS[name]
+        plan.append((name, code, flag, attrib, attrib.optional, attrib.default, kind))
+    _EXPORT_PLANS[key] = plan
+    return plan
+
+
+_NAMESPACE_CLASSES = dict()  # type: Dict[DXFAttributes, Type[DXFNamespace]]
+
+
+def namespace_class(entity_class: Type['DXFEntity']) -> Type[DXFNamespace]:
+    """
+    Returns the namespace class for `entity_class`, which stores the DXF attributes defined by
+    :attr:`DXFEntity.DXFATTRIBS` in slots, callback attributes are not stored. Namespace classes are generated at the
+    first request and shared by all entity classes with the same DXF attribute definitions. (internal API)
+
+    """
+    dxfattribs = entity_class.DXFATTRIBS
+    try:
+        return _NAMESPACE_CLASSES[dxfattribs]
+    except KeyError:
+        pass
+    # handle and owner are always stored, CLASS has no handle and no owner
+    names = ['handle', 'owner']
+    defaults = dict()
+    casts = dict()
+    for name, attrib in dxfattribs.items():
+        if attrib.xtype == XType.callback:
+            continue
+        if name not in names:
+            names.append(name)
+        defaults[name] = attrib.default
+        casts[name] = Vector if attrib.code in POINT_CODES else TYPE_TABLE.get(attrib.code, str)
+    geometry = frozenset(name for name, _ in dxfattribs.items() if name not in NON_GEOMETRY_ATTRIBS)
+    cls = type(entity_class.__name__ + 'Namespace', (DXFNamespace,), {
+        '__slots__': tuple(names),
+        '__module__': __name__,
+        '_FLAGS': {name: 1 << index for index, name in enumerate(names)},
+        '_DEFAULTS': defaults,
+        '_CASTS': casts,
+        '_DXFATTRIBS': dxfattribs,
+        '_GEOMETRY': geometry,
+        '_TRACKED': geometry.union(SETTER_EVENTS, INDEXED_ATTRIBS, AUDITED_ATTRIBS),
+    })
+    _NAMESPACE_CLASSES[dxfattribs] = cls
+    return cls
+
+
+def _new_namespace(entity_class: Type['DXFEntity']) -> DXFNamespace:
+    """ Unpickle helper, namespace classes are not importable. (internal API) """
+    return object.__new__(namespace_class(entity_class))
+
+
 class SubclassProcessor:
     """  Helper class for loading tags into entities. (internal class) """
     def __init__(self, tags: ExtendedTags, dxfversion=None):
@@ -350,38 +572,66 @@ class SubclassProcessor:
 
         """
 
-        def replace_attrib(code):
-            for index, dxfattr in enumerate(doublets):
-                if dxfattr.code == code:
-                    group_codes[code] = dxfattr
-                    del doublets[index]
-                    return
-            # remove group code if no more doublets are available
-            del group_codes[code]
-
         unprocessed_tags = Tags()
-        # do not cache group codes, content of group code will be deleted while processing
-        group_codes = dict()
-        doublets = []
-        for dxfattr in subclass_definition.attribs.values():
-            if dxfattr.code in group_codes:
-                doublets.append(dxfattr)
-            else:
-                group_codes[dxfattr.code] = dxfattr
-
+        group_codes = subclass_loader(subclass_definition)
+        flags = dxf._FLAGS
+        stored = dxf._flags
+        used = dict()  # count of processed tags by group code, some group codes are used by more than one attribute
         # iterate without leading subclass marker or for r12 without leading (0, ...) structure tag
         for tag in tags:
-            code, value = tag
-            if code in group_codes:
-                attrib = group_codes[code]  # type: DXFAttr
-                if (attrib.xtype != XType.callback) or (attrib.setter is not None):
-                    dxf.set(attrib.name, value)
-                replace_attrib(code)
-            else:
-                unprocessed_tags.append(tag)
+            code = tag.code
+            attribs = group_codes.get(code)
+            if attribs is not None:
+                index = used.get(code, 0)
+                if index < len(attribs):
+                    used[code] = index + 1
+                    name, cast, attrib = attribs[index]
+                    if cast is not None and name in flags:
+                        # direct assignment, no setter events while loading
+                        _setattr(dxf, name, cast(tag.value))
+                        stored |= flags[name]
+                    elif cast is not None or attrib.setter is not None:
+                        _setattr(dxf, '_flags', stored)
+                        dxf.set(name, tag.value)
+                        stored = dxf._flags
+                    continue
+            unprocessed_tags.append(tag)
+        _setattr(dxf, '_flags', stored)
         return unprocessed_tags
 
 
+_LOADERS = dict()  # type: Dict[int, Tuple[DefSubclass, Dict[int, List[Tuple[str, Optional[Callable], DXFAttr]]]]]
+
+
+def subclass_loader(subclass_definition: DefSubclass) -> Dict[int, List[Tuple[str, Optional[Callable], DXFAttr]]]:
+    """
+    Returns the precompiled DXF attribute loader for `subclass_definition` as dict of group codes, each group code
+    has a list of (name, cast, DXFAttr) tuples in definition order, `cast` is ``None`` for callback attributes.
+    Loaders are compiled at the first request and for registered entity classes at registration. (internal API)
+
+    """
+    try:
+        definition, group_codes = _LOADERS[id(subclass_definition)]
+    except KeyError:
+        pass
+    else:
+        if definition is subclass_definition:
+            return group_codes
+
+    group_codes = dict()
+    for name, attrib in subclass_definition.attribs.items():
+        if attrib.xtype == XType.callback:
+            cast = None
+        elif attrib.code in POINT_CODES:
+            cast = Vector
+        else:
+            cast = TYPE_TABLE.get(attrib.code, str)
+        group_codes.setdefault(attrib.code, []).append((name, cast, attrib))
+    # store definition to grant valid id() keys
+    _LOADERS[id(subclass_definition)] = (subclass_definition, group_codes)
+    return group_codes
+
+
 base_class = DefSubclass(None, {
     'handle': DXFAttr(5),
     # owner: Soft-pointer ID/handle to owner BLOCK_RECORD object
@@ -413,6 +663,13 @@ class DXFEntity:
     # 'protected' members from cloning, which may cause other problems.
     EXCLUDE_FROM_CLONING = {'doc'}
 
+    # cached WCS bounding box of graphical entities, see ezdxf.spatialindex.entities_box(), reset by changing a
+    # geometry DXF attribute, see NON_GEOMETRY_ATTRIBS
+    _box = None  # type: Optional[Tuple[float, float, float, float, float, float]]
+    # cached audit record of graphical entities, see ezdxf.audit.auditor.Auditor, reset by changing an audited DXF
+    # attribute, see AUDITED_ATTRIBS
+    _audit_record = None  # type: Optional[tuple]
+
     def __init__(self, doc: 'Drawing' = None):
         """ Default constructor. (internal API)"""
         # public attributes for package users
@@ -453,6 +710,66 @@ class DXFEntity:
         entity.load_tags(tags)
         return entity
 
+    @classmethod
+    def load_lazy(cls: Type[T], record: str, doc: 'Drawing') -> T:
+        """
+        Constructor for lazy loading, stores just the raw tags as compact DXF string `record`, decoding is delayed
+        until the first access of an entity attribute like :attr:`dxf`. Structure validation is also done at decoding.
+        The returned entity is an instance of a :class:`LazyEntity` subclass of `cls`, which becomes a `cls` instance
+        at decoding.
+
+        Args:
+            record: DXF tags as DXF string, requires handle and owner tag
+            doc: DXF Document
+
+        (internal API)
+        """
+        entity = lazy_class(cls).__new__(lazy_class(cls))  # without any setup
+        entity.doc = doc
+        entity._lazy_record = record
+        return entity
+
+    @property
+    def is_lazy(self) -> bool:
+        """ Returns ``True`` if entity is lazy loaded and not decoded yet. (internal API) """
+        return False  # not decoded lazy loaded entities are LazyEntity instances
+
+    def lazy_owner(self) -> Tuple[Optional[str], int]:
+        """
+        Returns the owner handle and the paperspace flag of a not decoded lazy loaded entity, without decoding the
+        entity. (internal API)
+        """
+        owner, paperspace, layer = self.lazy_common_attribs()
+        return owner, paperspace
+
+    def lazy_common_attribs(self) -> Tuple[Optional[str], int, Optional[str]]:
+        """
+        Returns the owner handle, the paperspace flag and the layer name of a not decoded lazy loaded entity, without
+        decoding the entity. (internal API)
+        """
+        owner = None
+        paperspace = 0
+        layer = None
+        appdata = False
+        subclass = 0
+        lines = self._lazy_record.split('\n')
+        for index in range(0, len(lines) - 1, 2):
+            code = int(lines[index])
+            if code == 100:
+                subclass += 1
+                if subclass > 1:  # paperspace flag and layer are located in subclass AcDbEntity
+                    break
+            elif subclass:
+                if code == 67:
+                    paperspace = int(lines[index + 1])
+                elif code == 8:
+                    layer = lines[index + 1]
+            elif code == 102:  # skip handles of AppData and Reactors
+                appdata = lines[index + 1].startswith('{')
+            elif code == OWNER_CODE and not appdata:
+                owner = lines[index + 1]
+        return owner, paperspace, layer
+
     @classmethod
     def from_text(cls: Type[T], text: str, doc: 'Drawing' = None) -> T:
         """ Load constructor from text for testing. (internal API)"""
@@ -469,7 +786,8 @@ class DXFEntity:
         entity.xdata = other.xdata
         entity.embedded_objects = other.embedded_objects
         entity.dxf.rewire(entity)
-        entity.doc.entitydb[entity.dxf.handle] = entity  # replace entity in entity db, can't call add() here
+        if entity.doc:  # entities loaded without a DXF document, e.g. by iterdxf()
+            entity.doc.entitydb[entity.dxf.handle] = entity  # replace entity in entity db, can't call add() here
         return entity
 
     def copy(self: T) -> T:
@@ -559,6 +877,81 @@ class DXFEntity:
         entity.post_new_hook()
         return entity
 
+    @classmethod
+    def new_entities(cls: Type[T], handles: Sequence[str], dxfattribs: dict = None,
+                     columns: Dict[str, Sequence] = None, doc: 'Drawing' = None) -> List[T]:
+        """
+        Constructor for building many new entities at once by ezdxf (trusted environment), creates one entity for each
+        handle in `handles`.
+
+        The shared `dxfattribs` are casted and validated once by building a prototype entity by :meth:`new`, their
+        values are copied into the DXF namespace of each new entity without setter events. The `columns` are a ``dict``
+        of DXF attribute names and sequences of values with one value for each new entity, ``None`` values leave the
+        attribute unset. :meth:`post_new_hook` is only called for each entity if required.
+
+        Args:
+            handles: unique DXF entity handles
+            dxfattribs: DXF attributes shared by all entities
+            columns: DXF attributes with an individual value for each entity
+            doc: DXF document
+
+        Returns: list of new entities, does not return the prototype
+
+        (internal API)
+
+        .. versionadded:: 0.11
+
+        """
+        count = len(handles)
+        columns = columns or {}
+        prototype = cls.new(handle=None, owner=None, dxfattribs=dxfattribs, doc=doc)
+        namespace = prototype.dxf
+        shared = namespace.all_existing_dxf_attribs()
+        shared.pop('handle', None)
+        shared_items = list(shared.items())
+        shared_flags = namespace._flags | namespace._FLAGS['handle']
+
+        names = []
+        flags = []
+        values = []
+        for name, column in columns.items():
+            attrib = cls.DXFATTRIBS.get(name)
+            if attrib is None or attrib.xtype == XType.callback:
+                raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(name, cls.DXFTYPE))
+            if hasattr(column, 'tolist'):  # NumPy array or array.array
+                column = column.tolist()
+            code = attrib.code
+            cast = Vector if code in POINT_CODES else TYPE_TABLE.get(code, str)
+            if any(value is None for value in column):
+                column = [None if value is None else cast(value) for value in column]
+            else:
+                column = list(map(cast, column))
+            if len(column) != count:
+                raise DXFValueError('Column "{}" requires {} values.'.format(name, count))
+            names.append(name)
+            flags.append(namespace._FLAGS[name])
+            values.append(column)
+        hook_required = cls.post_new_hook_required(names)
+
+        entities = []
+        rows = zip(*values) if values else repeat((), count)
+        for handle, row in zip(handles, rows):
+            entity = cls(doc)
+            namespace = entity.dxf
+            for key, value in shared_items:
+                _setattr(namespace, key, value)
+            _setattr(namespace, 'handle', handle)
+            entity_flags = shared_flags
+            for name, flag, value in zip(names, flags, row):
+                if value is not None:
+                    _setattr(namespace, name, value)
+                    entity_flags |= flag
+            _setattr(namespace, '_flags', entity_flags)
+            if hook_required:
+                entity.post_new_hook()
+            entities.append(entity)
+        return entities
+
     def update_dxf_attribs(self, dxfattribs: dict) -> None:
         """ Set DXF attributes by a ``dict`` like :code:`{'layer': 'test', 'color': 4}`. """
         for key, value in dxfattribs.items():
@@ -568,6 +961,13 @@ class DXFEntity:
         """ Post processing and integrity validation after entity creation (internal API) """
         pass
 
+    @classmethod
+    def post_new_hook_required(cls, names: Iterable[str]) -> bool:
+        """ Returns ``True`` if :meth:`new_entities` has to call :meth:`post_new_hook` for each new entity with
+        individual values for the DXF attributes `names`. (internal API)
+        """
+        return cls.post_new_hook is not DXFEntity.post_new_hook
+
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> DXFNamespace:
         # inheritance hook (internal API)
         return DXFNamespace(processor, self)
@@ -699,7 +1099,7 @@ class DXFEntity:
     @property
     def is_alive(self):
         """ Returns ``False`` if entity has been deleted. """
-        return hasattr(self, 'dxf')
+        return self.is_lazy or hasattr(self, 'dxf')
 
     def destroy(self) -> None:
         """
@@ -741,6 +1141,10 @@ class DXFEntity:
         """
         if tagwriter.dxfversion < self.MIN_DXF_VERSION_FOR_EXPORT:
             return
+        if self.is_lazy and tagwriter.dxfversion == self.doc._loaded_dxfversion:
+            # untouched lazy loaded entity, export tags as loaded
+            tagwriter.write_str(self._lazy_record)
+            return
         if not self.preprocess_export(tagwriter):
             return
         # ! first step !
@@ -1007,8 +1411,63 @@ class DXFEntity:
             self.reactors.discard(handle)
 
 
+class LazyEntity(DXFEntity):
+    """
+    Base class of lazy loaded entities, the :meth:`__getattr__` hook decodes the stored raw tags at the first access of
+    a not existing attribute and turns the entity into an instance of the real entity class. Not lazy loaded entities
+    do not pay for the hook. (internal class)
+
+    """
+    # the real entity class, set by lazy_class()
+    ENTITY_CLASS = DXFEntity  # type: Type[DXFEntity]
+
+    @property
+    def is_lazy(self) -> bool:
+        """ Returns ``True`` until the entity is decoded and turned into an instance of the real entity class. """
+        return True
+
+    def __getattr__(self, key: str) -> Any:
+        """ Called only for not existing attributes, decodes lazy loaded entities at first access. (internal API) """
+        record = self.__dict__.pop('_lazy_record', None)
+        if record is None:
+            raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, key))
+        tags = Tags.from_text(record)
+        if options.check_entity_tag_structures:
+            tags = Tags(entity_structure_validator(tags))
+        self.__class__ = self.ENTITY_CLASS
+        self.__init__(self.doc)
+        self.load_tags(ExtendedTags(tags))
+        return getattr(self, key)
+
+
+_LAZY_CLASSES = dict()  # type: Dict[Type[DXFEntity], Type[LazyEntity]]
+
+
+def lazy_class(entity_class: Type[DXFEntity]) -> Type[LazyEntity]:
+    """
+    Returns the lazy loading subclass of `entity_class`, generated at the first request. (internal API)
+    """
+    try:
+        return _LAZY_CLASSES[entity_class]
+    except KeyError:
+        pass
+    cls = type('Lazy' + entity_class.__name__, (LazyEntity, entity_class), {
+        '__module__': entity_class.__module__,
+        'ENTITY_CLASS': entity_class,
+    })
+    _LAZY_CLASSES[entity_class] = cls
+    return cls
+
+
+# paperspace flag of unknown graphic entities, required to assign entities to layouts
+tag_storage_class = DefSubclass(None, {
+    'paperspace': DXFAttr(67, default=0),
+})
+
+
 class DXFTagStorage(DXFEntity):
     """ Just store all the tags as they are. (internal class) """
+    DXFATTRIBS = DXFAttributes(base_class, tag_storage_class)
 
     def __init__(self, doc: 'Drawing' = None):
         """ Default constructor """
@@ -1036,10 +1495,10 @@ class DXFTagStorage(DXFEntity):
         self.DXFTYPE = self.base_class[0].value
         try:
             acdb_entity = tags.get_subclass('AcDbEntity')
-            self.dxf.__dict__['paperspace'] = acdb_entity.get_first_value(67, 0)
+            self.dxf.paperspace = acdb_entity.get_first_value(67, 0)
         except DXFKeyError:
             # just fake it
-            self.dxf.__dict__['paperspace'] = 0
+            self.dxf.paperspace = 0
 
     def export_entity(self, tagwriter: 'TagWriter') -> None:
         """ Write subclass tags as they are
@@ -7,16 +7,18 @@ from typing import TYPE_CHECKING, Optional, Tuple, Iterable, Callable
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.lldxf.const import DXF12, DXF2000, DXF2004, DXF2007, DXFValueError, DXFKeyError, DXFTableEntryError
 from ezdxf.lldxf.const import SUBCLASS_MARKER, DXFInvalidLayerName, DXFInvalidLineType
-from ezdxf.lldxf.const import DXFStructureError
+from ezdxf.lldxf.const import DXFStructureError, DXFTypeError
 from ezdxf.lldxf.validator import is_valid_layer_name
 from .dxfentity import DXFEntity, base_class, SubclassProcessor
-from ezdxf.math import OCS
+from ezdxf.math import OCS, Matrix44, Vector, Z_AXIS, BoundingBox
+from ezdxf.math.transformtools import transform_extrusion
 from ezdxf.tools.rgb import int2rgb, rgb2int
 from ezdxf.tools import float2transparency, transparency2float
 from .factory import register_entity
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Auditor, TagWriter, BaseLayout, DXFNamespace
+    from ezdxf.math.transformtools import OCSTransform
 
 __all__ = ['DXFGraphic', 'acdb_entity', 'entity_linker', 'SeqEnd']
 
@@ -74,6 +76,7 @@ class DXFGraphic(DXFEntity):
     DXFTYPE = 'DXFGFX'
     DEFAULT_ATTRIBS = {'layer': '0'}
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity)  # DXF attribute definitions
+    SUPPORTS_TRANSFORM = False  # True if the entity type supports transform()
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         """ Adds subclass processing for 'AcDbEntity', requires previous base class processing by parent class.
@@ -98,6 +101,16 @@ class DXFGraphic(DXFEntity):
             if ns.linetype not in self.doc.linetypes:
                 raise DXFInvalidLineType('Linetype "{}" not defined.'.format(ns.linetype))
 
+    @classmethod
+    def post_new_hook_required(cls, names: Iterable[str]) -> bool:
+        """ Returns ``True`` if :meth:`new_entities` has to call :meth:`post_new_hook` for each new entity with
+        individual values for the DXF attributes `names`. (internal API)
+        """
+        # post_new_hook() of DXFGraphic validates just the layer name and the linetype
+        if cls.post_new_hook is not DXFGraphic.post_new_hook:
+            return True
+        return any(name in ('layer', 'linetype') for name in names)
+
     @property
     def rgb(self) -> Optional[Tuple[int, int, int]]:
         """ Returns RGB true color as (r, g, b) tuple or None if true_color is not set. """
@@ -137,6 +150,68 @@ class DXFGraphic(DXFEntity):
         else:
             return None
 
+    def transform(self, m: Matrix44) -> 'DXFGraphic':
+        """
+        Transform entity by transformation matrix `m` inplace, returns `self`. Entity types which support this
+        transformation have the class attribute :attr:`SUPPORTS_TRANSFORM` set to ``True``.
+
+        Raises:
+            DXFTypeError: transformation not supported by this entity type
+            NonUniformScalingError: non uniform scaling not supported by this entity type
+
+        .. versionadded:: 0.11
+
+        """
+        raise DXFTypeError('Transformation of {} entity not supported.'.format(self.dxftype()))
+
+    def translate(self, dx: float, dy: float, dz: float) -> 'DXFGraphic':
+        """
+        Translate entity by vector ``(dx, dy, dz)`` inplace, returns `self`.
+
+        .. versionadded:: 0.11
+
+        """
+        return self.transform(Matrix44.translate(dx, dy, dz))
+
+    def bbox(self) -> Optional[BoundingBox]:
+        """
+        Returns the bounding box of the entity in :ref:`WCS` as :class:`~ezdxf.math.BoundingBox` object or ``None`` for
+        entities without extents like XLINE and RAY, for the accuracy of the bounding box see
+        :func:`ezdxf.spatialindex.entity_box`.
+
+        .. versionadded:: 0.11
+
+        """
+        from ezdxf.spatialindex import entity_box
+        box = entity_box(self)
+        if box is None:
+            return None
+        return BoundingBox([box[:3], box[3:]])
+
+    def _ocs_translation(self, dx: float, dy: float, dz: float) -> Vector:
+        """ Returns the WCS translation vector ``(dx, dy, dz)`` as OCS vector. (internal API) """
+        extrusion = self.dxf.get('extrusion')
+        if extrusion is None:
+            return Vector(dx, dy, dz)
+        return Vector(OCS(extrusion).from_wcs((dx, dy, dz)))
+
+    def _transform_extrusion(self, m: Matrix44) -> None:
+        """ Transform extrusion vector and thickness of WCS entities like LINE or POINT. (internal API) """
+        dxf = self.dxf
+        extrusion, scale = transform_extrusion(dxf.get('extrusion', Z_AXIS), m)
+        if dxf.hasattr('extrusion') or not extrusion.isclose(Z_AXIS):
+            dxf.extrusion = extrusion
+        if dxf.hasattr('thickness'):
+            dxf.thickness = dxf.thickness * scale
+
+    def _transform_ocs_extrusion(self, ocs: 'OCSTransform') -> None:
+        """ Set extrusion vector and thickness of OCS entities like CIRCLE or TEXT. (internal API) """
+        dxf = self.dxf
+        if dxf.hasattr('thickness'):
+            dxf.thickness = ocs.transform_thickness(dxf.thickness)
+        if dxf.hasattr('extrusion') or not ocs.new_extrusion.isclose(Z_AXIS):
+            dxf.extrusion = ocs.new_extrusion
+
     def set_owner(self, owner: str, paperspace: int = 0) -> None:
         """ Set owner attribute and paperspace flag. (internal API)"""
         self.dxf.owner = owner
@@ -3,18 +3,20 @@
 # Created 2019-02-15
 from typing import TYPE_CHECKING
 import math
-from ezdxf.math import Vector
+from ezdxf.math import Vector, Z_AXIS
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import SUBCLASS_MARKER, DXF2000
+from ezdxf.math.transformtools import conjugated_to_axis
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DXFNamespace
+    from ezdxf.eztypes import TagWriter, DXFNamespace, Matrix44
 
 __all__ = ['Ellipse']
 
+TAU = math.pi * 2
 
 acdb_ellipse = DefSubclass('AcDbEllipse', {
     'center': DXFAttr(10, xtype=XType.point3d, default=Vector(0, 0, 0)),
@@ -32,6 +34,7 @@ class Ellipse(DXFGraphic):
     DXFTYPE = 'ELLIPSE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_ellipse)
     MIN_DXF_VERSION_FOR_EXPORT = DXF2000
+    SUPPORTS_TRANSFORM = True
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         dxf = super().load_dxf_attribs(processor)
@@ -50,3 +53,39 @@ class Ellipse(DXFGraphic):
         self.dxf.export_dxf_attribs(tagwriter, [
             'center', 'major_axis', 'extrusion', 'ratio', 'start_param', 'end_param',
         ])
+
+    def transform(self, m: 'Matrix44') -> 'Ellipse':
+        """ Transform ELLIPSE entity by transformation matrix `m` inplace, supports also non uniform scaling.
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        major_axis = Vector(dxf.major_axis)
+        minor_axis = Vector(dxf.extrusion).cross(major_axis).normalize(major_axis.magnitude * dxf.ratio)
+        # transformed axis are conjugated semi-diameters of the new ellipse
+        a = Vector(m.transform_direction(major_axis))
+        b = Vector(m.transform_direction(minor_axis))
+        major_axis, minor_axis, offset = conjugated_to_axis(a, b)
+        dxf.center = Vector(m.transform(dxf.center))
+        dxf.major_axis = major_axis
+        dxf.ratio = min(minor_axis.magnitude / major_axis.magnitude, 1.)
+        extrusion = a.cross(b).normalize()
+        if dxf.hasattr('extrusion') or not extrusion.isclose(Z_AXIS):
+            dxf.extrusion = extrusion
+        start_param = dxf.start_param
+        sweep_param = dxf.end_param - start_param
+        if not math.isclose(sweep_param % TAU, 0., abs_tol=1e-12):  # full ellipse keeps its parameters
+            start_param = (start_param - offset) % TAU
+            dxf.start_param = start_param
+            dxf.end_param = (start_param + sweep_param) % TAU
+        return self
+
+    def translate(self, dx: float, dy: float, dz: float) -> 'Ellipse':
+        """ Optimized ELLIPSE translation about `dx` in x-axis, `dy` in y-axis and `dz` in z-axis.
+
+        .. versionadded:: 0.11
+
+        """
+        self.dxf.center = Vector(dx, dy, dz) + self.dxf.center
+        return self
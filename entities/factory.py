@@ -1,11 +1,11 @@
 # Created: 2019-02-15
 # Copyright (c) 2019, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Union, Dict, Sequence, List
 from ezdxf.tools.handle import ImageKeyGenerator, UnderlayKeyGenerator
 from ezdxf.lldxf.tags import Tags
 from ezdxf.lldxf.extendedtags import ExtendedTags
-from ezdxf.entities.dxfentity import DXFEntity, DXFTagStorage
+from ezdxf.entities.dxfentity import DXFEntity, DXFTagStorage, subclass_loader, namespace_class
 from ezdxf.lldxf.const import DXFInternalEzdxfError
 
 if TYPE_CHECKING:
@@ -21,6 +21,10 @@ def register_entity(cls):
     if name in ENTITY_CLASSES:
         raise DXFInternalEzdxfError('Double registration for DXF type {}.'.format(name))
     ENTITY_CLASSES[name] = cls
+    # precompile DXF attribute loaders and namespace class
+    for subclass in cls.DXFATTRIBS.subclasses():
+        subclass_loader(subclass)
+    namespace_class(cls)
     return cls
 
 
@@ -50,6 +54,34 @@ class EntityFactory:
             entity.seqend = seqend
         return entity
 
+    def create_db_entries(self, type_: str, count: int, dxfattribs: dict = None,
+                          columns: Dict[str, Sequence] = None) -> List['DXFEntity']:
+        """
+        Create `count` new entities of the same type and add them to drawing-database in one step. The `dxfattribs`
+        are shared by all new entities and `columns` contain an individual value for each entity, see
+        :meth:`DXFEntity.new_entities`.
+
+        .. versionadded:: 0.11
+
+        """
+        db = self.doc.entitydb
+        class_ = ENTITY_CLASSES.get(type_, DEFAULT_CLASS)
+        entities = class_.new_entities(db.next_handles(count), dxfattribs, columns, doc=self.doc)
+        self.doc.tracker.dxftypes.add(type_)
+        if not entities:
+            return entities
+        if hasattr(entities[0], 'cast'):
+            entities = [entity.cast() for entity in entities]
+        db.extend(entities)
+        if hasattr(entities[0], 'seqend'):
+            seqends = self.create_db_entries('SEQEND', count, columns={
+                'layer': [entity.dxf.layer for entity in entities],
+                'owner': [entity.dxf.owner for entity in entities],
+            })
+            for entity, seqend in zip(entities, seqends):
+                entity.seqend = seqend
+        return entities
+
     def load(self, tags: Union['ExtendedTags', 'Tags']) -> 'DXFEntity':
         entity = self.entity(tags)
         self.doc.entitydb.add(entity)
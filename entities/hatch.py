@@ -6,19 +6,20 @@ from contextlib import contextmanager
 import math
 import copy
 from ezdxf.math import Vector
+from ezdxf.math.transformtools import OCSTransform, conjugated_to_axis
 from ezdxf.tools.rgb import rgb2int, int2rgb
 from ezdxf.tools.pattern import PATTERN  # acad standard pattern definitions
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.tags import Tags, group_tags
 from ezdxf.lldxf.const import SUBCLASS_MARKER, DXF2000, DXF2004
 from ezdxf.lldxf import const
-from ezdxf.math.bspline import bspline_control_frame
+from ezdxf.math.bspline import bspline_control_frame, BSpline
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DXFNamespace, Drawing, RGB
+    from ezdxf.eztypes import TagWriter, DXFNamespace, Drawing, RGB, Matrix44
 
 __all__ = ['Hatch', 'Gradient', 'Pattern']
 
@@ -143,6 +144,7 @@ class Hatch(DXFGraphic):
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_hatch)
     DEFAULT_ATTRIBS = {'color': 1, 'layer': '0'}
     MIN_DXF_VERSION_FOR_EXPORT = DXF2000
+    SUPPORTS_TRANSFORM = True
 
     def __init__(self, doc: 'Drawing' = None):
         super().__init__(doc)
@@ -305,6 +307,7 @@ class Hatch(DXFGraphic):
     def edit_boundary(self) -> 'BoundaryPaths':
         """ Context manager to edit hatch boundary data, yields a :class:`BoundaryPaths` object. """
         yield self.paths
+        self._box = None
 
     def set_solid_fill(self, color: int = 7, style: int = 1, rgb: 'RGB' = None):
         """
@@ -452,6 +455,34 @@ class Hatch(DXFGraphic):
         """
         self.pattern = Pattern([PatternLine(line[0], line[1], line[2], line[3]) for line in lines])
 
+    def transform(self, m: 'Matrix44') -> 'Hatch':
+        """ Transform HATCH entity by transformation matrix `m` inplace, boundary paths, pattern definition lines,
+        seed points and the gradient direction are transformed.
+
+        Raises:
+            NonUniformScalingError: for non uniform scaling of polyline paths with arc segments (bulges), arc edges
+                are converted to ellipse edges
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        ocs = OCSTransform(dxf.extrusion, m)
+        old_elevation = Vector(dxf.elevation).z
+        self.paths.transform(ocs, old_elevation)
+        self.seeds = [ocs.transform_2d_vertex(seed, old_elevation) for seed in self.seeds]
+        if self.pattern:
+            self.pattern.transform(ocs, old_elevation)
+            dxf.pattern_angle = ocs.transform_deg_angle(dxf.pattern_angle)
+            dxf.pattern_scale = ocs.transform_width(dxf.pattern_scale)
+        if self.gradient:
+            self.gradient.transform(ocs)
+        if dxf.hasattr('mp_offset_vector'):
+            dxf.mp_offset_vector = ocs.transform_direction(dxf.mp_offset_vector)
+        dxf.elevation = Vector(0, 0, ocs.transform_vertex((0, 0, old_elevation)).z)
+        self._transform_ocs_extrusion(ocs)
+        return self
+
     # just for compatibility
     def get_seed_points(self) -> List:
         """
@@ -532,6 +563,13 @@ class BoundaryPaths:
         self.paths.append(new_path)
         return new_path
 
+    def transform(self, ocs: OCSTransform, elevation: float) -> None:
+        """ Transform all boundary paths located at `elevation` by `ocs`. (internal API) """
+        if not ocs.scale_uniform and any(path.PATH_TYPE == 'PolylinePath' and path.has_bulge() for path in self.paths):
+            raise const.NonUniformScalingError('HATCH polyline path with arcs does not support non uniform scaling.')
+        for path in self.paths:
+            path.transform(ocs, elevation)
+
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
         tagwriter.write_tag2(91, len(self.paths))
         for path in self.paths:
@@ -617,6 +655,13 @@ class PolylinePath:
                 return True
         return False
 
+    def transform(self, ocs: OCSTransform, elevation: float) -> None:
+        """ Transform polyline path located at `elevation` by `ocs`, bulges require uniform scaling.
+        (internal API)
+        """
+        transform_2d_vertex = ocs.transform_2d_vertex
+        self.vertices = [transform_2d_vertex((x, y), elevation) + (bulge,) for x, y, bulge in self.vertices]
+
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
         has_bulge = self.has_bulge()
         write_tag = tagwriter.write_tag2
@@ -795,6 +840,16 @@ class EdgePath:
         """ Delete all edges."""
         self.edges = []
 
+    def transform(self, ocs: OCSTransform, elevation: float) -> None:
+        """ Transform all edges located at `elevation` by `ocs`, arc edges are converted to ellipse edges for non
+        uniform scaling. (internal API)
+        """
+        if not ocs.scale_uniform:
+            self.edges = [EllipseEdge.from_arc_edge(edge) if edge.EDGE_TYPE == 'ArcEdge' else edge
+                          for edge in self.edges]
+        for edge in self.edges:
+            edge.transform(ocs, elevation)
+
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
         tagwriter.write_tag2(92, int(self.path_type_flags))
         tagwriter.write_tag2(93, len(self.edges))
@@ -832,6 +887,10 @@ class LineEdge:
         tagwriter.write_tag2(11, float(x))
         tagwriter.write_tag2(21, float(y))
 
+    def transform(self, ocs: OCSTransform, elevation: float) -> None:
+        self.start = ocs.transform_2d_vertex(self.start, elevation)
+        self.end = ocs.transform_2d_vertex(self.end, elevation)
+
 
 class ArcEdge:
     EDGE_TYPE = "ArcEdge"
@@ -870,6 +929,13 @@ class ArcEdge:
         tagwriter.write_tag2(51, self.end_angle)
         tagwriter.write_tag2(73, self.is_counter_clockwise)
 
+    def transform(self, ocs: OCSTransform, elevation: float) -> None:
+        """ Transform arc edge by `ocs`, supports only uniform scaling. """
+        self.center = ocs.transform_2d_vertex(self.center, elevation)
+        self.radius = ocs.transform_length(self.radius)
+        self.start_angle, self.end_angle = transform_angle_range(
+            self.start_angle, self.end_angle, ocs.transform_deg_angle(0.))
+
 
 class EllipseEdge:
     EDGE_TYPE = "EllipseEdge"
@@ -915,6 +981,31 @@ class EllipseEdge:
         tagwriter.write_tag2(51, self.end_angle)
         tagwriter.write_tag2(73, self.is_counter_clockwise)
 
+    @classmethod
+    def from_arc_edge(cls, arc: ArcEdge) -> 'EllipseEdge':
+        """ Returns a new :class:`EllipseEdge` for `arc`. (internal API) """
+        edge = cls()
+        edge.center = arc.center
+        edge.major_axis = (arc.radius, 0.)
+        edge.start_angle = arc.start_angle
+        edge.end_angle = arc.end_angle
+        edge.is_counter_clockwise = arc.is_counter_clockwise
+        return edge
+
+    def transform(self, ocs: OCSTransform, elevation: float) -> None:
+        """ Transform ellipse edge by `ocs`, supports also non uniform scaling. """
+        mx, my, *_ = self.major_axis
+        major_axis = Vector(mx, my)
+        minor_axis = Vector(-my, mx) * self.ratio
+        # transformed axis are conjugated semi-diameters of the new ellipse
+        major_axis, minor_axis, offset = conjugated_to_axis(
+            ocs.transform_direction(major_axis), ocs.transform_direction(minor_axis))
+        self.center = ocs.transform_2d_vertex(self.center, elevation)
+        self.major_axis = (major_axis.x, major_axis.y)
+        self.ratio = min(minor_axis.magnitude / major_axis.magnitude, 1.)
+        self.start_angle, self.end_angle = transform_angle_range(
+            self.start_angle, self.end_angle, -math.degrees(offset))
+
 
 class SplineEdge:
     EDGE_TYPE = "SplineEdge"
@@ -956,6 +1047,35 @@ class SplineEdge:
                 edge.end_tangent = value
         return edge
 
+    def construction_tool(self) -> BSpline:
+        """ Returns the B-spline curve of the edge as :class:`~ezdxf.math.BSpline` object in :ref:`OCS`, defined by
+        the control points, knots and weights or by the fit points if no control points exist.
+
+        Raises:
+            DXFValueError: invalid or incomplete spline definition
+
+        .. versionadded:: 0.11
+
+        """
+        order = self.degree + 1
+        count = len(self.control_points)
+        if count:
+            knots = self.knot_values if len(self.knot_values) == count + order else None
+            weights = self.weights if len(self.weights) == count else None
+            return BSpline(self.control_points, order=order, knots=knots, weights=weights)
+        if len(self.fit_points) < order:
+            raise const.DXFValueError('SplineEdge requires at least {} control points or fit points.'.format(order))
+        return bspline_control_frame(self.fit_points, degree=self.degree)
+
+    def approximate(self, segments: int = 40) -> List[Vector]:
+        """ Approximates the B-spline curve of the edge by line segments, returns `segments` + 1 vertices in
+        :ref:`OCS` as :class:`~ezdxf.math.Vector` objects, see :meth:`construction_tool`.
+
+        .. versionadded:: 0.11
+
+        """
+        return self.construction_tool().approximate(segments)
+
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
         write_tag = tagwriter.write_tag2
         write_tag(72, 4)  # edge type
@@ -1000,11 +1120,32 @@ class SplineEdge:
             tagwriter.write_tag2(13, float(x))
             tagwriter.write_tag2(23, float(y))
 
+    def transform(self, ocs: OCSTransform, elevation: float) -> None:
+        """ Transform spline edge by `ocs`, supports also non uniform scaling. """
+        transform_2d_vertex = ocs.transform_2d_vertex
+        self.control_points = [transform_2d_vertex(point, elevation) for point in self.control_points]
+        self.fit_points = [transform_2d_vertex(point, elevation) for point in self.fit_points]
+        for name in ('start_tangent', 'end_tangent'):
+            tangent = getattr(self, name)
+            if tangent is not None:
+                setattr(self, name, ocs.transform_2d_direction(tangent))
+
 
 EDGE_CLASSES = [None, LineEdge, ArcEdge, EllipseEdge, SplineEdge]
 EdgeTypes = Union[LineEdge, ArcEdge, EllipseEdge, SplineEdge]
 
 
+def transform_angle_range(start: float, end: float, delta: float) -> Tuple[float, float]:
+    """ Returns the angle range `start` to `end` in degrees rotated about `delta` degrees, a full circle range keeps
+    its angles. (internal API)
+    """
+    sweep = end - start
+    if math.isclose(sweep % 360., 0., abs_tol=1e-12):
+        return start, end
+    start = (start + delta) % 360.
+    return start, (start + sweep) % 360.
+
+
 class Pattern:
     def __init__(self, lines=None):
         self.lines = lines or []
@@ -1045,6 +1186,11 @@ class Pattern:
             for line in self.lines:
                 line.export_dxf(tagwriter)
 
+    def transform(self, ocs: OCSTransform, elevation: float) -> None:
+        """ Transform all pattern definition lines by `ocs`. (internal API) """
+        for line in self.lines:
+            line.transform(ocs, elevation)
+
     def __str__(self) -> str:
         return "[" + ",".join(str(line) for line in self.lines) + "]"
 
@@ -1085,6 +1231,17 @@ class PatternLine:
         for item in self.dash_length_items:
             write_tag(49, item)
 
+    def transform(self, ocs: OCSTransform, elevation: float) -> None:
+        """ Transform pattern definition line by `ocs`, an affine transformation maps parallel lines to parallel
+        lines, therefore also non uniform scaling is supported. (internal API)
+        """
+        direction = ocs.transform_direction(Vector.from_deg_angle(self.angle))
+        scale = direction.magnitude
+        self.angle = direction.angle_deg % 360.
+        self.base_point = ocs.transform_2d_vertex(self.base_point, elevation)
+        self.offset = ocs.transform_2d_direction(self.offset)
+        self.dash_length_items = [item * scale for item in self.dash_length_items]
+
     def __str__(self):
         return "[{0.angle}, {0.base_point}, {0.offset}, {0.dash_length_items}]".format(self)
 
@@ -1134,6 +1291,10 @@ class Gradient:
                     gdata.color2 = int2rgb(value)
         return gdata
 
+    def transform(self, ocs: OCSTransform) -> None:
+        """ Transform gradient direction by `ocs`. (internal API) """
+        self.rotation = ocs.transform_deg_angle(self.rotation)
+
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
         # order matters!
         write_tag = tagwriter.write_tag2
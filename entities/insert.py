@@ -2,15 +2,18 @@
 # License: MIT License
 # Created 2019-02-16
 from typing import TYPE_CHECKING, Iterable, cast, Tuple, Union, Optional, List
-from ezdxf.math import Vector
+import math
+from ezdxf.math import Vector, Matrix44, OCS, NULLVEC
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
-from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER, DXFValueError, DXFKeyError
+from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER, DXFValueError, DXFKeyError, NonUniformScalingError
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity, SeqEnd
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, Vertex, DXFNamespace, DXFEntity, Drawing, Attrib, AttDef
+    from ezdxf.eztypes import TagWriter, Vertex, DXFNamespace, DXFEntity, Drawing, Attrib, AttDef, BlockLayout
+    from ezdxf.eztypes import BaseLayout
+    from ezdxf.query import EntityQuery
 
 __all__ = ['Insert']
 
@@ -36,6 +39,7 @@ class Insert(DXFGraphic):
     """ DXF INSERT entity """
     DXFTYPE = 'INSERT'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_block_reference)
+    SUPPORTS_TRANSFORM = True
 
     def __init__(self, doc: 'Drawing' = None):
         super().__init__(doc)
@@ -252,6 +256,7 @@ class Insert(DXFGraphic):
         dxfattribs['insert'] = insert
         attrib = cast('Attrib', self._new_compound_entity('ATTRIB', dxfattribs))
         self.attribs.append(attrib)
+        self._box = None
 
         # this case is only possible if INSERT is read from file without attached ATTRIBS
         if self.seqend is None:
@@ -280,6 +285,7 @@ class Insert(DXFGraphic):
             if attrib.dxf.tag == tag:
                 del self.attribs[index]
                 self.entitydb.delete_entity(attrib)
+                self._box = None
                 return
         if not ignore:
             raise DXFKeyError(tag)
@@ -290,3 +296,140 @@ class Insert(DXFGraphic):
         for attrib in self.attribs:
             db.delete_entity(attrib)
         self.attribs = []
+        self._box = None
+
+    def block(self) -> Optional['BlockLayout']:
+        """ Returns the associated :class:`~ezdxf.layouts.BlockLayout` or ``None`` if the block does not exist.
+
+        .. versionadded:: 0.11
+
+        """
+        if self.doc is None:
+            return None
+        return self.doc.blocks.get(self.dxf.name)
+
+    def matrix44(self) -> Matrix44:
+        """
+        Returns the transformation matrix from block coordinates to :ref:`WCS`, includes the block base point,
+        scaling, rotation, extrusion and the insertion point, but not the grid placement of MINSERT.
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        ocs = self.ocs()
+        rotation = dxf.rotation
+        ux = Vector(ocs.to_wcs(Vector.from_deg_angle(rotation, dxf.xscale)))
+        uy = Vector(ocs.to_wcs(Vector.from_deg_angle(rotation + 90., dxf.yscale)))
+        uz = ocs.uz * dxf.zscale
+        block = self.block()
+        base_point = Vector(block.block.dxf.base_point) if block is not None else NULLVEC
+        origin = Vector(ocs.to_wcs(dxf.insert)) - (ux * base_point.x + uy * base_point.y + uz * base_point.z)
+        return Matrix44([
+            ux.x, ux.y, ux.z, 0.,
+            uy.x, uy.y, uy.z, 0.,
+            uz.x, uz.y, uz.z, 0.,
+            origin.x, origin.y, origin.z, 1.,
+        ])
+
+    def grid_offsets(self) -> List[Vector]:
+        """
+        Returns the :ref:`WCS` offsets of all grid placements of a MINSERT entity, returns ``[(0, 0, 0)]`` for a
+        single block reference. The grid spacing is not scaled by the block scaling factors.
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        row_count = max(dxf.row_count, 1)
+        column_count = max(dxf.column_count, 1)
+        if row_count == 1 and column_count == 1:
+            return [NULLVEC]
+        ocs = self.ocs()
+        ux = Vector(ocs.to_wcs(Vector.from_deg_angle(dxf.rotation, dxf.column_spacing)))
+        uy = Vector(ocs.to_wcs(Vector.from_deg_angle(dxf.rotation + 90., dxf.row_spacing)))
+        return [ux * column + uy * row for row in range(row_count) for column in range(column_count)]
+
+    def transform(self, m: Matrix44) -> 'Insert':
+        """
+        Transform INSERT entity and attached ATTRIB entities by transformation matrix `m` inplace.
+
+        Raises:
+            NonUniformScalingError: transformation results in a sheared block reference, which can not be
+                represented by an INSERT entity
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        old_ocs = self.ocs()
+        rotation = dxf.rotation
+        # unit vectors of the block coordinate system in WCS and their transformations
+        ux = Vector(m.transform_direction(old_ocs.to_wcs(Vector.from_deg_angle(rotation))))
+        uy = Vector(m.transform_direction(old_ocs.to_wcs(Vector.from_deg_angle(rotation + 90.))))
+        uz = Vector(m.transform_direction(old_ocs.uz))
+        scale_x = ux.magnitude
+        scale_y = uy.magnitude
+        extrusion = ux.cross(uy).normalize()  # preserves the orientation of the block x- and y-axis
+        scale_z = uz.dot(extrusion)
+        tol = 1e-9 * max(scale_x, scale_y, abs(scale_z), 1.)
+        if abs(ux.dot(uy)) > tol * scale_y or not uz.isclose(extrusion * scale_z, abs_tol=tol):
+            raise NonUniformScalingError('INSERT does not support shearing transformations.')
+        new_ocs = OCS(extrusion)
+        dxf.insert = Vector(new_ocs.from_wcs(m.transform(old_ocs.to_wcs(dxf.insert))))
+        rotation = Vector(new_ocs.from_wcs(ux)).angle_deg % 360.
+        if rotation or dxf.hasattr('rotation'):
+            dxf.rotation = rotation
+        for name, scale in (('xscale', scale_x), ('yscale', scale_y), ('zscale', scale_z)):
+            if dxf.hasattr(name) or not math.isclose(scale, 1.):
+                dxf.set(name, dxf.get(name, 1.) * scale)
+        if dxf.hasattr('column_spacing'):
+            dxf.column_spacing = dxf.column_spacing * scale_x
+        if dxf.hasattr('row_spacing'):
+            dxf.row_spacing = dxf.row_spacing * scale_y
+        if dxf.hasattr('extrusion') or not math.isclose(extrusion.z, 1.):
+            dxf.extrusion = extrusion
+        for attrib in self.attribs:
+            attrib.transform(m)
+        return self
+
+    def translate(self, dx: float, dy: float, dz: float) -> 'Insert':
+        """ Optimized INSERT translation about `dx` in x-axis, `dy` in y-axis and `dz` in z-axis.
+
+        .. versionadded:: 0.11
+
+        """
+        self.dxf.insert = self._ocs_translation(dx, dy, dz) + self.dxf.insert
+        for attrib in self.attribs:
+            attrib.translate(dx, dy, dz)
+        return self
+
+    def virtual_entities(self) -> Iterable[DXFGraphic]:
+        """
+        Yields the entities of the block definition transformed into :ref:`WCS`, nested block references are
+        exploded and MINSERT grids are expanded. The virtual entities are not stored in the entity database and
+        have no handle and no owner, ATTRIB entities of the block reference are not included.
+
+        BYBLOCK properties and entities on layer ``'0'`` are resolved by the block reference. Entities which do
+        not support transformation are skipped, CIRCLE and ARC entities are converted to ELLIPSE entities for non
+        uniform scaling.
+
+        .. versionadded:: 0.11
+
+        """
+        from ezdxf.explode import virtual_block_reference_entities
+        return virtual_block_reference_entities(self)
+
+    def explode(self, target_layout: 'BaseLayout' = None) -> 'EntityQuery':
+        """
+        Explode block reference into the `target_layout`, the default target layout is the layout of the block
+        reference. The exploded entities are stored in the entity database, ATTRIB entities are converted to TEXT
+        entities. The block reference is deleted from its layout and the entity database.
+
+        Returns an :class:`~ezdxf.query.EntityQuery` container with all exploded entities.
+
+        .. versionadded:: 0.11
+
+        """
+        from ezdxf.explode import explode_block_reference
+        return explode_block_reference(self, target_layout)
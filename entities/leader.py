@@ -13,7 +13,7 @@ from .factory import register_entity
 from .dimension import OverrideMixin
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DXFNamespace, Drawing, Vertex
+    from ezdxf.eztypes import TagWriter, DXFNamespace, Drawing, Vertex, Matrix44
 
 __all__ = ['Leader']
 
@@ -78,6 +78,7 @@ class Leader(DXFGraphic, OverrideMixin):
     DXFTYPE = 'LEADER'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_leader)
     MIN_DXF_VERSION_FOR_EXPORT = DXF2000
+    SUPPORTS_TRANSFORM = True
 
     def __init__(self, doc: 'Drawing' = None):
         super().__init__(doc)
@@ -130,3 +131,22 @@ class Leader(DXFGraphic, OverrideMixin):
         :class:`~ezdxf.math.Vector`.
         """
         self.vertices = [Vector(v) for v in vertices]
+        self._box = None
+
+    def transform(self, m: 'Matrix44') -> 'Leader':
+        """ Transform LEADER entity by transformation matrix `m` inplace.
+
+        .. versionadded:: 0.11
+
+        """
+        transform = m.transform
+        self.vertices = [Vector(transform(vertex)) for vertex in self.vertices]
+        self._box = None
+        dxf = self.dxf
+        for name in ('normal_vector', 'horizontal_direction'):
+            if dxf.hasattr(name):
+                dxf.set(name, Vector(m.transform_direction(dxf.get(name))).normalize())
+        for name in ('leader_offset_block_ref', 'leader_offset_annotation_placement'):
+            if dxf.hasattr(name):
+                dxf.set(name, Vector(m.transform_direction(dxf.get(name))))
+        return self
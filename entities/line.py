@@ -10,7 +10,7 @@ from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DXFNamespace
+    from ezdxf.eztypes import TagWriter, DXFNamespace, Matrix44
 
 __all__ = ['Line']
 
@@ -27,6 +27,7 @@ class Line(DXFGraphic):
     """ The LINE entity represents a 3D line from `start` to `end` """
     DXFTYPE = 'LINE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_line)
+    SUPPORTS_TRANSFORM = True
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         """
@@ -50,3 +51,27 @@ class Line(DXFGraphic):
         # for all DXF versions
         self.dxf.export_dxf_attribs(tagwriter, ['start', 'end', 'thickness', 'extrusion'])
         # xdata and embedded objects export will be done by parent class
+
+    def transform(self, m: 'Matrix44') -> 'Line':
+        """ Transform LINE entity by transformation matrix `m` inplace.
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        dxf.start = Vector(m.transform(dxf.start))
+        dxf.end = Vector(m.transform(dxf.end))
+        self._transform_extrusion(m)
+        return self
+
+    def translate(self, dx: float, dy: float, dz: float) -> 'Line':
+        """ Optimized LINE translation about `dx` in x-axis, `dy` in y-axis and `dz` in z-axis.
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        offset = Vector(dx, dy, dz)
+        dxf.start = offset + dxf.start
+        dxf.end = offset + dxf.end
+        return self
@@ -8,6 +8,8 @@ from contextlib import contextmanager
 from ezdxf.math import Vector
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import SUBCLASS_MARKER, DXF2000, LWPOLYLINE_CLOSED, LWPOLYLINE_PLINEGEN
+from ezdxf.lldxf.const import NonUniformScalingError
+from ezdxf.math.transformtools import OCSTransform, transform_vertex_arrays
 from ezdxf.lldxf.tags import Tags
 from ezdxf.lldxf.types import DXFTag, DXFVertex
 from ezdxf.lldxf.packedtags import VertexArray
@@ -16,7 +18,7 @@ from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, Drawing, Vertex, DXFNamespace
+    from ezdxf.eztypes import TagWriter, Drawing, Vertex, DXFNamespace, Matrix44
 
 __all__ = ['LWPolyline']
 
@@ -48,6 +50,7 @@ class LWPolyline(DXFGraphic):
     DXFTYPE = 'LWPOLYLINE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_lwpolyline)
     MIN_DXF_VERSION_FOR_EXPORT = DXF2000
+    SUPPORTS_TRANSFORM = True
 
     def __init__(self, doc: 'Drawing' = None):
         super().__init__(doc)
@@ -139,10 +142,12 @@ class LWPolyline(DXFGraphic):
 
         """
         self.lwpoints[index] = compile_array(value)
+        self._box = None
 
     def __delitem__(self, index: int) -> None:
         """ Delete point at position `index`, supports extended slicing. """
         del self.lwpoints[index]
+        self._box = None
 
     def vertices(self) -> Iterable[Tuple[float, float]]:
         """
@@ -162,6 +167,69 @@ class LWPolyline(DXFGraphic):
         for x, y in self.vertices():
             yield ocs.to_wcs((x, y, elevation))
 
+    def transform(self, m: 'Matrix44') -> 'LWPolyline':
+        """ Transform LWPOLYLINE entity by transformation matrix `m` inplace.
+
+        Raises:
+            NonUniformScalingError: for non uniform scaling of polylines with arc segments (bulges)
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        ocs = OCSTransform(dxf.extrusion, m)
+        if not ocs.scale_uniform and self.has_arc:
+            raise NonUniformScalingError('LWPOLYLINE with arcs does not support non uniform scaling.')
+        transform_vertex_arrays([self.lwpoints.values], ocs.matrix44(), vertex_size=5, z=dxf.elevation)
+        self._transform_attribs(ocs)
+        return self
+
+    @property
+    def has_arc(self) -> bool:
+        """ ``True`` if LWPOLYLINE has an arc segment.
+
+        .. versionadded:: 0.11
+
+        """
+        return any(self.lwpoints.values[4::5])
+
+    def _transform_attribs(self, ocs: OCSTransform) -> None:
+        """ Transform all attributes except the vertex locations by `ocs`, the vertex locations are transformed by
+        :func:`~ezdxf.math.transformtools.transform_vertex_arrays`. (internal API)
+        """
+        dxf = self.dxf
+        values = self.lwpoints.values
+        factor = ocs.transform_width(1.)
+        if factor != 1.:
+            for start in (2, 3):  # start- and end width
+                widths = values[start::5]
+                if any(widths):
+                    values[start::5] = array.array('d', [width * factor for width in widths])
+            if dxf.const_width:
+                dxf.const_width = dxf.const_width * factor
+        # all vertices of the transformed polyline have the same new elevation
+        elevation = ocs.transform_vertex((0, 0, dxf.elevation)).z
+        if elevation or dxf.hasattr('elevation'):
+            dxf.elevation = elevation
+        self._transform_ocs_extrusion(ocs)
+        self._box = None
+
+    def translate(self, dx: float, dy: float, dz: float) -> 'LWPolyline':
+        """ Optimized LWPOLYLINE translation about `dx` in x-axis, `dy` in y-axis and `dz` in z-axis.
+
+        .. versionadded:: 0.11
+
+        """
+        ox, oy, oz = self._ocs_translation(dx, dy, dz)
+        values = self.lwpoints.values
+        for index in range(0, len(values), 5):
+            values[index] += ox
+            values[index + 1] += oy
+        if oz:
+            self.dxf.elevation = self.dxf.elevation + oz
+        self._box = None
+        return self
+
     def append(self, point: Sequence[float], format: str = DEFAULT_FORMAT) -> None:
         """
         Append `point` to polyline, `format`` specifies a user defined point format.
@@ -174,6 +242,7 @@ class LWPolyline(DXFGraphic):
 
         """
         self.lwpoints.append(point, format=format)
+        self._box = None
 
     def insert(self, pos: int, point: Sequence[float], format: str = DEFAULT_FORMAT) -> None:
         """
@@ -189,6 +258,7 @@ class LWPolyline(DXFGraphic):
         """
         data = compile_array(point, format=format)
         self.lwpoints.insert(pos, data)
+        self._box = None
 
     def append_points(self, points: Iterable[Sequence[float]], format: str = DEFAULT_FORMAT) -> None:
         """
@@ -203,6 +273,7 @@ class LWPolyline(DXFGraphic):
         """
         for point in points:
             self.lwpoints.append(point, format=format)
+        self._box = None
 
     @contextmanager
     def points(self, format: str = DEFAULT_FORMAT) -> List[Sequence[float]]:
@@ -249,6 +320,7 @@ class LWPolyline(DXFGraphic):
     def clear(self) -> None:
         """ Remove all points. """
         self.lwpoints.clear()
+        self._box = None
 
 
 class LWPolylinePoints(VertexArray):
@@ -1,25 +1,27 @@
 # Copyright (c) 2019 Manfred Moitzi
 # License: MIT License
 # Created 2019-03-06
-from typing import TYPE_CHECKING, Iterable, Sequence, Tuple, Union, List, Dict
+from typing import TYPE_CHECKING, Iterable, Sequence, Tuple, Union, List
 import array
 import copy
-from itertools import chain
+from itertools import chain, islice, accumulate
 
 from contextlib import contextmanager
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.lldxf.const import SUBCLASS_MARKER, DXF2000, DXFValueError, DXFStructureError
-from ezdxf.lldxf.packedtags import VertexArray, TagArray, TagList
+from ezdxf.lldxf.packedtags import VertexArray, TagArray
 from ezdxf.tools import take2
+from ezdxf.math.transformtools import transform_vertex_arrays
+from ezdxf.math.vertexmerge import merge_vertices, remap_indices
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity
 
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DXFNamespace, Drawing, Vertex, Tags
+    from ezdxf.eztypes import TagWriter, DXFNamespace, Drawing, Vertex, Tags, Matrix44
 
-__all__ = ['Mesh', 'MeshData']
+__all__ = ['Mesh', 'MeshData', 'MeshDataView']
 
 acdb_mesh = DefSubclass('AcDbSubDMesh', {
     'version': DXFAttr(71, default=2),
@@ -67,44 +69,101 @@ class EdgeArray(TagArray):
     def export_dxf(self, tagwriter: 'TagWriter'):
         # count = count of edges not tags!
         tagwriter.write_tag2(94, len(self.values) // 2)
-        for index in self.values:
-            tagwriter.write_tag2(90, index)
+        tagwriter.write_values(90, self.values)
 
 
-class FaceList(TagList):
+class FaceArray:
+    """
+    Stores faces in compressed sparse row (CSR) format: all vertex indices of all faces in one flat array
+    :attr:`indices` and the start index of each face in :attr:`offsets`, the vertex indices of face ``n`` are
+    ``indices[offsets[n]:offsets[n + 1]]``. The last offset is the length of :attr:`indices`.
+
+    .. versionadded:: 0.11
+
+        replaces the FaceList class, which stored each face as separated array
+
+    """
+    __slots__ = ('offsets', 'indices')
+    DTYPE = 'L'
+
+    def __init__(self, offsets: Iterable[int] = None, indices: Iterable[int] = None):
+        self.offsets = self._array(offsets if offsets is not None else (0,))
+        self.indices = self._array(indices if indices is not None else [])
+        if self.offsets[-1] != len(self.indices):
+            raise DXFValueError('last face offset does not match the count of indices')
+
+    @classmethod
+    def _array(cls, values: Iterable[int]) -> array.array:
+        if isinstance(values, array.array) and values.typecode == cls.DTYPE:
+            return values  # no copy
+        return array.array(cls.DTYPE, values)
+
     def __len__(self) -> int:
-        return len(self.values)
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> array.array:
+        offsets = self.offsets
+        if index < 0:
+            index += len(offsets) - 1
+        return self.indices[offsets[index]:offsets[index + 1]]
 
     def __iter__(self) -> Iterable[array.array]:
-        return iter(self.values)
+        indices = self.indices
+        offsets = self.offsets
+        return (indices[start:end] for start, end in zip(offsets, islice(offsets, 1, None)))
 
-    def export_dxf(self, tagwriter: 'TagWriter'):
-        # count = count of tags not faces!
-        tagwriter.write_tag2(93, self.tag_count())
-        for face in self.values:
-            tagwriter.write_tag2(90, len(face))
-            for index in face:
-                tagwriter.write_tag2(90, index)
+    def __deepcopy__(self, memodict: dict = None) -> 'FaceArray':
+        return self.clone()
+
+    def clone(self) -> 'FaceArray':
+        """ Returns a deep copy. """
+        return self.__class__(array.array(self.DTYPE, self.offsets), array.array(self.DTYPE, self.indices))
+
+    @property
+    def values(self) -> List[array.array]:
+        """ Faces as list of ``array.array`` objects like the replaced FaceList class, returns a new list, changing
+        the list does not change the faces, assign a new list to replace all faces. (read/write)
+        """
+        return list(self)
+
+    @values.setter
+    def values(self, faces: Iterable[Sequence[int]]) -> None:
+        self.set_data(faces)
+
+    def clear(self) -> None:
+        """ Delete all faces. """
+        self.offsets = array.array(self.DTYPE, (0,))
+        self.indices = array.array(self.DTYPE)
 
     def tag_count(self) -> int:
-        return len(self.values) + sum(len(f) for f in self.values)
+        """ Count of DXF tags: a count tag for each face and a tag for each vertex index. """
+        return len(self.offsets) - 1 + len(self.indices)
 
     def set_data(self, faces: Iterable[Sequence[int]]) -> None:
-        _faces = []
-        for face in faces:
-            _faces.append(face_to_array(face))
-        self.values = _faces
-
+        """ Set faces from sequences of vertex indices. """
+        if not isinstance(faces, Sequence):
+            faces = list(faces)
+        self.indices = array.array(self.DTYPE, chain.from_iterable(faces))
+        self.offsets = array.array(self.DTYPE, accumulate(chain((0,), map(len, faces))))
+
+    def set_arrays(self, offsets: Iterable[int], indices: Iterable[int]) -> None:
+        """ Set faces in CSR format, ``array.array('L')`` objects are stored without copying. """
+        offsets = self._array(offsets)
+        indices = self._array(indices)
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(indices):
+            raise DXFValueError('invalid face offsets')
+        self.offsets = offsets
+        self.indices = indices
 
-def face_to_array(face: Sequence[int]) -> array.array:
-    max_index = max(face)
-    if max_index < 256:
-        dtype = 'B'
-    elif max_index < 65536:
-        dtype = 'I'
-    else:
-        dtype = 'L'
-    return array.array(dtype, face)
+    def export_dxf(self, tagwriter: 'TagWriter'):
+        # count = count of tags not faces!
+        tagwriter.write_tag2(93, self.tag_count())
+        indices = self.indices
+        values = []
+        for start, end in zip(self.offsets, islice(self.offsets, 1, None)):
+            values.append(end - start)
+            values.extend(indices[start:end])
+        tagwriter.write_values(90, values)
 
 
 def create_vertex_array(tags: 'Tags', start_index: int) -> 'VertexArray':
@@ -112,30 +171,19 @@ def create_vertex_array(tags: 'Tags', start_index: int) -> 'VertexArray':
     return VertexArray(data=chain.from_iterable(t.value for t in vertex_tags))
 
 
-def create_face_list(tags: 'Tags', start_index: int) -> 'FaceList':
-    faces = FaceList()
-    faces_list = faces.values
-    face = []
-    counter = 0
-    for tag in tags.collect_consecutive_tags(codes=(90,), start=start_index):
-        if not counter:
-            # leading counter tag
-            counter = tag.value
-            if face:
-                # group code 90 = 32 bit integer
-                faces_list.append(face_to_array(face))
-                face = []
-        else:
-            # followed by count face tags
-            counter -= 1
-            face.append(tag.value)
-
-    # add last face
-    if face:
-        # group code 90 = 32 bit integer
-        faces_list.append(face_to_array(face))
-
-    return faces
+def create_face_array(tags: 'Tags', start_index: int) -> 'FaceArray':
+    values = [tag.value for tag in tags.collect_consecutive_tags(codes=(90,), start=start_index)]
+    offsets = [0]
+    indices = []
+    index = 0
+    count = len(values)
+    while index < count:
+        # leading counter tag followed by count vertex indices
+        start = index + 1
+        index = start + values[index]
+        indices.extend(values[start:index])
+        offsets.append(len(indices))
+    return FaceArray(offsets, indices)
 
 
 def create_edge_array(tags: 'Tags', start_index: int) -> 'EdgeArray':
@@ -160,11 +208,12 @@ class Mesh(DXFGraphic):
     DXFTYPE = 'MESH'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_mesh)
     MIN_DXF_VERSION_FOR_EXPORT = DXF2000
+    SUPPORTS_TRANSFORM = True
 
     def __init__(self, doc: 'Drawing' = None):
         super().__init__(doc)
         self._vertices = VertexArray()  # vertices stored as array.array('d')
-        self._faces = FaceList()  # face lists data
+        self._faces = FaceArray()  # face data in CSR format
         self._edges = EdgeArray()  # edge indices stored as array.array('L')
         self._creases = array.array('f')  # creases stored as array.array('f')
 
@@ -206,7 +255,7 @@ class Mesh(DXFGraphic):
                 raise DXFStructureError(COUNT_ERROR_MSG.format(handle, 'face'))
             else:
                 # remove face count tag and all face tags
-                faces = create_face_list(mesh_tags, face_count_index + 1)
+                faces = create_face_array(mesh_tags, face_count_index + 1)
                 end_index = face_count_index + 1 + faces.tag_count()
                 del mesh_tags[face_count_index:end_index]
                 return faces
@@ -257,8 +306,7 @@ class Mesh(DXFGraphic):
         self._edges.export_dxf(tagwriter)
 
         tagwriter.write_tag2(95, len(self.creases))
-        for crease_value in self.creases:
-            tagwriter.write_tag2(140, crease_value)
+        tagwriter.write_values(140, self.creases)
 
     def export_override_data(self, tagwriter: 'TagWriter'):
         tagwriter.write_tag2(90, 0)
@@ -280,6 +328,7 @@ class Mesh(DXFGraphic):
     @vertices.setter
     def vertices(self, points: Iterable['Vertex']) -> None:
         self._vertices = VertexArray(chain.from_iterable(points))
+        self._box = None
 
     @property
     def edges(self):
@@ -292,13 +341,45 @@ class Mesh(DXFGraphic):
 
     @property
     def faces(self):
-        """ Faces as list like :class:`~ezdxf.lldxf.packedtags.TagList`. (read/write)"""
+        """ Faces as list like :class:`FaceArray`, each face is an ``array.array`` of vertex indices. (read/write)"""
         return self._faces
 
     @faces.setter
     def faces(self, faces: Iterable[Sequence[int]]) -> None:
         self._faces.set_data(faces)
 
+    def get_face_arrays(self) -> Tuple[array.array, array.array]:
+        """
+        Returns the faces in compressed sparse row (CSR) format as tuple ``(offsets, indices)`` of
+        ``array.array('L')`` objects without copying, the vertex indices of face ``n`` are
+        ``indices[offsets[n]:offsets[n + 1]]``.
+
+        .. versionadded:: 0.11
+
+        """
+        return self._faces.offsets, self._faces.indices
+
+    def set_face_arrays(self, offsets: Iterable[int], indices: Iterable[int]) -> None:
+        """
+        Set faces in compressed sparse row (CSR) format, see :meth:`get_face_arrays`. The first offset has to be 0
+        and the last offset has to be the count of `indices`. Arguments of type ``array.array('L')`` are stored
+        without copying.
+
+        .. versionadded:: 0.11
+
+        """
+        self._faces.set_arrays(offsets, indices)
+
+    def data_view(self) -> 'MeshDataView':
+        """
+        Returns a :class:`MeshDataView` of the mesh data without copying, changes of the view arrays are changes of
+        the MESH entity.
+
+        .. versionadded:: 0.11
+
+        """
+        return MeshDataView(self)
+
     def get_data(self) -> 'MeshData':
         return MeshData(self)
 
@@ -308,6 +389,16 @@ class Mesh(DXFGraphic):
         self._edges.set_data(data.edges)
         self.creases = data.edge_crease_values
 
+    def transform(self, m: 'Matrix44') -> 'Mesh':
+        """ Transform MESH entity by transformation matrix `m` inplace, supports also non uniform scaling.
+
+        .. versionadded:: 0.11
+
+        """
+        transform_vertex_arrays([self._vertices.values], m)
+        self._box = None
+        return self
+
     @contextmanager
     def edit_data(self) -> 'MeshData':
         """ Context manager various mesh data, returns :class:`MeshData`.
@@ -321,6 +412,54 @@ class Mesh(DXFGraphic):
         self.set_data(data)
 
 
+class MeshDataView:
+    """
+    Zero-copy view of the MESH data as flat arrays, all properties return the current arrays of the MESH entity.
+    Modify the arrays inplace, e.g. by ``numpy.frombuffer(view.vertices)``, or replace the data by the MESH entity
+    properties and methods. For convenient editing of the mesh data by Python lists use :meth:`Mesh.edit_data`.
+
+    .. versionadded:: 0.11
+
+    """
+    __slots__ = ('_mesh',)
+
+    def __init__(self, mesh: 'Mesh'):
+        self._mesh = mesh
+
+    @property
+    def vertices(self) -> array.array:
+        """ Vertex coordinates ``x0, y0, z0, x1, y1, z1, ...`` as ``array.array('d')``. """
+        return self._mesh._vertices.values
+
+    @property
+    def face_offsets(self) -> array.array:
+        """ Start index of each face in :attr:`face_indices` and the count of face indices as last value. """
+        return self._mesh._faces.offsets
+
+    @property
+    def face_indices(self) -> array.array:
+        """ Vertex indices of all faces. """
+        return self._mesh._faces.indices
+
+    @property
+    def edges(self) -> array.array:
+        """ Vertex indices of all edges ``start0, end0, start1, end1, ...``. """
+        return self._mesh._edges.values
+
+    @property
+    def creases(self) -> array.array:
+        """ Edge crease values as ``array.array('f')``. """
+        return self._mesh._creases
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self._mesh._vertices)
+
+    @property
+    def face_count(self) -> int:
+        return len(self._mesh._faces)
+
+
 class MeshData:
     def __init__(self, mesh):
         self.vertices = list(mesh.vertices)  # type: List[Tuple[float, float, float]]
@@ -350,50 +489,20 @@ class MeshData:
         self.vertices.append(vertex)
         return index
 
-    def optimize(self, precision: int = 6):
+    def optimize(self, precision: int = 6, tolerance: float = None) -> List[int]:
         """
         Tries to reduce vertex count by merging near vertices. `precision` defines the decimal places for coordinate
-        be equal to merge two vertices.
+        be equal to merge two vertices, or `tolerance` defines the max. distance of two vertices to be merged, see
+        :func:`~ezdxf.math.vertexmerge.merge_vertices`. Returns the new vertex index for each old vertex index.
+
+        .. versionchanged:: 0.11
+
+            argument `tolerance`, merges near vertices and not only identical vertices, preserves the order of the
+            remaining vertices
 
         """
-        def remove_doublette_vertices() -> Dict[int, int]:
-            def prepare_vertices() -> Iterable[Tuple[float, float, float]]:
-                for index, vertex in enumerate(self.vertices):
-                    x, y, z = vertex
-                    yield round(x, precision), round(y, precision), round(z, precision), index
-
-            sorted_vertex_list = list(sorted(prepare_vertices()))
-            original_vertices = self.vertices
-            self.vertices = []
-            index_map = {}  # type: Dict[int, int]
-            cmp_vertex = None
-            index = 0
-            while len(sorted_vertex_list):
-                vertex_entry = sorted_vertex_list.pop()
-                original_index = vertex_entry[3]
-                vertex = original_vertices[original_index]
-                if vertex != cmp_vertex:  # this is not a doublette
-                    index = len(self.vertices)
-                    self.vertices.append(vertex)
-                    index_map[original_index] = index
-                    cmp_vertex = vertex
-                else:  # it is a doublette
-                    index_map[original_index] = index
-            return index_map
-
-        def remap_faces() -> None:
-            self.faces = remap_indices(self.faces)
-
-        def remap_edges() -> None:
-            self.edges = remap_indices(self.edges)
-
-        def remap_indices(entity_list: Sequence[Sequence[int]]) -> List[Tuple]:
-            mapped_indices = []  # type: List[Tuple]
-            for entity in entity_list:
-                index_list = [index_map[index] for index in entity]
-                mapped_indices.append(tuple(index_list))
-            return mapped_indices
-
-        index_map = remove_doublette_vertices()
-        remap_faces()
-        remap_edges()
+        keep, index_map = merge_vertices(self.vertices, precision=precision, tolerance=tolerance)
+        self.vertices = [self.vertices[index] for index in keep]
+        self.faces = remap_indices(self.faces, index_map)
+        self.edges = remap_indices(self.edges, index_map)
+        return index_map
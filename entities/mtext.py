@@ -6,6 +6,7 @@ import math
 from contextlib import contextmanager
 
 from ezdxf.math import Vector
+from ezdxf.math.transformtools import OCSTransform
 from ezdxf.lldxf import const
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import SUBCLASS_MARKER, DXF2000
@@ -16,7 +17,7 @@ from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DXFNamespace, Drawing, DXFEntity, Vertex
+    from ezdxf.eztypes import TagWriter, DXFNamespace, Drawing, DXFEntity, Vertex, Matrix44
 
 __all__ = ['MText']
 
@@ -116,6 +117,7 @@ class MText(DXFGraphic):
     DXFTYPE = 'MTEXT'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_mtext)
     MIN_DXF_VERSION_FOR_EXPORT = DXF2000
+    SUPPORTS_TRANSFORM = True
 
     UNDERLINE_START = r'\L'
     UNDERLINE_STOP = r'\l'
@@ -220,6 +222,48 @@ class MText(DXFGraphic):
             self.dxf.attachment_point = attachment_point
         return self  # fluent interface
 
+    def transform(self, m: 'Matrix44') -> 'MText':
+        """ Transform MTEXT entity by transformation matrix `m` inplace. Non uniform scaling changes the character
+        height and the column width, the text itself is not distorted.
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        ocs = OCSTransform(dxf.extrusion, m)
+        dxf.insert = Vector(m.transform(dxf.insert))  # in WCS
+        if dxf.hasattr('text_direction'):  # text_direction in WCS has higher priority than rotation in OCS
+            rotation = Vector(ocs.old_ocs.from_wcs(dxf.text_direction)).angle_deg
+        else:
+            rotation = dxf.get('rotation', 0)
+        x_direction = ocs.transform_direction(Vector.from_deg_angle(rotation))
+        y_direction = ocs.transform_direction(Vector.from_deg_angle(rotation + 90.))
+        x_scale = x_direction.magnitude
+        y_scale = abs(x_direction.normalize().cross(y_direction).z)  # text height is perpendicular to the baseline
+        if dxf.hasattr('text_direction'):
+            dxf.text_direction = ocs.new_ocs.to_wcs(x_direction.normalize())
+        else:
+            rotation = x_direction.angle_deg % 360.
+            if rotation or dxf.hasattr('rotation'):
+                dxf.rotation = rotation
+        dxf.char_height = dxf.char_height * y_scale
+        for name, scale in (('width', x_scale), ('rect_width', x_scale), ('defined_height', y_scale),
+                            ('rect_height', y_scale)):
+            value = dxf.get(name)
+            if value:
+                dxf.set(name, value * scale)
+        self._transform_ocs_extrusion(ocs)
+        return self
+
+    def translate(self, dx: float, dy: float, dz: float) -> 'MText':
+        """ Optimized MTEXT translation about `dx` in x-axis, `dy` in y-axis and `dz` in z-axis.
+
+        .. versionadded:: 0.11
+
+        """
+        self.dxf.insert = Vector(dx, dy, dz) + self.dxf.insert
+        return self
+
     def set_bg_color(self, color: Union[int, str, Tuple[int, int, int], None], scale: float = 1.5):
         """
         Set background color as :ref:`ACI` value or as name string or as RGB tuple ``(r, g, b)``.
@@ -10,7 +10,7 @@ from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DXFNamespace
+    from ezdxf.eztypes import TagWriter, DXFNamespace, Matrix44
 
 __all__ = ['Point']
 
@@ -29,6 +29,7 @@ class Point(DXFGraphic):
     """ DXF POINT entity """
     DXFTYPE = 'POINT'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_point)
+    SUPPORTS_TRANSFORM = True
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         """ Loading interface. (internal API) """
@@ -48,3 +49,22 @@ class Point(DXFGraphic):
             tagwriter.write_tag2(SUBCLASS_MARKER, acdb_point.name)
         # for all DXF versions
         self.dxf.export_dxf_attribs(tagwriter, ['location', 'thickness', 'extrusion', 'angle'])
+
+    def transform(self, m: 'Matrix44') -> 'Point':
+        """ Transform POINT entity by transformation matrix `m` inplace.
+
+        .. versionadded:: 0.11
+
+        """
+        self.dxf.location = Vector(m.transform(self.dxf.location))
+        self._transform_extrusion(m)
+        return self
+
+    def translate(self, dx: float, dy: float, dz: float) -> 'Point':
+        """ Optimized POINT translation about `dx` in x-axis, `dy` in y-axis and `dz` in z-axis.
+
+        .. versionadded:: 0.11
+
+        """
+        self.dxf.location = Vector(dx, dy, dz) + self.dxf.location
+        return self
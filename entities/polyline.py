@@ -1,18 +1,24 @@
 # Copyright (c) 2019 Manfred Moitzi
 # License: MIT License
 # Created 2019-02-16
-from typing import TYPE_CHECKING, Iterable, Union, List, cast, Tuple, Sequence, Dict
-from itertools import chain
-from ezdxf.math import Vector
+from typing import TYPE_CHECKING, Iterable, Union, List, cast, Tuple, Sequence, Dict, Optional, Any
+from itertools import chain, islice, repeat
+import array
+from ezdxf.math import Vector, NULLVEC, Matrix44
+from ezdxf.math.transformtools import OCSTransform, transform_vertex_arrays
+from ezdxf.math.vertexmerge import merge_vertices
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER, VERTEXNAMES
 from ezdxf.lldxf import const
+from ezdxf.lldxf.packedtags import VertexArray
+from ezdxf.lldxf.tagwriter import TagWriter, TagCollector
+from ezdxf.lldxf.types import TAG_STRING_FORMAT
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity, SeqEnd
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, Vertex, FaceType, DXFNamespace, DXFEntity, Drawing
+    from ezdxf.eztypes import Vertex, FaceType, DXFNamespace, DXFEntity, Drawing, EntityDB
 
 __all__ = ['Polyline', 'Polyface', 'Polymesh']
 
@@ -53,6 +59,7 @@ class Polyline(DXFGraphic):
     """ DXF POLYLINE entity """
     DXFTYPE = 'POLYLINE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_polyline)
+    SUPPORTS_TRANSFORM = True
     # polyline flags (70)
     CLOSED = 1
     MESH_CLOSED_M_DIRECTION = CLOSED
@@ -72,12 +79,84 @@ class Polyline(DXFGraphic):
 
     def __init__(self, doc: 'Drawing' = None):
         super().__init__(doc)
-        self.vertices = []  # type: List[DXFVertex]
+        self._vertices = []  # type: List[DXFVertex]
+        self._packed = None  # type: Optional[PackedVertices]  # packed VERTEX storage
         self.seqend = None  # type: SeqEnd
 
+    @property
+    def vertices(self) -> List['DXFVertex']:
+        """ List of :class:`Vertex` entities, unpacks packed VERTEX entities, see :meth:`pack`. """
+        if self._packed is not None:
+            self.unpack()
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices: List['DXFVertex']) -> None:
+        self._packed = None
+        self._vertices = vertices
+        self._box = None
+
+    @property
+    def is_packed(self) -> bool:
+        """ ``True`` if the VERTEX entities are stored packed, see :meth:`pack`.
+
+        .. versionadded:: 0.11
+
+        """
+        return self._packed is not None
+
+    def pack(self) -> bool:
+        """
+        Store the VERTEX entities of a :class:`Polyface` or a :class:`Polymesh` as packed arrays, the VERTEX entities
+        are removed from the entity database but keep their handles for the DXF export. The VERTEX entities are
+        recreated on demand by accessing :attr:`vertices` or by methods which require the :class:`Vertex` entities.
+        Returns ``False`` if the POLYLINE is not a polyface or polygon mesh, or if a VERTEX has DXF attributes which
+        can not be packed, like a layer different to the POLYLINE layer, XDATA or an extension dictionary.
+
+        Packed VERTEX entities have the owner, layer, linetype and paperspace attributes of the POLYLINE entity,
+        each face record has a color, mesh vertices are exported before the face records.
+
+        .. versionadded:: 0.11
+
+        """
+        if self._packed is not None:
+            return True
+        if not (self.is_poly_face_mesh or self.is_polygon_mesh):
+            return False
+        packed = PackedVertices.from_polyline(self)
+        if packed is None:
+            return False
+        if self.doc is not None:
+            db = self.entitydb
+            for vertex in self._vertices:
+                if vertex.dxf.handle in db:
+                    db.delete_entity(vertex)
+            packed.reserve_handles(db)
+        self._vertices = []
+        self._packed = packed
+        return True
+
+    def unpack(self) -> None:
+        """ Create :class:`Vertex` entities from packed VERTEX entities, see :meth:`pack`.
+
+        .. versionadded:: 0.11
+
+        """
+        packed = self._packed
+        if packed is None:
+            return
+        self._packed = None
+        self._vertices = packed.create_vertices(self)
+
+    def _update_packed_handles(self) -> None:
+        # assign handles to modified packed VERTEX entities before the $HANDSEED export
+        if self.doc is not None and self.dxf.handle in self.entitydb:
+            self._packed.reserve_handles(self.entitydb)
+
     def linked_entities(self) -> Iterable['DXFVertex']:
         # don't yield SEQEND here, because it is not a DXFGraphic entity
-        return self.vertices
+        # packed VERTEX entities are not linked entities, they are exported by export_dxf()
+        return self._vertices
 
     def link_entity(self, entity: 'DXFEntity') -> None:
         assert isinstance(entity, DXFVertex)
@@ -90,12 +169,18 @@ class Polyline(DXFGraphic):
 
     def _copy_data(self, entity: 'Polyline') -> None:
         """ Copy vertices, does not store the copies into the entity database. """
-        entity.vertices = [vertex.copy() for vertex in self.vertices]
+        if self._packed is not None:
+            entity._vertices = []
+            entity._packed = self._packed.copy()
+        else:
+            entity.vertices = [vertex.copy() for vertex in self._vertices]
         entity.seqend = self.seqend.copy()
 
     def add_sub_entities_to_entitydb(self):
         """ Called by Entitydb.add(). (internal API) """
-        for vertex in self.vertices:
+        if self._packed is not None:
+            self._packed.reserve_handles(self.entitydb)
+        for vertex in self._vertices:
             vertex.doc = self.doc  # grant same document
             self.entitydb.add(vertex)
         if self.seqend:
@@ -156,6 +241,15 @@ class Polyline(DXFGraphic):
         # xdata and embedded objects export will be done by parent class
         # following VERTEX entities and SEQEND is exported by EntitySpace()
 
+    def export_dxf(self, tagwriter: 'TagWriter') -> None:
+        """ Export POLYLINE entity and packed VERTEX entities by `tagwriter`, linked VERTEX entities and SEQEND are
+        exported by the entity space. (internal API)
+        """
+        super().export_dxf(tagwriter)
+        if self._packed is not None and len(self._packed):
+            self._packed.export_dxf(tagwriter, self)
+            self.export_seqend(tagwriter)
+
     def export_seqend(self, tagwriter: 'TagWriter'):
         self.seqend.dxf.owner = self.dxf.owner
         self.seqend.dxf.layer = self.dxf.layer
@@ -166,9 +260,10 @@ class Polyline(DXFGraphic):
         Delete all data and references.
 
         """
-        for v in self.vertices:
+        for v in self._vertices:
             self.entitydb.delete_entity(v)
-        del self.vertices
+        del self._vertices
+        self._packed = None
         self.entitydb.delete_entity(self.seqend)
         super().destroy()
 
@@ -180,7 +275,8 @@ class Polyline(DXFGraphic):
             layer: new layer as string
 
         """
-        for v in self.vertices:
+        # packed VERTEX entities have always the layer of the POLYLINE
+        for v in self._vertices:
             v.dxf.layer = layer
 
     def on_linetype_change(self, linetype: str):
@@ -191,7 +287,7 @@ class Polyline(DXFGraphic):
             linetype: new linetype as string
 
         """
-        for v in self.vertices:
+        for v in self._vertices:
             v.dxf.linetype = linetype
 
     def get_vertex_flags(self) -> int:
@@ -264,7 +360,9 @@ class Polyline(DXFGraphic):
 
     def __len__(self) -> int:
         """ Returns count of :class:`Vertex` entities. """
-        return len(self.vertices)
+        if self._packed is not None:
+            return len(self._packed)
+        return len(self._vertices)
 
     def __getitem__(self, pos) -> 'DXFVertex':
         """ Get :class:`Vertex` entity at position `pos`, supports ``list`` slicing. """
@@ -272,7 +370,9 @@ class Polyline(DXFGraphic):
 
     def points(self) -> Iterable[Vector]:
         """ Returns iterable of all polyline vertices as ``(x, y, z)`` tuples, not as :class:`Vertex` objects."""
-        return (vertex.dxf.location for vertex in self.vertices)
+        if self._packed is not None:
+            return self._packed.points()
+        return (vertex.dxf.location for vertex in self._vertices)
 
     def append_vertices(self, points: Iterable['Vertex'], dxfattribs: dict = None) -> None:
         """ Append multiple :class:`Vertex` entities at location `points`.
@@ -283,7 +383,13 @@ class Polyline(DXFGraphic):
 
         """
         dxfattribs = dxfattribs or {}
+        if self._packed is not None and not dxfattribs:  # append packed mesh vertices
+            self._packed.vertices.extend(tuple(Vector(point)) for point in points)
+            self._update_packed_handles()
+            self._box = None
+            return
         self.vertices.extend(self._build_dxf_vertices(points, dxfattribs))
+        self._box = None
 
     def append_vertex(self, point: 'Vertex', dxfattribs: dict = None) -> None:
         """
@@ -294,8 +400,7 @@ class Polyline(DXFGraphic):
             dxfattribs: dict of DXF attributes for :class:`Vertex` class
 
         """
-        dxfattribs = dxfattribs or {}
-        self.vertices.extend(self._build_dxf_vertices([point], dxfattribs))
+        self.append_vertices([point], dxfattribs)
 
     def insert_vertices(self, pos: int, points: Iterable['Vertex'], dxfattribs: dict = None) -> None:
         """
@@ -310,6 +415,7 @@ class Polyline(DXFGraphic):
         """
         dxfattribs = dxfattribs or {}
         self.vertices[pos:pos] = list(self._build_dxf_vertices(points, dxfattribs))
+        self._box = None
 
     def _build_dxf_vertices(self, points: Iterable['Vertex'], dxfattribs: dict) -> List['DXFVertex']:
         """ Converts point (x, y, z)-tuples into DXFVertex objects.
@@ -331,11 +437,81 @@ class Polyline(DXFGraphic):
             dxfattribs['location'] = point
             yield create_vertex('VERTEX', dxfattribs)
 
+    def transform(self, m: 'Matrix44') -> 'Polyline':
+        """ Transform POLYLINE entity and all linked VERTEX entities by transformation matrix `m` inplace.
+
+        Raises:
+            NonUniformScalingError: for non uniform scaling of 2D polylines with arc segments (bulges)
+
+        .. versionadded:: 0.11
+
+        """
+        if self.is_2d_polyline:
+            self._transform_2d(OCSTransform(self.dxf.extrusion, m))
+        elif self._packed is not None:
+            transform_vertex_arrays([self._packed.vertices.values], m)
+        else:  # 3D polyline, polygon mesh and poly face mesh vertices are WCS locations
+            transform = m.transform
+            for vertex in self.vertices:
+                if not vertex.is_face_record:
+                    vertex.dxf.location = Vector(transform(vertex.dxf.location))
+        self._box = None
+        return self
+
+    def _transform_2d(self, ocs: OCSTransform) -> None:
+        dxf = self.dxf
+        if not ocs.scale_uniform and any(vertex.dxf.get('bulge') for vertex in self.vertices):
+            raise const.NonUniformScalingError('2D POLYLINE with arcs does not support non uniform scaling.')
+        old_elevation = Vector(dxf.get('elevation', NULLVEC)).z
+        # all vertices of the transformed polyline have the same new elevation
+        elevation = ocs.transform_vertex((0, 0, old_elevation)).z
+        transform_width = ocs.transform_width
+        for vertex in self.vertices:
+            vertex_dxf = vertex.dxf
+            x, y = ocs.transform_2d_vertex(vertex_dxf.location, old_elevation)
+            vertex_dxf.location = Vector(x, y, elevation)
+            for name in ('start_width', 'end_width'):
+                width = vertex_dxf.get(name)
+                if width:
+                    vertex_dxf.set(name, transform_width(width))
+            if vertex_dxf.hasattr('tangent'):
+                vertex_dxf.tangent = ocs.transform_deg_angle(vertex_dxf.tangent)
+        if elevation or dxf.hasattr('elevation'):
+            dxf.elevation = Vector(0, 0, elevation)
+        for name in ('default_start_width', 'default_end_width'):
+            width = dxf.get(name)
+            if width:
+                dxf.set(name, transform_width(width))
+        self._transform_ocs_extrusion(ocs)
+
+    def translate(self, dx: float, dy: float, dz: float) -> 'Polyline':
+        """ Optimized POLYLINE translation about `dx` in x-axis, `dy` in y-axis and `dz` in z-axis.
+
+        .. versionadded:: 0.11
+
+        """
+        if self.is_2d_polyline:
+            offset = self._ocs_translation(dx, dy, dz)
+            if offset.z:
+                self.dxf.elevation = Vector(0, 0, offset.z) + self.dxf.get('elevation', NULLVEC)
+        else:
+            offset = Vector(dx, dy, dz)
+        if self._packed is not None:
+            transform_vertex_arrays([self._packed.vertices.values], Matrix44.translate(*offset))
+            self._box = None
+            return self
+        for vertex in self.vertices:
+            if not vertex.is_face_record:
+                vertex.dxf.location = offset + vertex.dxf.location
+        self._box = None
+        return self
+
     def cast(self) -> Union['Polyline', 'Polymesh', 'Polyface']:
         mode = self.get_mode()
-        if mode == 'AcDbPolyFaceMesh':
+        # do not replace an already casted entity, the layout stores the casted entity
+        if mode == 'AcDbPolyFaceMesh' and not isinstance(self, Polyface):
             return Polyface.from_polyline(self)
-        elif mode == 'AcDbPolygonMesh':
+        elif mode == 'AcDbPolygonMesh' and not isinstance(self, Polymesh):
             return Polymesh.from_polyline(self)
         else:
             return self
@@ -368,7 +544,8 @@ class Polyface(Polyline):
     @classmethod
     def from_polyline(cls, polyline: Polyline) -> 'Polyface':
         polyface = cls.shallow_copy(polyline)
-        polyface.vertices = polyline.vertices
+        polyface._vertices = polyline._vertices
+        polyface._packed = polyline._packed
         polyface.seqend = polyline.seqend
         # do not destroy polyline - all data would be lost
         return polyface
@@ -417,6 +594,12 @@ class Polyface(Polyline):
             return self._new_compound_entity('VERTEX', dxfattribs)
 
         dxfattribs = dxfattribs or {}
+        if self._packed is not None:
+            if set(dxfattribs) <= {'color'}:  # face color is the only individual attribute of packed face records
+                self._packed.append_faces(faces, color=dxfattribs.get('color', 256))
+                self._update_packed_counts()
+                return
+            self.unpack()
 
         existing_vertices, existing_faces = self.indexed_faces()
         # existing_faces is a generator, can't append new data
@@ -434,7 +617,7 @@ class Polyface(Polyline):
             new_faces.append(face_record)
         self._rebuild(chain(existing_faces, new_faces))
 
-    def _rebuild(self, faces: Iterable['FaceProxy'], precision: int = 6) -> None:
+    def _rebuild(self, faces: Iterable['FaceProxy'], precision: int = 6, tolerance: float = None) -> None:
         """
         Build a valid Polyface structure out of *faces*.
 
@@ -442,7 +625,7 @@ class Polyface(Polyline):
             faces: iterable of FaceProxy objects.
 
         """
-        polyface_builder = PolyfaceBuilder(faces, precision=precision)
+        polyface_builder = PolyfaceBuilder(faces, precision=precision, tolerance=tolerance)
         self.vertices = []
         # polyline._unlink_all_vertices()  # but don't remove it from database
         self.vertices = polyface_builder.get_vertices()
@@ -452,17 +635,32 @@ class Polyface(Polyline):
         self.dxf.m_count = nvertices
         self.dxf.n_count = nfaces
 
-    def optimize(self, precision: int = 6) -> None:
+    def _update_packed_counts(self) -> None:
+        self.update_count(self._packed.vertex_count, self._packed.face_count)
+        self._update_packed_handles()
+        self._box = None
+
+    def optimize(self, precision: int = 6, tolerance: float = None) -> None:
         """
         Rebuilds :class:`Polyface` with vertex optimization. Merges vertices with nearly same vertex locations.
         Polyfaces created by `ezdxf` are optimized automatically.
 
         Args:
             precision: decimal precision for determining identical vertex locations
+            tolerance: max. distance of identical vertex locations, overrides argument `precision`, see
+                       :func:`~ezdxf.math.vertexmerge.merge_vertices`
+
+        .. versionchanged:: 0.11
+
+            argument `tolerance`
 
         """
+        if self._packed is not None:
+            self._packed.optimize(precision, tolerance)
+            self._update_packed_counts()
+            return
         vertices, faces = self.indexed_faces()
-        self._rebuild(faces, precision)
+        self._rebuild(faces, precision, tolerance)
 
     def faces(self) -> Iterable[List['DXFVertex']]:
         """
@@ -562,11 +760,11 @@ class FaceProxy:
 
 class PolyfaceBuilder:
     """ Optimized polyface builder. (internal class) """
-    def __init__(self, faces: Iterable['FaceProxy'], precision: int = 6):
+    def __init__(self, faces: Iterable['FaceProxy'], precision: int = 6, tolerance: float = None):
         self.precision = precision
+        self.tolerance = tolerance
         self.faces = []
         self.vertices = []
-        self.index_mapping = {}
         self.build(faces)
 
     @property
@@ -583,27 +781,304 @@ class PolyfaceBuilder:
         return vertices
 
     def build(self, faces: Iterable['FaceProxy']) -> None:
-        for face in faces:
-            face_record = face.face_record
-            for vertex, name in zip(face, VERTEXNAMES):
-                index = self.add(vertex)
+        faces = [(face.face_record, list(zip(face, VERTEXNAMES))) for face in faces]
+        vertices = [vertex for _, face_vertices in faces for vertex, _ in face_vertices]
+        # merge all vertices in one call
+        keep, mapping = merge_vertices(
+            [vertex.dxf.location for vertex in vertices], precision=self.precision, tolerance=self.tolerance)
+        self.vertices = [vertices[index] for index in keep]
+        mapping = iter(mapping)
+        for face_record, face_vertices in faces:
+            for _, name in face_vertices:
+                index = next(mapping)
                 # preserve sign of old index value
                 sign = -1 if face_record.dxf.get(name, 0) < 0 else +1
                 face_record.dxf.set(name, (index + 1) * sign)
             self.faces.append(face_record)
 
-    def add(self, vertex: 'DXFVertex') -> int:
-        def key(point):
-            return tuple((round(coord, self.precision) for coord in point))
 
-        location = key(vertex.dxf.location)
+# DXF attributes of VERTEX entities which can be stored packed, see Polyline.pack()
+MESH_VERTEX_ATTRIBS = frozenset(['handle', 'owner', 'layer', 'linetype', 'paperspace', 'location', 'flags'])
+FACE_RECORD_ATTRIBS = MESH_VERTEX_ATTRIBS | frozenset(['color', 'vtx0', 'vtx1', 'vtx2', 'vtx3'])
+# count of VERTEX entities written by one TagWriter.write_str() call
+EXPORT_CHUNK_SIZE = 1000
+
+
+class PackedVertices:
+    """
+    Packed VERTEX entities of a :class:`Polyface` or a :class:`Polymesh`, see :meth:`Polyline.pack`. (internal class)
+
+    vertices:
+
+        Mesh vertex locations as :class:`~ezdxf.lldxf.packedtags.VertexArray`.
+
+    faces:
+
+        Four signed 1-based vertex indices for each face record like the DXF attributes vtx0 to vtx3 of the face
+        record VERTEX, 0 for an unused index and a negative index indicates the beginning of an invisible edge.
+
+    colors:
+
+        Color of each face record, 256 for BYLAYER.
+
+    handles:
+
+        Handles of all packed VERTEX entities as integers, mesh vertices first followed by the face records, or
+        ``None`` if not assigned.
+
+    """
+    __slots__ = ('vertices', 'faces', 'colors', 'handles')
+
+    def __init__(self, vertices: Iterable[float] = None, faces: Iterable[int] = None, colors: Iterable[int] = None):
+        self.vertices = VertexArray(vertices)
+        self.faces = array.array('l', faces or [])
+        self.colors = array.array('h', colors or [])
+        self.handles = None  # type: Optional[array.array]
+
+    def __len__(self) -> int:
+        """ Returns count of packed VERTEX entities. """
+        return len(self.vertices) + len(self.colors)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def face_count(self) -> int:
+        return len(self.colors)
+
+    def copy(self) -> 'PackedVertices':
+        """ Returns a copy without handles. """
+        return self.__class__(self.vertices.values, self.faces, self.colors)
+
+    @classmethod
+    def from_polyline(cls, polyline: 'Polyline') -> Optional['PackedVertices']:
+        """ Returns the packed VERTEX entities of `polyline` or ``None`` if a VERTEX entity can not be packed. """
+        dxf = polyline.dxf
+        layer = dxf.layer
+        linetype = dxf.get('linetype')
+        paperspace = dxf.get('paperspace', 0)
+        vertex_flags = polyline.get_vertex_flags()
+        face_flags = const.VTX_3D_POLYFACE_MESH_VERTEX if polyline.is_poly_face_mesh else None
+        mesh_vertices = []
+        face_records = []
+        for vertex in polyline._vertices:
+            if vertex.appdata or vertex.reactors or vertex.extension_dict or vertex.xdata or vertex.embedded_objects:
+                return None
+            attribs = vertex.dxf.all_existing_dxf_attribs()
+            if attribs.get('layer', '0') != layer or attribs.get('linetype') != linetype or \
+                    attribs.get('paperspace', 0) != paperspace:
+                return None
+            flags = attribs.get('flags', 0)
+            if flags == vertex_flags and MESH_VERTEX_ATTRIBS.issuperset(attribs):
+                mesh_vertices.append(vertex)
+            elif flags == face_flags and FACE_RECORD_ATTRIBS.issuperset(attribs) and \
+                    Vector(attribs.get('location', NULLVEC)).is_null:
+                face_records.append(vertex)
+            else:
+                return None
+
+        packed = cls(
+            vertices=chain.from_iterable(vertex.dxf.location for vertex in mesh_vertices),
+            faces=[vertex.dxf.get(name, 0) for vertex in face_records for name in VERTEXNAMES],
+            colors=[vertex.dxf.get('color', const.BYLAYER) for vertex in face_records],
+        )
         try:
-            return self.index_mapping[location]
-        except KeyError:  # internal exception
-            index = len(self.vertices)
-            self.index_mapping[location] = index
-            self.vertices.append(vertex)
-            return index
+            packed.handles = array.array(
+                'Q', (int(vertex.dxf.handle, 16) for vertex in chain(mesh_vertices, face_records)))
+        except (TypeError, ValueError):  # VERTEX without handle
+            pass
+        return packed
+
+    def reserve_handles(self, db: 'EntityDB') -> None:
+        """ Assign a new block of handles from entity database `db`, if the packed VERTEX entities have no handles or
+        the count of VERTEX entities has changed, else reserve the existing handles, which are not stored in `db`.
+        """
+        count = len(self)
+        if self.handles is None or len(self.handles) != count:
+            self.handles = array.array('Q', (int(handle, 16) for handle in db.next_handles(count)))
+        elif count:
+            seed = max(self.handles) + 1
+            if int(str(db.handles), 16) < seed:  # you can not trust $HANDSEED value
+                db.handles.reset('%X' % seed)
+
+    def points(self) -> Iterable[Vector]:
+        """ Returns the locations of all packed VERTEX entities, face records are located at (0, 0, 0). """
+        return chain((Vector(vertex) for vertex in self.vertices), repeat(NULLVEC, self.face_count))
+
+    def face_indices(self) -> List[Sequence[int]]:
+        """ Returns the vertex indices of each face record as ``(vtx0, vtx1, vtx2, vtx3)`` slices. """
+        faces = self.faces
+        return [faces[index:index + 4] for index in range(0, len(faces), 4)]
+
+    def append_faces(self, faces: Iterable['FaceType'], color: int = const.BYLAYER) -> None:
+        """ Append `faces` and merge coincident vertices like :meth:`Polyface.append_faces`. """
+        vertices = list(self.vertices)
+        indices = self.face_indices()
+        colors = list(self.colors)
+        for face in faces:
+            # a face record references 4 vertices at most
+            points = [Vector(point) for point in islice(face, 4)]
+            start = len(vertices) + 1
+            vertices.extend(points)
+            indices.append(list(range(start, start + len(points))) + [0] * (4 - len(points)))
+            colors.append(color)
+        self._rebuild(vertices, indices, colors)
+
+    def optimize(self, precision: int = 6, tolerance: float = None) -> None:
+        """ Merge coincident vertices like :meth:`Polyface.optimize`. """
+        self._rebuild(list(self.vertices), self.face_indices(), self.colors, precision, tolerance)
+
+    def _rebuild(self, vertices: List['Vertex'], faces: List[Sequence[int]], colors: Iterable[int],
+                 precision: int = 6, tolerance: float = None) -> None:
+        # same structure as build by the PolyfaceBuilder: only referenced vertices in order of appearance
+        used = [vertices[abs(index) - 1] for face in faces for index in face if index]
+        keep, mapping = merge_vertices(used, precision=precision, tolerance=tolerance)
+        mapping = iter(mapping)
+        new_faces = array.array('l')
+        for face in faces:
+            count = len([index for index in face if index])
+            for slot in range(4):
+                if slot < count:
+                    index = next(mapping) + 1
+                    # preserve sign of old index value
+                    new_faces.append(-index if face[slot] < 0 else index)
+                else:
+                    new_faces.append(0)
+        self.vertices = VertexArray(chain.from_iterable(used[index] for index in keep))
+        self.faces = new_faces
+        self.colors = array.array('h', colors)
+
+    def shared_dxfattribs(self, polyline: 'Polyline') -> dict:
+        """ Returns the DXF attributes of the packed VERTEX entities inherited from `polyline`. """
+        dxf = polyline.dxf
+        dxfattribs = {'layer': dxf.layer}
+        for name in ('owner', 'linetype', 'paperspace'):
+            if dxf.hasattr(name):
+                dxfattribs[name] = dxf.get(name)
+        return dxfattribs
+
+    def create_vertices(self, polyline: 'Polyline') -> List['DXFVertex']:
+        """ Returns the packed VERTEX entities as new :class:`DXFVertex` entities with the packed handles, the new
+        entities are stored in the entity database if `polyline` is stored in the entity database.
+        """
+        doc = polyline.doc
+        db = doc.entitydb if doc is not None else None
+        stored = db is not None and polyline.dxf.handle in db
+        if stored:
+            self.reserve_handles(db)
+        if self.handles is not None and len(self.handles) == len(self):
+            handles = ['%X' % handle for handle in self.handles]
+        else:
+            handles = [None] * len(self)
+
+        dxfattribs = self.shared_dxfattribs(polyline)
+        vertex_count = self.vertex_count
+        vertices = DXFVertex.new_entities(
+            handles[:vertex_count], dict(dxfattribs, flags=polyline.get_vertex_flags()),
+            columns={'location': list(self.vertices)}, doc=doc)
+        if self.face_count:
+            faces = self.faces
+            columns = {name: [index or None for index in faces[slot::4]] for slot, name in enumerate(VERTEXNAMES)}
+            columns['color'] = [None if color == const.BYLAYER else color for color in self.colors]
+            vertices.extend(DXFVertex.new_entities(
+                handles[vertex_count:], dict(dxfattribs, flags=const.VTX_3D_POLYFACE_MESH_VERTEX, location=NULLVEC),
+                columns=columns, doc=doc))
+        if stored:
+            db.extend(vertices)
+        return vertices
+
+    def export_dxf(self, tagwriter: 'TagWriter', polyline: 'Polyline') -> None:
+        """ Export packed VERTEX entities as DXF VERTEX entities by `tagwriter`. """
+        if self.handles is None or len(self.handles) != len(self):
+            self.reserve_handles(polyline.entitydb)
+        handles = map('%X'.__mod__, self.handles)
+        dxfattribs = self.shared_dxfattribs(polyline)
+
+        # the variable tags of the vertex records are: handle (5) and location (10, 20, 30)
+        template = _vertex_template(
+            tagwriter, polyline.doc, dict(dxfattribs, flags=polyline.get_vertex_flags(), location=NULLVEC),
+            (10, 20, 30, 5))
+        values = self.vertices.values
+        _write_vertex_records(tagwriter, template, zip(values[0::3], values[1::3], values[2::3], handles))
+        if not self.face_count:
+            return
+
+        # the variable tags of the face records are: handle (5), color (62) and vertex indices (71, 72, 73, 74),
+        # the prototype has placeholder values for the optional color and vertex indices
+        template = _vertex_template(tagwriter, polyline.doc, dict(
+            dxfattribs, flags=const.VTX_3D_POLYFACE_MESH_VERTEX, location=NULLVEC,
+            color=1, vtx0=1, vtx1=1, vtx2=1, vtx3=1,
+        ), (71, 72, 73, 74, 62, 5))
+        faces = self.faces
+        records = (
+            (vtx0 or None, vtx1 or None, vtx2 or None, vtx3 or None, None if color == const.BYLAYER else color, handle)
+            for vtx0, vtx1, vtx2, vtx3, color, handle in zip(
+                faces[0::4], faces[1::4], faces[2::4], faces[3::4], self.colors, handles)
+        )
+        _write_vertex_records(tagwriter, template, records)
+
+
+def _vertex_template(tagwriter: 'TagWriter', doc: 'Drawing', dxfattribs: dict,
+                     variables: Sequence[int]) -> List[Union[str, Tuple[int, Any, Optional[int]]]]:
+    """
+    Returns the export template of VERTEX entities with the same DXF attributes `dxfattribs` as exported by
+    `tagwriter`, as list of ``(code, value, index)`` tuples, where `index` is the position of the tag value in a record
+    of :func:`_write_vertex_records` for tags with group codes in `variables` and ``None`` for fixed tags. Fixed tags
+    are preformatted DXF strings for the ASCII :class:`TagWriter`.
+
+    """
+    prototype = DXFVertex.new(handle='0', dxfattribs=dxfattribs, doc=doc)
+    collector = TagCollector(
+        dxfversion=tagwriter.dxfversion, write_handles=tagwriter.write_handles, optional=tagwriter.force_optional)
+    prototype.export_dxf(collector)
+    preformat = tagwriter.__class__ is TagWriter
+    template = []
+    for code, value in collector.tags:
+        if code in variables:
+            template.append((code, None, variables.index(code)))
+        elif preformat:
+            template.append(TAG_STRING_FORMAT % (code, value))
+        else:
+            template.append((code, value, None))
+    return template
+
+
+def _write_vertex_records(tagwriter: 'TagWriter', template: List, records: Iterable[Sequence[Any]]) -> None:
+    """ Write a VERTEX entity for each record of `records` by `template`, see :func:`_vertex_template`, tags with
+    ``None`` values are not written.
+    """
+    if tagwriter.__class__ is not TagWriter:
+        write_tag2 = tagwriter.write_tag2
+        for record in records:
+            for code, value, index in template:
+                if index is not None:
+                    value = record[index]
+                    if value is None:
+                        continue
+                write_tag2(code, value)
+        return
+
+    # write preformatted DXF strings in chunks
+    fmt = ''.join(
+        item.replace('{', '{{').replace('}', '}}') if isinstance(item, str) else '%3d\n{%d}\n' % (item[0], item[2])
+        for item in template
+    )
+    strings = []
+    for record in records:
+        if None in record:
+            strings.append(''.join(
+                item if isinstance(item, str) else
+                ('' if record[item[2]] is None else TAG_STRING_FORMAT % (item[0], record[item[2]]))
+                for item in template
+            ))
+        else:
+            strings.append(fmt.format(*record))
+        if len(strings) >= EXPORT_CHUNK_SIZE:
+            tagwriter.write_str(''.join(strings))
+            strings = []
+    if strings:
+        tagwriter.write_str(''.join(strings))
 
 
 class Polymesh(Polyline):
@@ -622,7 +1097,8 @@ class Polymesh(Polyline):
     @classmethod
     def from_polyline(cls, polyline: Polyline) -> 'Polymesh':
         polymesh = cls.shallow_copy(polyline)
-        polymesh.vertices = polyline.vertices
+        polymesh._vertices = polyline._vertices
+        polymesh._packed = polyline._packed
         polymesh.seqend = polyline.seqend
         # do not destroy polyline - all data would be lost
         return polymesh
@@ -637,10 +1113,15 @@ class Polymesh(Polyline):
             dxfattribs: dict of DXF attributes
 
         """
+        if self._packed is not None and not dxfattribs:  # location of packed mesh vertex
+            self._packed.vertices[self._mesh_vertex_index(pos)] = tuple(Vector(point))
+            self._box = None
+            return
         dxfattribs = dxfattribs or {}
         dxfattribs['location'] = point
         vertex = self.get_mesh_vertex(pos)
         vertex.update_dxf_attribs(dxfattribs)
+        self._box = None
 
     def get_mesh_vertex(self, pos: Tuple[int, int]) -> 'DXFVertex':
         """
@@ -650,12 +1131,14 @@ class Polymesh(Polyline):
             pos: 0-based ``(row, col)`` tuple, position of mesh vertex
 
         """
+        return self.vertices[self._mesh_vertex_index(pos)]
+
+    def _mesh_vertex_index(self, pos: Tuple[int, int]) -> int:
         m_count = self.dxf.m_count
         n_count = self.dxf.n_count
         m, n = pos
         if 0 <= m < m_count and 0 <= n < n_count:
-            pos = m * n_count + n
-            return self.vertices[pos]
+            return m * n_count + n
         else:
             raise const.DXFIndexError(repr(pos))
 
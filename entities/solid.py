@@ -5,12 +5,13 @@ from typing import TYPE_CHECKING
 from ezdxf.math import Vector
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER, VERTEXNAMES
+from ezdxf.math.transformtools import OCSTransform
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DXFNamespace
+    from ezdxf.eztypes import TagWriter, DXFNamespace, Matrix44
 
 __all__ = ['Solid', 'Trace', 'Face3d']
 
@@ -38,6 +39,7 @@ class Solid(_Base):
     """ DXF SHAPE entity """
     DXFTYPE = 'SOLID'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_trace)
+    SUPPORTS_TRANSFORM = True
 
     def __getitem__(self, num):
         return self.dxf.get(VERTEXNAMES[num])
@@ -68,6 +70,34 @@ class Solid(_Base):
             'vtx0', 'vtx1', 'vtx2', 'vtx3', 'thickness', 'extrusion',
         ])
 
+    def transform(self, m: 'Matrix44') -> 'Solid':
+        """ Transform SOLID/TRACE entity by transformation matrix `m` inplace.
+
+        .. versionadded:: 0.11
+
+        """
+        # SOLID and TRACE vertices are OCS coordinates
+        dxf = self.dxf
+        ocs = OCSTransform(dxf.extrusion, m)
+        for name in VERTEXNAMES:
+            if dxf.hasattr(name):
+                dxf.set(name, ocs.transform_vertex(dxf.get(name)))
+        self._transform_ocs_extrusion(ocs)
+        return self
+
+    def translate(self, dx: float, dy: float, dz: float) -> 'Solid':
+        """ Optimized SOLID/TRACE translation about `dx` in x-axis, `dy` in y-axis and `dz` in z-axis.
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        offset = self._ocs_translation(dx, dy, dz)
+        for name in VERTEXNAMES:
+            if dxf.hasattr(name):
+                dxf.set(name, offset + dxf.get(name))
+        return self
+
 
 @register_entity
 class Trace(Solid):
@@ -94,6 +124,7 @@ class Face3d(_Base):
     """ DXF 3DFACE entity """
     DXFTYPE = '3DFACE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_face)
+    SUPPORTS_TRANSFORM = True
 
     def is_invisible_edge(self, num) -> bool:
         """ Returns True if edge `num` is an invisible edge. """
@@ -124,3 +155,28 @@ class Face3d(_Base):
         if not self.dxf.hasattr('vtx3'):
             self.dxf.vtx3 = self.dxf.vtx2
         self.dxf.export_dxf_attribs(tagwriter, ['vtx0', 'vtx1', 'vtx2', 'vtx3', 'invisible'])
+
+    def transform(self, m: 'Matrix44') -> 'Face3d':
+        """ Transform 3DFACE entity by transformation matrix `m` inplace.
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        for name in VERTEXNAMES:
+            if dxf.hasattr(name):
+                dxf.set(name, Vector(m.transform(dxf.get(name))))
+        return self
+
+    def translate(self, dx: float, dy: float, dz: float) -> 'Face3d':
+        """ Optimized 3DFACE translation about `dx` in x-axis, `dy` in y-axis and `dz` in z-axis.
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        offset = Vector(dx, dy, dz)
+        for name in VERTEXNAMES:
+            if dxf.hasattr(name):
+                dxf.set(name, offset + dxf.get(name))
+        return self
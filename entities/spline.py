@@ -1,7 +1,7 @@
 # Copyright (c) 2019 Manfred Moitzi
 # License: MIT License
 # Created 2019-03-06
-from typing import TYPE_CHECKING, Iterable, Sequence
+from typing import TYPE_CHECKING, Iterable, Sequence, List
 import array
 import copy
 from itertools import chain
@@ -10,13 +10,14 @@ from ezdxf.math import Vector
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import SUBCLASS_MARKER, DXF2000, DXFValueError
 from ezdxf.lldxf.packedtags import VertexArray
-from ezdxf.math.bspline import uniform_knot_vector, open_uniform_knot_vector
+from ezdxf.math.bspline import uniform_knot_vector, open_uniform_knot_vector, BSpline, bspline_control_frame
+from ezdxf.math.transformtools import transform_vertex_arrays, transform_extrusion
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DXFNamespace, Drawing, Vertex, Tags
+    from ezdxf.eztypes import TagWriter, DXFNamespace, Drawing, Vertex, Tags, Matrix44
 
 __all__ = ['Spline']
 
@@ -62,6 +63,7 @@ class Spline(DXFGraphic):
     DXFTYPE = 'SPLINE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_spline)
     MIN_DXF_VERSION_FOR_EXPORT = DXF2000
+    SUPPORTS_TRANSFORM = True
     CLOSED = 1  # closed b-spline
     PERIODIC = 2  # uniform b-spline
     RATIONAL = 4  # rational b-spline
@@ -147,6 +149,7 @@ class Spline(DXFGraphic):
     @knots.setter
     def knots(self, values: Iterable[float]) -> None:
         self._knots = array.array('d', values)
+        self._box = None
 
     def knot_count(self) -> int:  # DXF callback attribute Spline.dxf.n_knots
         """ Count of knot values. """
@@ -160,6 +163,7 @@ class Spline(DXFGraphic):
     @weights.setter
     def weights(self, values: Iterable[float]) -> None:
         self._weights = array.array('d', values)
+        self._box = None
 
     @property
     def control_points(self) -> VertexArray:  # group code 10
@@ -169,6 +173,7 @@ class Spline(DXFGraphic):
     @control_points.setter
     def control_points(self, points: Iterable['Vertex']) -> None:
         self._control_points = VertexArray(chain.from_iterable(points))
+        self._box = None
 
     def control_point_count(self) -> int:  # DXF callback attribute Spline.dxf.n_control_points
         """ Count of control points. """
@@ -182,6 +187,7 @@ class Spline(DXFGraphic):
     @fit_points.setter
     def fit_points(self, points: Iterable['Vertex']) -> None:
         self._fit_points = VertexArray(chain.from_iterable(points))
+        self._box = None
 
     def fit_point_count(self) -> int:  # DXF callback attribute Spline.dxf.n_fit_points
         """ Count of fit points. """
@@ -257,6 +263,62 @@ class Spline(DXFGraphic):
             raise DXFValueError('Control point count must be equal to weights count.')
         self.weights = weights
 
+    def construction_tool(self) -> BSpline:
+        """ Returns the B-spline curve as :class:`~ezdxf.math.BSpline` object, defined by the control points, knots
+        and weights or by the fit points if no control points exist.
+
+        Raises:
+            DXFValueError: invalid or incomplete spline definition
+
+        .. versionadded:: 0.11
+
+        """
+        order = self.dxf.degree + 1
+        count = len(self._control_points)
+        if count:
+            knots = self.knots
+            if len(knots) != count + order:
+                knots = None  # use an open uniform knot vector for invalid knot vectors
+            weights = self.weights
+            return BSpline(self._control_points, order=order, knots=knots,
+                           weights=weights if len(weights) == count else None)
+        if len(self._fit_points) < order:
+            raise DXFValueError('SPLINE requires at least {} control points or fit points.'.format(order))
+        return bspline_control_frame(self._fit_points, degree=order - 1)
+
+    def approximate(self, segments: int = 40) -> List[Vector]:
+        """ Approximates the B-spline curve by line segments, returns `segments` + 1 vertices in :ref:`WCS` as
+        :class:`~ezdxf.math.Vector` objects, see :meth:`construction_tool`.
+
+        .. versionadded:: 0.11
+
+        """
+        return self.construction_tool().approximate(segments)
+
+    def transform(self, m: 'Matrix44') -> 'Spline':
+        """ Transform SPLINE entity by transformation matrix `m` inplace, supports also non uniform scaling.
+
+        .. versionadded:: 0.11
+
+        """
+        transform_vertex_arrays([self._control_points.values, self._fit_points.values], m)
+        self._transform_attribs(m)
+        return self
+
+    def _transform_attribs(self, m: 'Matrix44') -> None:
+        """ Transform all attributes except the control- and fit points by `m`, the points are transformed by
+        :func:`~ezdxf.math.transformtools.transform_vertex_arrays`. (internal API)
+        """
+        dxf = self.dxf
+        for name in ('start_tangent', 'end_tangent'):
+            tangent = dxf.get(name)
+            if tangent is not None:
+                tangent = Vector(m.transform_direction(tangent))
+                dxf.set(name, tangent.normalize() if tangent.magnitude else tangent)
+        if dxf.hasattr('extrusion'):
+            dxf.extrusion = transform_extrusion(dxf.extrusion, m)[0]
+        self._box = None
+
     @contextmanager
     def edit_data(self) -> 'SplineData':
         """
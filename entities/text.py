@@ -2,7 +2,9 @@
 # License: MIT License
 # Created 2019-02-15
 from typing import TYPE_CHECKING, Tuple, Union
+import math
 from ezdxf.math import Vector
+from ezdxf.math.transformtools import OCSTransform
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType, DXFValueError
 from ezdxf.lldxf import const
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER
@@ -11,7 +13,7 @@ from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, Vertex, DXFNamespace
+    from ezdxf.eztypes import TagWriter, Vertex, DXFNamespace, Matrix44
 
 __all__ = ['Text', 'acdb_text']
 
@@ -58,6 +60,7 @@ class Text(DXFGraphic):
     """ DXF TEXT entity """
     DXFTYPE = 'TEXT'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_text, acdb_text2)
+    SUPPORTS_TRANSFORM = True
     # horizontal align values
     LEFT = 0
     CENTER = 1
@@ -188,3 +191,43 @@ class Text(DXFGraphic):
         if halign > 2:
             valign = 0
         return const.TEXT_ALIGNMENT_BY_FLAGS.get((halign, valign), 'LEFT')
+
+    def transform(self, m: 'Matrix44') -> 'Text':
+        """ Transform TEXT entity by transformation matrix `m` inplace. Non uniform scaling changes the text height
+        and the width factor, the oblique angle is not changed.
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        ocs = OCSTransform(dxf.extrusion, m)
+        dxf.insert = ocs.transform_vertex(dxf.insert)
+        if dxf.hasattr('align_point'):
+            dxf.align_point = ocs.transform_vertex(dxf.align_point)
+        rotation = dxf.rotation
+        x_direction = ocs.transform_direction(Vector.from_deg_angle(rotation))
+        y_direction = ocs.transform_direction(Vector.from_deg_angle(rotation + 90.))
+        x_scale = x_direction.magnitude
+        y_scale = abs(x_direction.normalize().cross(y_direction).z)  # text height is perpendicular to the baseline
+        rotation = x_direction.angle_deg % 360.
+        if rotation or dxf.hasattr('rotation'):
+            dxf.rotation = rotation
+        if dxf.hasattr('height') or not math.isclose(y_scale, 1.):
+            dxf.height = dxf.height * y_scale
+        if not math.isclose(x_scale, y_scale, rel_tol=1e-9):
+            dxf.width = dxf.width * x_scale / y_scale
+        self._transform_ocs_extrusion(ocs)
+        return self
+
+    def translate(self, dx: float, dy: float, dz: float) -> 'Text':
+        """ Optimized TEXT translation about `dx` in x-axis, `dy` in y-axis and `dz` in z-axis.
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        offset = self._ocs_translation(dx, dy, dz)
+        dxf.insert = offset + dxf.insert
+        if dxf.hasattr('align_point'):
+            dxf.align_point = offset + dxf.align_point
+        return self
@@ -10,7 +10,7 @@ from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, DXFNamespace
+    from ezdxf.eztypes import TagWriter, DXFNamespace, Matrix44
 
 __all__ = ['Ray', 'XLine']
 
@@ -26,6 +26,7 @@ class XLine(DXFGraphic):
     DXFTYPE = 'XLINE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_xline)
     MIN_DXF_VERSION_FOR_EXPORT = DXF2000
+    SUPPORTS_TRANSFORM = True
     XLINE_SUBCLASS = 'AcDbXline'
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
@@ -45,6 +46,26 @@ class XLine(DXFGraphic):
         # for all DXF versions
         self.dxf.export_dxf_attribs(tagwriter, ['start', 'unit_vector'])
 
+    def transform(self, m: 'Matrix44') -> 'XLine':
+        """ Transform XLINE/RAY entity by transformation matrix `m` inplace.
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        dxf.start = Vector(m.transform(dxf.start))
+        dxf.unit_vector = Vector(m.transform_direction(dxf.unit_vector)).normalize()
+        return self
+
+    def translate(self, dx: float, dy: float, dz: float) -> 'XLine':
+        """ Optimized XLINE/RAY translation about `dx` in x-axis, `dy` in y-axis and `dz` in z-axis.
+
+        .. versionadded:: 0.11
+
+        """
+        self.dxf.start = Vector(dx, dy, dz) + self.dxf.start
+        return self
+
 
 @register_entity
 class Ray(XLine):
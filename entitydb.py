@@ -2,15 +2,18 @@
 # Created: 2019-02-14
 # Copyright (c) 2019, Manfred Moitzi
 # License: MIT License
-from typing import Optional, Iterable, Tuple, Union, TYPE_CHECKING
+from typing import Optional, Iterable, Tuple, Union, Dict, Set, Hashable, Any, Callable, List, Sequence, TYPE_CHECKING
+from collections import abc
+from operator import attrgetter, itemgetter
 from ezdxf.tools.handle import HandleGenerator
 from ezdxf.entities.dxfentity import DXFEntity
 from ezdxf.order import priority, zorder
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter
+    from ezdxf.eztypes import TagWriter, SpatialIndex
 
 DATABASE_EXCLUDE = {'SECTION', 'ENDSEC', 'EOF', 'TABLE', 'ENDTAB', 'CLASS', 'ACDSRECORD', 'ACDSSCHEMA'}
+HANDLE = attrgetter('dxf.handle')
 
 
 class EntityDB:
@@ -24,6 +27,10 @@ class EntityDB:
     def __init__(self):
         self._database = {}
         self.handles = HandleGenerator()
+        # secondary indexes: key -> index value -> set of handles, each index is build at the first request
+        self._indexes = dict()  # type: Dict[str, Dict[Hashable, Set[str]]]
+        # key -> handle -> indexed value
+        self._indexed_values = dict()  # type: Dict[str, Dict[str, Hashable]]
 
     def __getitem__(self, handle: str) -> DXFEntity:
         """ Get entity by `handle`. """
@@ -32,10 +39,15 @@ class EntityDB:
     def __setitem__(self, handle: str, entity: DXFEntity) -> None:
         """ Set `entity` for `handle`. """
         self._database[handle] = entity
+        for key in self._indexes:
+            self._unindex(key, handle)
+            self._index(key, handle, entity)
 
     def __delitem__(self, handle: str) -> None:
         """ Delete entity by `handle`. Removes entity only from database, does not destroy the entity. """
         del self._database[handle]
+        for key in self._indexes:
+            self._unindex(key, handle)
 
     def __contains__(self, item: Union[str, DXFEntity]) -> bool:
         """ ``True`` if database contains `item`, `item` can be a handle or an entity. """
@@ -67,6 +79,23 @@ class EntityDB:
             if handle not in self._database:  # you can not trust $HANDSEED value
                 return handle
 
+    def next_handles(self, count: int) -> List[str]:
+        """
+        Returns `count` unique handles, allocated as one block of consecutive handles.
+
+        .. versionadded:: 0.11
+
+        """
+        database = self._database
+        handles = self.handles.next_block(count)
+        if database.keys().isdisjoint(handles):
+            return handles
+        # you can not trust $HANDSEED value
+        handles = [handle for handle in handles if handle not in database]
+        while len(handles) < count:
+            handles.append(self.next_handle())
+        return handles
+
     def keys(self) -> Iterable[str]:
         """ Iterable of all handles. """
         return self._database.keys()
@@ -100,6 +129,114 @@ class EntityDB:
         if hasattr(entity, 'add_sub_entities_to_entitydb'):
             entity.add_sub_entities_to_entitydb()
 
+    def extend(self, entities: Iterable[DXFEntity]) -> None:
+        """
+        Add multiple new `entities` in one step, entities without handle are added by :meth:`add`. Sub entities like
+        ATTRIB, VERTEX and SEQEND are not added automatically like by :meth:`add`. (internal API)
+
+        .. versionadded:: 0.11
+
+        """
+        entities = list(entities)
+        handles = list(map(HANDLE, entities))
+        if None in handles or not DATABASE_EXCLUDE.isdisjoint(entity.dxftype() for entity in entities):
+            for entity in entities:
+                self.add(entity)
+            return
+        added = list(zip(handles, entities))
+        self._database.update(added)
+        for key in self._indexes:
+            for handle, entity in added:
+                self._unindex(key, handle)  # replaced entity
+                self._index(key, handle, entity)
+
+    def index(self, key: str) -> Dict[Hashable, Set[str]]:
+        """
+        Returns the secondary index `key` as dict of index values and sets of handles, valid keys are ``'dxftype'``,
+        ``'layer'``, ``'owner'``, ``'name'`` (block name of INSERT entities) and ``'geometry'`` (geometry block name
+        of DIMENSION entities). String values are stored in lower case. Each index is build at the first request and
+        is updated by adding and deleting entities and by setting indexed DXF attributes. Don't modify the returned
+        index.
+
+        .. versionadded:: 0.11
+
+        """
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._build_index(key)
+        return index
+
+    def handles_by_index(self, conditions: Iterable[Tuple[str, Any]]) -> Set[str]:
+        """
+        Returns the handles of all entities matching all index `conditions` as ``(key, value)`` tuples, where `key`
+        is an index key and `value` is an index value or a set of index values (match any value). String values are
+        case insensitive. The result may contain entities not matching the conditions in the original case.
+
+        .. versionadded:: 0.11
+
+        """
+        result = None
+        for key, value in conditions:
+            index = self.index(key)
+            if isinstance(value, (set, frozenset)):
+                handles = set()
+                for v in value:
+                    handles.update(index.get(index_value(v), ()))
+            else:
+                handles = index.get(index_value(value), set())
+            result = set(handles) if result is None else result & handles
+            if not result:
+                break
+        return result if result is not None else set(self._database.keys())
+
+    def reindex(self, entity: DXFEntity, key: str) -> None:
+        """ Update secondary index `key` of `entity` after changing an indexed DXF attribute. (internal API) """
+        if key not in self._indexes:
+            return
+        handle = entity.dxf.handle
+        if self._database.get(handle) is not entity:  # entity is not stored in this database
+            return
+        if self._indexed_values[key].get(handle) != INDEX_FUNCTIONS[key](entity):
+            self._unindex(key, handle)
+            self._index(key, handle, entity)
+
+    def _build_index(self, key: str) -> Dict[Hashable, Set[str]]:
+        func = INDEX_FUNCTIONS[key]
+        index = dict()
+        values = dict()
+        for handle, entity in self._database.items():
+            value = func(entity)
+            if value is not None:
+                values[handle] = value
+                handles = index.get(value)
+                if handles is None:
+                    index[value] = {handle}
+                else:
+                    handles.add(handle)
+        self._indexes[key] = index
+        self._indexed_values[key] = values
+        return index
+
+    def _index(self, key: str, handle: str, entity: DXFEntity) -> None:
+        value = INDEX_FUNCTIONS[key](entity)
+        if value is not None:
+            self._indexed_values[key][handle] = value
+            index = self._indexes[key]
+            handles = index.get(value)
+            if handles is None:
+                index[value] = {handle}
+            else:
+                handles.add(handle)
+
+    def _unindex(self, key: str, handle: str) -> None:
+        value = self._indexed_values[key].pop(handle, None)
+        if value is not None:
+            index = self._indexes[key]
+            handles = index[value]
+            handles.discard(handle)
+            if not handles:
+                del index[value]
+
     def delete_entity(self, entity: DXFEntity) -> None:
         """ Removes `entity` from database and destroys the `entity`. """
         del self[entity.dxf.handle]
@@ -126,6 +263,70 @@ class EntityDB:
         return new_entity
 
 
+def index_value(value: Any) -> Any:
+    """ Returns `value` as normalized index value, strings in lower case. (internal API) """
+    return value.lower() if isinstance(value, str) else value
+
+
+def dxftype_index_value(entity: DXFEntity) -> str:
+    return entity.dxftype().lower()
+
+
+def layer_index_value(entity: DXFEntity) -> Optional[str]:
+    if entity.is_lazy:
+        layer = entity.lazy_common_attribs()[2]
+    else:
+        try:
+            layer = entity.dxf.get('layer')
+        except AttributeError:  # not supported or destroyed entity
+            return None
+    return index_value(layer)
+
+
+def owner_index_value(entity: DXFEntity) -> Optional[str]:
+    """ Returns the owner handle of `entity` as index value, does not decode lazy loaded entities. (internal API) """
+    if entity.is_lazy:
+        owner = entity.lazy_owner()[0]
+    else:
+        try:
+            owner = entity.dxf.get('owner')
+        except AttributeError:  # destroyed entity
+            return None
+    return index_value(owner)
+
+
+def name_index_value(entity: DXFEntity) -> Optional[str]:
+    if entity.dxftype() != 'INSERT':
+        return None
+    try:
+        return index_value(entity.dxf.get('name'))
+    except AttributeError:  # destroyed entity
+        return None
+
+
+def geometry_index_value(entity: DXFEntity) -> Optional[str]:
+    if entity.dxftype() != 'DIMENSION':
+        return None
+    try:
+        return index_value(entity.dxf.get('geometry'))
+    except AttributeError:  # destroyed entity
+        return None
+
+
+# secondary indexes of the entity database, the index functions return the index value of an entity or None for
+# not indexed entities and do not decode lazy loaded entities
+INDEX_FUNCTIONS = {
+    'dxftype': dxftype_index_value,
+    'layer': layer_index_value,
+    'owner': owner_index_value,
+    'name': name_index_value,  # block name of INSERT entities
+    'geometry': geometry_index_value,  # geometry block name of DIMENSION entities
+}  # type: Dict[str, Callable[[DXFEntity], Optional[Hashable]]]
+
+
+COMPACT_THRESHOLD = 32  # minimum count of tombstones before compacting the slot list
+
+
 class EntitySpace:
     """
     An :class:`EntitySpace` is a collection of :class:`~ezdxf.entities.dxfentity.DXFEntity` objects, that stores only
@@ -134,15 +335,30 @@ class EntitySpace:
     The :class:`~ezdxf.layouts.Modelspace`, any :class:`~ezdxf.layouts.Paperspace` layout and
     :class:`~ezdxf.layouts.BlockLayout` objects have an :class:`EntitySpace` container to store their entities.
 
+    Entities are stored in a list of slots in order of appearance, an entity -> slot map supports membership tests and
+    removing of entities in O(1). Removed entities leave a tombstone (``None``) in their slot, the slot list is
+    compacted if more than half of the slots are tombstones or at the next index access.
+
     """
 
     def __init__(self, entities=None):
         entities = entities or []
-        self.entities = list(e for e in entities if e.is_alive)
+        self._entities = list(e for e in entities if e.is_alive)  # type: List[Optional[DXFEntity]]
+        self._slots = {entity: slot for slot, entity in enumerate(self._entities)}  # type: Dict[DXFEntity, int]
+        self._handles = None  # type: Optional[Dict[str, int]]  # handle -> slot, build at the first request
+        self._tombstones = 0
+        self._spatial_index = None  # type: SpatialIndex
 
     def __iter__(self) -> Iterable['DXFEntity']:
         """ Iterable of all entities. """
-        return (e for e in self.entities if e.is_alive)
+        return (e for e in self._entities if e is not None and e.is_alive)
+
+    @property
+    def entities(self) -> Sequence['DXFEntity']:
+        """ Read only live view of all entities in order of appearance, changes of the entity space are visible in
+        the view, use :meth:`add`, :meth:`extend` and :meth:`remove` to change the entity space.
+        """
+        return EntitiesView(self)
 
     def __getitem__(self, index) -> 'DXFEntity':
         """ Get entity at index `item`
@@ -152,19 +368,82 @@ class EntitySpace:
         an index slice ``layout[:10]`` to get the first 10 or less entities as ``List[DXFEntity]``.
 
         """
-        return self.entities[index]
+        if self._tombstones:
+            self._compact()
+        return self._entities[index]
 
     def __len__(self) -> int:
         """ Count of entities. """
-        return len(self.entities)
+        return len(self._entities) - self._tombstones
+
+    def __contains__(self, entity: 'DXFEntity') -> bool:
+        """ ``True`` if `entity` is stored in this entity space. """
+        return entity in self._slots
+
+    def in_order(self, entities: Iterable['DXFEntity']) -> List['DXFEntity']:
+        """ Returns the `entities` stored in this entity space in order of appearance, other entities and deleted
+        entities are ignored. (internal API)
+
+        .. versionadded:: 0.11
+
+        """
+        slots = self._slots
+        found = [(slots[e], e) for e in entities if e in slots and e.is_alive]
+        found.sort(key=itemgetter(0))
+        return [e for slot, e in found]
 
     def has_handle(self, handle: str) -> bool:
         """ ``True`` if `handle` is present. """
-        return any(e.dxf.handle == handle for e in self)
+        handles = self._handles
+        if handles is None:  # decodes lazy loaded entities
+            handles = {e.dxf.handle: slot for e, slot in self._slots.items() if e.is_alive}
+            self._handles = handles
+        slot = handles.get(handle)
+        if slot is None:
+            return False
+        entity = self._entities[slot]
+        return entity is not None and entity.is_alive
 
     def purge(self):
         """ Remove deleted entities. """
-        self.entities = list(self)
+        if any(not e.is_alive for e in self._slots):
+            self._entities = list(self)
+            self._reindex()
+            self._spatial_index = None  # rebuild at next request
+        elif self._tombstones:
+            self._compact()
+
+    def _compact(self) -> None:
+        """ Remove tombstones from the slot list. """
+        self._entities = [e for e in self._entities if e is not None]
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._slots = {entity: slot for slot, entity in enumerate(self._entities)}
+        self._handles = None
+        self._tombstones = 0
+
+    def spatial_index(self) -> 'SpatialIndex':
+        """
+        Returns the :class:`~ezdxf.spatialindex.SpatialIndex` of all entities, the index is build at the first
+        request and updated automatically by :meth:`add`, :meth:`extend`, :meth:`remove` and :meth:`clear`.
+
+        .. versionadded:: 0.11
+
+        """
+        if self._spatial_index is None:
+            from ezdxf.spatialindex import SpatialIndex
+            self._spatial_index = SpatialIndex(self)
+        return self._spatial_index
+
+    def reset_spatial_index(self) -> None:
+        """ Discard the spatial index after changing the geometry of many entities, the index is rebuild at the
+        next request.
+
+        .. versionadded:: 0.11
+
+        """
+        self._spatial_index = None
 
     def reorder(self, order: int = 1) -> None:
         """ Reorder entities in place.
@@ -180,15 +459,36 @@ class EntitySpace:
         else:
             return  # do nothing
 
-        self.entities.sort(key=lambda e: e.priority, reverse=reverse)
+        entities = [e for e in self._entities if e is not None]
+        entities.sort(key=lambda e: e.priority, reverse=reverse)
+        self._entities = entities
+        self._reindex()
 
     def add(self, entity: 'DXFEntity') -> None:
-        """ Add `entity`. """
-        self.entities.append(entity)
+        """ Add `entity`, adding an already stored entity does nothing. """
+        if entity in self._slots:
+            return
+        slot = len(self._entities)
+        self._entities.append(entity)
+        self._slots[entity] = slot
+        if self._handles is not None:
+            self._handles[entity.dxf.handle] = slot
+        if self._spatial_index is not None:
+            self._spatial_index.add(entity)
 
     def extend(self, entities: Iterable['DXFEntity']) -> None:
-        """ Add multiple `entities`."""
-        self.entities.extend(entities)
+        """ Add multiple `entities`, already stored entities are ignored. """
+        slots = self._slots
+        # dict.fromkeys() removes duplicates and preserves order of appearance
+        entities = [e for e in dict.fromkeys(entities) if e not in slots]
+        start = len(self._entities)
+        self._entities.extend(entities)
+        slots.update(zip(entities, range(start, start + len(entities))))
+        if self._handles is not None:
+            self._handles.update(zip(map(HANDLE, entities), range(start, start + len(entities))))
+        if self._spatial_index is not None:
+            for entity in entities:
+                self._spatial_index.add(entity)
 
     def export_dxf(self, tagwriter: 'TagWriter', order=0) -> None:
         """
@@ -223,10 +523,48 @@ class EntitySpace:
                 entity.export_seqend(tagwriter)
 
     def remove(self, entity: 'DXFEntity') -> None:
-        """ Remove `entity`. """
-        self.entities.remove(entity)
+        """ Remove `entity`.
+
+        Raises:
+            ValueError: `entity` is not stored in this entity space
+
+        """
+        try:
+            slot = self._slots.pop(entity)
+        except KeyError:
+            raise ValueError('Entity not in entity space.')
+        self._entities[slot] = None  # tombstone
+        self._tombstones += 1
+        # the handle map is not updated, the tombstone invalidates the entry
+        if self._tombstones > COMPACT_THRESHOLD and self._tombstones * 2 > len(self._entities):
+            self._compact()
+        if self._spatial_index is not None:
+            self._spatial_index.remove(entity)
 
     def clear(self) -> None:
         """ Remove all entities. """
         # do not delete database objects - entity space just manage handles
-        self.entities = list()
+        self._entities = list()
+        self._reindex()
+        if self._spatial_index is not None:
+            self._spatial_index.clear()
+
+
+class EntitiesView(abc.Sequence):
+    """ Read only live view of the entities of an :class:`EntitySpace`. (internal class) """
+    __slots__ = ('_space',)
+
+    def __init__(self, space: EntitySpace):
+        self._space = space
+
+    def __getitem__(self, index):
+        return self._space[index]
+
+    def __len__(self) -> int:
+        return len(self._space)
+
+    def __iter__(self) -> Iterable['DXFEntity']:
+        return iter(self._space)
+
+    def __contains__(self, entity: 'DXFEntity') -> bool:
+        return entity in self._space
@@ -0,0 +1,243 @@
+# Purpose: explode block references into virtual or database DXF entities
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, List, Dict, Tuple, Optional, Set
+import logging
+import math
+from ezdxf.math import Vector, Matrix44
+from ezdxf.lldxf.const import BYBLOCK, LINEWEIGHT_BYBLOCK, NonUniformScalingError, DXFStructureError
+from ezdxf.entities.factory import ENTITY_CLASSES
+from ezdxf.query import EntityQuery
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Insert, BlockLayout, BaseLayout, DXFGraphic, Text, BaseAttrib, Circle, Ellipse
+
+__all__ = ['BlockReferenceCache', 'virtual_block_reference_entities', 'explode_block_reference',
+           'explode_block_references']
+
+logger = logging.getLogger('ezdxf')
+
+EXCLUDED_ATTRIBS = {'handle', 'owner'}
+
+
+class BlockReferenceCache:
+    """
+    Cache of flattened block definitions, nested block references are exploded and all entities are transformed by
+    the linear part (scaling, rotation and extrusion) of the block reference transformation. Block references of
+    the same block with the same linear transformation, like thousands of instances of the same symbol, share the
+    cached entities and the virtual entities of each block reference are just translated copies of the cached
+    entities.
+
+    The cache is valid as long as the block definitions are not modified.
+
+    .. versionadded:: 0.11
+
+    """
+
+    def __init__(self):
+        # key: (block record handle, linear transformation), value: transformed block entities
+        self._entities = dict()  # type: Dict[Tuple[str, Tuple[float, ...]], List[DXFGraphic]]
+        self._in_progress = set()  # type: Set[str]
+
+    def __len__(self) -> int:
+        """ Count of cached block transformations. """
+        return len(self._entities)
+
+    def clear(self) -> None:
+        """ Clear cache. """
+        self._entities.clear()
+
+    def block_entities(self, block: 'BlockLayout', m: Matrix44) -> List['DXFGraphic']:
+        """ Returns the flattened entities of `block` transformed by the linear part of `m`, the translation of `m`
+        is ignored. (internal API)
+        """
+        handle = block.block_record_handle
+        key = (handle, linear_key(m))
+        entities = self._entities.get(key)
+        if entities is None:
+            if handle in self._in_progress:
+                raise DXFStructureError('Circular block reference in block "{}".'.format(block.name))
+            self._in_progress.add(handle)
+            try:
+                entities = list(transformed_block_entities(block, linear_part(m), self))
+            finally:
+                self._in_progress.discard(handle)
+            self._entities[key] = entities
+        return entities
+
+
+def linear_key(m: Matrix44) -> Tuple[float, ...]:
+    """ Returns the linear part of transformation matrix `m` as hashable tuple. (internal API) """
+    return tuple(round(value, 12) for value in m.matrix[:12])
+
+
+def linear_part(m: Matrix44) -> Matrix44:
+    """ Returns the linear part of transformation matrix `m` without translation. (internal API) """
+    return Matrix44(m.matrix[:12] + [0., 0., 0., 1.])
+
+
+def virtual_block_reference_entities(insert: 'Insert',
+                                     cache: BlockReferenceCache = None) -> Iterable['DXFGraphic']:
+    """
+    Yields the virtual entities of block reference `insert` in :ref:`WCS`, see
+    :meth:`~ezdxf.entities.Insert.virtual_entities`. Share a :class:`BlockReferenceCache` between multiple calls to
+    reuse the transformed block definitions.
+
+    .. versionadded:: 0.11
+
+    """
+    block = insert.block()
+    if block is None:
+        logger.debug('Block definition "{}" of INSERT not found.'.format(insert.dxf.name))
+        return
+    if cache is None:
+        cache = BlockReferenceCache()
+    m = insert.matrix44()
+    origin = Vector(m.matrix[12:15])
+    prototypes = cache.block_entities(block, m)
+    for offset in insert.grid_offsets():
+        dx, dy, dz = origin + offset
+        translate = bool(dx or dy or dz)
+        for prototype in prototypes:
+            entity = prototype.copy()
+            if translate:
+                entity.translate(dx, dy, dz)
+            resolve_byblock_properties(entity, insert)
+            yield entity
+
+
+def transformed_block_entities(block: 'BlockLayout', m: Matrix44,
+                               cache: BlockReferenceCache) -> Iterable['DXFGraphic']:
+    """ Yields virtual copies of all entities of `block` transformed by `m`, nested block references are exploded.
+    (internal API)
+    """
+    for entity in block:
+        dxftype = entity.dxftype()
+        if dxftype == 'INSERT':
+            for virtual_entity in virtual_block_reference_entities(entity, cache):
+                virtual_entity = transform_entity(virtual_entity, m)
+                if virtual_entity is not None:
+                    yield virtual_entity
+            entities = (attrib_to_text(attrib) for attrib in entity.attribs if not attrib.is_invisible)
+        elif dxftype == 'ATTDEF':  # only constant attributes are displayed by block references
+            entities = [attrib_to_text(entity)] if entity.is_const and not entity.is_invisible else []
+        else:
+            entities = [entity.copy()]
+        for virtual_entity in entities:
+            virtual_entity = transform_entity(virtual_entity, m)
+            if virtual_entity is not None:
+                yield virtual_entity
+
+
+def transform_entity(entity: 'DXFGraphic', m: Matrix44) -> Optional['DXFGraphic']:
+    """ Transform `entity` inplace by `m`, returns ``None`` for entities which do not support this transformation.
+    CIRCLE and ARC entities are converted to ELLIPSE entities for non uniform scaling. (internal API)
+    """
+    if not entity.SUPPORTS_TRANSFORM:
+        logger.debug('Transformation of {} entity not supported, entity skipped.'.format(entity.dxftype()))
+        return None
+    try:
+        return entity.transform(m)
+    except NonUniformScalingError:
+        if entity.dxftype() in ('CIRCLE', 'ARC'):
+            return circle_to_ellipse(entity).transform(m)
+        logger.debug('Non uniform scaling of {} entity not supported, entity skipped.'.format(entity.dxftype()))
+    return None
+
+
+def circle_to_ellipse(circle: 'Circle') -> 'Ellipse':
+    """ Returns a new virtual ELLIPSE entity for `circle`, supports CIRCLE and ARC. (internal API) """
+    dxf = circle.dxf
+    ocs = circle.ocs()
+    dxfattribs = converted_dxfattribs(circle, 'ELLIPSE')
+    dxfattribs['center'] = ocs.to_wcs(dxf.center)
+    dxfattribs['major_axis'] = ocs.ux * dxf.radius
+    dxfattribs['ratio'] = 1.
+    dxfattribs['extrusion'] = ocs.uz
+    if circle.dxftype() == 'ARC':
+        dxfattribs['start_param'] = math.radians(dxf.start_angle)
+        dxfattribs['end_param'] = math.radians(dxf.end_angle)
+    return ENTITY_CLASSES['ELLIPSE'].new(dxfattribs=dxfattribs, doc=circle.doc)
+
+
+def attrib_to_text(attrib: 'BaseAttrib') -> 'Text':
+    """ Returns a new virtual TEXT entity for ATTRIB or ATTDEF entity `attrib`. (internal API) """
+    return ENTITY_CLASSES['TEXT'].new(dxfattribs=converted_dxfattribs(attrib, 'TEXT'), doc=attrib.doc)
+
+
+def converted_dxfattribs(entity: 'DXFGraphic', dxftype: str) -> dict:
+    """ Returns all existing DXF attributes of `entity` supported by `dxftype`, except handle and owner.
+    (internal API)
+    """
+    supported = ENTITY_CLASSES[dxftype].DXFATTRIBS
+    return {
+        key: value for key, value in entity.dxf.all_existing_dxf_attribs().items()
+        if key in supported and key not in EXCLUDED_ATTRIBS
+    }
+
+
+def resolve_byblock_properties(entity: 'DXFGraphic', insert: 'Insert') -> None:
+    """ Entities on layer ``'0'`` and BYBLOCK properties inherit the properties of the block reference `insert`.
+    (internal API)
+    """
+    dxf = entity.dxf
+    insert_dxf = insert.dxf
+    if dxf.layer == '0':
+        dxf.layer = insert_dxf.layer
+    if dxf.get('color') == BYBLOCK:
+        dxf.color = insert_dxf.get('color', 256)
+    linetype = dxf.get('linetype')
+    if linetype is not None and linetype.upper() == 'BYBLOCK':
+        dxf.linetype = insert_dxf.get('linetype', 'BYLAYER')
+    if dxf.get('lineweight') == LINEWEIGHT_BYBLOCK:
+        dxf.lineweight = insert_dxf.get('lineweight', -1)
+
+
+def explode_block_reference(insert: 'Insert', target_layout: 'BaseLayout' = None,
+                            cache: BlockReferenceCache = None) -> EntityQuery:
+    """
+    Explode block reference `insert` into `target_layout`, see :meth:`~ezdxf.entities.Insert.explode`.
+
+    .. versionadded:: 0.11
+
+    """
+    source_layout = insert.get_layout()
+    if target_layout is None:
+        target_layout = source_layout
+        if target_layout is None:
+            raise DXFStructureError('INSERT without layout assignment, specify target layout.')
+    entities = _exploded_entities(insert, cache)
+    target_layout.add_entities(entities)
+    if source_layout is not None:
+        source_layout.delete_entity(insert)
+    else:
+        insert.entitydb.delete_entity(insert)
+    return EntityQuery(entities)
+
+
+def explode_block_references(layout: 'BaseLayout') -> EntityQuery:
+    """
+    Explode all block references of `layout`, see :meth:`~ezdxf.layouts.BaseLayout.explode_all`.
+
+    .. versionadded:: 0.11
+
+    """
+    cache = BlockReferenceCache()
+    entities = []
+    for insert in list(layout.query('INSERT')):
+        entities.extend(_exploded_entities(insert, cache))
+        layout.delete_entity(insert)
+    layout.add_entities(entities)
+    return EntityQuery(entities)
+
+
+def _exploded_entities(insert: 'Insert', cache: Optional[BlockReferenceCache]) -> List['DXFGraphic']:
+    """ Returns the virtual entities of `insert` and its attached ATTRIB entities as TEXT entities, all stored in the
+    entity database.
+    """
+    entities = list(virtual_block_reference_entities(insert, cache))
+    entities.extend(attrib_to_text(attrib) for attrib in insert.attribs if not attrib.is_invisible)
+    db = insert.entitydb
+    for entity in entities:
+        db.add(entity)
+    return entities
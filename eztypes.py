@@ -37,6 +37,7 @@ if TYPE_CHECKING:
     from ezdxf.entitydb import EntitySpace
     from ezdxf.drawing import Drawing
     from ezdxf.entitydb import EntityDB
+    from ezdxf.spatialindex import SpatialIndex
 
     # Sections and Tables
     from ezdxf.sections.table import Table, ViewportTable, LayerTable, StyleTable
@@ -11,6 +11,9 @@ from ezdxf.drawing import Drawing
 if TYPE_CHECKING:
     from ezdxf.eztypes import DXFInfo
 
+GZIP_SIGNATURE = b'\x1f\x8b'
+XZ_SIGNATURE = b'\xfd7zXZ\x00'
+
 
 def new(dxfversion: str = DXF2013, setup: Union[str, bool, Sequence[str]] = None) -> 'Drawing':
     """
@@ -59,7 +62,8 @@ def new(dxfversion: str = DXF2013, setup: Union[str, bool, Sequence[str]] = None
     return doc
 
 
-def read(stream: TextIO, legacy_mode: bool = False, filter_stack=None) -> 'Drawing':
+def read(stream: TextIO, legacy_mode: bool = False, filter_stack=None, workers: int = None,
+         lazy: bool = False) -> 'Drawing':
     """
     Read DXF drawing from a text-stream. Open stream in text mode (``mode='rt'``) and the correct encoding has to be
     set at the open function, the stream requires at least a :meth:`readline` method. Since DXF version R2007 (AC1021)
@@ -73,6 +77,8 @@ def read(stream: TextIO, legacy_mode: bool = False, filter_stack=None) -> 'Drawi
         stream: input text stream opened with correct encoding, requires only a :meth:`readline` method.
         legacy_mode: adds an extra trouble shooting import layer if ``True``
         filter_stack: interface to put filters between reading layers
+        workers: count of worker processes to load DXF entities, see :func:`readfile`
+        lazy: decode graphic entities at first access, see :func:`readfile`
 
     Raises:
         DXFStructureError: for invalid DXF structure
@@ -80,10 +86,11 @@ def read(stream: TextIO, legacy_mode: bool = False, filter_stack=None) -> 'Drawi
     """
     from ezdxf.drawing import Drawing
 
-    return Drawing.read(stream, legacy_mode=legacy_mode, filter_stack=filter_stack)
+    return Drawing.read(stream, legacy_mode=legacy_mode, filter_stack=filter_stack, workers=workers, lazy=lazy)
 
 
-def readfile(filename: str, encoding: str = None, legacy_mode: bool = False, filter_stack=None) -> 'Drawing':
+def readfile(filename: str, encoding: str = None, legacy_mode: bool = False, filter_stack=None,
+             workers: int = None, lazy: bool = False) -> 'Drawing':
     """
     Read DXF drawing specified by `filename` from file-system.
 
@@ -104,29 +111,75 @@ def readfile(filename: str, encoding: str = None, legacy_mode: bool = False, fil
         encoding: use ``None`` for auto detect (default), or set a specific encoding like ``'utf-8'``
         legacy_mode: adds an extra trouble shooting import layer if ``True``
         filter_stack: interface to put filters between reading layers
+        workers: count of worker processes to load the DXF entities of the ENTITIES, BLOCKS and OBJECTS sections,
+                 ``None`` or ``1`` for loading by the calling process, parallel loading is only supported for DXF
+                 R2000 and later, DXF R12 files are always loaded by the calling process
+        lazy: store the graphic entities of the ENTITIES and BLOCKS sections as raw tags and decode them at the
+              first access of an entity attribute, untouched entities are exported unchanged, lazy loading is only
+              supported for DXF R2000 and later, overrides argument `workers`
 
     Raises:
         IOError: File `filename` is not a DXF file or does not exist.
         DXFStructureError: for invalid DXF structure
 
+    .. versionadded:: 0.11
+
+        binary DXF files are detected automatically, arguments `legacy_mode` and `filter_stack` are ignored for
+        binary DXF files
+
+    .. versionadded:: 0.11
+
+        argument `workers` for parallel loading
+
+    .. versionadded:: 0.11
+
+        argument `lazy` for lazy loading of graphic entities
+
     """
     # for argument filter_stack see :class:`~ezdxf.drawing.Drawing.read` for more information
-    from ezdxf.lldxf.validator import is_dxf_file
+    from ezdxf.lldxf.validator import is_dxf_file, is_binary_dxf_file
     from ezdxf.tools.codepage import is_supported_encoding
 
-    if not is_dxf_file(filename):
+    if is_binary_dxf_file(filename):
+        doc = _read_binary_file(filename, workers=workers, lazy=lazy)
+    elif is_dxf_file(filename):
+        info = dxf_file_info(filename)
+        if legacy_mode or filter_stack:
+            with open(filename, mode='rt', encoding=info.encoding, errors='ignore') as fp:
+                doc = read(fp, legacy_mode=legacy_mode, filter_stack=filter_stack, workers=workers, lazy=lazy)
+        else:
+            doc = _read_ascii_file(filename, info.encoding, workers=workers, lazy=lazy)
+    else:
         raise IOError("File '{}' is not a DXF file.".format(filename))
 
-    info = dxf_file_info(filename)
-    with open(filename, mode='rt', encoding=info.encoding, errors='ignore') as fp:
-        doc = read(fp, legacy_mode=legacy_mode, filter_stack=filter_stack)
-
     doc.filename = filename
     if encoding is not None and is_supported_encoding(encoding):
         doc.encoding = encoding
     return doc
 
 
+def _read_ascii_file(filename: str, encoding: str, workers: int = None, lazy: bool = False) -> 'Drawing':
+    from ezdxf.lldxf.tagger import stream_tag_compiler
+
+    # the file is read in blocks, the whole file content is never loaded into memory at once
+    with open(filename, mode='rb') as fp:
+        return Drawing.from_tags(stream_tag_compiler(fp, encoding=encoding), workers=workers, lazy=lazy)
+
+
+def _read_ascii_data(data: bytes, encoding: str, workers: int = None, lazy: bool = False) -> 'Drawing':
+    from ezdxf.lldxf.tagger import bytes_tag_compiler
+
+    return Drawing.from_tags(bytes_tag_compiler(data, encoding=encoding), workers=workers, lazy=lazy)
+
+
+def _read_binary_file(filename: str, workers: int = None, lazy: bool = False) -> 'Drawing':
+    from ezdxf.lldxf.tagger import binary_tags_loader
+
+    with open(filename, mode='rb') as fp:
+        data = fp.read()
+    return Drawing.from_tags(binary_tags_loader(data), workers=workers, lazy=lazy)
+
+
 def dxf_file_info(filename: str) -> 'DXFInfo':
     """
     Reads basic file information from DXF files: DXF version, encoding and handle seed.
@@ -158,16 +211,77 @@ def dxf_stream_info(stream: TextIO) -> 'DXFInfo':
 def readzip(zipfile: str, filename: str = None) -> 'Drawing':
     """
     Read DXF drawing specified by `filename` from a zip archive, or if `filename` is ``None`` the first DXF file in the
-    zip archive.
+    zip archive. ASCII and binary DXF files are supported, like written by :meth:`~ezdxf.drawing.Drawing.saveas`.
 
     Args:
         zipfile: name of the zip archive
         filename: filename of DXF file, or ``None`` to read the first DXF file from the zip archive.
 
+    .. versionchanged:: 0.11
+
+        support for binary DXF files
+
     """
     from ezdxf.tools.zipmanager import ctxZipReader
+    from ezdxf.lldxf.tagger import binary_tags_loader
 
     with ctxZipReader(zipfile, filename) as zipstream:
-        doc = read(zipstream)
+        if zipstream.is_binary_dxf:
+            doc = Drawing.from_tags(binary_tags_loader(zipstream.read_binary()))
+        else:
+            doc = read(zipstream)
         doc.filename = zipstream.dxf_file_name
     return doc
+
+
+def readgz(filename: str, encoding: str = None, workers: int = None, lazy: bool = False) -> 'Drawing':
+    """
+    Read DXF drawing from a gzip (``.dxf.gz``) or xz (``.dxf.xz``) compressed file, like written by
+    :meth:`~ezdxf.drawing.Drawing.saveas`. The compression method is detected by the file signature, ASCII and binary
+    DXF files are supported. The whole file is decompressed at once into memory and the DXF tags are compiled from the
+    decompressed bytes, for all other arguments see :func:`readfile`.
+
+    Args:
+        filename: name of the compressed DXF file
+        encoding: use ``None`` for auto detect (default), or set a specific encoding like ``'utf-8'``
+        workers: count of worker processes to load DXF entities, see :func:`readfile`
+        lazy: decode graphic entities at first access, see :func:`readfile`
+
+    Raises:
+        IOError: File `filename` is not a compressed DXF file or does not exist.
+        DXFStructureError: for invalid DXF structure
+
+    .. versionadded:: 0.11
+
+    """
+    import io
+    from ezdxf.lldxf.const import DXFBINARY_SIGNATURE
+    from ezdxf.lldxf.tagger import binary_tags_loader
+    from ezdxf.lldxf.validator import is_dxf_stream
+    from ezdxf.tools.codepage import is_supported_encoding
+
+    with open(filename, mode='rb') as fp:
+        signature = fp.read(6)
+    if signature.startswith(GZIP_SIGNATURE):
+        import gzip as compression
+    elif signature.startswith(XZ_SIGNATURE):
+        import lzma as compression
+    else:
+        raise IOError("File '{}' is not a gzip or xz compressed file.".format(filename))
+
+    with compression.open(filename, mode='rb') as fp:
+        data = fp.read()
+
+    if data.startswith(DXFBINARY_SIGNATURE):
+        doc = Drawing.from_tags(binary_tags_loader(data), workers=workers, lazy=lazy)
+    else:
+        # decodes only the beginning of the data until the requested information is found
+        if not is_dxf_stream(io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='ignore')):
+            raise IOError("File '{}' is not a DXF file.".format(filename))
+        info = dxf_stream_info(io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='ignore'))
+        doc = _read_ascii_data(data, info.encoding, workers=workers, lazy=lazy)
+
+    doc.filename = filename
+    if encoding is not None and is_supported_encoding(encoding):
+        doc.encoding = encoding
+    return doc
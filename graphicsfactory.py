@@ -1,7 +1,7 @@
 # Created: 10.03.2013
 # Copyright (c) 2013-2018, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Iterable, Sequence, Dict, Tuple, cast
+from typing import TYPE_CHECKING, Iterable, Sequence, Dict, Tuple, List, Union, cast
 import math
 import logging
 
@@ -61,6 +61,30 @@ class CreatorInterface:
     def add_entity(self, entity: 'DXFGraphic') -> None:
         pass
 
+    def new_entities(self, type_: str, count: int, dxfattribs: dict = None,
+                     columns: Dict[str, Sequence] = None) -> List['DXFGraphic']:
+        """
+        Create `count` entities of the same type in one step in drawing database and add them to the entity space.
+        Handles are allocated as one block, the shared `dxfattribs` are validated once and `columns` contain an
+        individual value for each entity, like ``{'start': starts, 'end': ends}``.
+
+        Args:
+            type_ : DXF type string, like ``'LINE'``, ``'CIRCLE'`` or ``'LWPOLYLINE'``
+            count: count of new entities
+            dxfattribs: DXF attributes shared by all new entities
+            columns: ``dict`` of DXF attribute names and sequences of `count` values
+
+        .. versionadded:: 0.11
+
+        """
+        entities = self.dxffactory.create_db_entries(type_, count, dxfattribs, columns)
+        self.add_entities(entities)
+        return entities
+
+    def add_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        for entity in entities:
+            self.add_entity(entity)
+
     def add_point(self, location: 'Vertex', dxfattribs: dict = None) -> 'Point':
         """
         Add a :class:`~ezdxf.entities.Point` entity at `location`.
@@ -74,6 +98,20 @@ class CreatorInterface:
         dxfattribs['location'] = location
         return self.new_entity('POINT', dxfattribs)
 
+    def add_points(self, locations: Sequence['Vertex'], dxfattribs: dict = None) -> List['Point']:
+        """
+        Add multiple :class:`~ezdxf.entities.Point` entities in one step, much faster than multiple
+        :meth:`add_point` calls, accepts also NumPy arrays of shape ``(n, 2)`` or ``(n, 3)``.
+
+        Args:
+            locations: sequence of 2D/3D points in :ref:`WCS`
+            dxfattribs: DXF attributes shared by all new entities
+
+        .. versionadded:: 0.11
+
+        """
+        return self.new_entities('POINT', len(locations), dxfattribs, {'location': locations})
+
     def add_line(self, start: 'Vertex', end: 'Vertex', dxfattribs: dict = None) -> 'Line':
         """
         Add a :class:`~ezdxf.entities.Line` entity from `start` to `end`.
@@ -89,6 +127,23 @@ class CreatorInterface:
         dxfattribs['end'] = end
         return self.new_entity('LINE', dxfattribs)
 
+    def add_lines(self, starts: Sequence['Vertex'], ends: Sequence['Vertex'], dxfattribs: dict = None) -> List['Line']:
+        """
+        Add multiple :class:`~ezdxf.entities.Line` entities in one step, much faster than multiple :meth:`add_line`
+        calls, accepts also NumPy arrays of shape ``(n, 2)`` or ``(n, 3)``.
+
+        Args:
+            starts: sequence of 2D/3D start points in :ref:`WCS`
+            ends: sequence of 2D/3D end points in :ref:`WCS`
+            dxfattribs: DXF attributes shared by all new entities
+
+        .. versionadded:: 0.11
+
+        """
+        if len(starts) != len(ends):
+            raise DXFValueError('Count of start and end points does not match.')
+        return self.new_entities('LINE', len(starts), dxfattribs, {'start': starts, 'end': ends})
+
     def add_circle(self, center: 'Vertex', radius: float, dxfattribs: dict = None) -> 'Circle':
         """
         Add a :class:`~ezdxf.entities.Circle` entity. This is an 2D element, which can be placed in space by
@@ -105,6 +160,30 @@ class CreatorInterface:
         dxfattribs['radius'] = radius
         return self.new_entity('CIRCLE', dxfattribs)
 
+    def add_circles(self, centers: Sequence['Vertex'], radii: Union[float, Sequence[float]],
+                    dxfattribs: dict = None) -> List['Circle']:
+        """
+        Add multiple :class:`~ezdxf.entities.Circle` entities in one step, much faster than multiple
+        :meth:`add_circle` calls.
+
+        Args:
+            centers: sequence of 2D/3D points in :ref:`WCS`
+            radii: one radius for all circles or a sequence of radii
+            dxfattribs: DXF attributes shared by all new entities
+
+        .. versionadded:: 0.11
+
+        """
+        columns = {'center': centers}
+        if isinstance(radii, (int, float)):
+            dxfattribs = dict(dxfattribs or {})
+            dxfattribs['radius'] = radii
+        elif len(radii) == len(centers):
+            columns['radius'] = radii
+        else:
+            raise DXFValueError('Count of centers and radii does not match.')
+        return self.new_entities('CIRCLE', len(centers), dxfattribs, columns)
+
     def add_ellipse(self, center: 'Vertex', major_axis: 'Vertex' = (1, 0, 0), ratio: float = 1, start_param: float = 0,
                     end_param: float = 2 * math.pi, dxfattribs: dict = None) -> 'Ellipse':
         """
@@ -223,6 +302,23 @@ class CreatorInterface:
         blockref = self.new_entity('INSERT', dxfattribs)  # type: Insert
         return blockref
 
+    def add_blockrefs(self, name: str, inserts: Sequence['Vertex'], dxfattribs: dict = None) -> List['Insert']:
+        """
+        Add multiple :class:`~ezdxf.entities.Insert` entities of block `name` in one step, much faster than multiple
+        :meth:`add_blockref` calls.
+
+        Args:
+            name: block name
+            inserts: sequence of insert locations as 2D/3D points in :ref:`WCS`
+            dxfattribs: DXF attributes shared by all new :class:`Insert` entities
+
+        .. versionadded:: 0.11
+
+        """
+        dxfattribs = dict(dxfattribs or {})
+        dxfattribs['name'] = name
+        return self.new_entities('INSERT', len(inserts), dxfattribs, {'insert': inserts})
+
     def add_auto_blockref(self, name: str, insert: 'Vertex', values: Dict[str, str], dxfattribs: dict = None) \
             -> 'Insert':
         """
@@ -333,7 +429,8 @@ class CreatorInterface:
         dxfattribs['flags'] = dxfattribs.get('flags', 0) | const.POLYLINE_3D_POLYLINE
         return self.add_polyline2d(points, dxfattribs)
 
-    def add_polymesh(self, size: Tuple[int, int] = (3, 3), dxfattribs: dict = None) -> 'Polymesh':
+    def add_polymesh(self, size: Tuple[int, int] = (3, 3), dxfattribs: dict = None,
+                     packed: bool = False) -> 'Polymesh':
         """
         Add a :class:`~ezdxf.entities.Polymesh` entity, which is a wrapper class for the POLYLINE entity.
         A polymesh is a grid of `mcount` x `ncount` vertices and every vertex has its own (x, y, z)-coordinates.
@@ -341,6 +438,12 @@ class CreatorInterface:
         Args:
             size: 2-tuple (`mcount`, `ncount`)
             dxfattribs: additional DXF attributes for :class:`~ezdxf.entities.Polyline` entity
+            packed: store mesh vertices packed without creating VERTEX entities, see
+                    :meth:`~ezdxf.entities.Polyline.pack`
+
+        .. versionchanged:: 0.11
+
+            argument `packed`
 
         """
         dxfattribs = dict(dxfattribs or {})
@@ -352,18 +455,25 @@ class CreatorInterface:
         m_close = dxfattribs.pop('m_close', False)
         n_close = dxfattribs.pop('n_close', False)
         polymesh = self.new_entity('POLYLINE', dxfattribs)  # type: Polymesh
+        if packed:
+            polymesh.pack()
 
         points = [(0, 0, 0)] * (m_size * n_size)
         polymesh.append_vertices(points)  # init mesh vertices
         polymesh.close(m_close, n_close)
         return polymesh.cast()
 
-    def add_polyface(self, dxfattribs: dict = None) -> 'Polyface':
+    def add_polyface(self, dxfattribs: dict = None, packed: bool = False) -> 'Polyface':
         """
         Add a :class:`~ezdxf.entities.Polyface` entity, which is a wrapper class for the POLYLINE entity.
 
         Args:
             dxfattribs: additional DXF attributes for :class:`~ezdxf.entities.Polyline` entity
+            packed: store faces packed without creating VERTEX entities, see :meth:`~ezdxf.entities.Polyline.pack`
+
+        .. versionchanged:: 0.11
+
+            argument `packed`
 
         """
         dxfattribs = dict(dxfattribs or {})
@@ -372,6 +482,8 @@ class CreatorInterface:
         n_close = dxfattribs.pop('n_close', False)
         polyface = self.new_entity('POLYLINE', dxfattribs)  # type: Polyface
         polyface.close(m_close, n_close)
+        if packed:
+            polyface.pack()
         return polyface.cast()
 
     def _add_quadrilateral(self, type_: str, points: Iterable['Vertex'], dxfattribs: dict = None) -> 'DXFGraphic':
@@ -445,6 +557,30 @@ class CreatorInterface:
         lwpolyline.closed = closed
         return lwpolyline
 
+    def add_lwpolylines(self, polylines: Sequence[Iterable['Vertex']], format: str = 'xyseb',
+                        dxfattribs: dict = None) -> List['LWPolyline']:
+        """
+        Add multiple 2D polylines as :class:`~ezdxf.entities.LWPolyline` entities in one step, much faster than
+        multiple :meth:`add_lwpolyline` calls, for point `format` see :meth:`add_lwpolyline`. (requires DXF R2000)
+
+        Args:
+            polylines: sequence of polylines, each polyline is an iterable of points
+            format: user defined point format, default is ``"xyseb"``
+            dxfattribs: DXF attributes shared by all new entities, ``'closed'`` closes all polylines
+
+        .. versionadded:: 0.11
+
+        """
+        if self.dxfversion < DXF2000:
+            raise DXFVersionError('LWPOLYLINE requires DXF R2000')
+        dxfattribs = dict(dxfattribs or {})
+        if dxfattribs.pop('closed', False):
+            dxfattribs['flags'] = dxfattribs.get('flags', 0) | const.LWPOLYLINE_CLOSED
+        lwpolylines = self.new_entities('LWPOLYLINE', len(polylines), dxfattribs)  # type: List[LWPolyline]
+        for lwpolyline, points in zip(lwpolylines, polylines):
+            lwpolyline.set_points(points, format=format)
+        return lwpolylines
+
     def add_mtext(self, text: str, dxfattribs: dict = None) -> 'MText':
         """
         Add a multiline text entity with automatic text wrapping at boundaries as :class:`~ezdxf.entities.MText` entity.
@@ -1,15 +1,16 @@
 # Created: 2019-02-18
 # Copyright (c) 2019, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Dict, Iterable, List, Hashable
+from typing import TYPE_CHECKING, Dict, Iterable, List, Hashable, Union, Any, Sequence, Optional
 from ezdxf.lldxf.const import DXFValueError, DXFStructureError
-from ezdxf.query import EntityQuery
+from ezdxf.query import EntityQuery, indexed_query
 from ezdxf.groupby import groupby
+from ezdxf.columns import to_columns, from_columns
 from ezdxf.entitydb import EntityDB
 from ezdxf.graphicsfactory import CreatorInterface
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import BlockRecord, DXFGraphic, Dictionary, KeyFunc
+    from ezdxf.eztypes import BlockRecord, DXFGraphic, Dictionary, KeyFunc, SpatialIndex, Matrix44, BoundingBox
 
 
 class BaseLayout(CreatorInterface):
@@ -107,6 +108,35 @@ class BaseLayout(CreatorInterface):
 
         self.block_record.add_entity(entity)
 
+    def add_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        """
+        Add multiple existing :class:`DXFGraphic` entities to a layout in one step, see :meth:`add_entity`.
+
+        .. versionadded:: 0.11
+
+        """
+        entities = list(entities)
+        for entity in entities:
+            if entity.doc != self.doc:
+                raise DXFStructureError('Adding entities from a different DXF drawing is not supported.')
+        self.block_record.add_entities(entities)
+
+    def new_entities(self, type_: str, count: int, dxfattribs: dict = None,
+                     columns: Dict[str, Sequence] = None) -> List['DXFGraphic']:
+        """ Create `count` entities of the same type in one step, see :meth:`~CreatorInterface.new_entities`.
+
+        .. versionadded:: 0.11
+
+        """
+        # assign the new entities to this layout at creation
+        dxfattribs = dict(dxfattribs or {})
+        dxfattribs['owner'] = self.block_record_handle
+        if self.block_record.is_any_paperspace:
+            dxfattribs['paperspace'] = 1
+        entities = self.dxffactory.create_db_entries(type_, count, dxfattribs, columns)
+        self.entity_space.extend(entities)
+        return entities
+
     def unlink_entity(self, entity: 'DXFGraphic') -> None:
         """
         Unlink `entity` from layout but does not delete entity from the drawing database, this removes `entity` just
@@ -136,12 +166,84 @@ class BaseLayout(CreatorInterface):
         """
         return self.entitydb[handle]
 
+    def explode_all(self) -> EntityQuery:
+        """
+        Explode all block references (INSERT) of this layout into this layout, nested block references are exploded
+        too and ATTRIB entities are converted to TEXT entities. The transformed block definitions are cached and
+        shared by block references of the same block with the same scaling and rotation. To get the exploded
+        entities without storing them in the entity database use :meth:`Insert.virtual_entities`.
+
+        Returns an :class:`~ezdxf.query.EntityQuery` container with all exploded entities.
+
+        .. versionadded:: 0.11
+
+        """
+        from ezdxf.explode import explode_block_references
+        return explode_block_references(self)
+
+    def transform_all(self, m: 'Matrix44') -> EntityQuery:
+        """
+        Transform all entities of this layout inplace by transformation matrix `m`, the vertices of MESH, SPLINE and
+        LWPOLYLINE entities are transformed in batches, see :func:`ezdxf.transform.transform_entities`.
+
+        Returns an :class:`~ezdxf.query.EntityQuery` container with all entities which do not support this
+        transformation, like non uniform scaled CIRCLE entities or SPLINE entities with invalid vertex arrays, these
+        entities are not modified, all entities are checked before the first entity is transformed.
+
+        .. versionadded:: 0.11
+
+        """
+        from ezdxf.transform import transform_entities
+        skipped = transform_entities(self, m)
+        self.entity_space.reset_spatial_index()
+        return EntityQuery(skipped)
+
+    def extents(self, cached: bool = True) -> Optional['BoundingBox']:
+        """
+        Returns the extents of all entities in this layout in :ref:`WCS` as :class:`~ezdxf.math.BoundingBox` object
+        or ``None`` if no entity has a bounding box, see :func:`ezdxf.spatialindex.entities_box`.
+
+        The bounding boxes of the entities are cached and a cached bounding box is invalidated by changing any DXF
+        attribute of the entity or by the methods which change the geometry of the entity like
+        :meth:`LWPolyline.append` or :meth:`Insert.add_attrib`. Set `cached` to ``False`` to recalculate all bounding
+        boxes after changing vertex arrays, hatch boundary paths or linked entities like VERTEX and ATTRIB inplace or
+        after changing block definitions.
+
+        Args:
+            cached: reuse cached bounding boxes of the entities if ``True``
+
+        .. versionadded:: 0.11
+
+        """
+        from ezdxf.spatialindex import entities_box
+        from ezdxf.math import BoundingBox
+        box = entities_box(self, cached=cached)
+        if box is None:
+            return None
+        return BoundingBox([box[:3], box[3:]])
+
+    def spatial_index(self) -> 'SpatialIndex':
+        """
+        Returns the :class:`~ezdxf.spatialindex.SpatialIndex` of all entities in this layout, the index is build at
+        the first request and stays up to date for entities added by :meth:`add_entity` or the ``add_...()`` factory
+        methods and entities removed by :meth:`unlink_entity` or :meth:`delete_entity`.
+
+        .. versionadded:: 0.11
+
+        """
+        return self.entity_space.spatial_index()
+
     def query(self, query: str = '*') -> EntityQuery:
         """
         Get all DXF entities matching the :ref:`entity query string`.
 
+        .. versionadded:: 0.11
+
+            uses the secondary indexes of the entity database for queries by entity names or equality of the
+            attributes ``layer``, ``owner`` and ``name`` (INSERT)
+
         """
-        return EntityQuery(iter(self), query)
+        return indexed_query([self], self.entitydb, query)
 
     def groupby(self, dxfattrib: str = "", key: 'KeyFunc' = None) -> dict:
         """
@@ -156,6 +258,40 @@ class BaseLayout(CreatorInterface):
         """
         return groupby(iter(self), dxfattrib, key)
 
+    def to_columns(self, names: Iterable[str], types: Union[str, Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Returns the DXF attributes `names` of all entities as ``dict`` of NumPy arrays, see
+        :func:`ezdxf.columns.to_columns`.
+
+        Args:
+            names: iterable of DXF attribute names like ``['layer', 'color', 'start', 'end']``
+            types: DXF types of the exported entities as string like ``'LINE CIRCLE'`` or as iterable of strings,
+                   ``None`` for all entities
+
+        .. versionadded:: 0.11
+
+        """
+        if types is None:
+            entities = iter(self)
+        else:
+            entities = self.query(types if isinstance(types, str) else ' '.join(types))
+        return to_columns(entities, names)
+
+    def from_columns(self, dxftype: str, columns: Dict[str, Any], dxfattribs: dict = None) -> List['DXFGraphic']:
+        """
+        Creates new entities of type `dxftype` from a ``dict`` of `columns`, one entity for each row, see
+        :func:`ezdxf.columns.from_columns`.
+
+        Args:
+            dxftype: DXF type of the new entities like ``'LINE'``
+            columns: ``dict`` of DXF attribute names and columns, e.g. the result of :meth:`to_columns`
+            dxfattribs: DXF attributes shared by all new entities
+
+        .. versionadded:: 0.11
+
+        """
+        return from_columns(self, dxftype, columns, dxfattribs)
+
     def move_to_layout(self, entity: 'DXFGraphic', layout: 'BaseLayout') -> None:
         """
         Move entity to another layout.
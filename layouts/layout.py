@@ -9,6 +9,7 @@ from .base import BaseLayout
 if TYPE_CHECKING:
     from ezdxf.eztypes import GeoData, SortEntsTable
     from ezdxf.eztypes import Vertex, Viewport, Drawing, Dictionary, DXFLayout, DXFGraphic, BlockLayout
+    from ezdxf.eztypes import BoundingBox
 
 
 def get_block_entity_space(doc: 'Drawing', block_record_handle: str) -> 'EntitySpace':
@@ -226,12 +227,43 @@ class Layout(BaseLayout):
             return empty
         return iter(sortents_table)
 
+    # header variables of the layout extents, only set for the modelspace and the active paperspace layout
+    EXTENTS_HEADER_VARS = ('$PEXTMIN', '$PEXTMAX')
+
     def reset_extends(self) -> None:
         """ Reset extends. """
         dxf = self.dxf_layout.dxf
         dxf.extmin = (+1e20, +1e20, +1e20)  # AutoCAD default
         dxf.extmax = (-1e20, -1e20, -1e20)  # AutoCAD default
 
+    def update_extents(self, cached: bool = True) -> Optional['BoundingBox']:
+        """
+        Set the extents of the layout to the extents of all entities, see :meth:`extents`. Updates also the header
+        variables ``$EXTMIN`` and ``$EXTMAX`` for the modelspace and ``$PEXTMIN`` and ``$PEXTMAX`` for the active
+        paperspace layout. Resets the extents to the AutoCAD defaults for layouts without any entity extents.
+
+        Returns the new extents as :class:`~ezdxf.math.BoundingBox` object or ``None``.
+
+        Args:
+            cached: reuse cached bounding boxes of the entities if ``True``
+
+        .. versionadded:: 0.11
+
+        """
+        bbox = self.extents(cached=cached)
+        if bbox is None:
+            self.reset_extends()
+        else:
+            dxf = self.dxf_layout.dxf
+            dxf.extmin = bbox.extmin
+            dxf.extmax = bbox.extmax
+        if self.is_modelspace or self.is_active_paperspace:
+            extmin_var, extmax_var = self.EXTENTS_HEADER_VARS
+            dxf = self.dxf_layout.dxf
+            self.doc.header[extmin_var] = dxf.extmin
+            self.doc.header[extmax_var] = dxf.extmax
+        return bbox
+
     def set_plot_type(self, value: int = 5) -> None:
         """
         === ============================================================
@@ -342,6 +374,8 @@ class Modelspace(Layout):
     ``Model``.
 
     """
+    EXTENTS_HEADER_VARS = ('$EXTMIN', '$EXTMAX')
+
     @property
     def name(self) -> str:
         """ Name of modelspace is fixed as ``'Model'``. """
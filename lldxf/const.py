@@ -40,6 +40,9 @@ versions_supported_by_new = [DXF12, DXF2000, DXF2004, DXF2007, DXF2010, DXF2013,
 versions_supported_by_save = versions_supported_by_new
 LATEST_DXF_VERSION = versions_supported_by_new[-1]
 
+# first 22 bytes of a binary DXF file
+DXFBINARY_SIGNATURE = b'AutoCAD Binary DXF\r\n\x1a\x00'
+
 acad_release_to_dxf_version = {
     acad: dxf for dxf, acad in acad_release.items()
 }
@@ -124,6 +127,10 @@ class DXFUndefinedBlockError(DXFKeyError):
     pass
 
 
+class NonUniformScalingError(DXFValueError):
+    pass
+
+
 APP_DATA_MARKER = 102
 SUBCLASS_MARKER = 100
 XDATA_MARKER = 1001
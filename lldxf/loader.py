@@ -5,9 +5,11 @@
 import logging
 from typing import Callable, Dict, Iterable, List, Union, TYPE_CHECKING
 from collections import OrderedDict
+from itertools import repeat
 
-from .const import DXFStructureError
+from .const import DXFStructureError, DXF2000
 from .tags import group_tags, DXFTag, Tags
+from .types import DXFVertex, DXFBinaryTag, POINT_CODES, BINARAY_DATA
 from .extendedtags import ExtendedTags
 from .validator import entity_structure_validator
 
@@ -115,18 +117,35 @@ EXCLUDE_STRUCTURE_CHECK = {'SECTION', 'ENDSEC', 'EOF', 'TABLE', 'ENDTAB', 'CLASS
 def load_dxf_entities(dxf_entities: List[Tags], factory: 'EntityFactory') -> Iterable['DXFEntity']:
     check_tag_structure = options.check_entity_tag_structures
     for entity in dxf_entities:
-        if len(entity) == 0:
-            raise DXFStructureError('Invalid empty DXF entity.')
-        code, dxftype = entity[0]
-        if code != 0:
-            raise DXFStructureError('Invalid first tag in DXF entity, group code={} .'.format(code))
-
+        dxftype = _check_first_tag(entity)
         if check_tag_structure and (dxftype not in EXCLUDE_STRUCTURE_CHECK):
             entity = entity_structure_validator(entity)
         yield factory.load(entity)
 
 
-def fill_database(sections: Dict, factory: 'EntityFactory') -> None:
+def _check_first_tag(entity: Tags) -> str:
+    if len(entity) == 0:
+        raise DXFStructureError('Invalid empty DXF entity.')
+    code, dxftype = entity[0]
+    if code != 0:
+        raise DXFStructureError('Invalid first tag in DXF entity, group code={} .'.format(code))
+    return dxftype
+
+
+def fill_database(sections: Dict, factory: 'EntityFactory', workers: int = None, lazy: bool = False) -> None:
+    """
+    Load all DXF entities into the entity database of the document associated to `factory`. If `workers` is greater
+    than 1, the entities of the ENTITIES, BLOCKS and OBJECTS sections are loaded by a pool of `workers` processes,
+    the result is the same as for serial loading: same handles and same order of entities. If `lazy` is ``True``,
+    graphic entities of the ENTITIES and BLOCKS sections are stored as raw tags, see :func:`fill_database_lazy`.
+
+    """
+    if lazy and factory.doc.dxfversion >= DXF2000:
+        fill_database_lazy(sections, factory)
+        return
+    if workers is not None and workers > 1 and factory.doc.dxfversion >= DXF2000:
+        fill_database_parallel(sections, factory, workers)
+        return
     # CLASSES and HEADER have no EntityDB entries.
     for name in ['TABLES', 'CLASSES', 'ENTITIES', 'BLOCKS', 'OBJECTS']:
         if name in sections:
@@ -135,3 +154,120 @@ def fill_database(sections: Dict, factory: 'EntityFactory') -> None:
             for index, entity in enumerate(load_dxf_entities(section, factory)):
                 # all entities are DXFEntity or inherited
                 section[index] = entity
+
+
+LAZY_SECTIONS = {'ENTITIES', 'BLOCKS'}
+# linked and attached entities are required to build the DXF structure, they are always decoded at loading
+NOT_LAZY_ENTITIES = {'INSERT', 'POLYLINE', 'VERTEX', 'ATTRIB', 'SEQEND', 'MTEXT'}
+
+
+def fill_database_lazy(sections: Dict, factory: 'EntityFactory') -> None:
+    """
+    Load all DXF entities into the entity database like :func:`fill_database`, but graphic entities of the ENTITIES
+    and BLOCKS sections are not decoded, they store just their raw tags and will be decoded at the first access of an
+    entity attribute like :attr:`dxf`. Entity structure validation is also delayed until decoding. Lazy loading is
+    only supported for DXF R2000 and later, because handle and owner tags are required. (internal API)
+
+    """
+    from ezdxf.entities.factory import ENTITY_CLASSES
+    from ezdxf.entities.dxfgfx import DXFGraphic
+
+    doc = factory.doc
+    db = doc.entitydb
+    for name in ['TABLES', 'CLASSES', 'ENTITIES', 'BLOCKS', 'OBJECTS']:
+        if name not in sections:
+            continue
+        section = sections[name]
+        if name not in LAZY_SECTIONS:
+            for index, entity in enumerate(load_dxf_entities(section, factory)):
+                section[index] = entity
+            continue
+
+        for index, tags in enumerate(section):
+            dxftype = _check_first_tag(tags)
+            class_ = ENTITY_CLASSES.get(dxftype)
+            handle = tags[1].value if len(tags) > 1 and tags[1].code == 5 else None
+            if handle is None or dxftype in NOT_LAZY_ENTITIES or \
+                    class_ is None or not issubclass(class_, DXFGraphic) or handle in db:
+                # decode entity, same as load_dxf_entities()
+                entity = next(load_dxf_entities([tags], factory))
+            else:
+                entity = class_.load_lazy(''.join(tag.dxfstr() for tag in tags), doc)
+                db[handle] = entity
+            section[index] = entity
+
+
+PARALLEL_SECTIONS = ['ENTITIES', 'BLOCKS', 'OBJECTS']
+MIN_CHUNK_SIZE = 1000  # min. count of entities processed by one task
+
+
+def fill_database_parallel(sections: Dict, factory: 'EntityFactory', workers: int) -> None:
+    """
+    Loads the entities of the ENTITIES, BLOCKS and OBJECTS sections by a process pool, the TABLES and CLASSES
+    sections are loaded by the calling process. Entities are loaded without an associated document by the worker
+    processes, therefore parallel loading is only supported for DXF R2000 and later. (internal API)
+
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    doc = factory.doc
+    db = doc.entitydb
+    check_tag_structure = options.check_entity_tag_structures
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # submit all tasks before loading TABLES and CLASSES
+        tasks = []
+        for name in PARALLEL_SECTIONS:
+            if name in sections:
+                section = sections[name]
+                chunk_size = max(MIN_CHUNK_SIZE, len(section) // (workers * 4) + 1)
+                chunks = [
+                    [tags_to_tuples(entity) for entity in section[start:start + chunk_size]]
+                    for start in range(0, len(section), chunk_size)
+                ]
+                tasks.append((section, executor.map(load_entity_chunk, chunks, repeat(check_tag_structure))))
+
+        for name in ['TABLES', 'CLASSES']:
+            if name in sections:
+                section = sections[name]
+                for index, entity in enumerate(load_dxf_entities(section, factory)):
+                    section[index] = entity
+
+        for section, results in tasks:
+            index = 0
+            for entities in results:
+                for entity in entities:
+                    entity.doc = doc
+                    db.add(entity)
+                    section[index] = entity
+                    index += 1
+
+
+def tags_to_tuples(tags: Tags) -> List[tuple]:
+    """ Returns `tags` as list of (code, value) tuples, pickling tuples is faster than pickling DXFTag(). """
+    return [(tag.code, tag._value) for tag in tags]
+
+
+def load_entity_chunk(chunk: List[List[tuple]], check_tag_structure: bool = True) -> List['DXFEntity']:
+    """ Worker process function, returns DXF entities without associated document. (internal API) """
+    from ezdxf.entities.factory import EntityFactory
+
+    def build_tags(tuples: List[tuple]) -> Tags:
+        tags = Tags()
+        for code, value in tuples:
+            if code in POINT_CODES:
+                tags.append(DXFVertex(code, value))
+            elif code in BINARAY_DATA:
+                tags.append(DXFBinaryTag(code, value))
+            else:
+                tags.append(DXFTag(code, value))
+        return tags
+
+    factory = EntityFactory()
+    entities = []
+    for tuples in chunk:
+        entity = build_tags(tuples)
+        _check_first_tag(entity)
+        if check_tag_structure and (entity[0].value not in EXCLUDE_STRUCTURE_CHECK):
+            entity = entity_structure_validator(entity)
+        entities.append(factory.entity(entity))
+    return entities
@@ -172,12 +172,7 @@ class VertexArray:
         self.values = survivors
 
     def export_dxf(self, tagwriter: 'TagWriter', code=10):
-        delta = 0
-        for c in self.values:
-            tagwriter.write_tag2(code + delta, c)
-            delta += 10
-            if delta > 20:
-                delta = 0
+        tagwriter.write_vertices(code, self.values, self.VERTEX_SIZE)
 
     def append(self, point: Sequence[float]) -> None:
         """ Append `point`. """
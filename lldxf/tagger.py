@@ -2,11 +2,14 @@
 # Created: 10.04.2016
 # Copyright (c) 2016-2018, Manfred Moitzi
 # License: MIT License
-from typing import Iterable, TextIO, Iterator
+from typing import Iterable, TextIO, BinaryIO, Iterator, List
+from functools import partial
+import struct
 
 from .types import DXFTag, DXFVertex, DXFBinaryTag
-from .const import DXFStructureError
-from .types import POINT_CODES, TYPE_TABLE, BINARAY_DATA
+from .const import DXFStructureError, DXF2007, DXFBINARY_SIGNATURE
+from .types import POINT_CODES, TYPE_TABLE, BINARAY_DATA, BYTES, INT16, INT32, INT64, DOUBLE
+from ezdxf.tools.binarydata import hexstr_to_bytes
 
 
 def internal_tag_compiler(s: str) -> Iterable[DXFTag]:
@@ -166,3 +169,311 @@ def tag_compiler(tagger: Iterator[DXFTag]) -> Iterable[DXFTag]:
                         raise DXFStructureError(error_msg(x))
         except StopIteration:
             return
+
+
+def binary_tags_loader(data: bytes, errors: str = 'ignore') -> Iterable[DXFTag]:
+    """
+    Yields compiled DXF tags from binary DXF `data`, the same tag stream as tag_compiler() yields for ASCII DXF files.
+    Strings are decoded by the encoding defined by the header variables $ACADVER and $DWGCODEPAGE, DXF R2007 and
+    later is always UTF-8 encoded.
+
+    Args:
+        data: binary DXF data, including the leading binary DXF signature
+        errors: string decoding error handler, see :meth:`bytes.decode`
+
+    Yields: DXFTag() or inherited
+
+    Raises: DXFStructureError() for invalid binary DXF data.
+
+    """
+    if data[:22] != DXFBINARY_SIGNATURE:
+        raise DXFStructureError('Not a binary DXF data structure.')
+
+    from ezdxf.tools.codepage import toencoding
+    unpack_from = struct.unpack_from
+    length = len(data)
+    # DXF R12 stores group codes as 1 byte, later versions as 2 bytes, detect the size by the first tag (0, 'SECTION')
+    r12 = data[23] != 0
+    encoding = 'cp1252'
+    header_var = None
+    index = 22
+
+    def read_tag():
+        nonlocal index
+        if r12:
+            code = data[index]
+            index += 1
+            if code == 255:  # extended group code
+                code = unpack_from('<H', data, index)[0]
+                index += 2
+        else:
+            code = unpack_from('<H', data, index)[0]
+            index += 2
+
+        if code in DOUBLE:
+            value = unpack_from('<d', data, index)[0]
+            index += 8
+        elif code in INT16:
+            value = unpack_from('<h', data, index)[0]
+            index += 2
+        elif code in INT32:
+            value = unpack_from('<i', data, index)[0]
+            index += 4
+        elif code in BYTES:
+            value = data[index]
+            index += 1
+        elif code in INT64:
+            value = unpack_from('<q', data, index)[0]
+            index += 8
+        elif code in BINARAY_DATA:
+            size = data[index]
+            index += 1
+            value = data[index: index + size]
+            index += size
+        else:  # null terminated string
+            end = data.index(b'\x00', index)
+            value = data[index: end].decode(encoding, errors=errors)
+            index = end + 1
+        return code, value
+
+    try:
+        while index < length:
+            code, value = read_tag()
+            if code in POINT_CODES:
+                y_code, y = read_tag()  # y coordinate is mandatory
+                if y_code != code + 10:
+                    raise DXFStructureError("Missing required y coordinate near index: {}.".format(index))
+                if index < length:
+                    prev_index = index
+                    z_code, z = read_tag()  # z coordinate just for 3d points
+                    if z_code == code + 20:
+                        yield DXFVertex(code, (value, y, z))
+                        continue
+                    index = prev_index  # undo: not a z coordinate
+                yield DXFVertex(code, (value, y))
+            elif code in BINARAY_DATA:
+                yield DXFBinaryTag(code, value)
+            else:
+                # update string encoding by header variables $ACADVER and $DWGCODEPAGE
+                if code == 9:
+                    header_var = value
+                elif header_var is not None:
+                    if header_var == '$ACADVER' and value >= DXF2007:
+                        encoding = 'utf8'
+                    elif header_var == '$DWGCODEPAGE' and encoding != 'utf8':
+                        encoding = toencoding(value)
+                    header_var = None
+                yield DXFTag(code, value)
+    except (struct.error, IndexError, ValueError):
+        raise DXFStructureError('Invalid binary DXF data near index: {}.'.format(index))
+
+
+# type casters as list for fast group code lookup, group codes > 1071 are not used by the DXF reference
+_FAST_TYPE_TABLE = [TYPE_TABLE.get(code, str) for code in range(1072)]
+_Y_AND_Z_CODES = set(code + 10 for code in POINT_CODES) | set(code + 20 for code in POINT_CODES)
+# Pending group codes and values of a block and the lists of a chunk are alive until the chunk is consumed and each
+# garbage collection has to traverse them, so large blocks and chunks slow down loading of large DXF files.
+CHUNK_SIZE = 0x4000  # count of tags compiled in one batch
+BLOCK_SIZE = 0x100000  # count of bytes decoded at once
+
+
+def bytes_tag_compiler(data: bytes, encoding: str = 'cp1252', errors: str = 'ignore') -> Iterable[DXFTag]:
+    """
+    Compiles DXF tags from ASCII DXF `data` as bytes, fast replacement for tag_compiler(low_level_tagger(stream)) and
+    yields identical tags. The `data` is decoded in blocks of :attr:`BLOCK_SIZE` bytes, the lines of a block are
+    split in a single pass, all group codes of a block are converted in one batch and the tag values are compiled in
+    chunks. Skips comment tags 999.
+
+    Args:
+        data: ASCII DXF data as bytes
+        encoding: text encoding of `data`
+        errors: decoding error handler, see :meth:`bytes.decode`
+
+    Yields: DXFTag() or inherited
+
+    Raises: DXFStructureError() for invalid group codes, invalid dxf values and unexpected coordinate order.
+
+    """
+    blocks = (data[start:start + BLOCK_SIZE] for start in range(0, len(data), BLOCK_SIZE))
+    return _compile_blocks(blocks, encoding, errors)
+
+
+def stream_tag_compiler(stream: BinaryIO, encoding: str = 'cp1252', errors: str = 'ignore',
+                        block_size: int = BLOCK_SIZE) -> Iterable[DXFTag]:
+    """
+    Compiles DXF tags from a binary `stream` of ASCII DXF data like :func:`bytes_tag_compiler`, but reads and
+    decodes the data in blocks of `block_size` bytes, therefore the whole file is never loaded into memory at once.
+
+    Args:
+        stream: binary stream of ASCII DXF data, requires only a :meth:`read` method
+        encoding: text encoding of the data
+        errors: decoding error handler, see :meth:`bytes.decode`
+        block_size: count of bytes to read at once
+
+    Yields: DXFTag() or inherited
+
+    Raises: DXFStructureError() for invalid group codes, invalid dxf values and unexpected coordinate order.
+
+    .. versionadded:: 0.11
+
+    """
+    return _compile_blocks(iter(partial(stream.read, block_size), b''), encoding, errors)
+
+
+def _compile_blocks(blocks: Iterable[bytes], encoding: str, errors: str) -> Iterable[DXFTag]:
+    """ Compiles DXF tags from consecutive `blocks` of ASCII DXF data, blocks can split lines at any position. """
+    codes = []  # type: List[int]  # group codes not compiled yet
+    values = []  # type: List[str]  # tag values not compiled yet
+    offset = 0  # tag index of codes[0] for error messages
+    pending = []  # type: List[str]  # group code line without value at the end of the last block
+    tail = b''  # incomplete line at the end of the last block
+
+    def add_lines(text: str) -> None:
+        nonlocal pending
+        if '\r' in text:  # universal line endings like text mode streams
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        lines = text.split('\n')
+        # split() creates an extra item, if text ends with '\n'
+        if lines[-1] == '':
+            lines.pop()
+        if pending:
+            lines = pending + lines
+        if len(lines) & 1:  # group code without value
+            pending = [lines.pop()]
+        else:
+            pending = []
+        raw_codes = lines[0::2]
+        raw_values = lines[1::2]
+        del lines
+        first_line = (offset + len(codes)) * 2 + 1
+        try:
+            new_codes = list(map(int, raw_codes))
+        except ValueError:
+            for index, code in enumerate(raw_codes):
+                try:
+                    int(code)
+                except ValueError:
+                    raise DXFStructureError('Invalid group code "{}" at line {}.'.format(code, first_line + index * 2))
+        del raw_codes
+        if 999 in new_codes:  # remove comments
+            raw_values = [value for code, value in zip(new_codes, raw_values) if code != 999]
+            new_codes = [code for code in new_codes if code != 999]
+        codes.extend(new_codes)
+        values.extend(raw_values)
+
+    def compile_chunks(last: bool) -> Iterable[DXFTag]:
+        nonlocal offset
+        count = len(codes)
+        start = 0
+        while start < count:
+            end = start + CHUNK_SIZE
+            if end >= count:
+                if not last:  # wait for more data
+                    break
+                end = count
+            # do not split vertices between chunks, a x-coordinate is never the last tag of a chunk
+            while end < count and (codes[end] in _Y_AND_Z_CODES or codes[end - 1] in POINT_CODES):
+                end += 1
+            if end == count and not last:  # the vertex at the end may continue in the next block
+                break
+            yield from _compile_chunk(codes[start:end], values[start:end], offset + start, last_chunk=(end == count))
+            start = end
+        del codes[:start]
+        del values[:start]
+        offset += start
+
+    for block in blocks:
+        data = tail + block if tail else block
+        cut = data.rfind(b'\n') + 1
+        tail = data[cut:]
+        if cut:
+            add_lines(data[:cut].decode(encoding, errors=errors))
+            del data
+            yield from compile_chunks(last=False)
+    if tail:
+        add_lines(tail.decode(encoding, errors=errors))
+    yield from compile_chunks(last=True)
+
+
+def _compile_chunk(codes: List[int], values: List[str], offset: int, last_chunk: bool) -> Iterable[DXFTag]:
+    """ Yields compiled tags for `codes` and `values`, `offset` is the tag index of the first tag for error messages.
+    The tags are created at yielding, so the consumer decides how many tag objects are alive at the same time.
+    """
+    def line(index: int) -> int:
+        return (offset + index) * 2 + 2
+
+    type_table = _FAST_TYPE_TABLE
+    if min(codes) >= 0 and max(codes) < 1072:
+        try:
+            # fast path!
+            typed_values = [type_table[code](value) for code, value in zip(codes, values)]
+        except ValueError:
+            typed_values = None
+    else:
+        typed_values = None
+
+    if typed_values is None:  # slow path
+        typed_values = []
+        for index, (code, value) in enumerate(zip(codes, values)):
+            type_ = TYPE_TABLE.get(code, str)
+            try:
+                typed_values.append(type_(value))
+            except ValueError:
+                if type_ is int:  # ProE stores int values as floats :((
+                    try:
+                        typed_values.append(int(float(value)))
+                        continue
+                    except ValueError:
+                        pass
+                elif type_ is float and (code in POINT_CODES or code in _Y_AND_Z_CODES):
+                    raise DXFStructureError('Invalid floating point values near line: {}.'.format(line(index)))
+                raise DXFStructureError('Invalid tag (code={code}, value="{value}") near line: {line}.'.format(
+                    line=line(index), code=code, value=value))
+
+    binary_tags = [index for index, code in enumerate(codes) if code in BINARAY_DATA]
+    for index in binary_tags:
+        try:
+            typed_values[index] = hexstr_to_bytes(values[index])
+        except ValueError:
+            raise DXFStructureError('Invalid binary data near line: {}.'.format(line(index)))
+
+    def compile_tags(start: int, end: int) -> Iterable[DXFTag]:
+        if not binary_tags:
+            return map(DXFTag, codes[start:end], typed_values[start:end])
+        return (DXFBinaryTag(code, value) if code in BINARAY_DATA else DXFTag(code, value)
+                for code, value in zip(codes[start:end], typed_values[start:end]))
+
+    vertices = [index for index, code in enumerate(codes) if code in POINT_CODES]
+    count = len(codes)
+    if not vertices:
+        yield from compile_tags(0, count)
+        return
+
+    # replace vertex components by DXFVertex() tags
+    start = 0
+    for index in vertices:
+        if index < start:  # x-coordinate was consumed as z-coordinate; y-coordinate check raises an error
+            continue
+        if start < index:
+            yield from compile_tags(start, index)
+        code = codes[index]
+        if index + 2 >= count:
+            if index + 1 < count and codes[index + 1] != code + 10:
+                raise DXFStructureError("Missing required y coordinate near line: {}.".format(line(index + 1)))
+            if last_chunk:  # same behavior as tag_compiler(): vertex at the end is ignored
+                return
+            if index + 1 >= count:  # chunks are never split behind a x-coordinate
+                raise DXFStructureError("Missing required y coordinate near line: {}.".format(line(index + 1)))
+            # 2d vertex at the end of a chunk, chunks are never split in front of a z-coordinate
+            yield DXFVertex(code, typed_values[index: index + 2])
+            return
+        if codes[index + 1] != code + 10:  # like 20 for base x-code 10
+            raise DXFStructureError("Missing required y coordinate near line: {}.".format(line(index + 1)))
+        if codes[index + 2] == code + 20:  # it is a z-coordinate like (30, 0.0) for base x-code 10
+            yield DXFVertex(code, typed_values[index: index + 3])
+            start = index + 3
+        else:
+            yield DXFVertex(code, typed_values[index: index + 2])
+            start = index + 2
+    if start < count:
+        yield from compile_tags(start, count)
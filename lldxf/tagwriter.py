@@ -1,15 +1,24 @@
 # Created: 13.01.2018
 # Copyright (c) 2018, Manfred Moitzi
 # License: MIT License
-from typing import Any, TextIO, TYPE_CHECKING, Union, List, Iterable
-from .types import TAG_STRING_FORMAT, cast_tag_value
+from typing import Any, TextIO, BinaryIO, TYPE_CHECKING, Union, List, Iterable
+import struct
+from .types import TAG_STRING_FORMAT, cast_tag_value, POINT_CODES, BINARAY_DATA, BYTES, INT16, INT32, INT64, DOUBLE
 from .tags import DXFTag, Tags
-from .const import LATEST_DXF_VERSION
+from .tagger import internal_tag_compiler
+from .const import LATEST_DXF_VERSION, DXF12, DXFBINARY_SIGNATURE
+from ezdxf.tools.binarydata import hexstr_to_bytes
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import ExtendedTags, DXFEntity
 
-__all__ = ['TagWriter', 'TagCollector', 'basic_tags_from_text']
+__all__ = ['TagWriter', 'BinaryTagWriter', 'TagCollector', 'basic_tags_from_text']
+
+
+BUFFER_SIZE = 4096  # count of buffered DXF strings, written as one chunk
+# Binary DXF stores binary data in chunks with a 1 byte length prefix (max. 255 bytes), but 127 bytes are used like
+# the 254 hex chars of ASCII DXF, so reloaded binary data has the same tag structure in both formats.
+BINARY_CHUNK_SIZE = 127
 
 
 class TagWriter:
@@ -19,11 +28,17 @@ class TagWriter:
     Args:
         stream: text stream
         write_handles: if False don't write handles (5, 105), use only for DXF R12 format
+        buffered: collect output in chunks of :data:`BUFFER_SIZE` DXF strings and write each chunk by one
+                  ``stream.write()`` call, requires a final :meth:`flush` call
 
     """
+    EMPTY = ''  # joins buffered chunks
 
-    def __init__(self, stream: TextIO, dxfversion=LATEST_DXF_VERSION, write_handles: bool = True):
+    def __init__(self, stream: TextIO, dxfversion=LATEST_DXF_VERSION, write_handles: bool = True,
+                 buffered: bool = False):
         self._stream = stream
+        self._buffer = []  # type: List
+        self._write = self._buffered_write if buffered else stream.write
         # this are just options for export functions
         self.dxfversion = dxfversion
         self.write_handles = write_handles  # flag is needed for new new entity structure!
@@ -46,17 +61,135 @@ class TagWriter:
                 self.write_tag(tag)
 
     def write_tag(self, tag: DXFTag) -> None:
-        self._stream.write(tag.dxfstr())
+        self._write(tag.dxfstr())
 
     def write_tag2(self, code: int, value: Any) -> None:
-        self._stream.write(TAG_STRING_FORMAT % (code, value))
+        self._write(TAG_STRING_FORMAT % (code, value))
 
     def write_vertex(self, code: int, vertex: Iterable[float]) -> None:
         for index, value in enumerate(vertex):
             self.write_tag2(code + index * 10, value)
 
+    def write_values(self, code: int, values: Iterable[Any]) -> None:
+        """ Write a tag with group code `code` for each value of `values`.
+
+        .. versionadded:: 0.11
+
+        """
+        self._write(''.join(map(('%3d\n{}\n' % code).format, values)))
+
+    def write_vertices(self, code: int, values: Iterable[float], vertex_size: int = 3) -> None:
+        """ Write vertices from flat `values` with `vertex_size` components, e.g. for `code` 10 the group codes
+        10, 20 and 30 for 3D vertices.
+
+        .. versionadded:: 0.11
+
+        """
+        fmt = ''.join('%3d\n{}\n' % (code + index * 10) for index in range(vertex_size))
+        values = iter(values)
+        self._write(''.join(map(fmt.format, *([values] * vertex_size))))
+
+    def write_str(self, s: str) -> None:
+        self._write(s)
+
+    def _buffered_write(self, s: Any) -> None:
+        buffer = self._buffer
+        buffer.append(s)
+        if len(buffer) >= BUFFER_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """ Write buffered output as one chunk into the stream, does not flush the stream itself. """
+        if self._buffer:
+            self._stream.write(self.EMPTY.join(self._buffer))
+            self._buffer = []
+
+
+class BinaryTagWriter(TagWriter):
+    """
+    Writes DXF tags into a binary stream as binary DXF.
+
+    Args:
+        stream: binary stream
+        write_handles: if False don't write handles (5, 105), use only for DXF R12 format
+        encoding: string encoding, DXF R2007 and later requires ``'utf8'``
+        buffered: collect output in chunks, see :class:`TagWriter`
+
+    """
+    EMPTY = b''
+
+    def __init__(self, stream: BinaryIO, dxfversion=LATEST_DXF_VERSION, write_handles: bool = True,
+                 encoding: str = 'utf8', buffered: bool = False):
+        super().__init__(stream, dxfversion=dxfversion, write_handles=write_handles, buffered=buffered)
+        self._encoding = encoding
+        # DXF R12 stores group codes as 1 byte, group codes >= 255 as 0xff + 2 bytes
+        self._r12 = dxfversion <= DXF12
+
+    def write_signature(self) -> None:
+        """ Write the binary DXF signature, has to be the first data of a binary DXF file. """
+        self._write(DXFBINARY_SIGNATURE)
+
+    def write_tag(self, tag: DXFTag) -> None:
+        code = tag.code
+        if code in POINT_CODES:
+            self.write_vertex(code, tag.value)
+        else:
+            self.write_tag2(code, tag.value)
+
+    def write_tag2(self, code: int, value: Any) -> None:
+        self._write(self._encode_code(code) + self._encode_value(code, value))
+
+    def write_vertex(self, code: int, vertex: Iterable[float]) -> None:
+        self._write(b''.join(
+            self._encode_code(code + index * 10) + struct.pack('<d', value) for index, value in enumerate(vertex)
+        ))
+
+    def write_values(self, code: int, values: Iterable[Any]) -> None:
+        encoded_code = self._encode_code(code)
+        encode_value = self._encode_value
+        self._write(b''.join(encoded_code + encode_value(code, value) for value in values))
+
+    def write_vertices(self, code: int, values: Iterable[float], vertex_size: int = 3) -> None:
+        codes = [self._encode_code(code + index * 10) for index in range(vertex_size)]
+        pack = struct.Struct('<d').pack
+        self._write(b''.join(codes[index % vertex_size] + pack(value) for index, value in enumerate(values)))
+
     def write_str(self, s: str) -> None:
-        self._stream.write(s)
+        for tag in internal_tag_compiler(s):
+            self.write_tag(tag)
+
+    def _encode_code(self, code: int) -> bytes:
+        if self._r12:
+            if code < 255:
+                return struct.pack('<B', code)
+            return struct.pack('<BH', 255, code)
+        return struct.pack('<H', code)
+
+    def _encode_value(self, code: int, value: Any) -> bytes:
+        if code in DOUBLE:
+            return struct.pack('<d', float(value))
+        elif code in INT16:
+            return struct.pack('<h', int(value))
+        elif code in INT32:
+            return struct.pack('<i', int(value))
+        elif code in BYTES:
+            return struct.pack('<B', int(value))
+        elif code in INT64:
+            return struct.pack('<q', int(value))
+        elif code in BINARAY_DATA:
+            if isinstance(value, str):
+                value = hexstr_to_bytes(value)
+            # split binary data into chunks of BINARY_CHUNK_SIZE bytes, each chunk is a tag of its own
+            data = []
+            for start in range(0, max(len(value), 1), BINARY_CHUNK_SIZE):
+                if start:
+                    data.append(self._encode_code(code))
+                chunk = value[start: start + BINARY_CHUNK_SIZE]
+                data.append(struct.pack('<B', len(chunk)))
+                data.append(bytes(chunk))
+            return b''.join(data)
+        else:  # null terminated string
+            return str(value).encode(self._encoding, errors='dxfreplace') + b'\x00'
 
 
 class TagCollector:
@@ -90,6 +223,14 @@ class TagCollector:
         for index, value in enumerate(vertex):
             self.write_tag2(code + index * 10, value)
 
+    def write_values(self, code: int, values: Iterable[Any]) -> None:
+        for value in values:
+            self.write_tag2(code, value)
+
+    def write_vertices(self, code: int, values: Iterable[float], vertex_size: int = 3) -> None:
+        for index, value in enumerate(values):
+            self.write_tag2(code + (index % vertex_size) * 10, value)
+
     def write_str(self, s: str) -> None:
         self.write_tags(Tags.from_text(s))
 
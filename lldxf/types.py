@@ -42,6 +42,14 @@ HEX_HANDLE_CODES = set(chain(HANDLE_CODES, POINTER_CODES))
 BINARAY_DATA = {310, 311, 312, 313, 314, 315, 316, 317, 318, 319, 1004}
 EMBEDDED_OBJ_STR = 'Embedded Object'
 
+# value types of group codes in binary DXF files, all other group codes are null terminated strings
+BYTES = set(range(290, 300))  # bool as 1 byte
+INT16 = set(chain(range(60, 80), range(170, 180), range(270, 290), range(370, 390), range(400, 410),
+                  range(1060, 1071)))
+INT32 = set(chain(range(90, 100), range(420, 430), range(440, 450), range(450, 460), [1071]))
+INT64 = set(range(160, 170))
+DOUBLE = set(chain(range(10, 60), range(110, 150), range(210, 240), range(460, 470), range(1010, 1060)))
+
 
 def handle_code(dxftype: str) -> int:
     return 105 if dxftype == 'DIMSTYLE' else 5
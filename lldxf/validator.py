@@ -8,7 +8,7 @@ from typing import TextIO, Iterable, List
 
 from .const import DXFStructureError, DXFError, DXFValueError, DXFAppDataError, DXFXDataError
 from .const import APP_DATA_MARKER, HEADER_VAR_MARKER, XDATA_MARKER
-from .const import INVALID_LAYER_NAME_CHARACTERS, acad_release
+from .const import INVALID_LAYER_NAME_CHARACTERS, acad_release, DXFBINARY_SIGNATURE
 from .tagger import low_level_tagger
 from .types import is_embedded_object_marker, DXFTag, NONE_TAG
 from ezdxf.tools.codepage import toencoding
@@ -196,10 +196,18 @@ def entity_structure_validator(tags: List[DXFTag]) -> Iterable[DXFTag]:
 
 
 def is_dxf_file(filename: str) -> bool:
+    if is_binary_dxf_file(filename):
+        return True
     with io.open(filename, errors='ignore') as fp:
         return is_dxf_stream(fp)
 
 
+def is_binary_dxf_file(filename: str) -> bool:
+    with io.open(filename, 'rb') as fp:
+        signature = fp.read(22)
+        return signature == DXFBINARY_SIGNATURE
+
+
 def is_dxf_stream(stream: TextIO) -> bool:
     try:
         reader = low_level_tagger(stream)
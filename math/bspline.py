@@ -221,14 +221,21 @@ rather than normal 3D coordinates.
 
 """
 from typing import List, Iterable, Sequence, TYPE_CHECKING, Dict, Tuple, Optional
+from bisect import bisect_right
+from functools import lru_cache
 from .vector import Vector, distance
 from .matrix import Matrix
 from math import pow, isclose
 from ezdxf.lldxf.const import DXFValueError
 
+from .numpysupport import numpy  # None if NumPy is not installed, B-splines are evaluated by pure Python code
+
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
 
+BASIS_CACHE_SIZE = 4096  # max. count of cached basis values of a single Basis() object
+NUMPY_MIN_POINTS = 256  # evaluate batches of at least this count of points by NumPy if available
+
 
 def open_uniform_knot_vector(n: int, order: int) -> List[float]:
     """
@@ -578,6 +585,57 @@ class Basis:
         self.order = order  # type: int
         self.count = count  # type: int
         self.weights = weights  # type: Optional[Sequence[float]]
+        # key: t, value: index of first control point, non zero basis values
+        self._cache = dict()  # type: Dict[float, Tuple[int, List[float]]]
+
+    def clear_cache(self) -> None:
+        """ Clear cached basis values, required after changing the knot vector or the control point count. """
+        self._cache.clear()
+
+    def span(self, t: float) -> int:
+        """ Returns the index `j` of the knot span ``knots[j] <= t < knots[j+1]`` clamped to the valid parameter
+        range of the B-spline, the last span is used for ``t == knots[count]``.
+        """
+        return min(max(bisect_right(self.knots, t) - 1, self.order - 1), self.count - 1)
+
+    def local_basis(self, t: float) -> Tuple[int, List[float]]:
+        """
+        Returns the index of the first control point affecting the curve at parameter `t` and the `order` non zero
+        (unweighted) basis values at `t`, calculated by the triangular scheme of de Boor for a single knot span in
+        O(order²) instead of O(count * order) for the whole basis vector. Results are cached.
+
+        Parameters outside of the valid range from ``knots[order-1]`` to ``knots[count]`` are clamped to this range,
+        therefore the basis values never extrapolate the curve beyond its start and end point.
+
+        .. versionadded:: 0.11
+
+        """
+        cached = self._cache.get(t)
+        if cached is not None:
+            return cached
+        knots = self.knots
+        order = self.order
+        u = min(max(t, knots[order - 1]), knots[self.count])
+        span = self.span(u)
+        values = [0.] * order
+        values[0] = 1.
+        left = [0.] * order
+        right = [0.] * order
+        for k in range(1, order):
+            left[k] = u - knots[span + 1 - k]
+            right[k] = knots[span + k] - u
+            saved = 0.
+            for r in range(k):
+                denominator = right[r + 1] + left[k - r]
+                temp = values[r] / denominator if denominator else 0.
+                values[r] = saved + right[r + 1] * temp
+                saved = left[k - r] * temp
+            values[k] = saved
+        result = (span - order + 1, values)
+        if len(self._cache) >= BASIS_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[t] = result
+        return result
 
     @property
     def max_t(self) -> float:
@@ -597,20 +655,14 @@ class Basis:
         return [1. if k1 <= t < k2 else 0. for k1, k2 in zip(self.knots, self.knots[1:])]
 
     def basis(self, t: float) -> List[float]:
-        knots = self.knots
-        nbasis = self.create_nbasis(t)
-        # calculate the higher order basis functions
-        for k in range(2, self.order + 1):
-            for i in range(self.nplusc - k):
-                d = ((t - knots[i]) * nbasis[i]) / (knots[i + k - 1] - knots[i]) if nbasis[i] != 0. else 0.
-                e = ((knots[i + k] - t) * nbasis[i + 1]) / (knots[i + k] - knots[i + 1]) if nbasis[i + 1] != 0. else 0.
-                nbasis[i] = d + e
-        if isclose(t, self.max_t):  # pick up last point
-            nbasis[self.count - 1] = 1.
+        """ Returns the basis vector for all control points at parameter `t`. """
+        start, values = self.local_basis(t)
+        nbasis = [0.] * self.count
+        nbasis[start:start + self.order] = values
         if self.weights is None:
-            return nbasis[:self.count]
+            return nbasis
         else:
-            return self.weighting(nbasis[:self.count])
+            return self.weighting(nbasis)
 
     def weighting(self, nbasis: Iterable[float]) -> List[float]:
         products = [nb * w for nb, w in zip(nbasis, self.weights)]
@@ -671,6 +723,48 @@ class DBasisU(DBasis):
         return nbasis
 
 
+class BasisTable:
+    """
+    Basis values of a B-spline for a sequence of parameters, created by :func:`basis_table`. (internal API)
+
+    Args:
+        starts: index of the first control point for each parameter
+        values: `order` non zero basis values for each parameter
+
+    """
+
+    def __init__(self, starts: Sequence[int], values: Sequence[List[float]]):
+        self.starts = starts
+        self.values = values
+        self._arrays = None
+
+    def arrays(self):
+        """ Returns the table as NumPy arrays, created at the first request. """
+        if self._arrays is None:
+            self._arrays = (numpy.array(self.starts, dtype=numpy.intp), numpy.array(self.values, dtype=numpy.float64))
+        return self._arrays
+
+
+@lru_cache(maxsize=64)
+def basis_table(knots: Tuple[float, ...], order: int, t: Tuple[float, ...]) -> BasisTable:
+    """
+    Returns the :class:`BasisTable` for the B-spline defined by `knots` and `order` at all parameters `t`, the results
+    are cached and shared by all B-splines with the same knot vector and order. (internal API)
+
+    .. versionadded:: 0.11
+
+    """
+    basis = Basis(knots, order, len(knots) - order)
+    local_basis = basis.local_basis
+    starts = []
+    values = []
+    for u in t:
+        start, basis_values = local_basis(u)
+        starts.append(start)
+        values.append(basis_values)
+    return BasisTable(starts, values)
+
+
 class BSpline:
     """
     Calculate the points of a `B-spline`_ curve, using an uniform open `knot`_ vector ("clamped").
@@ -732,23 +826,33 @@ class BSpline:
         """ Returns the `basis`_ vector for position t. """
         return self.basis.basis(t)
 
+    def params(self, segments: int) -> List[float]:
+        """ Returns `segments` + 1 evenly spaced parameters of the valid parameter range from ``knots[order-1]`` to
+        ``knots[count]``, which is the range from 0 to :attr:`max_t` for open uniform knot vectors.
+
+        .. versionadded:: 0.11
+
+        """
+        knots = self.basis.knots
+        start = knots[self.order - 1]
+        step = (knots[self.count] - start) / segments
+        return [start + index * step for index in range(segments + 1)]
+
     def step_size(self, segments: int) -> float:
         return self.max_t / float(segments)
 
     def approximate(self, segments: int = 20) -> Iterable[Vector]:
-        """ Approximates the whole B-spline from 0 to max_t, by line segments as a list of vertices, vertices count =
-        segments + 1.
+        """ Approximates the whole B-spline by line segments as a list of vertices, vertices count = segments + 1,
+        see :meth:`params`.
         """
-        step = self.step_size(segments)
-        for point_index in range(segments + 1):
-            yield self.point(point_index * step)
+        return self.points(self.params(segments))
 
     def point(self, t: float) -> Vector:
         """
         Get point at SplineCurve(t) as tuple (x, y, z).
 
         Args:
-            t: parameter in range [0, max_t]
+            t: parameter in range [0, max_t], clamped to the valid parameter range, see :meth:`params`
 
         Returns: Vector(x, y, z)
 
@@ -756,11 +860,67 @@ class BSpline:
         if isclose(t, self.max_t):
             t = self.max_t
 
+        start, values = self.basis.local_basis(t)
+        control_points = self.control_points[start:start + self.order]
+        weights = self.basis.weights
+        if weights is not None:
+            values = [value * weight for value, weight in zip(values, weights[start:start + self.order])]
+            s = sum(values)
+            if s == 0.:
+                return Vector()
+            values = [value / s for value in values]
         p = Vector()
-        for control_point, basis in zip(self.control_points, self.basis_values(t)):
+        for control_point, basis in zip(control_points, values):
             p += control_point * basis
         return p
 
+    def points(self, t: Iterable[float]) -> List[Vector]:
+        """
+        Returns the curve points for all parameters `t` as list of :class:`Vector` objects, this is much faster than
+        calling :meth:`point` for each parameter. The basis values of a parameter sequence are cached and reused by all
+        B-splines with the same knot vector and order, like the B-splines of many SPLINE entities flattened with the
+        same segment count. Large batches are evaluated by NumPy if available.
+
+        Args:
+            t: iterable of parameters in range [0, max_t], clamped to the valid parameter range, see :meth:`params`
+
+        .. versionadded:: 0.11
+
+        """
+        max_t = self.max_t
+        t = tuple(max_t if isclose(u, max_t) else u for u in t)
+        table = basis_table(tuple(self.basis.knots), self.order, t)
+        if numpy is not None and len(t) >= NUMPY_MIN_POINTS:
+            return self._numpy_points(table)
+        weights = self.basis.weights
+        vertices = [p.xyz for p in self.control_points]
+        order = self.order
+        points = []
+        for start, values in zip(table.starts, table.values):
+            if weights is not None:
+                values = [value * weight for value, weight in zip(values, weights[start:start + order])]
+                s = sum(values)
+                values = [value / s for value in values] if s else [0.] * order
+            x = y = z = 0.
+            for (vx, vy, vz), value in zip(vertices[start:start + order], values):
+                x += vx * value
+                y += vy * value
+                z += vz * value
+            points.append(Vector(x, y, z))
+        return points
+
+    def _numpy_points(self, table: 'BasisTable') -> List[Vector]:
+        starts, values = table.arrays()
+        indices = starts[:, None] + numpy.arange(self.order)
+        control_points = numpy.array([p.xyz for p in self.control_points], dtype=numpy.float64)
+        weights = self.basis.weights
+        if weights is not None:
+            values = values * numpy.array(weights, dtype=numpy.float64)[indices]
+            s = values.sum(axis=1)
+            values = numpy.divide(values, s[:, None], out=numpy.zeros_like(values), where=s[:, None] != 0.)
+        points = numpy.einsum('mk,mkd->md', values, control_points[indices])
+        return [Vector(p) for p in points.tolist()]
+
     def insert_knot(self, t: float) -> None:
         """
         Insert additional knot, without altering the curve shape.
@@ -795,6 +955,7 @@ class BSpline:
         cpoints[k - p + 1:k] = [new_point(i) for i in range(k - p + 1, k + 1)]
         knots.insert(k + 1, t)  # knot[k] <= t < knot[k+1]
         self.basis.count = len(cpoints)
+        self.basis.clear_cache()
 
 
 class BSplineU(BSpline):
@@ -813,12 +974,6 @@ class BSplineU(BSpline):
     def step_size(self, segments: int) -> float:
         return float(self.count - self.order + 1) / segments
 
-    def approximate(self, segments=20) -> Iterable[Vector]:
-        step = self.step_size(segments)
-        base = float(self.order - 1)
-        for point_index in range(segments + 1):
-            yield self.point(base + point_index * step)
-
     def t_array(self) -> List[float]:
         raise NotImplemented
 
@@ -842,6 +997,10 @@ class BSplineClosed(BSplineU):
 
 
 class DerivativePoint:  # Mixin
+    def points(self, t: Iterable[float]) -> List[Tuple[Vector, Vector, Vector]]:
+        """ Returns point, 1st and 2nd derivative for all parameters `t`, see :meth:`point`. """
+        return [self.point(u) for u in t]
+
     def point(self, t: float) -> Tuple[Vector, Vector, Vector]:
         """
         Get point, 1st and 2nd derivative at B-spline(t) as tuple (p, d1, d3),
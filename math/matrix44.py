@@ -5,13 +5,18 @@
 # Created: 19.04.2010
 # Copyright (c) 2010-2018 Manfred Moitzi
 # License: MIT License
-from typing import Sequence, Iterable, List, Tuple, TYPE_CHECKING
+from typing import Sequence, Iterable, List, Tuple, TYPE_CHECKING, Union
 from math import sin, cos, tan
 from itertools import chain
+from array import array
+
+from .numpysupport import numpy  # None if NumPy is not installed, vertex arrays are transformed by pure Python code
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
 
+VertexBuffer = Union[array, memoryview, 'numpy.ndarray']
+
 Tuple4Float = Tuple[float, float, float, float]
 
 
@@ -473,6 +478,19 @@ class Matrix44:
                 x * m[1] + y * m[5] + z * m[9] + m[13],
                 x * m[2] + y * m[6] + z * m[10] + m[14])
 
+    def transform_direction(self, vector: 'Vertex') -> Tuple[float, float, float]:
+        """
+        Transforms a 3D direction vector without translation and returns the result as a tuple.
+
+        .. versionadded:: 0.11
+
+        """
+        m = self.matrix
+        x, y, z = vector
+        return (x * m[0] + y * m[4] + z * m[8],
+                x * m[1] + y * m[5] + z * m[9],
+                x * m[2] + y * m[6] + z * m[10])
+
     def transform_vectors(self, vectors: Iterable['Vertex']) -> List['Vertex']:
         """
         Returns a list of transformed vectors.
@@ -489,6 +507,58 @@ class Matrix44:
             ))
         return result
 
+    def transform_array(self, vertices: VertexBuffer) -> VertexBuffer:
+        """
+        Returns transformed `vertices` as the same kind of container, `vertices` is an ``array('d')`` or a
+        ``memoryview`` of packed ``(x, y, z)`` vertices like the values of
+        :class:`~ezdxf.lldxf.packedtags.VertexArray`, or a NumPy array of shape ``(n, 3)``. The vertices are
+        transformed by a NumPy matrix multiplication if NumPy is available, else by pure Python code, without
+        creating a tuple or :class:`Vector` object for each vertex.
+
+        Raises:
+            TypeError: unsupported container type or memoryview format other than ``'d'``
+            ValueError: count of values is not a multiple of 3
+
+        .. versionadded:: 0.11
+
+        """
+        if numpy is not None and isinstance(vertices, numpy.ndarray):
+            return self._numpy_transform(vertices.reshape(-1, 3)).reshape(vertices.shape)
+        if isinstance(vertices, memoryview):
+            if vertices.format != 'd':
+                raise TypeError('memoryview of format "d" required.')
+            values = array('d')
+            values.frombytes(vertices.tobytes())
+            result = memoryview(self.transform_array(values))
+            if vertices.ndim > 1:
+                result = result.cast('B').cast('d', shape=vertices.shape)
+            return result
+        if not isinstance(vertices, array) or vertices.typecode != 'd':
+            raise TypeError("array('d'), memoryview or NumPy array required.")
+        if len(vertices) % 3:
+            raise ValueError('Count of values has to be a multiple of 3.')
+        if numpy is not None:
+            result = array('d')
+            result.frombytes(self._numpy_transform(numpy.frombuffer(vertices, dtype=numpy.float64).reshape(-1, 3))
+                             .tobytes())
+            return result
+        m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 = self.matrix
+        result = []
+        extend = result.extend
+        values = iter(vertices)
+        for x, y, z in zip(values, values, values):
+            extend((
+                x * m0 + y * m4 + z * m8 + m12,
+                x * m1 + y * m5 + z * m9 + m13,
+                x * m2 + y * m6 + z * m10 + m14
+            ))
+        return array('d', result)
+
+    def _numpy_transform(self, vertices: 'numpy.ndarray') -> 'numpy.ndarray':
+        """ Returns transformed NumPy array `vertices` of shape ``(n, 3)``. """
+        m = numpy.array(self.matrix, dtype=numpy.float64).reshape(4, 4)
+        return vertices @ m[:3, :3] + m[3, :3]
+
     def transpose(self) -> None:
         """
         Swaps the rows for columns inplace.
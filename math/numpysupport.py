@@ -0,0 +1,13 @@
+# Purpose: optional NumPy support
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+"""
+NumPy is an optional dependency of ezdxf, import `numpy` from this module and provide a pure Python code path for
+``numpy is None``.
+"""
+try:
+    import numpy
+except ImportError:  # NumPy is not installed
+    numpy = None
+
+__all__ = ['numpy']
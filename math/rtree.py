@@ -0,0 +1,265 @@
+# Purpose: R-tree spatial index for axis aligned bounding boxes
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import Iterable, Iterator, List, Tuple, Any, Optional, Sequence
+import heapq
+import math
+
+# axis aligned bounding box as tuple (min_x, min_y, min_z, max_x, max_y, max_z)
+Box = Tuple[float, float, float, float, float, float]
+Entry = Tuple[Box, Any]  # (box, item)
+
+MAX_NODE_SIZE = 16
+
+
+class Node:
+    """ R-tree node, children of leaf nodes are ``(box, item)`` tuples, children of inner nodes are :class:`Node`
+    objects. (internal class)
+    """
+    __slots__ = ('box', 'children', 'is_leaf')
+
+    def __init__(self, children: List, is_leaf: bool):
+        self.children = children
+        self.is_leaf = is_leaf
+        self.box = union_box(self.child_boxes())
+
+    def child_boxes(self) -> Iterator[Box]:
+        if self.is_leaf:
+            return (entry[0] for entry in self.children)
+        else:
+            return (node.box for node in self.children)
+
+    def update_box(self) -> None:
+        self.box = union_box(self.child_boxes())
+
+
+class RTree:
+    """
+    R-tree of items with axis aligned bounding boxes, the tree is bulk loaded by the Sort-Tile-Recursive (STR)
+    algorithm and supports incremental :meth:`insert` and :meth:`remove` of items.
+
+    Bounding boxes are tuples ``(min_x, min_y, min_z, max_x, max_y, max_z)``, items have to be hashable and
+    are identified by equality.
+
+    Args:
+        entries: iterable of ``(box, item)`` tuples
+        max_node_size: maximum count of children per node
+
+    .. versionadded:: 0.11
+
+    """
+
+    def __init__(self, entries: Iterable[Entry] = None, max_node_size: int = MAX_NODE_SIZE):
+        self.max_node_size = max(int(max_node_size), 4)
+        entries = list(entries or [])
+        self._count = len(entries)
+        self._root = self._bulk_load(entries)
+
+    def __len__(self) -> int:
+        """ Count of items. """
+        return self._count
+
+    def __iter__(self) -> Iterator[Entry]:
+        """ Iterable of all ``(box, item)`` tuples. """
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.is_leaf:
+                yield from node.children
+            else:
+                stack.extend(node.children)
+
+    @property
+    def box(self) -> Optional[Box]:
+        """ Bounding box of all items or ``None`` for an empty tree. """
+        return self._root.box
+
+    def _bulk_load(self, entries: List[Entry]) -> Node:
+        size = self.max_node_size
+        nodes = [Node(group, is_leaf=True) for group in str_pack(entries, lambda e: e[0], size)]
+        if not nodes:
+            return Node([], is_leaf=True)
+        while len(nodes) > 1:
+            nodes = [Node(group, is_leaf=False) for group in str_pack(nodes, lambda n: n.box, size)]
+        return nodes[0]
+
+    def insert(self, box: Box, item: Any) -> None:
+        """ Insert `item` with bounding `box`. """
+        sibling = self._insert(self._root, (box, item))
+        if sibling is not None:  # split root
+            self._root = Node([self._root, sibling], is_leaf=False)
+        self._count += 1
+
+    def _insert(self, node: Node, entry: Entry) -> Optional[Node]:
+        box = entry[0]
+        if node.is_leaf:
+            node.children.append(entry)
+        else:
+            child = min(node.children, key=lambda n: (enlargement(n.box, box), margin(n.box)))
+            sibling = self._insert(child, entry)
+            if sibling is not None:
+                node.children.append(sibling)
+        if len(node.children) > self.max_node_size:
+            return self._split(node)
+        node.box = box if node.box is None else union_box((node.box, box))
+        return None
+
+    @staticmethod
+    def _split(node: Node) -> Node:
+        """ Split `node` at the median of the axis with the largest spread of the child centers, returns the new
+        sibling node.
+        """
+        boxes = list(node.child_boxes())
+        axis = max(range(3), key=lambda i: spread(boxes, i))
+        order = sorted(range(len(boxes)), key=lambda index: boxes[index][axis] + boxes[index][axis + 3])
+        children = node.children
+        half = len(order) // 2
+        node.children = [children[index] for index in order[:half]]
+        node.update_box()
+        return Node([children[index] for index in order[half:]], is_leaf=node.is_leaf)
+
+    def remove(self, box: Box, item: Any) -> bool:
+        """ Remove `item` with bounding `box`, `box` has to be the same box as used for insertion. Returns ``True``
+        if `item` was found.
+        """
+        if self._root.box is None or not self._remove(self._root, box, item):
+            return False
+        self._count -= 1
+        root = self._root
+        while not root.is_leaf and len(root.children) == 1:
+            root = root.children[0]
+        if not root.children:
+            root = Node([], is_leaf=True)
+        self._root = root
+        return True
+
+    def _remove(self, node: Node, box: Box, item: Any) -> bool:
+        children = node.children
+        if node.is_leaf:
+            for index, entry in enumerate(children):
+                if entry[1] == item:
+                    del children[index]
+                    node.update_box()
+                    return True
+            return False
+        for index, child in enumerate(children):
+            if is_inside(box, child.box) and self._remove(child, box, item):
+                if not child.children:
+                    del children[index]
+                node.update_box()
+                return True
+        return False
+
+    def intersects(self, box: Box) -> Iterator[Entry]:
+        """ Yields all ``(box, item)`` tuples with a bounding box intersecting `box`, touching boxes intersect. """
+        if self._root.box is None:
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.is_leaf:
+                for entry in node.children:
+                    if is_intersecting(entry[0], box):
+                        yield entry
+            else:
+                stack.extend(child for child in node.children if is_intersecting(child.box, box))
+
+    def contains(self, box: Box) -> Iterator[Entry]:
+        """ Yields all ``(box, item)`` tuples with a bounding box completely inside of `box`. """
+        for entry in self.intersects(box):
+            if is_inside(entry[0], box):
+                yield entry
+
+    def nearest(self, point: Sequence[float], k: int = 1) -> List[Tuple[float, Entry]]:
+        """ Returns the `k` nearest ``(box, item)`` tuples to `point` as list of ``(distance, (box, item))`` tuples,
+        ordered by ascending distance. The distance is measured from `point` to the nearest point of the bounding box,
+        the distance is 0 for points inside the bounding box.
+        """
+        result = []
+        if self._root.box is None or k < 1:
+            return result
+        point = tuple(point) + (0., 0., 0.)[len(point):]
+        counter = 0  # tie breaker, nodes and entries are not comparable
+        heap = [(box_distance2(self._root.box, point), counter, self._root, None)]
+        while heap:
+            distance2, _, node, entry = heapq.heappop(heap)
+            if entry is not None:
+                result.append((math.sqrt(distance2), entry))
+                if len(result) == k:
+                    break
+                continue
+            if node.is_leaf:
+                for entry in node.children:
+                    counter += 1
+                    heapq.heappush(heap, (box_distance2(entry[0], point), counter, None, entry))
+            else:
+                for child in node.children:
+                    counter += 1
+                    heapq.heappush(heap, (box_distance2(child.box, point), counter, child, None))
+        return result
+
+
+def str_pack(items: List, box: Any, size: int) -> List[List]:
+    """ Sort-Tile-Recursive packing of `items` into groups of `size` items, function `box` returns the bounding box of
+    an item. Items are tiled by the x- and y-axis of the box centers. (internal API)
+    """
+    count = len(items)
+    if count == 0:
+        return []
+    slab_count = math.ceil(math.sqrt(math.ceil(count / size)))
+    slab_size = slab_count * size
+    items = sorted(items, key=lambda item: box(item)[0] + box(item)[3])
+    groups = []
+    for start in range(0, count, slab_size):
+        slab = sorted(items[start:start + slab_size], key=lambda item: box(item)[1] + box(item)[4])
+        groups.extend(slab[index:index + size] for index in range(0, len(slab), size))
+    return groups
+
+
+def union_box(boxes: Iterable[Box]) -> Optional[Box]:
+    """ Returns the bounding box of all `boxes` or ``None`` for no boxes. """
+    boxes = list(boxes)
+    if not boxes:
+        return None
+    min_x, min_y, min_z, max_x, max_y, max_z = zip(*boxes)
+    return min(min_x), min(min_y), min(min_z), max(max_x), max(max_y), max(max_z)
+
+
+def margin(box: Box) -> float:
+    """ Sum of the box edge lengths, unlike the volume also usable for flat boxes. """
+    return box[3] - box[0] + box[4] - box[1] + box[5] - box[2]
+
+
+def enlargement(box: Box, other: Box) -> float:
+    """ Increase of the margin of `box` to include `other`. """
+    return margin(union_box((box, other))) - margin(box)
+
+
+def spread(boxes: List[Box], axis: int) -> float:
+    centers = [b[axis] + b[axis + 3] for b in boxes]
+    return max(centers) - min(centers)
+
+
+def is_intersecting(box: Box, other: Box) -> bool:
+    return (box[0] <= other[3] and other[0] <= box[3] and
+            box[1] <= other[4] and other[1] <= box[4] and
+            box[2] <= other[5] and other[2] <= box[5])
+
+
+def is_inside(box: Box, other: Box) -> bool:
+    """ ``True`` if `box` is inside of `other`. """
+    return (other[0] <= box[0] and box[3] <= other[3] and
+            other[1] <= box[1] and box[4] <= other[4] and
+            other[2] <= box[2] and box[5] <= other[5])
+
+
+def box_distance2(box: Box, point: Sequence[float]) -> float:
+    """ Squared distance from `point` to the nearest point of `box`. """
+    distance2 = 0.
+    for axis in range(3):
+        value = point[axis]
+        if value < box[axis]:
+            distance2 += (box[axis] - value) ** 2
+        elif value > box[axis + 3]:
+            distance2 += (value - box[axis + 3]) ** 2
+    return distance2
@@ -0,0 +1,188 @@
+# Purpose: tools to transform DXF entities by Matrix44
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Tuple, Iterable
+from array import array
+import math
+from .vector import Vector
+from .ucs import OCS
+from .matrix44 import Matrix44
+
+from .numpysupport import numpy  # None if NumPy is not installed, vertex arrays are transformed by pure Python code
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
+REL_TOL = 1e-9
+
+
+class OCSTransform:
+    """
+    Transformation of the :ref:`OCS` of 2D entities like CIRCLE, TEXT or LWPOLYLINE by the transformation matrix `m`.
+    The new extrusion vector is perpendicular to the transformed OCS xy-plane, therefore the orientation of the
+    transformed OCS is preserved, an arc stays counter clockwise oriented also for mirror transformations.
+
+    Args:
+        extrusion: extrusion vector of the source OCS
+        m: transformation matrix
+
+    .. versionadded:: 0.11
+
+    """
+
+    def __init__(self, extrusion: 'Vertex', m: 'Matrix44'):
+        self.m = m
+        self.old_extrusion = Vector(extrusion).normalize()
+        self.old_ocs = OCS(self.old_extrusion)
+        ux = Vector(m.transform_direction(self.old_ocs.ux))
+        uy = Vector(m.transform_direction(self.old_ocs.uy))
+        self.scale_ux = ux.magnitude
+        self.scale_uy = uy.magnitude
+        self._uniform = (
+                math.isclose(self.scale_ux, self.scale_uy, rel_tol=REL_TOL) and
+                abs(ux.dot(uy)) <= REL_TOL * self.scale_ux * self.scale_uy
+        )
+        self.new_extrusion = ux.cross(uy).normalize()
+        self.new_ocs = OCS(self.new_extrusion)
+
+    @property
+    def scale_uniform(self) -> bool:
+        """ ``True`` if the OCS xy-plane is scaled uniform without shearing. """
+        return self._uniform
+
+    def matrix44(self) -> Matrix44:
+        """ Returns the transformation matrix from old OCS coordinates to new OCS coordinates. """
+        old_ocs = self.old_ocs
+        new_ocs = self.new_ocs
+        return Matrix44.chain(
+            Matrix44.ucs(old_ocs.ux, old_ocs.uy, old_ocs.uz).get_transpose(),  # old OCS to WCS
+            self.m,
+            Matrix44.ucs(new_ocs.ux, new_ocs.uy, new_ocs.uz),  # WCS to new OCS
+        )
+
+    def transform_vertex(self, vertex: 'Vertex') -> Vector:
+        """ Returns the new OCS location of the old OCS `vertex`. """
+        return Vector(self.new_ocs.from_wcs(self.m.transform(self.old_ocs.to_wcs(vertex))))
+
+    def transform_2d_vertex(self, vertex: 'Vertex', elevation: float) -> Tuple[float, float]:
+        """ Returns the new OCS location of the old 2D OCS `vertex` located at `elevation` as ``(x, y)`` tuple. """
+        x, y, *_ = vertex
+        x, y, _ = self.transform_vertex((x, y, elevation))
+        return x, y
+
+    def transform_direction(self, direction: 'Vertex') -> Vector:
+        """ Returns the new OCS direction of the old OCS `direction`, the length of the direction is transformed. """
+        return Vector(self.new_ocs.from_wcs(self.m.transform_direction(self.old_ocs.to_wcs(direction))))
+
+    def transform_2d_direction(self, direction: 'Vertex') -> Tuple[float, float]:
+        """ Returns the new OCS direction of the old 2D OCS `direction` as ``(x, y)`` tuple. """
+        x, y, *_ = direction
+        x, y, _ = self.transform_direction((x, y, 0.))
+        return x, y
+
+    def transform_length(self, length: float) -> float:
+        """ Returns the transformed `length` of the OCS xy-plane, only valid for uniform scaling. """
+        return length * self.scale_ux
+
+    def transform_width(self, width: float) -> float:
+        """ Returns the transformed `width` of lines in the OCS xy-plane, the average scaling of the OCS x- and y-axis
+        is used for non uniform scaling.
+        """
+        if self._uniform:
+            return width * self.scale_ux
+        return width * (self.scale_ux + self.scale_uy) / 2.
+
+    def transform_deg_angle(self, angle: float) -> float:
+        """ Returns the new OCS angle of the old OCS `angle` in degrees. """
+        return self.transform_direction(Vector.from_deg_angle(angle)).angle_deg % 360.
+
+    def transform_thickness(self, thickness: float) -> float:
+        """ Returns the transformed `thickness` in extrusion direction. """
+        return thickness * Vector(self.m.transform_direction(self.old_extrusion)).dot(self.new_extrusion)
+
+
+def transform_extrusion(extrusion: 'Vertex', m: 'Matrix44') -> Tuple[Vector, float]:
+    """
+    Returns the transformed `extrusion` vector of WCS entities like LINE or POINT as normalized vector and the scaling
+    factor for the thickness.
+
+    .. versionadded:: 0.11
+
+    """
+    extrusion = Vector(m.transform_direction(extrusion))
+    return extrusion.normalize(), extrusion.magnitude
+
+
+def conjugated_to_axis(a: Vector, b: Vector) -> Tuple[Vector, Vector, float]:
+    """
+    Returns the major- and the minor axis of an ellipse defined by the conjugated semi-diameters `a` and `b` and the
+    parameter offset of the major axis, an ellipse point ``a * cos(t) + b * sin(t)`` is located at parameter
+    ``t - offset`` of the returned axis.
+
+    .. versionadded:: 0.11
+
+    """
+    t0 = math.atan2(2. * a.dot(b), a.dot(a) - b.dot(b)) / 2.
+    cos_t0 = math.cos(t0)
+    sin_t0 = math.sin(t0)
+    major = a * cos_t0 + b * sin_t0
+    minor = b * cos_t0 - a * sin_t0
+    return major, minor, t0
+
+
+def transform_vertex_arrays(arrays: Iterable['array'], m: Matrix44, vertex_size: int = 3, z: float = 0.) -> None:
+    """
+    Transform the vertices packed into the ``array('d')`` objects of `arrays` inplace by transformation matrix `m`,
+    like the values of :class:`~ezdxf.lldxf.packedtags.VertexArray`. Each vertex has `vertex_size` components, a
+    vertex size of 3 transforms ``(x, y, z)`` vertices, for all other vertex sizes only the first two components are
+    transformed as ``(x, y)`` vertices located at `z` and the remaining components of the vertex, like the widths and
+    the bulge of LWPOLYLINE points, are not changed.
+
+    All vertices of all arrays are transformed by a single matrix multiplication if NumPy is available, else by pure
+    Python code.
+
+    Args:
+        arrays: iterable of ``array('d')`` objects
+        m: transformation matrix
+        vertex_size: count of components per vertex
+        z: z-axis value of 2D vertices
+
+    Raises:
+        ValueError: count of values of any array is not a multiple of `vertex_size`, no array is transformed
+
+    .. versionadded:: 0.11
+
+    """
+    arrays = [values for values in arrays if len(values)]
+    if not arrays:
+        return
+    if any(len(values) % vertex_size for values in arrays):
+        raise ValueError('Count of values has to be a multiple of {}.'.format(vertex_size))
+    m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 = m.matrix
+    if vertex_size != 3:  # 2D vertices: fold the constant z-axis into the translation
+        m12 += z * m8
+        m13 += z * m9
+    if numpy is not None:
+        _numpy_transform(arrays, (m0, m1, m2, m4, m5, m6, m8, m9, m10), (m12, m13, m14), vertex_size)
+        return
+    for values in arrays:
+        if vertex_size == 3:
+            values[:] = m.transform_array(values)
+        else:
+            xs = values[0::vertex_size]
+            ys = values[1::vertex_size]
+            values[0::vertex_size] = array('d', [x * m0 + y * m4 + m12 for x, y in zip(xs, ys)])
+            values[1::vertex_size] = array('d', [x * m1 + y * m5 + m13 for x, y in zip(xs, ys)])
+
+
+def _numpy_transform(arrays, linear, translation, vertex_size: int) -> None:
+    dims = 3 if vertex_size == 3 else 2
+    views = [numpy.frombuffer(values, dtype=numpy.float64).reshape(-1, vertex_size) for values in arrays]
+    vertices = numpy.concatenate([view[:, :dims] for view in views])
+    matrix = numpy.array(linear, dtype=numpy.float64).reshape(3, 3)[:dims, :dims]
+    vertices = vertices @ matrix + numpy.array(translation[:dims], dtype=numpy.float64)
+    start = 0
+    for view in views:
+        end = start + len(view)
+        view[:, :dims] = vertices[start:end]
+        start = end
@@ -2,9 +2,11 @@
 # License: MIT License
 from typing import TYPE_CHECKING, Tuple, Sequence, Iterable
 from .vector import Vector, X_AXIS, Y_AXIS, Z_AXIS
+from .matrix44 import Matrix44
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import GenericLayoutType, Vertex, BaseLayout
+    from .matrix44 import VertexBuffer
 
 
 def render_axis(layout: 'BaseLayout',
@@ -93,6 +95,15 @@ class OCS:
         for point in points:
             yield self.from_wcs(point)
 
+    def points_from_wcs_array(self, vertices: 'VertexBuffer') -> 'VertexBuffer':
+        """ Returns OCS vertices from WCS `vertices` as the same kind of container, see
+        :meth:`Matrix44.transform_array`.
+
+        .. versionadded:: 0.11
+
+        """
+        return Matrix44.ucs(self.ux, self.uy, self.uz).transform_array(vertices)
+
     def to_wcs(self, point: 'Vertex') -> 'Vertex':
         """ Returns WCS vector for OCS `point`. """
         if self.transform:
@@ -105,6 +116,15 @@ class OCS:
         for point in points:
             yield self.to_wcs(point)
 
+    def points_to_wcs_array(self, vertices: 'VertexBuffer') -> 'VertexBuffer':
+        """ Returns WCS vertices for OCS `vertices` as the same kind of container, see
+        :meth:`Matrix44.transform_array`.
+
+        .. versionadded:: 0.11
+
+        """
+        return Matrix44.ucs(self.ux, self.uy, self.uz).get_transpose().transform_array(vertices)
+
     def render_axis(self, layout: 'BaseLayout', length: float = 1, colors: Tuple[int, int, int] = (1, 3, 5)):
         """ Render axis as 3D lines into a `layout`. """
         render_axis(
@@ -186,6 +206,17 @@ class UCS:
         for point in points:
             yield self.to_wcs(point)
 
+    def points_to_wcs_array(self, vertices: 'VertexBuffer') -> 'VertexBuffer':
+        """ Returns WCS vertices for UCS `vertices` as the same kind of container, see
+        :meth:`Matrix44.transform_array`.
+
+        .. versionadded:: 0.11
+
+        """
+        m = Matrix44.ucs(self.ux, self.uy, self.uz).get_transpose()
+        m.set_row(3, (self.origin.x, self.origin.y, self.origin.z, 1.))
+        return m.transform_array(vertices)
+
     def to_ocs(self, point: 'Vertex') -> 'Vertex':
         """
         Returns OCS vector for UCS `point`.
@@ -243,6 +274,16 @@ class UCS:
         for point in points:
             yield self.from_wcs(point)
 
+    def points_from_wcs_array(self, vertices: 'VertexBuffer') -> 'VertexBuffer':
+        """ Returns UCS vertices from WCS `vertices` as the same kind of container, see
+        :meth:`Matrix44.transform_array`.
+
+        .. versionadded:: 0.11
+
+        """
+        m = Matrix44.chain(Matrix44.translate(*(-self.origin)), Matrix44.ucs(self.ux, self.uy, self.uz))
+        return m.transform_array(vertices)
+
     @property
     def is_cartesian(self) -> bool:
         """ Returns ``True`` if cartesian coordinate system. """
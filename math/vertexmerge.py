@@ -0,0 +1,174 @@
+# Purpose: merge coincident vertices of meshes
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Sequence, Dict, Optional
+from itertools import chain
+import math
+
+from .numpysupport import numpy  # None if NumPy is not installed, vertices are merged by pure Python code
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
+# minimum count of vertices to remove exact duplicates by NumPy
+NUMPY_MIN_VERTICES = 1024
+
+Point = Tuple[float, float, float]
+
+
+def merge_vertices(vertices: Iterable['Vertex'], precision: int = 6,
+                   tolerance: float = None) -> Tuple[List[int], List[int]]:
+    """
+    Merges coincident vertices in one call. Vertices are coincident if their coordinates rounded to `precision`
+    decimal places are equal, or if argument `tolerance` is given, if the distance of the vertices is less or equal
+    to `tolerance`. The first vertex of coincident vertices is the representative of the merged vertex.
+
+    The tolerance based merging assigns each vertex to the first existing representative in the `tolerance` range
+    by a grid hash with a cell size of `tolerance`, if no representative is found the vertex is a new
+    representative. This is faster and more reliable than rounding, vertices with a small distance can have different
+    rounded coordinates.
+
+    If NumPy is available and the count of vertices is at least ``NUMPY_MIN_VERTICES``, the rounding based merging
+    is done by NumPy, for the tolerance based merging exact duplicates are removed by NumPy at first, for meshes with
+    shared vertices the remaining Python code processes only a fraction of the vertices. The result is the same with
+    and without NumPy.
+
+    Args:
+        vertices: iterable of ``(x, y, z)`` tuples or :class:`~ezdxf.math.Vector` objects or a NumPy array of shape
+                  ``(n, 3)``
+        precision: decimal places of coordinates to be equal
+        tolerance: max. distance of coincident vertices, overrides argument `precision`
+
+    Returns:
+        tuple (keep, mapping), `keep` is the list of the indices of the merged vertices in the input `vertices`,
+        `mapping` is the list of the new vertex indices for each input vertex, ``keep[mapping[i]]`` is the index
+        of the merged vertex of input vertex ``i``
+
+    .. versionadded:: 0.11
+
+    """
+    if tolerance is not None and tolerance <= 0.:
+        raise ValueError('tolerance has to be > 0')
+    if numpy is not None:
+        if not isinstance(vertices, numpy.ndarray):
+            vertices = vertices if isinstance(vertices, Sequence) else list(vertices)
+        if len(vertices) >= NUMPY_MIN_VERTICES:
+            return _numpy_merge_vertices(vertices, precision, tolerance)
+    points = [(x, y, z) for x, y, z in vertices]
+    return _merge_points(points, precision, tolerance)
+
+
+def remap_indices(entities: Iterable[Sequence[int]], mapping: Sequence[int]) -> List[Tuple[int, ...]]:
+    """
+    Returns vertex index lists of faces or edges remapped by `mapping` as returned by :func:`merge_vertices`.
+
+    .. versionadded:: 0.11
+
+    """
+    return [tuple(mapping[index] for index in entity) for entity in entities]
+
+
+def _merge_points(points: List[Point], precision: int, tolerance: float) -> Tuple[List[int], List[int]]:
+    if tolerance is None:
+        p = precision
+        return _merge_keys([(round(x, p), round(y, p), round(z, p)) for x, y, z in points])
+
+    # exact duplicates do not need the neighborhood search
+    unique, mapping = _merge_keys(points)
+    keep, unique_mapping = _merge_by_distance([points[index] for index in unique], tolerance)
+    keep = [unique[index] for index in keep]
+    return keep, [unique_mapping[index] for index in mapping]
+
+
+def _merge_keys(keys: List[Point]) -> Tuple[List[int], List[int]]:
+    ledger = dict()  # type: Dict[Point, int]
+    keep = []
+    mapping = []
+    for index, key in enumerate(keys):
+        new_index = ledger.setdefault(key, len(keep))
+        if new_index == len(keep):
+            keep.append(index)
+        mapping.append(new_index)
+    return keep, mapping
+
+
+def _merge_by_distance(points: List[Point], tolerance: float) -> Tuple[List[int], List[int]]:
+    floor = math.floor
+    scale = 1. / tolerance
+    max_dist2 = tolerance * tolerance
+    offsets = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)]
+    grid = dict()  # type: Dict[Tuple[int, int, int], List[int]]
+    keep = []
+    mapping = []
+    for index, (x, y, z) in enumerate(points):
+        cx, cy, cz = floor(x * scale), floor(y * scale), floor(z * scale)
+        found = -1
+        for dx, dy, dz in offsets:
+            for new_index in grid.get((cx + dx, cy + dy, cz + dz), ()):
+                if found != -1 and new_index > found:
+                    continue
+                rx, ry, rz = points[keep[new_index]]
+                if (rx - x) ** 2 + (ry - y) ** 2 + (rz - z) ** 2 <= max_dist2:
+                    found = new_index
+        if found == -1:
+            found = len(keep)
+            keep.append(index)
+            grid.setdefault((cx, cy, cz), []).append(found)
+        mapping.append(found)
+    return keep, mapping
+
+
+def _numpy_merge_vertices(vertices, precision: int, tolerance: float) -> Tuple[List[int], List[int]]:
+    if isinstance(vertices, numpy.ndarray):
+        points = vertices.astype(numpy.float64).reshape(-1, 3)
+    else:
+        points = numpy.fromiter(chain.from_iterable(vertices), dtype=numpy.float64, count=len(vertices) * 3)
+        points = points.reshape(-1, 3)
+
+    if tolerance is None:
+        keys = _numpy_rounding_keys(points, precision)
+        if keys is not None:
+            keep, mapping = _numpy_group(keys)
+            return keep.tolist(), mapping.tolist()
+
+    # remove exact duplicates and process the remaining vertices by Python code
+    unique, unique_inverse = _numpy_group(points)
+    keep, unique_mapping = _merge_points(list(map(tuple, points[unique].tolist())), precision, tolerance)
+    keep = unique[keep].tolist()
+    mapping = numpy.array(unique_mapping, dtype=numpy.int64)[unique_inverse].tolist()
+    return keep, mapping
+
+
+def _numpy_rounding_keys(points: 'numpy.ndarray', precision: int) -> Optional['numpy.ndarray']:
+    """ Returns the rounded coordinates as integer multiples of ``10 ** -precision``, identical to the rounding
+    by Python :func:`round`, or ``None`` if the scaled coordinates exceed the exact integer range of floats.
+    """
+    scaled = points * (10. ** precision)
+    if not numpy.all(numpy.abs(scaled) < 2. ** 52):
+        return None
+    keys = numpy.rint(scaled)
+    # scaled coordinates close to the half way between two integers may be rounded differently by Python
+    boundary = numpy.abs(numpy.abs(scaled - numpy.floor(scaled)) - .5) < 1e-6
+    for row, col in zip(*numpy.nonzero(boundary)):
+        keys[row, col] = round(round(float(points[row, col]), precision) * 10. ** precision)
+    return keys.astype(numpy.int64)
+
+
+def _numpy_group(keys: 'numpy.ndarray') -> Tuple['numpy.ndarray', 'numpy.ndarray']:
+    """ Groups identical rows of `keys`, returns the index of the first row of each group in the order of
+    occurrence, and the group index of each row.
+    """
+    count = len(keys)
+    order = numpy.lexsort(keys.T[::-1])  # stable: first row of a group is the first occurrence
+    sorted_keys = keys[order]
+    first_of_group = numpy.empty(count, dtype=bool)
+    first_of_group[0] = True
+    first_of_group[1:] = numpy.any(sorted_keys[1:] != sorted_keys[:-1], axis=1)
+    group = numpy.empty(count, dtype=numpy.int64)
+    group[order] = numpy.cumsum(first_of_group) - 1
+    first = order[first_of_group]
+    # renumber groups in order of first occurrence
+    occurrence = numpy.argsort(first, kind='stable')
+    rank = numpy.empty_like(occurrence)
+    rank[occurrence] = numpy.arange(len(occurrence))
+    return first[occurrence], rank[group]
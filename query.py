@@ -2,16 +2,20 @@
 # Created: 27.04.13
 # Copyright (C) 2013, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Iterable, Callable, Hashable, Dict, List, Any, Sequence, Union
+from typing import TYPE_CHECKING, Iterable, Callable, Hashable, Dict, List, Any, Sequence, Union, Tuple, Set, Optional
 import re
 import operator
+from functools import lru_cache
+from itertools import chain
 
-from collections import abc
+from collections import abc, deque
 from ezdxf.queryparser import EntityQueryParser
 from ezdxf.groupby import groupby
+from ezdxf.columns import to_columns
+from ezdxf.entitydb import index_value, owner_index_value
 
 if TYPE_CHECKING:  # import forward references
-    from ezdxf.eztypes import DXFEntity
+    from ezdxf.eztypes import DXFEntity, BaseLayout, EntityDB
 
 
 class EntityQuery(abc.Sequence):
@@ -151,16 +155,187 @@ class EntityQuery(abc.Sequence):
         """
         return groupby(self.entities, dxfattrib, key)
 
+    def to_columns(self, names: Iterable[str]) -> Dict[str, Any]:
+        """
+        Returns the DXF attributes `names` of all entities as ``dict`` of NumPy arrays, see
+        :func:`ezdxf.columns.to_columns`.
+
+        .. versionadded:: 0.11
+
+        """
+        return to_columns(self.entities, names)
+
+
+QUERY_CACHE_SIZE = 512  # count of cached compiled queries
 
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
 def entity_matcher(query: str) -> Callable[['DXFEntity'], bool]:
+    """
+    Returns a function ``match(entity) -> bool`` for the `query` string, the query is parsed and compiled once into a
+    single Python function and the result is stored in a LRU cache of :data:`QUERY_CACHE_SIZE` queries.
+
+    """
     query_args = EntityQueryParser.parseString(query, parseAll=True)
-    entity_matcher_ = build_entity_name_matcher(query_args.EntityQuery)
-    attrib_matcher = build_entity_attributes_matcher(query_args.AttribQuery, query_args.AttribQueryOptions)
+    return compile_query(query_args.EntityQuery, query_args.AttribQuery, query_args.AttribQueryOptions)
+
+
+def compile_query(names: Sequence[str], tokens: Sequence, options: str) -> Callable[['DXFEntity'], bool]:
+    """
+    Compiles the parsed entity query `names` and attribute query `tokens` into the source code of one Python function,
+    every relation of the attribute query is compiled into a small function without the overhead of the token tree
+    interpretation of :class:`BoolExpression`. (internal API)
+
+    """
+    namespace = {'re': re, 'to_lower': to_lower}
+    relations = []  # type: List[str]
+    terms = []
+    include, exclude, take_all = _split_names(' '.join(names))
+    if take_all:
+        if exclude:
+            namespace['exclude'] = frozenset(exclude)
+            terms.append('dxftype() not in exclude')
+    else:
+        namespace['include'] = frozenset(include)
+        terms.append('dxftype() in include')
+    if len(tokens):
+        terms.append(_compile_expression(tokens, 'i' == options, relations, namespace))
+
+    source = relations + [
+        'def match(entity):',
+        '    dxftype = entity.dxftype',
+        '    return {}'.format(' and '.join(terms) if terms else 'True'),
+    ]
+    exec(compile('\n'.join(source), '<query>', 'exec'), namespace)
+    match = namespace['match']
+    match.index_conditions = _index_conditions(include if not take_all else None, tokens)
+    return match
+
+
+INDEXED_RELATIONS = {'layer', 'owner', 'name'}
+INDEX_SELECTIVITY = 8  # use index only if less than 1/INDEX_SELECTIVITY of all entities are candidates
+
+
+def _index_conditions(include: Optional[Set[str]], tokens: Sequence) -> List[Tuple[str, Any]]:
+    """ Returns the conditions for a secondary index lookup as list of ``(key, value)`` tuples, see
+    :meth:`ezdxf.entitydb.EntityDB.handles_by_index`. Only the entity names and equality relations of indexed
+    attributes in top level AND expressions are used, all other terms are checked by the compiled query.
+    """
+    conditions = []
+    if include is not None:
+        conditions.append(('dxftype', frozenset(include)))
+
+    def collect(tokens: Sequence) -> None:
+        tokens = tuple(tokens)
+        if len(tokens) == 3 and tokens[1] == '==':
+            name, op, value = tokens
+            # block name index exists only for INSERT entities
+            if name in INDEXED_RELATIONS and isinstance(value, str) and (name != 'name' or include == {'INSERT'}):
+                conditions.append((name, value))
+        elif len(tokens) == 1:
+            collect(tokens[0])
+        elif all(token == '&' for token in tokens[1::2]):
+            for token in tokens[0::2]:
+                collect(token)
+
+    if len(tokens):
+        collect(tokens)
+    if any(key == 'name' for key, value in conditions):  # block name index contains only INSERT entities
+        conditions = conditions[1:]
+    return conditions
+
+
+def indexed_query(layouts: Iterable['BaseLayout'], db: 'EntityDB', query: str = '*') -> 'EntityQuery':
+    """
+    Returns all entities of `layouts` matching `query` in the same order as ``EntityQuery(chain(*layouts), query)``,
+    but uses the secondary indexes of the entity database `db` to find the candidates, if the query filters by entity
+    names or by equality of the attributes ``layer``, ``owner`` or ``name`` (INSERT). (internal API)
+
+    """
+    match = entity_matcher(query)
+    conditions = match.index_conditions
+    handles = db.handles_by_index(conditions) if conditions else None
+    # scanning all entities is faster for low selective queries
+    if handles is None or len(handles) * INDEX_SELECTIVITY > len(db):
+        return EntityQuery(chain.from_iterable(layouts), query)
+
+    candidates = dict()  # type: Dict[str, List[DXFEntity]]
+    for handle in handles:
+        entity = db[handle]
+        if match(entity):
+            owner = owner_index_value(entity)
+            if owner in candidates:
+                candidates[owner].append(entity)
+            else:
+                candidates[owner] = [entity]
+    result = EntityQuery()
+    for layout in layouts:
+        entities = candidates.get(index_value(layout.layout_key))
+        if entities:  # candidates are owned by this layout, but not all are stored in the layout like BLOCK
+            result.entities.extend(layout.entity_space.in_order(entities))
+    return result
+
+
+def _compile_expression(tokens: Union[str, Sequence], ignore_case: bool, relations: List[str], namespace: Dict) -> str:
+    """ Returns the source code of the boolean expression `tokens`, the relation functions are stored as source code
+    in `relations` and their values in `namespace`. Evaluation order is the same as for :meth:`BoolExpression.evaluate`.
+    """
+    def is_relation(tokens: Sequence) -> bool:
+        return len(tokens) == 3 and tokens[1] in Relation.VALID_CMP_OPERATORS
+
+    tokens = tuple(tokens)
+    if is_relation(tokens):
+        return _compile_relation(tokens, ignore_case, relations, namespace)
+
+    values = deque()
+    operators = []
+    for token in tokens:
+        if isinstance(token, str):  # bool operator
+            operators.append(token)
+        else:
+            values.append(_compile_expression(token, ignore_case, relations, namespace))
+    for op in operators:  # as queue -> first in, first out
+        if op == '!':
+            value = '(not {})'.format(values.popleft())
+        else:
+            value = '({} {} {})'.format(values.popleft(), BOOL_OPERATORS[op], values.popleft())
+        values.appendleft(value)
+    return values.popleft()
+
 
-    def matcher(entity: 'DXFEntity') -> bool:
-        return entity_matcher_(entity) and attrib_matcher(entity)
+BOOL_OPERATORS = {
+    '&': 'and',
+    '|': 'or',
+}
 
-    return matcher
+
+def _compile_relation(relation: Sequence, ignore_case: bool, relations: List[str], namespace: Dict) -> str:
+    """ Returns the source code to call the compiled `relation` function, same behavior as :meth:`Relation.evaluate`.
+    """
+    name, op, value = relation
+    index = len(relations)
+    value_name = 'value{}'.format(index)
+    get_value = 'entity.get_dxf_attrib({!r})'.format(name)
+    if ignore_case:
+        get_value = 'to_lower({})'.format(get_value)
+
+    if '?' in op:
+        re_flags = re.IGNORECASE if ignore_case else 0
+        namespace[value_name] = re.compile(value + '$', flags=re_flags).match  # always match whole pattern
+        test = '{}({}) is {}None'.format(value_name, get_value, 'not ' if op == '?' else '')
+    else:
+        namespace[value_name] = to_lower(value) if ignore_case else value
+        test = '{} {} {}'.format(get_value, op, value_name)
+
+    function_name = 'relation{}'.format(index)
+    relations.append('\n'.join([
+        'def {}(entity):'.format(function_name),
+        '    try:',
+        '        return {}'.format(test),
+        '    except (AttributeError, ValueError):',
+        '        return False',
+    ]))
+    return '{}(entity)'.format(function_name)
 
 
 def build_entity_name_matcher_old(names: Sequence[str]) -> Callable[['DXFEntity'], bool]:
@@ -268,13 +443,7 @@ def _compile_tokens(tokens: Union[str, Sequence], ignore_case: bool) -> Union[st
 def build_entity_attributes_matcher(tokens: Sequence, options: str) -> Callable[['DXFEntity'], bool]:
     if not len(tokens):
         return lambda x: True
-    ignore_case = 'i' == options  # at this time just one option is supported
-    expr = BoolExpression(_compile_tokens(tokens, ignore_case))
-
-    def match_bool_expr(entity: 'DXFEntity') -> bool:
-        return expr.evaluate(entity)
-
-    return match_bool_expr
+    return compile_query(['*'], tokens, options)
 
 
 def unique_entities(entities: Iterable['DXFEntity']) -> Iterable['DXFEntity']:
@@ -314,6 +483,12 @@ def name_matcher(query: str = "*") -> Callable[[str], bool]:
         else:
             return e in include
 
+    include, exclude, take_all = _split_names(query)
+    return match
+
+
+def _split_names(query: str) -> Tuple[Set[str], Set[str], bool]:
+    """ Returns included names, excluded names and the take all state of the name `query`. """
     match_strings = set(query.upper().split())
     take_all = False
     exclude = set()
@@ -325,8 +500,7 @@ def name_matcher(query: str = "*") -> Callable[[str], bool]:
             exclude.add(name[1:])
         else:
             include.add(name)
-
-    return match
+    return include, exclude, take_all
 
 
 def new(entities: Iterable['DXFEntity'] = None, query: str = '*') -> EntityQuery:
@@ -456,25 +456,34 @@ def extrude(profile: Iterable['Vertex'], path: Iterable['Vertex'], close: bool =
         prev_top = top_profile[0]
         for bottom, top in zip(bottom_profile[1:], top_profile[1:]):
             face = (prev_bottom, bottom, top, prev_top)  # counter clock wise: normals outwards
-            mesh.faces.append(face)
+            faces.append(face)
             prev_bottom = bottom
             prev_top = top
 
-    mesh = MeshVertexMerger()
+    def add_vertices(new_vertices: List[Vector]) -> range:
+        start = len(vertices)
+        vertices.extend(new_vertices)
+        return range(start, len(vertices))
+
+    vertices = []  # type: List[Vector]
+    faces = []  # type: List[Tuple[int, int, int, int]]
     if close:
         profile = close_polygon(profile)
     profile = [Vector(p) for p in profile]
     path = [Vector(p) for p in path]
     start_point = path[0]
-    bottom_indices = mesh.add_vertices(profile)  # base profile
+    bottom_indices = add_vertices(profile)  # base profile
     for target_point in path[1:]:
         translation_vector = target_point - start_point
         # profile will just be translated
         profile = [vec + translation_vector for vec in profile]
-        top_indices = mesh.add_vertices(profile)
+        top_indices = add_vertices(profile)
         add_hull(bottom_indices, top_indices)
         bottom_indices = top_indices
         start_point = target_point
+    # merge all vertices in one call
+    mesh = MeshVertexMerger()
+    mesh.add_mesh(vertices=vertices, faces=faces)
     return mesh
 
 
@@ -3,11 +3,15 @@
 # License: MIT License
 from typing import List, Sequence, Tuple, Iterable, TYPE_CHECKING
 from ezdxf.math.vector import Vector
+from ezdxf.math.vertexmerge import merge_vertices, remap_indices
 from ezdxf.lldxf.const import DXFValueError
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex, Matrix44, BaseLayout
 
+# minimum count of vertices to merge by merge_vertices() in MeshVertexMerger.add_vertices()
+BATCH_MIN_VERTICES = 64
+
 
 class MeshBuilder:
     """
@@ -107,6 +111,28 @@ class MeshBuilder:
         for face_vertices in faces:
             self.faces.append(tuple(indices[vi] for vi in face_vertices))
 
+    def optimize(self, precision: int = 6, tolerance: float = None) -> List[int]:
+        """
+        Merges coincident vertices inplace and remaps the vertex indices of all faces and edges. Vertices are
+        coincident if their coordinates rounded to `precision` decimal places are equal, or if their distance is less
+        or equal to `tolerance`, see :func:`~ezdxf.math.vertexmerge.merge_vertices`.
+
+        Args:
+            precision: decimal places of coordinates to be equal
+            tolerance: max. distance of coincident vertices, overrides argument `precision`
+
+        Returns:
+            list of the new vertex index for each old vertex index
+
+        .. versionadded:: 0.11
+
+        """
+        keep, mapping = merge_vertices(self.vertices, precision=precision, tolerance=tolerance)
+        self.vertices = [self.vertices[index] for index in keep]
+        self.faces = remap_indices(self.faces, mapping)
+        self.edges = remap_indices(self.edges, mapping)
+        return mapping
+
     def transform(self, matrix: 'Matrix44') -> 'MeshBuilder':
         """
         Transform actual mesh into a new mesh by applying the transformation `matrix` to vertices.
@@ -163,15 +189,23 @@ class MeshBuilder:
             dxfattribs: dict of DXF attributes e.g. ``{'layer': 'mesh', 'color': 7}``
             matrix: transformation matrix of type :class:`~ezdxf.math.Matrix44`
 
+        Returns:
+            :class:`~ezdxf.entities.Mesh` entity
+
+        .. versionchanged:: 0.11
+
+            returns the new MESH entity
+
         """
         mesh = layout.add_mesh(dxfattribs=dxfattribs)
-        with mesh.edit_data() as data:
-            if matrix is not None:
-                data.vertices = matrix.transform_vectors(self.vertices)
-            else:
-                data.vertices = self.vertices
-            data.edges = self.edges
-            data.faces = self.faces
+        # transfer data directly into the packed MESH arrays, without intermediate MeshData lists
+        if matrix is not None:
+            mesh.vertices = matrix.transform_vectors(self.vertices)
+        else:
+            mesh.vertices = self.vertices
+        mesh.edges = self.edges
+        mesh.faces = self.faces
+        return mesh
 
     @classmethod
     def from_mesh(cls, other) -> 'MeshBuilder':
@@ -193,6 +227,9 @@ class MeshVertexMerger(MeshBuilder):
     Mesh with unique vertices. Resulting meshes have no doublets, but MeshVertexMerger() needs extra memory for
     bookkeeping.
 
+    Adding many vertices at once, e.g. by :meth:`add_mesh`, merges the added vertices in one call by
+    :func:`~ezdxf.math.vertexmerge.merge_vertices` before looking up the existing vertices.
+
     """
 
     def __init__(self, precision: int = 6):
@@ -222,17 +259,43 @@ class MeshVertexMerger(MeshBuilder):
             tuple: indices of the `vertices` added to the :attr:`~MeshBuilder.vertices` list
 
         """
+        vertices = list(vertices)
+        if len(vertices) < BATCH_MIN_VERTICES:
+            return tuple(self._add_vertices(vertices))
+        keep, mapping = merge_vertices(vertices, precision=self.precision)
+        indices = self._add_vertices(vertices[index] for index in keep)
+        return tuple(indices[index] for index in mapping)
+
+    def _add_vertices(self, vertices: Iterable['Vertex']) -> List[int]:
+        key = self.key
+        ledger = self.ledger
         indices = []
         for vertex in vertices:
-            key = self.key(vertex)
+            location = key(vertex)
             try:
-                indices.append(self.ledger[key])
+                indices.append(ledger[location])
             except KeyError:
                 index = len(self.vertices)
                 self.vertices.append(vertex)
-                self.ledger[key] = index
+                ledger[location] = index
                 indices.append(index)
-        return tuple(indices)
+        return indices
+
+    def optimize(self, precision: int = None, tolerance: float = None) -> List[int]:
+        """
+        Merges coincident vertices inplace like :meth:`MeshBuilder.optimize`, but uses the :attr:`precision` of the
+        merger as default precision.
+
+        .. versionadded:: 0.11
+
+        """
+        mapping = super().optimize(self.precision if precision is None else precision, tolerance)
+        key = self.key
+        ledger = dict()
+        for index, vertex in enumerate(self.vertices):
+            ledger.setdefault(key(vertex), index)
+        self.ledger = ledger
+        return mapping
 
     def index(self, vertex: 'Vertex') -> int:
         """
@@ -270,8 +270,12 @@ class BlocksSection:
 
         """
         if safe:
-            # block names are case insensitive
-            references = set(entity.dxf.name.lower() for entity in self.doc.query('INSERT'))
+            # block names are case insensitive, the block name index of the entity database stores lower case names
+            db = self.doc.entitydb
+            references = set(
+                name for name, handles in db.index('name').items()
+                if any(db[handle].dxf.owner is not None for handle in handles)  # ignore unlinked INSERT entities
+            )
 
         def is_save(name: str) -> bool:
             if safe and is_special_block(name):
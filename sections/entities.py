@@ -50,13 +50,17 @@ class EntitySection:
             raise DXFStructureError("Critical structure error in ENTITIES section.")
 
         def add(entity: 'DXFGraphic'):
-            handle = entity.dxf.owner
+            if entity.is_lazy:  # don't decode lazy loaded entities
+                handle, paperspace = entity.lazy_owner()
+            else:
+                handle = entity.dxf.owner
+                paperspace = None
             # higher priority for owner handle
             if handle == msp_layout_key:
                 paperspace = 0
             elif handle == psp_layout_key:
                 paperspace = 1
-            else:  # paperspace flag as fallback
+            elif paperspace is None:  # paperspace flag as fallback
                 paperspace = entity.dxf.paperspace
 
             if paperspace:
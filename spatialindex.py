@@ -0,0 +1,631 @@
+# Purpose: spatial index for DXF entities
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, List, Dict, Optional, Tuple, Callable, Union, Sequence
+import math
+import re
+
+from ezdxf.math import Vector, OCS, Z_AXIS
+from ezdxf.math.bulge import bulge_to_arc
+from ezdxf.math.bspline import BSpline
+from ezdxf.math.rtree import RTree, Box, MAX_NODE_SIZE
+from ezdxf.query import EntityQuery
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFGraphic, Vertex, BoundingBox, BoundingBox2d, Drawing
+
+__all__ = ['SpatialIndex', 'entity_box', 'entities_box']
+
+INF = float('inf')
+TAU = math.pi * 2.
+SPLINE_SEGMENTS = 8  # count of curve samples per knot span to find the extreme points of a B-spline curve
+TEXT_CHAR_WIDTH = 1.  # estimated character width as factor of the text height (monospaced font)
+MTEXT_LINE_SPACING = 5. / 3.  # line distance as factor of the char height at line spacing factor 1
+MTEXT_FORMAT_CODES = re.compile(r'\\[ACFHQTWfhpcq][^;]*;|\\[LlOoKk]|[{}]')
+TEXT_SPECIAL_CHARS = re.compile(r'%%[cdpuoCDPUO]')
+
+
+class SpatialIndex:
+    """
+    Spatial index of DXF entities based on a bulk loaded R-tree (Sort-Tile-Recursive packing). The bounding boxes of
+    the entities are calculated in :ref:`WCS` by :func:`entity_box`, entities without a bounding box like XLINE and RAY
+    are not indexed and never returned by a query.
+
+    The index is build by :meth:`~ezdxf.layouts.BaseLayout.spatial_index` and is updated automatically for entities
+    added to or unlinked from the layout. Call :meth:`update` after changing the geometry of an indexed entity.
+
+    Args:
+        entities: iterable of :class:`~ezdxf.entities.DXFGraphic` entities
+        max_node_size: maximum count of children per R-tree node
+
+    .. versionadded:: 0.11
+
+    """
+
+    def __init__(self, entities: Iterable['DXFGraphic'] = None, max_node_size: int = MAX_NODE_SIZE):
+        self._boxes = dict()  # type: Dict[DXFGraphic, Box]
+        # new entities are indexed at the next query, because the geometry of new entities is often set
+        # after adding the entity to the layout, like the points of LWPOLYLINE
+        self._pending = dict()  # type: Dict[DXFGraphic, None] # ordered set
+        block_cache = dict()
+        entries = []
+        for entity in (entities or []):
+            box = entity_box(entity, block_cache)
+            if box is not None:
+                self._boxes[entity] = box
+                entries.append((box, entity))
+        self._tree = RTree(entries, max_node_size=max_node_size)
+
+    def __len__(self) -> int:
+        """ Count of indexed entities. """
+        self._update_pending()
+        return len(self._boxes)
+
+    def __contains__(self, entity: 'DXFGraphic') -> bool:
+        """ ``True`` if `entity` is indexed. """
+        self._update_pending()
+        return entity in self._boxes
+
+    def add(self, entity: 'DXFGraphic') -> None:
+        """ Add `entity` to the spatial index. """
+        self._pending[entity] = None
+
+    def remove(self, entity: 'DXFGraphic') -> None:
+        """ Remove `entity` from the spatial index, ignores not indexed entities. """
+        if entity in self._pending:
+            del self._pending[entity]
+        box = self._boxes.pop(entity, None)
+        if box is not None:
+            self._tree.remove(box, entity)
+
+    def update(self, entity: 'DXFGraphic') -> None:
+        """ Update bounding box of `entity` after changing its geometry. """
+        self.remove(entity)
+        self.add(entity)
+
+    def clear(self) -> None:
+        """ Remove all entities. """
+        self._boxes = dict()
+        self._pending = dict()
+        self._tree = RTree()
+
+    def _update_pending(self) -> None:
+        if not self._pending:
+            return
+        for entity in self._pending:
+            if not entity.is_alive:
+                continue
+            box = entity_box(entity)
+            if box is not None:
+                self._boxes[entity] = box
+                self._tree.insert(box, entity)
+        self._pending = dict()
+
+    def bbox(self) -> Optional[Box]:
+        """ Returns the bounding box of all indexed entities as tuple ``(min_x, min_y, min_z, max_x, max_y, max_z)``
+        or ``None`` if the index is empty.
+        """
+        self._update_pending()
+        return self._tree.box
+
+    def intersects(self, bbox: Union['BoundingBox', 'BoundingBox2d']) -> EntityQuery:
+        """
+        Returns all entities with a bounding box intersecting `bbox` as :class:`~ezdxf.query.EntityQuery`, entities
+        touching `bbox` are included. A :class:`~ezdxf.math.BoundingBox2d` ignores the z-axis.
+
+        Args:
+            bbox: :class:`~ezdxf.math.BoundingBox` or :class:`~ezdxf.math.BoundingBox2d`
+
+        """
+        self._update_pending()
+        return EntityQuery(entity for box, entity in self._tree.intersects(query_box(bbox)) if entity.is_alive)
+
+    def contains(self, bbox: Union['BoundingBox', 'BoundingBox2d']) -> EntityQuery:
+        """
+        Returns all entities with a bounding box completely inside of `bbox` as :class:`~ezdxf.query.EntityQuery`.
+        A :class:`~ezdxf.math.BoundingBox2d` ignores the z-axis.
+
+        Args:
+            bbox: :class:`~ezdxf.math.BoundingBox` or :class:`~ezdxf.math.BoundingBox2d`
+
+        """
+        self._update_pending()
+        return EntityQuery(entity for box, entity in self._tree.contains(query_box(bbox)) if entity.is_alive)
+
+    def nearest(self, point: 'Vertex', k: int = 1) -> List['DXFGraphic']:
+        """
+        Returns the `k` nearest entities to `point`, ordered by ascending distance. The distance is measured to the
+        bounding box of the entities, all entities with `point` inside their bounding box have the distance 0.
+
+        Args:
+            point: search location in :ref:`WCS`
+            k: count of entities to return
+
+        """
+        self._update_pending()
+        return [entity for distance, (box, entity) in self._tree.nearest(Vector(point).xyz, k)]
+
+
+def query_box(bbox: Union['BoundingBox', 'BoundingBox2d']) -> Box:
+    """ Returns bounding box object `bbox` as box tuple. (internal API) """
+    extmin, extmax = bbox.extmin, bbox.extmax
+    if len(extmin) == 2:  # BoundingBox2d: Vec2
+        return extmin[0], extmin[1], -INF, extmax[0], extmax[1], INF
+    return tuple(extmin) + tuple(extmax)
+
+
+def box_of_points(points: Iterable['Vertex']) -> Optional[Box]:
+    """ Returns bounding box tuple of `points` or ``None`` for no points. (internal API) """
+    points = [Vector(p).xyz for p in points]
+    if not points:
+        return None
+    x, y, z = zip(*points)
+    return min(x), min(y), min(z), max(x), max(y), max(z)
+
+
+def arc_points(center: 'Vertex', radius: float, start_angle: float, end_angle: float) -> List[Vector]:
+    """ Returns start-, end- and the quadrant points of a counter clockwise arc, angles in degrees. (internal API) """
+    center = Vector(center)
+    start_angle %= 360.
+    end_angle %= 360.
+    if math.isclose(start_angle, end_angle):
+        end_angle = start_angle + 360.
+    elif end_angle < start_angle:
+        end_angle += 360.
+    points = [center + Vector.from_deg_angle(start_angle, radius), center + Vector.from_deg_angle(end_angle, radius)]
+    for quadrant in range(0, 720, 90):
+        if start_angle < quadrant < end_angle:
+            points.append(center + Vector.from_deg_angle(quadrant, radius))
+    return points
+
+
+def bulge_polyline_points(vertices: Iterable[Tuple[float, float, float]], closed: bool) -> List[Vector]:
+    """ Returns the vertices and the arc extreme points of 2D polyline `vertices` as ``(x, y, bulge)`` tuples.
+    (internal API)
+    """
+    vertices = list(vertices)
+    points = [Vector(x, y) for x, y, bulge in vertices]
+    if closed and vertices:
+        vertices.append(vertices[0])
+    for (x1, y1, bulge), (x2, y2, _) in zip(vertices, vertices[1:]):
+        if bulge:
+            center, start_angle, end_angle, radius = bulge_to_arc((x1, y1), (x2, y2), bulge)
+            points.extend(arc_points(center, radius, math.degrees(start_angle), math.degrees(end_angle)))
+    return points
+
+
+def ellipse_points(center: Vector, major_axis: Vector, minor_axis: Vector, start_param: float,
+                   end_param: float) -> List[Vector]:
+    """ Returns start-, end- and the axis aligned extreme points of the counter clockwise elliptic arc
+    ``center + major_axis * cos(t) + minor_axis * sin(t)`` from `start_param` to `end_param`, params in radians, the
+    axis vectors do not have to be perpendicular. (internal API)
+    """
+    start_param %= TAU
+    end_param %= TAU
+    if math.isclose(start_param, end_param, abs_tol=1e-12):
+        end_param = start_param + TAU
+    elif end_param < start_param:
+        end_param += TAU
+    params = [start_param, end_param]
+    for a, b in zip(major_axis, minor_axis):
+        if a or b:  # extreme values of a * cos(t) + b * sin(t) at t = atan2(b, a) + k * pi
+            t = math.atan2(b, a) % TAU
+            params.extend(t + k * math.pi for k in range(-1, 4) if start_param < t + k * math.pi < end_param)
+    return [center + major_axis * math.cos(t) + minor_axis * math.sin(t) for t in params]
+
+
+def spline_points(spline: BSpline) -> List[Vector]:
+    """ Returns start-, end- and the approximated axis aligned extreme points of B-spline curve `spline`. The curve
+    is sampled by :attr:`SPLINE_SEGMENTS` points per knot span and each local extreme value of a sample sequence is
+    refined by successive parabolic interpolation. (internal API)
+    """
+    knots = spline.knot_values()
+    start = knots[spline.order - 1]
+    end = knots[spline.count]
+    count = (len(set(knot for knot in knots if start < knot < end)) + 1) * SPLINE_SEGMENTS
+    step = (end - start) / count
+    params = [start + step * index for index in range(count + 1)]
+    # additional samples close to the start- and end point to bracket extreme values in the first and last interval
+    params[1:1] = [start + step * 1e-3]
+    params[-1:-1] = [end - step * 1e-3]
+    points = spline.points(params)
+    extremes = []
+    for axis in range(3):
+        values = [p[axis] for p in points]
+        for index in range(1, len(params) - 1):
+            v0, v1, v2 = values[index - 1:index + 2]
+            if (v1 - v0) * (v2 - v1) < 0.:  # local minimum or maximum
+                sign = 1. if v1 > v0 else -1.
+                extremes.append(refine_extreme_point(
+                    spline, axis, params[index - 1:index + 2], (v0 * sign, v1 * sign, v2 * sign), sign))
+    points.extend(extremes)
+    return points
+
+
+def refine_extreme_point(spline: BSpline, axis: int, params: Sequence[float], values: Sequence[float],
+                         sign: float, max_iterations: int = 16) -> Vector:
+    """ Returns the curve point of the local maximum of ``spline.point(t)[axis] * sign`` bracketed by three
+    `params` and their `values`, the middle value is the biggest value. (internal API)
+    """
+    t0, t1, t2 = params
+    v0, v1, v2 = values
+    p1 = spline.point(t1)
+    for _ in range(max_iterations):
+        denominator = (t1 - t0) * (v1 - v2) - (t1 - t2) * (v1 - v0)
+        if not denominator:
+            break
+        t = t1 - ((t1 - t0) ** 2 * (v1 - v2) - (t1 - t2) ** 2 * (v1 - v0)) / denominator / 2.
+        if not (t0 < t < t2) or math.isclose(t, t1, rel_tol=1e-12, abs_tol=1e-12):
+            break
+        p = spline.point(t)
+        v = p[axis] * sign
+        if v > v1:  # new bracket around t
+            if t < t1:
+                t1, t2, v1, v2 = t, t1, v, v1
+            else:
+                t0, t1, v0, v1 = t1, t, v1, v
+            p1 = p
+        elif t < t1:
+            t0, v0 = t, v
+        else:
+            t2, v2 = t, v
+    return p1
+
+
+def ocs_box(entity: 'DXFGraphic', points: Iterable['Vertex'], elevation: float = None) -> Optional[Box]:
+    """ Returns the WCS bounding box of OCS `points`, replaces the z-axis by `elevation` if not ``None``.
+    (internal API)
+    """
+    if elevation is not None:
+        points = (Vector(p).replace(z=elevation) for p in points)
+    extrusion = Vector(entity.dxf.get('extrusion', Z_AXIS))
+    if extrusion.isclose(Z_AXIS):
+        return box_of_points(points)
+    return box_of_points(OCS(extrusion).points_to_wcs(points))
+
+
+def _point(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    return box_of_points([entity.dxf.location])
+
+
+def _line(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    return box_of_points([entity.dxf.start, entity.dxf.end])
+
+
+def _circle(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    dxf = entity.dxf
+    ocs = OCS(dxf.extrusion)
+    radius = abs(dxf.radius)
+    return box_of_points(ellipse_points(Vector(ocs.to_wcs(dxf.center)), ocs.ux * radius, ocs.uy * radius, 0., TAU))
+
+
+def _arc(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    dxf = entity.dxf
+    ocs = OCS(dxf.extrusion)
+    radius = abs(dxf.radius)
+    return box_of_points(ellipse_points(Vector(ocs.to_wcs(dxf.center)), ocs.ux * radius, ocs.uy * radius,
+                                        math.radians(dxf.start_angle), math.radians(dxf.end_angle)))
+
+
+def _ellipse(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    dxf = entity.dxf
+    major_axis = Vector(dxf.major_axis)
+    minor_axis = Vector(dxf.extrusion).cross(major_axis).normalize(major_axis.magnitude * dxf.ratio)
+    return box_of_points(ellipse_points(Vector(dxf.center), major_axis, minor_axis, dxf.start_param, dxf.end_param))
+
+
+def _lwpolyline(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    points = bulge_polyline_points(entity.get_points('xyb'), entity.closed)
+    return ocs_box(entity, points, elevation=entity.dxf.elevation)
+
+
+def _polyline(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    if entity.is_2d_polyline:
+        vertices = ((v.dxf.location[0], v.dxf.location[1], v.dxf.bulge) for v in entity.vertices)
+        points = bulge_polyline_points(vertices, entity.is_closed)
+        return ocs_box(entity, points, elevation=Vector(entity.dxf.elevation).z)
+    return box_of_points(entity.points())
+
+
+def _trace(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    dxf = entity.dxf
+    return ocs_box(entity, [dxf.get(name) for name in ('vtx0', 'vtx1', 'vtx2', 'vtx3') if dxf.hasattr(name)])
+
+
+def _3dface(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    dxf = entity.dxf
+    return box_of_points(dxf.get(name) for name in ('vtx0', 'vtx1', 'vtx2', 'vtx3') if dxf.hasattr(name))
+
+
+def _spline(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    try:
+        return box_of_points(spline_points(entity.construction_tool()))
+    except ValueError:  # invalid spline definition
+        # a B-spline curve is inside the convex hull of its control points
+        return box_of_points(entity.control_points) or box_of_points(entity.fit_points)
+
+
+def _mesh(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    return box_of_points(entity.vertices)
+
+
+def _leader(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    return box_of_points(entity.vertices)
+
+
+def text_width(text: str, height: float) -> float:
+    """ Returns the estimated width of a single line `text` with character height `height`. (internal API) """
+    return len(TEXT_SPECIAL_CHARS.sub('_', text)) * height * TEXT_CHAR_WIDTH
+
+
+def _text(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    # the text width is estimated for a monospaced font, the text height is the cap height
+    dxf = entity.dxf
+    align, p1, p2 = entity.get_pos()
+    p1 = Vector(p1)
+    height = dxf.height
+    if p2 is not None:  # ALIGNED and FIT: text fits between p1 and p2
+        direction = Vector(p2) - p1
+        width = direction.magnitude
+        direction = direction.normalize() if width else Vector.from_deg_angle(dxf.rotation)
+        halign, valign = 0, 0
+    else:
+        direction = Vector.from_deg_angle(dxf.rotation)
+        width = text_width(dxf.text, height) * dxf.width
+        halign, valign = dxf.halign, dxf.valign
+    if halign == 4:  # MIDDLE: centered horizontal and vertical
+        halign, valign = 1, 2
+    left = -width * {1: .5, 2: 1.}.get(halign, 0.)
+    bottom = -height * {2: .5, 3: 1.}.get(valign, 0.)
+    normal = direction.orthogonal()
+    points = [p1 + direction * x + normal * y for x in (left, left + width) for y in (bottom, bottom + height)]
+    return ocs_box(entity, points, elevation=p1.z)
+
+
+def _mtext(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    # the text width is estimated for a monospaced font if the reference column width is not defined
+    dxf = entity.dxf
+    char_height = dxf.char_height
+    lines = [MTEXT_FORMAT_CODES.sub('', line) for line in entity.text.replace('\n', '\\P').split('\\P')]
+    width = dxf.get('width', 0.) or max(text_width(line, char_height) for line in lines)
+    height = char_height * (1. + (len(lines) - 1) * MTEXT_LINE_SPACING * dxf.get('line_spacing_factor', 1.))
+    row, column = divmod(dxf.attachment_point - 1, 3)  # 1 = top left ... 9 = bottom right
+    left = -width * column / 2.
+    top = height * row / 2.
+    extrusion = Vector(dxf.extrusion).normalize()
+    if dxf.hasattr('text_direction'):
+        x_axis = Vector(dxf.text_direction).normalize()
+    else:
+        x_axis = Vector(OCS(extrusion).to_wcs(Vector.from_deg_angle(dxf.get('rotation', 0.))))
+    y_axis = extrusion.cross(x_axis).normalize()
+    insert = Vector(dxf.insert)
+    return box_of_points(insert + x_axis * x + y_axis * y for x in (left, left + width) for y in (top - height, top))
+
+
+def _insert_point(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    # entities without measurable content like SHAPE or UNDERLAY are represented by their insertion point
+    return box_of_points([entity.dxf.insert])
+
+
+def _location(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    return box_of_points([entity.dxf.location])
+
+
+def _image(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    dxf = entity.dxf
+    insert = Vector(dxf.insert)
+    width, height = dxf.image_size[:2]
+    u = Vector(dxf.u_pixel) * width
+    v = Vector(dxf.v_pixel) * height
+    return box_of_points([insert, insert + u, insert + v, insert + u + v])
+
+
+def _viewport(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    dxf = entity.dxf
+    center = Vector(dxf.center)
+    extent = Vector(dxf.width / 2., dxf.height / 2.)
+    return box_of_points([center - extent, center + extent])
+
+
+def _hatch(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    ocs = OCS(entity.dxf.extrusion)
+    elevation = Vector(entity.dxf.elevation).z
+    points = []
+    wcs_points = []  # extreme points of arcs and ellipses in WCS
+
+    def add_ellipse(center: 'Vertex', major_axis: Vector, minor_axis: Vector, start: float, end: float,
+                    ccw: bool) -> None:
+        center = Vector(ocs.to_wcs(Vector(center).replace(z=elevation)))
+        if not ccw:  # bounding box of the full ellipse
+            start, end = 0., 360.
+        wcs_points.extend(ellipse_points(center, Vector(ocs.to_wcs(major_axis)), Vector(ocs.to_wcs(minor_axis)),
+                                         math.radians(start), math.radians(end)))
+
+    for path in entity.paths:
+        if path.PATH_TYPE == 'PolylinePath':
+            points.extend(bulge_polyline_points(path.vertices, path.is_closed))
+            continue
+        for edge in path.edges:
+            edge_type = edge.EDGE_TYPE
+            if edge_type == 'LineEdge':
+                points.extend((edge.start, edge.end))
+            elif edge_type == 'ArcEdge':
+                add_ellipse(edge.center, Vector(edge.radius, 0.), Vector(0., edge.radius), edge.start_angle,
+                            edge.end_angle, edge.is_counter_clockwise)
+            elif edge_type == 'EllipseEdge':  # start- and end angle are ellipse params in degrees
+                major_axis = Vector(edge.major_axis[:2])
+                add_ellipse(edge.center, major_axis, major_axis.orthogonal() * edge.ratio, edge.start_angle,
+                            edge.end_angle, edge.is_counter_clockwise)
+            elif edge_type == 'SplineEdge':
+                try:
+                    points.extend(spline_points(edge.construction_tool()))
+                except ValueError:  # invalid spline definition
+                    points.extend(edge.control_points or edge.fit_points)
+    points = [Vector(p).replace(z=elevation) for p in points]
+    if not ocs.transform:
+        return box_of_points(points + wcs_points)
+    return box_of_points(list(ocs.points_to_wcs(points)) + wcs_points)
+
+
+def block_box(doc: 'Drawing', name: str, cache: Dict) -> Optional[Box]:
+    """ Returns the bounding box of all entities in block `name` in block coordinates, results are stored in `cache`.
+    (internal API)
+    """
+    if name in cache:
+        return cache[name]
+    cache[name] = None  # guard against recursive block references
+    block = doc.blocks.get(name) if doc is not None else None
+    if block is None:
+        return None
+    boxes = [entity_box(entity, cache) for entity in block]
+    points = []
+    for box in boxes:
+        if box is not None:
+            points.append(box[:3])
+            points.append(box[3:])
+    box = box_of_points(points)
+    cache[name] = box
+    return box
+
+
+def _insert(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    dxf = entity.dxf
+    insert = Vector(dxf.insert)
+    content = block_box(entity.doc, dxf.name, cache)
+    points = []
+    if content is not None:
+        base_point = Vector(entity.doc.blocks.get(dxf.name).block.dxf.base_point)
+        xscale = dxf.xscale
+        yscale = dxf.yscale
+        zscale = dxf.zscale
+        min_x, min_y, min_z, max_x, max_y, max_z = content
+        corners = [Vector(x, y, z) - base_point for x in (min_x, max_x) for y in (min_y, max_y) for z in (min_z, max_z)]
+        corners = [Vector(p.x * xscale, p.y * yscale, p.z * zscale) for p in corners]
+        # MINSERT grid: include the block corners at the last column and row
+        columns = max(dxf.column_count, 1)
+        rows = max(dxf.row_count, 1)
+        offsets = {(0, 0), ((columns - 1) * dxf.column_spacing, 0), (0, (rows - 1) * dxf.row_spacing),
+                   ((columns - 1) * dxf.column_spacing, (rows - 1) * dxf.row_spacing)}
+        rotation = dxf.rotation
+        for offset in offsets:
+            points.extend(insert + (corner + offset).rotate_deg(rotation) for corner in corners)
+    else:
+        points.append(insert)
+    box = ocs_box(entity, points)
+    attrib_boxes = [_text(attrib, cache) for attrib in entity.attribs]
+    if attrib_boxes:
+        box = box_of_points(chain_boxes([box] + attrib_boxes))
+    return box
+
+
+def _dimension(entity: 'DXFGraphic', cache: Dict) -> Optional[Box]:
+    dxf = entity.dxf
+    # the geometry block of the dimension entity is defined in WCS
+    box = block_box(entity.doc, dxf.get('geometry'), cache) if dxf.hasattr('geometry') else None
+    if box is None:
+        box = box_of_points(dxf.get(name) for name in ('defpoint', 'defpoint2', 'defpoint3', 'defpoint4', 'defpoint5')
+                            if dxf.hasattr(name))
+    return box
+
+
+def chain_boxes(boxes: Iterable[Optional[Box]]) -> Iterable[Tuple[float, float, float]]:
+    """ Yields the min and max points of all valid `boxes`. (internal API) """
+    for box in boxes:
+        if box is not None:
+            yield box[:3]
+            yield box[3:]
+
+
+BOX_FUNCTIONS = {
+    'POINT': _point,
+    'LINE': _line,
+    'CIRCLE': _circle,
+    'ARC': _arc,
+    'ELLIPSE': _ellipse,
+    'LWPOLYLINE': _lwpolyline,
+    'POLYLINE': _polyline,
+    'SOLID': _trace,
+    'TRACE': _trace,
+    '3DFACE': _3dface,
+    'SPLINE': _spline,
+    'HELIX': _spline,
+    'MESH': _mesh,
+    'LEADER': _leader,
+    'TEXT': _text,
+    'ATTRIB': _text,
+    'ATTDEF': _text,
+    'SHAPE': _insert_point,
+    'MTEXT': _mtext,
+    'IMAGE': _image,
+    'WIPEOUT': _image,
+    'VIEWPORT': _viewport,
+    'HATCH': _hatch,
+    'INSERT': _insert,
+    'DIMENSION': _dimension,
+    'TOLERANCE': _insert_point,
+    'PDFUNDERLAY': _insert_point,
+    'DWFUNDERLAY': _insert_point,
+    'DGNUNDERLAY': _insert_point,
+    'LIGHT': _location,
+    'VERTEX': _location,
+}  # type: Dict[str, Callable[[DXFGraphic, Dict], Optional[Box]]]
+
+
+def entity_box(entity: 'DXFGraphic', cache: Dict = None) -> Optional[Box]:
+    """
+    Returns the approximated bounding box of `entity` in :ref:`WCS` as tuple ``(min_x, min_y, min_z, max_x, max_y,
+    max_z)`` or ``None`` for unsupported entities and entities without a bounding box like XLINE and RAY.
+
+    The bounding box is exact for linear entities, CIRCLE, ARC and ELLIPSE entities, the bounding box of SPLINE
+    entities is calculated from sampled curve points with refined extreme points, the size of TEXT and MTEXT entities
+    is estimated for a monospaced font and INSERT entities are bounded by the transformed bounding box of the block
+    content. The thickness of entities is ignored.
+
+    Args:
+        entity: DXF entity
+        cache: cache for block bounding boxes, pass the same dict for multiple entities of the same document
+
+    .. versionadded:: 0.11
+
+    """
+    func = BOX_FUNCTIONS.get(entity.dxftype())
+    if func is None:
+        return None
+    if cache is None:
+        cache = dict()
+    try:
+        return func(entity, cache)
+    except (AttributeError, TypeError, ValueError, ZeroDivisionError):  # invalid or incomplete geometry
+        return None
+
+
+def entities_box(entities: Iterable['DXFGraphic'], cached: bool = True) -> Optional[Box]:
+    """
+    Returns the bounding box of all `entities` in :ref:`WCS` as tuple ``(min_x, min_y, min_z, max_x, max_y, max_z)``
+    or ``None`` if no entity has a bounding box, see :func:`entity_box`.
+
+    The bounding box of each entity is stored in the entity and reused by subsequent calls until a geometry DXF
+    attribute of the entity is changed or a method which changes the geometry of the entity is called. The cache does
+    not track inplace changes of vertex arrays, boundary paths, attached sub-entities like VERTEX and ATTRIB entities or
+    block definitions, set `cached` to ``False`` to recalculate the bounding boxes of all entities after such changes.
+
+    Args:
+        entities: iterable of DXF entities
+        cached: reuse cached bounding boxes if ``True``
+
+    .. versionadded:: 0.11
+
+    """
+    cache = dict()
+    boxes = []
+    for entity in entities:
+        box = entity._box if cached else None
+        if box is None:
+            box = entity_box(entity, cache)
+            entity._box = box
+        if box is not None:
+            boxes.append(box)
+    if not boxes:
+        return None
+    min_x, min_y, min_z, max_x, max_y, max_z = zip(*boxes)
+    return min(min_x), min(min_y), min(min_z), max(max_x), max(max_y), max(max_z)
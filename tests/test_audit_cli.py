@@ -0,0 +1,114 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import json
+import sys
+import pytest
+import ezdxf
+from ezdxf import options
+from ezdxf.audit import __main__ as cli
+from ezdxf.audit.auditor import Auditor
+
+BROKEN_DXF = "  0\nSECTION\n  2\nENTITIES\n  0\nLINE\n 10\nxyz\n 20\n0.0\n  0\nENDSEC\n  0\nEOF\n"
+
+
+def new_dxf(filename, issues=False):
+    doc = ezdxf.new('R12', setup=True)
+    doc.modelspace().add_line((0, 0), (1, 0), dxfattribs={'linetype': 'DASHED'})
+    if issues:  # undefined linetype
+        doc.linetypes.remove('DASHED')
+    doc.saveas(str(filename))
+
+
+@pytest.fixture
+def folder(tmpdir):
+    new_dxf(tmpdir.join('a.dxf'))
+    new_dxf(tmpdir.join('b.dxf'))
+    tmpdir.join('notes.txt').write('no DXF file')
+    return tmpdir
+
+
+@pytest.fixture
+def audit(monkeypatch):
+    # main() sets option compress_binary_data
+    monkeypatch.setattr(options, 'compress_binary_data', True, raising=False)
+
+    def run(*args):
+        monkeypatch.setattr(sys, 'argv', ['audit'] + [str(arg) for arg in args])
+        try:
+            cli.main()
+        except SystemExit as e:
+            return e.code
+        return 0
+    return run
+
+
+def records(filename):
+    with open(str(filename), encoding='utf-8') as fp:
+        return {record['filename'].replace('\\', '/').split('/')[-1]: record for record in map(json.loads, fp)}
+
+
+def test_audit_files_of_folder(folder, audit):
+    report = folder.join('report.jsonl')
+    assert audit('--json', report, folder) == 0
+    result = records(report)
+    assert sorted(result) == ['a.dxf', 'b.dxf', 'notes.txt']
+    assert result['a.dxf']['status'] == cli.OK
+    assert result['a.dxf']['entity_counts']['LINE'] == 1
+    assert result['notes.txt']['status'] == cli.SKIPPED
+
+
+def test_audit_issues_do_not_change_exit_code(folder, audit):
+    new_dxf(folder.join('a.dxf'), issues=True)
+    report = folder.join('report.jsonl')
+    assert audit('--json', report, folder) == 0
+    result = records(report)['a.dxf']
+    assert result['status'] == cli.ISSUES
+    assert result['error_count'] == 1
+    assert audit('--json', report, '--fail-fast', folder.join('a.dxf'), folder.join('b.dxf')) == cli.EXIT_FAIL_FAST
+    assert sorted(records(report)) == ['a.dxf']
+
+
+def test_invalid_dxf_structure_does_not_stop_batch(folder, audit):
+    folder.join('a.dxf').write(BROKEN_DXF)
+    report = folder.join('report.jsonl')
+    assert audit('--json', report, folder) == cli.EXIT_DXF_ERROR
+    result = records(report)
+    assert result['a.dxf']['status'] == cli.FAILED
+    assert result['a.dxf']['exit_code'] == cli.EXIT_DXF_ERROR
+    assert result['b.dxf']['status'] == cli.OK
+
+
+def test_audit_error_does_not_stop_batch(folder, audit, monkeypatch):
+    run = Auditor.run
+
+    def failing_run(self):
+        if self.doc.filename.endswith('a.dxf'):
+            raise RuntimeError('audit failed')
+        return run(self)
+
+    monkeypatch.setattr(Auditor, 'run', failing_run)
+    report = folder.join('report.jsonl')
+    assert audit('--json', report, folder) == cli.EXIT_READ_ERROR
+    result = records(report)
+    assert result['a.dxf']['status'] == cli.FAILED
+    assert result['a.dxf']['exit_code'] == cli.EXIT_READ_ERROR
+    assert result['a.dxf']['message'] == 'RuntimeError: audit failed'
+    assert 'errors' not in result['a.dxf']
+    assert result['b.dxf']['status'] == cli.OK
+
+
+def test_resume_by_checkpoint_skips_own_output_files(folder, audit):
+    report = folder.join('report.jsonl')
+    checkpoint = folder.join('done.txt')
+    assert audit('--json', report, '--checkpoint', checkpoint, folder) == 0
+    assert sorted(records(report)) == ['a.dxf', 'b.dxf', 'notes.txt']
+    assert len(checkpoint.readlines()) == 3
+
+    new_dxf(folder.join('c.dxf'))
+    assert audit('--json', report, '--checkpoint', checkpoint, folder) == 0
+    assert len(report.readlines()) == 4  # appended, each file audited once
+    assert sorted(records(report)) == ['a.dxf', 'b.dxf', 'c.dxf', 'notes.txt']
+    assert len(checkpoint.readlines()) == 4
+
+    assert audit('--json', report, '--checkpoint', checkpoint, folder) == 0
+    assert len(report.readlines()) == 4
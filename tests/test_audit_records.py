@@ -0,0 +1,67 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.lldxf.const import Error
+
+
+@pytest.fixture
+def doc():
+    doc = ezdxf.new('R2018', setup=True)
+    msp = doc.modelspace()
+    for x in range(10):
+        msp.add_line((x, 0), (x, 1))
+    return doc
+
+
+def codes(errors):
+    return [error.code for error in errors]
+
+
+def test_repeated_run_reuses_audit_records(doc):
+    auditor = doc.auditor()
+    assert auditor.run() == []
+    count = auditor.checked_entities
+    assert count >= 10
+    assert auditor.reused_entities == 0
+    assert doc.auditor().run() == []
+    assert auditor.run() == []
+    assert auditor.checked_entities == 0
+    assert auditor.reused_entities == count
+
+
+def test_changing_audited_attribute_invalidates_audit_record(doc):
+    auditor = doc.auditor()
+    auditor.run()
+    count = auditor.checked_entities
+    line = doc.modelspace()[0]
+    line.dxf.color = 300
+    assert codes(auditor.run()) == [Error.INVALID_COLOR_INDEX]
+    assert auditor.errors[0].entity is line
+    assert auditor.checked_entities == 1
+    line.dxf.color = 1
+    line.dxf.owner = 'FFFF'
+    assert codes(auditor.run()) == [Error.POINTER_TARGET_NOT_EXISTS]
+    assert auditor.reused_entities == count - 1
+
+
+def test_changed_lookup_is_applied_to_reused_audit_records(doc):
+    msp = doc.modelspace()
+    msp[0].dxf.linetype = 'DASHED'
+    msp[1].dxf.linetype = 'DASHED'
+    auditor = doc.auditor()
+    assert auditor.run() == []
+    doc.linetypes.remove('DASHED')
+    assert codes(auditor.run()) == [Error.UNDEFINED_LINETYPE] * 2
+    assert auditor.checked_entities == 0
+
+
+def test_geometry_change_does_not_invalidate_audit_record(doc):
+    line = doc.modelspace()[0]
+    doc.auditor().run()
+    record = line._audit_record
+    assert record is not None
+    line.dxf.start = (5, 5)
+    assert line._audit_record is record
+    line.dxf.layer = 'OTHER'
+    assert line._audit_record is None
@@ -0,0 +1,52 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.lldxf.validator import is_binary_dxf_file
+from ezdxf.lldxf.tags import Tags
+from ezdxf.lldxf.types import DXFBinaryTag
+
+BINARY_DATA = bytes(range(256)) * 2  # requires several binary chunks
+
+
+def create_doc(dxfversion: str):
+    doc = ezdxf.new(dxfversion)
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 2), dxfattribs={'layer': 'LINES', 'color': 3})
+    msp.add_circle((1, 2, 3), radius=2.5)
+    msp.add_text('Grüße €', dxfattribs={'height': 0.5})
+    if doc.dxfversion > 'AC1009':
+        msp.add_lwpolyline([(0, 0), (1, 0, 0.5), (1, 1)])
+        xrecord = doc.objects.add_xrecord(doc.rootdict.dxf.handle)
+        xrecord.tags = Tags([DXFBinaryTag(310, BINARY_DATA)])
+    return doc
+
+
+@pytest.mark.parametrize('dxfversion', ['R12', 'R2000', 'R2018'])
+@pytest.mark.parametrize('ext', ['dxf', 'dxf.gz', 'dxf.zip'])
+def test_binary_dxf_round_trip(dxfversion, ext, tmpdir):
+    doc = create_doc(dxfversion)
+    filename = str(tmpdir.join('binary.' + ext))
+    doc.saveas(filename, fmt='bin')
+    if ext == 'dxf':
+        assert is_binary_dxf_file(filename)
+        doc2 = ezdxf.readfile(filename)
+    elif ext == 'dxf.gz':
+        doc2 = ezdxf.readgz(filename)
+    else:
+        doc2 = ezdxf.readzip(filename)
+
+    assert doc2.dxfversion == doc.dxfversion
+    msp = doc2.modelspace()
+    assert [e.dxftype() for e in msp] == [e.dxftype() for e in doc.modelspace()]
+    line, circle, text = msp[:3]
+    assert line.dxf.layer == 'LINES'
+    assert line.dxf.color == 3
+    assert line.dxf.end == (1, 2, 0)
+    assert circle.dxf.center == (1, 2, 3)
+    assert circle.dxf.radius == 2.5
+    assert text.dxf.text == 'Grüße €'
+    if doc2.dxfversion > 'AC1009':
+        assert msp[3].get_points() == doc.modelspace()[3].get_points()
+        xrecord = doc2.objects.query('XRECORD')[0]
+        assert b''.join(tag.value for tag in xrecord.tags if tag.code == 310) == BINARY_DATA
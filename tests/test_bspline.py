@@ -0,0 +1,71 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+from ezdxf.math import bspline
+from ezdxf.math import BSpline, BSplineU, BSplineClosed, Vector
+from ezdxf.math.bspline import basis_table
+
+POINTS = [(0, 0, 0), (1, 3, 0), (3, 4, 1), (5, 1, 0), (7, 2, 2), (8, 5, 0), (10, 0, 1)]
+
+
+def splines():
+    return [
+        BSpline(POINTS, order=4),
+        BSpline(POINTS, order=3, weights=[1, 2, 1, 3, 1, 2, 1]),
+        BSpline(POINTS, order=4, knots=[0, 0, 0, 0, 1, 1, 2, 3, 3, 3, 3]),
+        BSplineU(POINTS, order=4),
+        BSplineClosed(POINTS, order=4),
+    ]
+
+
+@pytest.fixture(params=[256, 1], ids=['python', 'numpy-if-available'])
+def numpy_min_points(request, monkeypatch):
+    monkeypatch.setattr(bspline, 'NUMPY_MIN_POINTS', request.param)
+
+
+def vectors_isclose(points1, points2):
+    return len(points1) == len(points2) and all(Vector(p1).isclose(p2) for p1, p2 in zip(points1, points2))
+
+
+@pytest.mark.parametrize('spline', splines())
+def test_points_match_point(spline, numpy_min_points):
+    t = spline.params(40)
+    assert vectors_isclose(spline.points(t), [spline.point(u) for u in t])
+    assert vectors_isclose(list(spline.approximate(40)), [spline.point(u) for u in t])
+
+
+@pytest.mark.parametrize('spline', splines())
+def test_basis_table_matches_basis(spline):
+    t = tuple(spline.params(17))
+    table = basis_table(tuple(spline.knot_values()), spline.order, t)
+    for u, start, values in zip(t, table.starts, table.values):
+        basis = spline.basis.basis(u) if spline.basis.weights is None else None
+        if basis is not None:
+            expected = [0.] * spline.count
+            expected[start:start + spline.order] = values
+            assert basis == pytest.approx(expected)
+        assert sum(values) == pytest.approx(1.)
+
+
+def test_open_spline_interpolates_end_points(numpy_min_points):
+    spline = BSpline(POINTS, order=4)
+    assert spline.point(0).isclose(POINTS[0])
+    assert spline.point(spline.max_t).isclose(POINTS[-1])
+    assert vectors_isclose(spline.points([0, spline.max_t]), [POINTS[0], POINTS[-1]])
+
+
+@pytest.mark.parametrize('spline', splines())
+def test_parameters_outside_of_valid_range_are_clamped(spline, numpy_min_points):
+    knots = spline.knot_values()
+    start = spline.point(knots[spline.order - 1])
+    end = spline.point(knots[spline.count])
+    for t in (-1., 0., knots[spline.order - 1]):
+        assert spline.point(t).isclose(start)
+    for t in (knots[spline.count], spline.max_t, spline.max_t + 1.):
+        assert spline.point(t).isclose(end)
+    assert vectors_isclose(spline.points([-1., 0., spline.max_t, spline.max_t + 1.]), [start, start, end, end])
+
+
+def test_closed_spline_ends_at_start_point():
+    spline = BSplineClosed(POINTS, order=4)
+    assert spline.point(0).isclose(spline.point(spline.max_t))
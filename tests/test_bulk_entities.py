@@ -0,0 +1,97 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.lldxf.const import DXFValueError, DXFAttributeError
+
+
+@pytest.fixture
+def doc():
+    doc = ezdxf.new('R2018')
+    doc.layers.new('BULK')
+    doc.blocks.new('BLOCK').add_line((0, 0), (1, 0))
+    return doc
+
+
+def check_db_entries(doc, layout, entities):
+    db = doc.entitydb
+    handles = [entity.dxf.handle for entity in entities]
+    assert len(set(handles)) == len(handles)
+    for entity in entities:
+        assert db[entity.dxf.handle] is entity
+        assert entity.dxf.owner == layout.layout_key
+        assert entity.doc is doc
+    assert list(layout)[-len(entities):] == entities
+
+
+def test_add_lines(doc):
+    msp = doc.modelspace()
+    lines = msp.add_lines([(0, 0), (1, 1), (2, 2)], [(1, 0), (2, 1), (3, 2, 3)],
+                          dxfattribs={'layer': 'BULK', 'color': 3})
+    check_db_entries(doc, msp, lines)
+    assert [line.dxf.end for line in lines] == [(1, 0, 0), (2, 1, 0), (3, 2, 3)]
+    assert all(line.dxf.layer == 'BULK' and line.dxf.color == 3 for line in lines)
+    # shared attributes are copied, not shared
+    lines[0].dxf.color = 1
+    assert lines[1].dxf.color == 3
+
+
+def test_add_lines_in_paperspace(doc):
+    layout = doc.layout('Layout1')
+    lines = layout.add_lines([(0, 0)], [(1, 0)])
+    check_db_entries(doc, layout, lines)
+    assert lines[0].dxf.paperspace == 1
+
+
+def test_add_lines_requires_same_count_of_points(doc):
+    with pytest.raises(DXFValueError):
+        doc.modelspace().add_lines([(0, 0), (1, 1)], [(1, 0)])
+
+
+def test_add_circles(doc):
+    msp = doc.modelspace()
+    circles = msp.add_circles([(0, 0), (5, 5)], 2.5)
+    check_db_entries(doc, msp, circles)
+    assert [circle.dxf.radius for circle in circles] == [2.5, 2.5]
+    circles = msp.add_circles([(0, 0), (5, 5)], [1, 2])
+    assert [circle.dxf.radius for circle in circles] == [1, 2]
+    assert [circle.dxf.center for circle in circles] == [(0, 0, 0), (5, 5, 0)]
+    with pytest.raises(DXFValueError):
+        msp.add_circles([(0, 0), (5, 5)], [1, 2, 3])
+
+
+def test_add_blockrefs(doc):
+    msp = doc.modelspace()
+    inserts = msp.add_blockrefs('BLOCK', [(0, 0), (10, 0)], dxfattribs={'xscale': 2})
+    check_db_entries(doc, msp, inserts)
+    assert [insert.dxf.insert for insert in inserts] == [(0, 0, 0), (10, 0, 0)]
+    for insert in inserts:
+        assert insert.dxf.name == 'BLOCK'
+        assert insert.dxf.xscale == 2
+        assert insert.seqend.dxf.handle in doc.entitydb
+        assert insert.seqend.dxf.owner == msp.layout_key
+
+
+def test_shared_dxfattribs_are_validated(doc):
+    msp = doc.modelspace()
+    count = len(doc.entitydb)
+    with pytest.raises(DXFAttributeError):
+        msp.add_lines([(0, 0)], [(1, 0)], dxfattribs={'radius': 1})
+    with pytest.raises(DXFAttributeError):
+        msp.add_points([(0, 0)], dxfattribs={'invalid': 1})
+    assert len(doc.entitydb) == count
+    assert len(msp) == 0
+
+
+def test_bulk_entities_round_trip(doc, tmpdir):
+    msp = doc.modelspace()
+    msp.add_points([(0, 0), (1, 1)], dxfattribs={'layer': 'BULK'})
+    msp.add_lines([(0, 0)], [(1, 0)])
+    msp.add_blockrefs('BLOCK', [(5, 5)])
+    filename = str(tmpdir.join('bulk.dxf'))
+    doc.saveas(filename)
+    msp2 = ezdxf.readfile(filename).modelspace()
+    assert [e.dxftype() for e in msp2] == ['POINT', 'POINT', 'LINE', 'INSERT']
+    assert msp2[1].dxf.location == (1, 1, 0)
+    assert msp2[1].dxf.layer == 'BULK'
+    assert msp2[3].dxf.name == 'BLOCK'
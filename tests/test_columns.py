@@ -0,0 +1,71 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import math
+import pytest
+import ezdxf
+from ezdxf.columns import to_columns, from_columns, Categorical
+from ezdxf.lldxf.const import DXFAttributeError
+
+
+@pytest.fixture
+def msp():
+    doc = ezdxf.new('R2018')
+    doc.layers.new('LINES')
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'LINES', 'color': 1})
+    msp.add_line((0, 1), (2, 1, 3), dxfattribs={'layer': 'LINES', 'thickness': 0.5})
+    msp.add_line((0, 2), (3, 2))
+    msp.add_circle((7, 8), radius=2.5, dxfattribs={'color': 5})
+    return msp
+
+
+def points(column):
+    values = list(column.flat if hasattr(column, 'flat') else column)
+    return [tuple(values[index:index + 3]) for index in range(0, len(values), 3)]
+
+
+def test_to_columns_returns_attribute_values(msp):
+    columns = to_columns(msp, ['dxftype', 'layer', 'color', 'start', 'radius', 'handle'])
+    dxftype = columns['dxftype']
+    assert isinstance(dxftype, Categorical)
+    assert [dxftype.categories[code] for code in dxftype.codes] == ['LINE', 'LINE', 'LINE', 'CIRCLE']
+    layer = columns['layer']
+    assert [layer.categories[code] for code in layer.codes] == ['LINES', 'LINES', '0', '0']
+    assert list(columns['color']) == [1, 256, 256, 5]
+    assert points(columns['start'])[:3] == [(0, 0, 0), (0, 1, 0), (0, 2, 0)]
+    assert all(math.isnan(value) for value in points(columns['start'])[3])
+    radius = list(columns['radius'])
+    assert all(math.isnan(value) for value in radius[:3])
+    assert radius[3] == 2.5
+    assert list(columns['handle']) == [int(e.dxf.handle, 16) for e in msp]
+
+
+def test_to_columns_raises_for_unknown_attribute(msp):
+    with pytest.raises(DXFAttributeError):
+        to_columns(msp, ['xyz'])
+
+
+def test_from_columns_round_trip(msp):
+    names = ['layer', 'color', 'start', 'end', 'thickness']
+    lines = msp.query('LINE')
+    columns = to_columns(lines, names)
+    new_lines = from_columns(msp, 'LINE', columns)
+    assert len(new_lines) == 3
+    for line, new_line in zip(lines, new_lines):
+        assert new_line.dxf.handle != line.dxf.handle
+        assert new_line.dxf.owner == msp.layout_key
+        for name in names:  # unset attributes are exported as DXF default values
+            assert new_line.dxf.get(name) == getattr(line.dxf, name)
+    assert to_columns(new_lines, names).keys() == columns.keys()
+
+
+def test_from_columns_leaves_missing_values_unset(msp):
+    columns = to_columns(msp, ['center', 'radius', 'color'])
+    circles = from_columns(msp, 'CIRCLE', columns, dxfattribs={'layer': 'LINES'})
+    assert len(circles) == 4
+    assert circles[0].dxf.hasattr('center') is False
+    assert circles[0].dxf.hasattr('radius') is False
+    assert circles[3].dxf.center == (7, 8, 0)
+    assert circles[3].dxf.radius == 2.5
+    assert circles[3].dxf.color == 5
+    assert all(circle.dxf.layer == 'LINES' for circle in circles)
@@ -0,0 +1,86 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.entities.line import Line
+from ezdxf.query import EntityQuery, INDEX_SELECTIVITY
+
+
+@pytest.fixture
+def doc():
+    doc = ezdxf.new('R2018')
+    msp = doc.modelspace()
+    for index in range(10):
+        msp.add_line((index, 0), (index, 1), dxfattribs={'layer': 'Layer{}'.format(index % 3)})
+    msp.add_circle((0, 0), 1, dxfattribs={'layer': 'Layer0'})
+    return doc
+
+
+def layer_handles(doc, layer: str):
+    return set(doc.entitydb.index('layer').get(layer.lower(), set()))
+
+
+def check_index(db, key: str):
+    # the incremental updated index has to match a new build index
+    index = {value: set(handles) for value, handles in db.index(key).items()}
+    assert index == db._build_index(key)
+
+
+def test_index_by_layer(doc):
+    msp = doc.modelspace()
+    handles = layer_handles(doc, 'LAYER0')
+    assert handles == {e.dxf.handle for e in msp if e.dxf.layer == 'Layer0'}
+    assert len(handles) == 5
+
+
+def test_index_follows_new_and_deleted_entities(doc):
+    db = doc.entitydb
+    msp = doc.modelspace()
+    db.index('layer')
+    db.index('dxftype')
+    line = msp.add_line((0, 0), (1, 1), dxfattribs={'layer': 'NEW'})
+    assert layer_handles(doc, 'new') == {line.dxf.handle}
+    handle = line.dxf.handle
+    msp.delete_entity(line)
+    assert layer_handles(doc, 'new') == set()
+    assert handle not in db.index('dxftype')['line']
+    check_index(db, 'layer')
+    check_index(db, 'dxftype')
+
+
+def test_index_follows_changed_attribute(doc):
+    db = doc.entitydb
+    db.index('layer')
+    line = doc.modelspace()[0]
+    line.dxf.layer = 'CHANGED'
+    assert layer_handles(doc, 'changed') == {line.dxf.handle}
+    assert line.dxf.handle not in layer_handles(doc, 'layer0')
+    check_index(db, 'layer')
+
+
+def test_extend_replaces_indexed_entity(doc):
+    db = doc.entitydb
+    db.index('layer')
+    old = doc.modelspace()[0]
+    handle = old.dxf.handle
+    new = Line.new(handle=handle, owner=old.dxf.owner, dxfattribs={'layer': 'REPLACED'}, doc=doc)
+    db.extend([new])
+    assert db[handle] is new
+    assert handle in layer_handles(doc, 'replaced')
+    assert handle not in layer_handles(doc, 'layer0')
+    check_index(db, 'layer')
+
+
+def test_indexed_query_in_entity_space_order(doc):
+    msp = doc.modelspace()
+    for index in range(100):
+        msp.add_point((index, 0), dxfattribs={'layer': 'POINTS'})
+    # move first entity to the end of the entity space, handle order differs from entity space order
+    first = msp[0]
+    msp.unlink_entity(first)
+    msp.add_entity(first)
+    query = '*[layer=="Layer0"]'
+    assert len(doc.entitydb.handles_by_index([('layer', 'Layer0')])) * INDEX_SELECTIVITY < len(doc.entitydb)
+    result = list(msp.query(query))
+    assert result == list(EntityQuery(msp, query))
+    assert result[-1] is first
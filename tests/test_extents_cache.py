@@ -0,0 +1,69 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+
+
+@pytest.fixture
+def msp():
+    doc = ezdxf.new('R2018')
+    return doc.modelspace()
+
+
+def test_extents_of_empty_layout(msp):
+    assert msp.extents() is None
+
+
+def test_lwpolyline_append_invalidates_cached_box(msp):
+    lwpolyline = msp.add_lwpolyline([(0, 0), (1, 1)])
+    assert msp.extents().extmax == (1, 1, 0)
+    lwpolyline.append((5, 7))
+    assert msp.extents().extmax == (5, 7, 0)
+    lwpolyline.set_points([(0, 0), (2, 2)])
+    assert msp.extents().extmax == (2, 2, 0)
+
+
+def test_changing_dxf_attribute_invalidates_cached_box(msp):
+    line = msp.add_line((0, 0), (1, 1))
+    assert msp.extents().extmax == (1, 1, 0)
+    line.dxf.end = (3, 4)
+    assert msp.extents().extmax == (3, 4, 0)
+
+
+def test_spline_and_mesh_setters_invalidate_cached_box(msp):
+    spline = msp.add_spline([(0, 0, 0), (1, 1, 0), (2, 0, 0)])
+    mesh = msp.add_mesh()
+    mesh.vertices = [(0, 0, 0), (1, 0, 0), (1, 1, 0)]
+    assert msp.extents().extmax.x == pytest.approx(2)
+    spline.fit_points = [(0, 0, 0), (1, 1, 0), (8, 0, 0)]
+    assert msp.extents().extmax.x == pytest.approx(8)
+    mesh.vertices = [(0, 0, 0), (1, 0, 0), (1, 9, 0)]
+    assert msp.extents().extmax.y == pytest.approx(9)
+
+
+def test_saved_extents_are_not_cached(msp, tmpdir):
+    lwpolyline = msp.add_lwpolyline([(0, 0), (1, 1)])
+    assert msp.extents().extmax == (1, 1, 0)
+    # inplace modification of the vertex array is not tracked by the cached bounding box
+    values = lwpolyline.lwpoints.values  # x, y, start width, end width, bulge for each point
+    values[5] = 6
+    values[6] = 6
+    filename = str(tmpdir.join('extents.dxf'))
+    msp.doc.update_extents = True
+    msp.doc.saveas(filename)
+    doc = ezdxf.readfile(filename)
+    assert doc.header['$EXTMAX'] == (6, 6, 0)
+
+
+def test_only_geometry_attributes_invalidate_cached_box(msp):
+    line = msp.add_line((0, 0), (1, 1))
+    msp.extents()
+    box = line._box
+    assert box is not None
+    line.dxf.color = 3
+    line.dxf.layer = 'LINES'
+    assert line._box == box
+    line.dxf.discard('color')
+    assert line._box == box
+    line.dxf.thickness = 2
+    assert line._box is None
@@ -0,0 +1,80 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+
+
+@pytest.fixture(scope='module', params=['R12', 'R2018'])
+def filename(request, tmpdir_factory):
+    doc = ezdxf.new(request.param)
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0))
+    msp.add_circle((0, 0), radius=2)
+    msp.add_polyline3d([(0, 0, 0), (1, 1, 1), (2, 0, 1)])
+    msp.add_text('TEXT')
+    doc.layout('Layout1').add_line((0, 0), (3, 0))
+    doc.blocks.new('BLOCK').add_line((0, 0), (4, 0))
+    name = str(tmpdir_factory.mktemp('iterdxf').join('iterdxf.dxf'))
+    doc.saveas(name)
+    return name
+
+
+def test_iterdxf_yields_only_modelspace_entities(filename):
+    entities = list(ezdxf.iterdxf(filename))
+    assert [e.dxftype() for e in entities] == ['LINE', 'CIRCLE', 'POLYLINE', 'TEXT']
+    line = entities[0]
+    assert line.dxf.end == (1, 0, 0)
+    assert line.doc is None
+
+
+def test_iterdxf_links_vertices_to_polyline(filename):
+    polyline = list(ezdxf.iterdxf(filename, types=['POLYLINE']))[0]
+    assert [v.dxf.location for v in polyline.vertices] == [(0, 0, 0), (1, 1, 1), (2, 0, 1)]
+
+
+def test_iterdxf_filters_types(filename):
+    assert [e.dxftype() for e in ezdxf.iterdxf(filename, types=['CIRCLE', 'TEXT'])] == ['CIRCLE', 'TEXT']
+
+
+def test_lazy_loaded_header(filename):
+    dxf = ezdxf.opendxf(filename)
+    assert dxf.dxfversion == ezdxf.readfile(filename).dxfversion
+    assert '$ACADVER' in dxf.header
+
+
+@pytest.fixture(scope='module', params=['R12', 'R2000'])
+def insert_filename(request, tmpdir_factory):
+    doc = ezdxf.new(request.param)
+    doc.blocks.new('BLOCK').add_line((0, 0), (4, 0))
+    msp = doc.modelspace()
+    msp.add_blockref('BLOCK', (0, 0)).add_attrib('TAG1', 'value1')
+    msp.add_polyline3d([(0, 0, 0), (1, 1, 1)])
+    msp.add_blockref('BLOCK', (1, 0)).add_attrib('TAG2', 'value2')
+    msp.add_line((0, 0), (1, 0))
+    name = str(tmpdir_factory.mktemp('iterdxf').join('insert.dxf'))
+    doc.saveas(name)
+    return name
+
+
+def test_linked_entities_are_not_yielded_on_their_own(insert_filename):
+    assert list(ezdxf.iterdxf(insert_filename, types=['ATTRIB', 'VERTEX', 'SEQEND'])) == []
+    inserts = list(ezdxf.iterdxf(insert_filename, types=['INSERT']))
+    assert [[attrib.dxf.tag for attrib in insert.attribs] for insert in inserts] == [['TAG1'], ['TAG2']]
+
+
+def test_linked_entities_of_skipped_entities_are_not_loaded(insert_filename, monkeypatch):
+    from ezdxf.dxfstream import EntityFactory
+    loaded = []
+    entity = EntityFactory.entity
+
+    def loading_entity(self, tags):
+        loaded.append(tags[0].value)
+        return entity(self, tags)
+
+    monkeypatch.setattr(EntityFactory, 'entity', loading_entity)
+    assert [e.dxftype() for e in ezdxf.iterdxf(insert_filename, types=['LINE'])] == ['LINE']
+    assert loaded == ['LINE']
+    loaded.clear()
+    polyline = list(ezdxf.iterdxf(insert_filename, types=['POLYLINE']))[0]
+    assert len(polyline.vertices) == 2
+    assert loaded == ['POLYLINE', 'VERTEX', 'VERTEX', 'SEQEND']
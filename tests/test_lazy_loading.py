@@ -0,0 +1,53 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.entities.dxfentity import LazyEntity
+from ezdxf.entities.line import Line
+
+
+@pytest.fixture(scope='module')
+def filename(tmpdir_factory):
+    doc = ezdxf.new('R2018')
+    msp = doc.modelspace()
+    for index in range(10):
+        msp.add_line((index, 0), (index, 1), dxfattribs={'layer': 'LINES'})
+    msp.add_circle((0, 0), radius=2)
+    name = str(tmpdir_factory.mktemp('lazy').join('lazy.dxf'))
+    doc.saveas(name)
+    return name
+
+
+def test_entities_are_decoded_at_first_access(filename):
+    doc = ezdxf.readfile(filename, lazy=True)
+    line = doc.modelspace()[0]
+    assert line.is_lazy
+    assert isinstance(line, LazyEntity)
+    assert isinstance(line, Line)
+    assert line.dxftype() == 'LINE'
+    assert line.is_lazy, 'dxftype() should not decode the entity'
+
+    assert line.dxf.start == (0, 0, 0)
+    assert not line.is_lazy
+    assert type(line) is Line
+
+
+def test_not_lazy_loaded_entities_have_no_lazy_hook(filename):
+    line = ezdxf.readfile(filename).modelspace()[0]
+    assert type(line) is Line
+    with pytest.raises(AttributeError):
+        line.xyz
+
+
+def test_lazy_loaded_document_round_trip(filename, tmpdir):
+    doc = ezdxf.readfile(filename, lazy=True)
+    msp = doc.modelspace()
+    msp[1].dxf.color = 1
+    assert len(msp.query('LINE[layer=="LINES"]')) == 10
+    name = str(tmpdir.join('lazy2.dxf'))
+    doc.saveas(name)
+
+    msp2 = ezdxf.readfile(name).modelspace()
+    assert [e.dxftype() for e in msp2] == ['LINE'] * 10 + ['CIRCLE']
+    assert msp2[1].dxf.color == 1
+    assert msp2[9].dxf.end == (9, 1, 0)
@@ -0,0 +1,67 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import copy
+import ezdxf
+from ezdxf.entities.mesh import FaceArray
+from ezdxf.lldxf.const import DXFValueError
+
+FACES = [(0, 1, 2), (0, 2, 3, 4), (4, 5)]
+
+
+@pytest.fixture
+def faces():
+    faces = FaceArray()
+    faces.set_data(FACES)
+    return faces
+
+
+def as_tuples(faces):
+    return [tuple(face) for face in faces]
+
+
+def test_face_array_api(faces):
+    assert len(faces) == 3
+    assert tuple(faces[1]) == (0, 2, 3, 4)
+    assert tuple(faces[-1]) == (4, 5)
+    assert as_tuples(faces) == FACES
+    assert as_tuples(faces.values) == FACES
+    assert faces.tag_count() == 3 + 9
+
+
+def test_face_array_values_setter(faces):
+    faces.values = [(7, 8, 9)]
+    assert as_tuples(faces) == [(7, 8, 9)]
+
+
+def test_face_array_clear(faces):
+    faces.clear()
+    assert len(faces) == 0
+    assert faces.values == []
+
+
+def test_face_array_clone_is_independent(faces):
+    for clone in (faces.clone(), copy.deepcopy(faces)):
+        clone.values = [(1, 2, 3)]
+        assert as_tuples(faces) == FACES
+
+
+def test_face_array_set_arrays(faces):
+    faces.set_arrays([0, 2, 3], [5, 6, 7])
+    assert as_tuples(faces) == [(5, 6), (7,)]
+    with pytest.raises(DXFValueError):
+        faces.set_arrays([0, 2, 4], [5, 6, 7])
+
+
+def test_mesh_round_trip(tmpdir):
+    doc = ezdxf.new('R2018')
+    mesh = doc.modelspace().add_mesh()
+    with mesh.edit_data() as data:
+        data.vertices = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 2, 0), (1, 2, 0)]
+        data.faces = FACES
+    filename = str(tmpdir.join('mesh.dxf'))
+    doc.saveas(filename)
+
+    mesh2 = ezdxf.readfile(filename).modelspace().query('MESH')[0]
+    assert list(mesh2.vertices) == list(mesh.vertices)
+    assert as_tuples(mesh2.faces) == FACES
@@ -0,0 +1,89 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+
+CUBE = [
+    [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)],
+    [(0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)],
+    [(0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1)],
+    [(0, 1, 0), (1, 1, 0), (1, 1, 1), (0, 1, 1)],
+    [(0, 0, 0), (0, 1, 0), (0, 1, 1), (0, 0, 1)],
+    [(1, 0, 0), (1, 1, 0), (1, 1, 1), (1, 0, 1)],
+]
+
+
+def face_points(polyface):
+    return [tuple(vertex.dxf.location for vertex in face[:-1]) for face in polyface.faces()]
+
+
+def vertex_tags(doc):
+    return [(v.dxf.location, v.dxf.flags, v.dxf.vtx0, v.dxf.vtx1, v.dxf.vtx2, v.dxf.vtx3)
+            for v in doc.modelspace()[0].vertices]
+
+
+@pytest.fixture(params=['R12', 'R2000', 'R2018'])
+def dxfversion(request):
+    return request.param
+
+
+def test_packed_polyface_round_trip(dxfversion, tmpdir):
+    doc = ezdxf.new(dxfversion)
+    polyface = doc.modelspace().add_polyface()
+    polyface.append_faces(CUBE, dxfattribs={'color': 3})
+    polyface.optimize()
+    expected = face_points(polyface)
+    count = len(polyface.vertices)
+    assert polyface.pack() is True
+    assert polyface.is_packed
+    filename = str(tmpdir.join('polyface.dxf'))
+    doc.saveas(filename)
+
+    doc2 = ezdxf.readfile(filename)
+    polyface2 = doc2.modelspace()[0]
+    assert polyface2.is_poly_face_mesh
+    assert len(polyface2.vertices) == count
+    assert face_points(polyface2) == expected
+    assert {v.dxf.color for v in polyface2.vertices if v.is_face_record} == {3}
+
+
+def test_packed_and_unpacked_export_are_equal(dxfversion, tmpdir):
+    docs = []
+    for pack in (False, True):
+        doc = ezdxf.new(dxfversion)
+        polyface = doc.modelspace().add_polyface()
+        polyface.append_faces(CUBE)
+        if pack:
+            polyface.pack()
+        filename = str(tmpdir.join('polyface{}.dxf'.format(int(pack))))
+        doc.saveas(filename)
+        docs.append(ezdxf.readfile(filename))
+    assert vertex_tags(docs[0]) == vertex_tags(docs[1])
+
+
+def test_unpack_restores_vertex_entities(dxfversion):
+    doc = ezdxf.new(dxfversion)
+    polyface = doc.modelspace().add_polyface()
+    polyface.append_faces(CUBE)
+    expected = face_points(polyface)
+    polyface.pack()
+    polyface.unpack()
+    assert not polyface.is_packed
+    assert face_points(polyface) == expected
+    assert all(vertex.dxf.handle in doc.entitydb for vertex in polyface.vertices)
+
+
+def test_packed_polymesh_round_trip(tmpdir):
+    doc = ezdxf.new('R2000')
+    polymesh = doc.modelspace().add_polymesh(size=(3, 4))
+    for m in range(3):
+        for n in range(4):
+            polymesh.set_mesh_vertex((m, n), (m, n, m * n))
+    assert polymesh.pack() is True
+    filename = str(tmpdir.join('polymesh.dxf'))
+    doc.saveas(filename)
+
+    polymesh2 = ezdxf.readfile(filename).modelspace()[0]
+    assert polymesh2.is_polygon_mesh
+    assert polymesh2.get_mesh_vertex((2, 3)).dxf.location == (2, 3, 6)
+    assert [v.dxf.location for v in polymesh2.vertices] == [(m, n, m * n) for m in range(3) for n in range(4)]
@@ -0,0 +1,86 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+from io import StringIO, BytesIO
+from ezdxf.lldxf import tagger
+from ezdxf.lldxf.tagger import low_level_tagger, tag_compiler, bytes_tag_compiler, stream_tag_compiler
+from ezdxf.lldxf.types import DXFVertex
+from ezdxf.lldxf.const import DXFStructureError
+
+DATA = """  0
+SECTION
+  2
+ENTITIES
+  0
+LINE
+  5
+FF
+999
+comment
+  8
+0
+ 10
+1.0
+ 20
+2.0
+ 30
+3.0
+ 11
+4.0
+ 21
+5.0
+  0
+POINT
+ 10
+7.0
+ 20
+8.0
+ 62
+1
+  0
+ENDSEC
+  0
+EOF
+"""
+
+
+def reference(text: str):
+    return list(tag_compiler(low_level_tagger(StringIO(text))))
+
+
+@pytest.fixture(params=[1, 2, 3, 5, 0x10000])
+def chunk_size(request, monkeypatch):
+    monkeypatch.setattr(tagger, 'CHUNK_SIZE', request.param)
+    return request.param
+
+
+def test_bytes_tag_compiler_at_chunk_boundaries(chunk_size):
+    tags = list(bytes_tag_compiler(DATA.encode()))
+    assert tags == reference(DATA)
+    assert tags[5] == DXFVertex(10, (1., 2., 3.))
+    assert tags[6] == DXFVertex(11, (4., 5.))
+
+
+@pytest.mark.parametrize('block_size', [1, 3, 64])
+def test_bytes_tag_compiler_at_block_boundaries(chunk_size, block_size, monkeypatch):
+    monkeypatch.setattr(tagger, 'BLOCK_SIZE', block_size)
+    assert list(bytes_tag_compiler(DATA.encode())) == reference(DATA)
+
+
+@pytest.mark.parametrize('block_size', [1, 2, 3, 7, 64, 4096])
+def test_stream_tag_compiler_at_block_boundaries(chunk_size, block_size):
+    tags = list(stream_tag_compiler(BytesIO(DATA.encode()), block_size=block_size))
+    assert tags == reference(DATA)
+
+
+def test_stream_tag_compiler_windows_line_endings():
+    data = DATA.replace('\n', '\r\n').encode()
+    assert list(stream_tag_compiler(BytesIO(data), block_size=5)) == reference(DATA)
+
+
+def test_missing_y_coordinate_at_chunk_boundary(chunk_size):
+    data = "  0\nPOINT\n 10\n1.0\n  0\nEOF\n".encode()
+    with pytest.raises(DXFStructureError):
+        list(bytes_tag_compiler(data))
+    with pytest.raises(DXFStructureError):
+        list(stream_tag_compiler(BytesIO(data), block_size=3))
@@ -0,0 +1,80 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.math import Matrix44
+
+
+@pytest.fixture
+def msp():
+    doc = ezdxf.new('R2018')
+    return doc.modelspace()
+
+
+def test_transform_all_by_translation(msp):
+    line = msp.add_line((0, 0), (1, 0))
+    spline = msp.add_spline([(0, 0, 0), (1, 1, 0), (2, 0, 0), (3, 1, 0)])
+    lwpolyline = msp.add_lwpolyline([(0, 0), (1, 1)])
+    mesh = msp.add_mesh()
+    mesh.vertices = [(0, 0, 0), (1, 0, 0), (1, 1, 0)]
+    mesh.faces = [(0, 1, 2)]
+
+    skipped = msp.transform_all(Matrix44.translate(10, 0, 0))
+    assert len(skipped) == 0
+    assert line.dxf.start == (10, 0, 0)
+    assert spline.fit_points[0] == (10, 0, 0)
+    assert lwpolyline[1][:2] == (11, 1)
+    assert mesh.vertices[2] == (11, 1, 0)
+
+
+def test_transform_all_skips_invalid_spline_without_changing_anything(msp):
+    line = msp.add_line((0, 0), (1, 0))
+    mesh = msp.add_mesh()
+    mesh.vertices = [(0, 0, 0), (1, 0, 0), (1, 1, 0)]
+    spline = msp.add_spline()
+    spline.fit_points = [(0, 0), (1, 1), (2, 0), (3, 3)]  # 2D points, invalid vertex array
+    fit_points = list(spline.fit_points.values)
+
+    skipped = msp.transform_all(Matrix44.translate(10, 0, 0))
+    assert list(skipped) == [spline]
+    assert list(spline.fit_points.values) == fit_points
+    assert line.dxf.start == (10, 0, 0)
+    assert mesh.vertices[0] == (10, 0, 0)
+
+
+def test_transform_all_skips_non_uniform_scaled_circle(msp):
+    circle = msp.add_circle((1, 0), radius=1)
+    line = msp.add_line((0, 0), (1, 0))
+    skipped = msp.transform_all(Matrix44.scale(2, 1, 1))
+    assert list(skipped) == [circle]
+    assert circle.dxf.center == (1, 0, 0)
+    assert circle.dxf.radius == 1
+    assert line.dxf.end == (2, 0, 0)
+
+
+def test_transform_all_updates_extents(msp):
+    msp.add_line((0, 0), (1, 1))
+    assert msp.extents().extmax == (1, 1, 0)
+    msp.transform_all(Matrix44.translate(10, 0, 0))
+    assert msp.extents().extmax == (11, 1, 0)
+
+
+def test_transform_dimension_with_shared_geometry_block():
+    doc = ezdxf.new('R2018', setup=True)
+    msp = doc.modelspace()
+    override = msp.add_linear_dim(base=(3, 2), p1=(0, 0), p2=(3, 0))
+    override.render()
+    dim1 = override.dimension
+    dim2 = doc.entitydb.duplicate_entity(dim1)
+    msp.add_entity(dim2)
+    name = dim1.dxf.geometry
+    assert dim2.dxf.geometry == name
+
+    def lines(block_name):
+        return [line.dxf.start for line in doc.blocks[block_name].query('LINE')]
+
+    before = lines(name)
+    dim2.transform(Matrix44.translate(0, 100, 0))
+    assert dim2.dxf.geometry != name, 'expected a copy of the shared geometry block'
+    assert lines(name) == before, 'shared geometry block should not be modified'
+    assert [p.y for p in lines(dim2.dxf.geometry)] == [p.y + 100 for p in before]
@@ -0,0 +1,52 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+from ezdxf.math import vertexmerge
+from ezdxf.math.vertexmerge import merge_vertices, remap_indices
+
+VERTICES = [(0, 0, 0), (1, 0, 0), (1.00000001, 0, 0), (0, 0, 0), (1, 1, 0), (1.0004, 1, 0)]
+
+
+@pytest.fixture(params=[1024, 1], ids=['python', 'numpy-if-available'])
+def numpy_min_vertices(request, monkeypatch):
+    monkeypatch.setattr(vertexmerge, 'NUMPY_MIN_VERTICES', request.param)
+
+
+def test_merge_by_precision(numpy_min_vertices):
+    keep, mapping = merge_vertices(VERTICES)
+    assert keep == [0, 1, 4, 5]
+    assert mapping == [0, 1, 1, 0, 2, 3]
+    keep, mapping = merge_vertices(VERTICES, precision=3)
+    assert keep == [0, 1, 4]
+    assert mapping == [0, 1, 1, 0, 2, 2]
+
+
+def test_merge_by_tolerance(numpy_min_vertices):
+    keep, mapping = merge_vertices(VERTICES, tolerance=1e-6)
+    assert keep == [0, 1, 4, 5]
+    assert mapping == [0, 1, 1, 0, 2, 3]
+    keep, mapping = merge_vertices(VERTICES, tolerance=1e-3)
+    assert keep == [0, 1, 4]
+    assert mapping == [0, 1, 1, 0, 2, 2]
+
+
+def test_tolerance_merges_vertices_with_different_rounded_coordinates(numpy_min_vertices):
+    vertices = [(0.000049, 0, 0), (0.000051, 0, 0)]  # rounded to 0.0 and 0.0001
+    assert merge_vertices(vertices, precision=4) == ([0, 1], [0, 1])
+    assert merge_vertices(vertices, tolerance=1e-5) == ([0], [0, 0])
+
+
+def test_tolerance_is_a_distance(numpy_min_vertices):
+    vertices = [(0, 0, 0), (0.6, 0.6, 0.6)]  # each coordinate in tolerance, distance is not
+    assert merge_vertices(vertices, tolerance=0.7) == ([0, 1], [0, 1])
+    assert merge_vertices(vertices, tolerance=1.1) == ([0], [0, 0])
+
+
+def test_invalid_tolerance():
+    with pytest.raises(ValueError):
+        merge_vertices(VERTICES, tolerance=0)
+
+
+def test_remap_indices():
+    keep, mapping = merge_vertices(VERTICES)
+    assert remap_indices([(0, 1, 4), (3, 2, 5)], mapping) == [(0, 1, 2), (0, 1, 3)]
@@ -0,0 +1,154 @@
+# Purpose: simple benchmarks for the DXF loading and saving pipeline
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+"""
+Usage::
+
+    python -m ezdxf.tools.benchmark tagger FILE [FILE ...]
+    python -m ezdxf.tools.benchmark namespace FILE [FILE ...]
+    python -m ezdxf.tools.benchmark load FILE [FILE ...]
+    python -m ezdxf.tools.benchmark write FILE [FILE ...]
+
+"""
+from typing import Callable, Iterable, Tuple
+import sys
+import time
+import argparse
+
+
+def measure(func: Callable[[], int], repeat: int = 3) -> Tuple[int, float]:
+    """ Returns the result of `func` and the best run time in seconds out of `repeat` runs. """
+    best = None
+    result = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        t = time.perf_counter() - t0
+        if best is None or t < best:
+            best = t
+    return result, best
+
+
+def bench_tagger(filename: str, repeat: int = 3) -> None:
+    """ Compares the tags per second of the stream based, the bytes based and the block based tag compiler. """
+    from ezdxf.filemanagement import dxf_file_info
+    from ezdxf.lldxf.tagger import low_level_tagger, tag_compiler, bytes_tag_compiler, stream_tag_compiler
+
+    encoding = dxf_file_info(filename).encoding
+
+    def stream_compiler() -> int:
+        with open(filename, mode='rt', encoding=encoding, errors='ignore') as fp:
+            return count(tag_compiler(low_level_tagger(fp)))
+
+    def bytes_compiler() -> int:
+        with open(filename, mode='rb') as fp:
+            data = fp.read()
+        return count(bytes_tag_compiler(data, encoding=encoding))
+
+    def block_compiler() -> int:
+        with open(filename, mode='rb') as fp:
+            return count(stream_tag_compiler(fp, encoding=encoding))
+
+    print_result('low_level_tagger + tag_compiler', *measure(stream_compiler, repeat))
+    print_result('bytes_tag_compiler', *measure(bytes_compiler, repeat))
+    print_result('stream_tag_compiler', *measure(block_compiler, repeat))
+
+
+def bench_load(filename: str, repeat: int = 3) -> None:
+    """ Reports the load time of the DXF document and the loaded entities per second. """
+    from ezdxf.filemanagement import readfile
+
+    def load() -> int:
+        return len(readfile(filename).entitydb)
+
+    entities, seconds = measure(load, repeat)
+    print_result('readfile', entities, seconds, unit='entities')
+    print('{:<40} {:>10.2f} us/entity'.format('', seconds / entities * 1e6))
+
+
+def bench_write(filename: str, repeat: int = 3) -> None:
+    """ Reports the export time of the loaded DXF document into a text stream and the exported entities per second. """
+    import io
+    from ezdxf.filemanagement import readfile
+
+    doc = readfile(filename)
+
+    def write() -> int:
+        doc.write(io.StringIO())
+        return len(doc.entitydb)
+
+    entities, seconds = measure(write, repeat)
+    print_result('Drawing.write', entities, seconds, unit='entities')
+    print('{:<40} {:>10.2f} us/entity'.format('', seconds / entities * 1e6))
+
+
+def bench_namespace(filename: str, repeat: int = 3) -> None:
+    """ Reports the size of the DXF namespaces of LINE, LWPOLYLINE and INSERT entities and the DXF attribute access
+    rate for all modelspace entities.
+    """
+    from ezdxf.filemanagement import readfile
+
+    doc = readfile(filename)
+    msp = doc.modelspace()
+    for dxftype in ('LINE', 'LWPOLYLINE', 'INSERT'):
+        entities = msp.query(dxftype)
+        if len(entities):
+            size = sum(namespace_size(entity.dxf) for entity in entities) / len(entities)
+            print('{:<40} {:>10} entities {:>8.0f} bytes/namespace'.format(dxftype, len(entities), size))
+
+    entities = list(msp)
+
+    def access() -> int:
+        for entity in entities:
+            dxf = entity.dxf
+            dxf.layer  # existing attribute
+            dxf.color  # DXF default value, if not set
+            dxf.get('linetype')
+            dxf.hasattr('lineweight')
+        return len(entities) * 4
+
+    print_result('DXF attribute access', *measure(access, repeat), unit='attribs')
+
+
+def namespace_size(dxf) -> int:
+    size = sys.getsizeof(dxf)
+    for name in ('__dict__', '_flags'):  # instance dict or slots
+        try:
+            size += sys.getsizeof(object.__getattribute__(dxf, name))
+        except AttributeError:
+            pass
+    return size
+
+
+def count(tags: Iterable) -> int:
+    n = 0
+    for _ in tags:
+        n += 1
+    return n
+
+
+def print_result(name: str, tags: int, seconds: float, unit: str = 'tags') -> None:
+    print('{:<40} {:>10} {} {:>8.3f}s {:>12.0f} {}/s'.format(name, tags, unit, seconds, tags / seconds, unit))
+
+
+BENCHMARKS = {
+    'tagger': bench_tagger,
+    'namespace': bench_namespace,
+    'load': bench_load,
+    'write': bench_write,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS.keys()), help='benchmark to run')
+    parser.add_argument('files', metavar='FILE', nargs='+', help='DXF files')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='count of runs, best run is reported')
+    args = parser.parse_args(sys.argv[1:])
+    for filename in args.files:
+        print(filename)
+        BENCHMARKS[args.benchmark](filename, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
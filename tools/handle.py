@@ -2,6 +2,7 @@
 # Created: 11.03.2011
 # Copyright (c) 2011-2018, Manfred Moitzi
 # License: MIT License
+from typing import List
 
 
 class HandleGenerator:
@@ -20,6 +21,12 @@ class HandleGenerator:
 
     __next__ = next
 
+    def next_block(self, count: int) -> List[str]:
+        """ Returns `count` consecutive handles. """
+        start = self._handle
+        self._handle += count
+        return ["%X" % value for value in range(start, start + count)]
+
 
 class ImageKeyGenerator(HandleGenerator):
     def __str__(self):
@@ -7,6 +7,7 @@ import zipfile
 from contextlib import contextmanager
 
 from ezdxf.lldxf.validator import is_dxf_stream, dxf_info
+from ezdxf.lldxf.const import DXFBINARY_SIGNATURE
 
 WIN_NEW_LINE = b'\r\n'
 NEW_LINE = b'\n'
@@ -22,6 +23,7 @@ class ZipReader:
         self.dxf_file = None  # type: BinaryIO
         self.encoding = 'cp1252'
         self.dxfversion = 'AC1009'
+        self.is_binary_dxf = False
 
     def open(self, dxf_file_name: str = None) -> None:
         def open_dxf_file() -> BinaryIO:
@@ -30,6 +32,10 @@ class ZipReader:
         self.zip_archive = zipfile.ZipFile(self.zip_archive_name)
         self.dxf_file_name = dxf_file_name if dxf_file_name is not None else self.get_first_dxf_file_name()
         self.dxf_file = open_dxf_file()
+        self.is_binary_dxf = self.dxf_file.read(len(DXFBINARY_SIGNATURE)) == DXFBINARY_SIGNATURE
+        self.dxf_file = open_dxf_file()  # restart
+        if self.is_binary_dxf:  # binary DXF is loaded by read_binary(), encoding is stored in the HEADER section
+            return
 
         # reading with standard encoding 'cp1252' - readline() fails if leading comments contain none ascii characters
         if not is_dxf_stream(cast(TextIO, self)):
@@ -59,6 +65,10 @@ class ZipReader:
         next_line = self.dxf_file.readline().replace(WIN_NEW_LINE, NEW_LINE)
         return str(next_line, self.encoding)
 
+    def read_binary(self) -> bytes:
+        """ Returns the whole content of a binary DXF file. """
+        return self.dxf_file.read()
+
     def close(self) -> None:
         self.zip_archive.close()
 
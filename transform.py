@@ -0,0 +1,109 @@
+# Purpose: batch transformation of DXF entities by Matrix44
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, List, Dict, Tuple
+import logging
+from ezdxf.math import Matrix44
+from ezdxf.math.transformtools import OCSTransform, transform_vertex_arrays
+from ezdxf.lldxf.const import NonUniformScalingError
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFGraphic, LWPolyline, Spline
+
+__all__ = ['transform_entities']
+
+logger = logging.getLogger('ezdxf')
+
+
+def transform_entities(entities: Iterable['DXFGraphic'], m: Matrix44) -> List['DXFGraphic']:
+    """
+    Transform `entities` inplace by transformation matrix `m`, returns the entities which do not support this
+    transformation, these entities are not modified.
+
+    The vertices of the array based entities MESH, SPLINE and LWPOLYLINE are collected and transformed by one matrix
+    multiplication for all MESH and SPLINE entities and one matrix multiplication for all LWPOLYLINE entities with the
+    same extrusion vector and elevation, which is much faster than transforming each entity by itself, especially if
+    NumPy is available. All other entities are transformed by :meth:`~ezdxf.entities.DXFGraphic.transform`.
+
+    All entities are checked before the first entity is transformed, array based entities with invalid vertex arrays,
+    like SPLINE entities with 2D points, are returned as not supported entities. An entity which raises an
+    unexpected error while transforming is also returned as not supported entity and the error is logged, this entity
+    may be partially transformed.
+
+    Args:
+        entities: iterable of :class:`~ezdxf.entities.DXFGraphic` entities
+        m: transformation matrix
+
+    .. versionadded:: 0.11
+
+    """
+    skipped = []  # type: List[DXFGraphic]
+    wcs_arrays = []
+    meshes = []  # type: List[DXFGraphic]
+    splines = []  # type: List[Spline]
+    others = []  # type: List[DXFGraphic]
+    # key: (extrusion, elevation), value: LWPOLYLINE entities
+    lwpolylines = dict()  # type: Dict[Tuple[Tuple[float, float, float], float], List[LWPolyline]]
+    # check all entities before transforming any entity
+    for entity in entities:
+        dxftype = entity.dxftype()
+        if dxftype == 'MESH':
+            arrays = [entity.vertices.values]
+        elif dxftype == 'SPLINE':
+            arrays = [entity.control_points.values, entity.fit_points.values]
+        elif dxftype == 'LWPOLYLINE':
+            arrays = [entity.lwpoints.values]
+        elif entity.SUPPORTS_TRANSFORM:
+            others.append(entity)
+            continue
+        else:
+            logger.debug('Transformation of {} entity not supported.'.format(dxftype))
+            skipped.append(entity)
+            continue
+
+        vertex_size = 5 if dxftype == 'LWPOLYLINE' else 3
+        if any(len(values) % vertex_size for values in arrays):
+            logger.debug('Invalid vertex array in {} entity #{}.'.format(dxftype, entity.dxf.handle))
+            skipped.append(entity)
+        elif dxftype == 'LWPOLYLINE':
+            dxf = entity.dxf
+            key = (tuple(dxf.extrusion), dxf.elevation)
+            lwpolylines.setdefault(key, []).append(entity)
+        else:
+            wcs_arrays.extend(arrays)
+            if dxftype == 'MESH':
+                meshes.append(entity)
+            else:
+                splines.append(entity)
+
+    lwpolyline_transformations = []
+    for (extrusion, elevation), polylines in lwpolylines.items():
+        ocs = OCSTransform(extrusion, m)
+        if not ocs.scale_uniform:
+            skipped.extend(polyline for polyline in polylines if polyline.has_arc)
+            polylines = [polyline for polyline in polylines if not polyline.has_arc]
+        lwpolyline_transformations.append((ocs, elevation, polylines))
+
+    transform_vertex_arrays(wcs_arrays, m)
+    for mesh in meshes:
+        mesh._box = None
+    for spline in splines:
+        spline._transform_attribs(m)
+
+    for ocs, elevation, polylines in lwpolyline_transformations:
+        transform_vertex_arrays(
+            (polyline.lwpoints.values for polyline in polylines), ocs.matrix44(), vertex_size=5, z=elevation)
+        for polyline in polylines:
+            polyline._transform_attribs(ocs)
+
+    for entity in others:
+        try:
+            entity.transform(m)
+        except NonUniformScalingError as e:
+            logger.debug(str(e))
+            skipped.append(entity)
+        except (ValueError, TypeError, ArithmeticError) as e:
+            logger.warning('Transformation of {} entity #{} failed: {}'.format(
+                entity.dxftype(), entity.dxf.handle, str(e)))
+            skipped.append(entity)
+    return skipped